@@ -26,6 +26,7 @@ interface NodeRunLog {
   total_completion_tokens: number;
   total_tokens: number;
   prompt_chars: number;
+  prompt_chars_untrimmed?: number;
   error_type: string | null;
   error_message: string | null;
   input_state: unknown;
@@ -103,6 +104,7 @@ async function readLocalLogs(
       total_completion_tokens: log.total_completion_tokens ?? 0,
       total_tokens: log.total_tokens ?? 0,
       prompt_chars: log.prompt_chars ?? 0,
+      prompt_chars_untrimmed: log.prompt_chars_untrimmed ?? log.prompt_chars ?? 0,
       error_type: log.error_type ?? null,
       error_message: log.error_message ?? null,
     };
@@ -128,15 +128,18 @@ export async function GET(request: NextRequest) {
         const logs = await logsRes.json();
         if (!logs.summary) return null;
 
-        // Calculate estimated cost from individual node runs
-        let totalCost = 0;
-        for (const run of logs.runs ?? []) {
-          for (const tu of run.token_usage ?? []) {
-            totalCost += estimateCost(
-              tu.prompt_tokens,
-              tu.completion_tokens,
-              tu.model_name,
-            );
+        // Prefer the backend's price-table cost; estimate for older API versions
+        let totalCost = logs.summary.total_cost_usd ?? null;
+        if (totalCost == null) {
+          totalCost = 0;
+          for (const run of logs.runs ?? []) {
+            for (const tu of run.token_usage ?? []) {
+              totalCost += estimateCost(
+                tu.prompt_tokens,
+                tu.completion_tokens,
+                tu.model_name,
+              );
+            }
           }
         }
 
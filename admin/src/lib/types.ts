@@ -318,6 +318,10 @@ export interface TokenUsageItem {
   completion_tokens: number;
   total_tokens: number;
   model_name: string | null;
+  cached_tokens?: number;
+  images?: number;
+  cost_usd?: number | null;
+  price_version?: string | null;
 }
 
 export interface NodeRunLog {
@@ -331,6 +335,8 @@ export interface NodeRunLog {
   total_completion_tokens: number;
   total_tokens: number;
   prompt_chars: number;
+  prompt_chars_untrimmed?: number;  // before prompt budget trimming
+  cost_usd?: number;
   error_type: string | null;
   error_message: string | null;
   input_state: Record<string, unknown> | null;
@@ -347,6 +353,12 @@ export interface PipelineRunSummary {
   status: string;
   started_at: string | null;
   ended_at: string | null;
+  total_cost_usd?: number;
+  published?: boolean;
+  cost_per_published_article?: number | null;
+  revision_loops?: number;
+  revision_cost_usd?: number;
+  cost_per_revision_loop?: number | null;
 }
 
 export interface LogsResponse {
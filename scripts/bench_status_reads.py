@@ -0,0 +1,98 @@
+"""Benchmark: latency of pipeline status reads from the run status registry.
+
+Measures, for a registry holding ``--threads`` runs on a local SQLite
+table:
+
+- ``registry hit``: ``RunStatusRegistry.get`` served from memory
+- ``registry refresh``: the same with the TTL at 0 (one table read each)
+- ``GET /status``: the full endpoint over ASGI, fired at ``--rate``
+  polls/s, so latency includes FastAPI routing and serialization
+
+    uv run python scripts/bench_status_reads.py --threads 1000 --rate 1000 --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+
+def _report(label: str, samples_s: list[float]) -> None:
+    from editorial_ai.observability.loop_monitor import percentile
+
+    us = [s * 1e6 for s in samples_s]
+    print(
+        f"{label:>18}  n={len(us):>6}  p50={percentile(us, 50):>8.1f}us  "
+        f"p99={percentile(us, 99):>8.1f}us  max={max(us):>9.1f}us"
+    )
+
+
+async def main(threads: int, rate: float, seconds: float) -> None:
+    from httpx import ASGITransport, AsyncClient
+
+    from editorial_ai.api.app import app
+    from editorial_ai.observability import run_status as run_status_module
+    from editorial_ai.observability.run_status import (
+        RunStatus,
+        RunStatusRegistry,
+        SqliteRunStatusStore,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteRunStatusStore(Path(tmp) / "run_status.db")
+        registry = RunStatusRegistry(store, ttl_s=3600)
+        run_status_module._registry_instance = registry
+        ids = [f"thread-{i}" for i in range(threads)]
+        await store.upsert([RunStatus(t, pipeline_status="drafting") for t in ids])
+
+        samples = []
+        for _ in range(20_000):
+            t0 = time.perf_counter()
+            await registry.get(random.choice(ids))
+            samples.append(time.perf_counter() - t0)
+        _report("registry hit", samples)
+
+        registry.ttl_s = 0
+        samples = []
+        for _ in range(2_000):
+            t0 = time.perf_counter()
+            await registry.get(random.choice(ids))
+            samples.append(time.perf_counter() - t0)
+        _report("registry refresh", samples)
+        registry.ttl_s = 1.0
+
+        samples = []
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+
+            async def poll() -> None:
+                t0 = time.perf_counter()
+                resp = await client.get(f"/api/pipeline/status/{random.choice(ids)}")
+                resp.raise_for_status()
+                samples.append(time.perf_counter() - t0)
+
+            tasks = []
+            interval = 1 / rate
+            started = time.perf_counter()
+            for i in range(int(rate * seconds)):
+                delay = started + i * interval - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(poll()))
+            await asyncio.gather(*tasks)
+            achieved = len(tasks) / (time.perf_counter() - started)
+        _report(f"GET /status @{achieved:.0f}/s", samples)
+        await registry.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=1000, help="endpoint polls per second")
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.threads, args.rate, args.seconds))
@@ -0,0 +1,127 @@
+"""Benchmark: job throughput of the multi-process worker vs. process count.
+
+Runs the real worker machinery (``editorial_ai.worker`` processes draining
+a SQLite job queue) with a CPU-bound handler that mimics the pure-Python
+parts of a pipeline run — layout validation, node log snapshot
+serialization and base64 image encoding — without any LLM or network I/O.
+Throughput should grow roughly linearly with processes up to the number
+of cores; a single event loop stays flat however many job slots it has.
+
+    uv run python scripts/bench_worker_scaling.py --jobs 200 --processes 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+BENCH_KIND = "bench_cpu"
+IMAGE_BYTES = os.urandom(512 * 1024)  # a small layout PNG's worth
+
+
+async def cpu_job(graph: object, job: object) -> None:
+    """One pipeline run's worth of CPU work (no I/O)."""
+    from editorial_ai.models.layout import MagazineLayout, create_default_template
+    from editorial_ai.observability.snapshot import full_snapshot, truncate
+
+    for _ in range(job.payload.get("rounds", 20)):
+        layout = create_default_template("bench keyword", "Bench Title")
+        dumped = layout.model_dump()
+        MagazineLayout.model_validate(dumped)
+        state = {"current_draft": dumped, "curated_topics": [dumped] * 3}
+        json.dumps(full_snapshot(state), ensure_ascii=False)
+        truncate(state)
+    base64.b64encode(IMAGE_BYTES)
+
+
+@asynccontextmanager
+async def no_graph():
+    yield None
+
+
+async def _enqueue(n: int, rounds: int) -> None:
+    from editorial_ai.jobs import get_job_queue
+
+    queue = get_job_queue()
+    for i in range(n):
+        await queue.enqueue(BENCH_KIND, f"bench-{i}", {"rounds": rounds})
+
+
+async def _succeeded() -> int:
+    from editorial_ai.jobs import get_job_queue
+
+    return (await get_job_queue().counts()).get("succeeded", 0)
+
+
+def _wait_for(target: int, timeout_s: float) -> None:
+    deadline = time.monotonic() + timeout_s
+    while asyncio.run(_succeeded()) < target:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"only {asyncio.run(_succeeded())}/{target} jobs finished")
+        time.sleep(0.05)
+
+
+def run(processes: int, jobs: int, rounds: int, affinity: bool, timeout_s: float) -> float:
+    """Jobs/s for ``processes`` single-slot workers on a fresh queue."""
+    from editorial_ai.jobs import queue as queue_module
+    from editorial_ai.worker import start_processes, stop_processes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Read by the spawned workers' settings as well as ours
+        os.environ["JOB_QUEUE_BACKEND"] = "sqlite"
+        os.environ["JOB_QUEUE_SQLITE_PATH"] = str(Path(tmp) / "jobs.db")
+        os.environ["JOB_POLL_INTERVAL_S"] = "0.02"
+        os.environ["LOG_COMPACT_AFTER_DAYS"] = "0"
+        from editorial_ai.config import settings
+
+        settings.job_queue_backend = "sqlite"
+        settings.job_queue_sqlite_path = os.environ["JOB_QUEUE_SQLITE_PATH"]
+        queue_module._queue_instance = None
+
+        procs = start_processes(
+            processes, affinity=affinity, graph_factory=no_graph,
+            handlers={BENCH_KIND: cpu_job}, concurrency=1,
+        )
+        try:
+            # Warm-up: one job per process so imports and startup are not timed
+            asyncio.run(_enqueue(processes, 1))
+            _wait_for(processes, timeout_s)
+            started = time.perf_counter()
+            asyncio.run(_enqueue(jobs, rounds))
+            _wait_for(processes + jobs, timeout_s)
+            elapsed = time.perf_counter() - started
+        finally:
+            stop_processes(procs)
+            queue_module._queue_instance = None
+    return jobs / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    cores = os.cpu_count() or 1
+    defaults = sorted({1, 2, 4, cores} - {n for n in (2, 4) if n > cores})
+    parser.add_argument("--processes", type=int, nargs="+", default=defaults)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20, help="CPU work per job")
+    parser.add_argument("--affinity", action="store_true", help="pin each process to a core")
+    parser.add_argument("--timeout", type=float, default=600)
+    args = parser.parse_args()
+
+    print(f"cores={cores} jobs={args.jobs} rounds={args.rounds} affinity={args.affinity}")
+    print(f"{'processes':>9}  {'jobs/s':>8}  {'speedup':>7}")
+    baseline = None
+    for n in args.processes:
+        rate = run(n, args.jobs, args.rounds, args.affinity, args.timeout)
+        baseline = baseline or rate
+        print(f"{n:>9}  {rate:>8.1f}  {rate / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -401,6 +401,8 @@ async def run_scenario(label, scenario):
             "seed_keyword": scenario["seed_keyword"],
             "category": scenario["category"],
         },
+        # Bulk run: yields LLM capacity to admin-triggered runs in the same process
+        "priority": "batch",
     }
 
     start = time.time()
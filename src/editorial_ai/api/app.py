@@ -10,15 +10,24 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from editorial_ai.api.routes import admin, health, logs, pipeline, sources
+from editorial_ai.api.routes import admin, health, logs, observability, pipeline, sources
 from editorial_ai.checkpointer import create_checkpointer
 from editorial_ai.config import settings
 from editorial_ai.graph import build_graph
+from editorial_ai.io_executor import shutdown_io_executor
+from editorial_ai.jobs import JobWorkerPool, get_job_queue
+from editorial_ai.observability import (
+    get_event_bus,
+    get_log_sink,
+    get_loop_monitor,
+    get_run_status_registry,
+)
+from editorial_ai.routing import get_routing_watcher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage checkpointer and graph lifecycle."""
+    """Manage checkpointer, graph and job worker lifecycle."""
     # Fail-fast: check required env vars
     missing = settings.validate_required_for_server()
     if missing:
@@ -30,11 +39,39 @@ async def lifespan(app: FastAPI):
         )
         sys.exit(1)
 
-    async with create_checkpointer() as checkpointer:
-        await checkpointer.setup()
-        app.state.checkpointer = checkpointer
-        app.state.graph = build_graph(checkpointer=checkpointer)
-        yield
+    loop_monitor = get_loop_monitor()
+    loop_monitor.start()
+    log_sink = get_log_sink()
+    log_sink.start()
+    routing_watcher = get_routing_watcher()
+    routing_watcher.start()
+    event_bus = get_event_bus()
+    event_bus.start()
+    run_status = get_run_status_registry()
+    run_status.start()
+    try:
+        async with create_checkpointer() as checkpointer:
+            await checkpointer.setup()
+            app.state.checkpointer = checkpointer
+            app.state.graph = build_graph(checkpointer=checkpointer)
+            # Without API_JOB_WORKERS the API only enqueues; editorial-worker runs jobs
+            worker_pool = JobWorkerPool(
+                app.state.graph, concurrency=None if settings.api_job_workers else 0
+            )
+            app.state.worker_pool = worker_pool
+            worker_pool.start()
+            try:
+                yield
+            finally:
+                await worker_pool.stop()
+    finally:
+        await get_job_queue().close()
+        await run_status.stop()
+        await event_bus.stop()
+        await routing_watcher.stop()
+        await log_sink.stop()
+        await loop_monitor.stop()
+        shutdown_io_executor()
 
 
 app = FastAPI(title="Editorial AI Admin API", lifespan=lifespan)
@@ -59,4 +96,5 @@ app.include_router(logs.router, prefix="/api/contents", tags=["logs"])
 app.include_router(admin.router, prefix="/api/contents", tags=["contents"])
 app.include_router(pipeline.router, prefix="/api/pipeline", tags=["pipeline"])
 app.include_router(sources.router, prefix="/api/sources", tags=["sources"])
+app.include_router(observability.router, prefix="/api/observability", tags=["observability"])
 app.include_router(health.router, tags=["health"])
@@ -3,20 +3,25 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
-from langgraph.graph.state import CompiledStateGraph
-from langgraph.types import Command
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
 
-from editorial_ai.api.deps import get_graph, verify_api_key
+from editorial_ai.api.deps import verify_api_key
 from editorial_ai.api.schemas import (
     ApproveRequest,
     ContentListResponse,
     ContentResponse,
     RejectRequest,
+    ResumeTicketResponse,
 )
+from editorial_ai.jobs import PIPELINE_RESUME, Job, get_job_queue
+from editorial_ai.observability.events import publish_progress
+from editorial_ai.observability.run_status import RESUMING, get_run_status_registry
 from editorial_ai.services.content_service import (
+    ContentConflictError,
     get_content_by_id,
+    is_current_version,
     list_contents,
     list_contents_count,
     update_content_status,
@@ -27,6 +32,15 @@ logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_api_key)])
 
 
+def _check_expected_version(content: dict, expected_updated_at: datetime | None) -> None:
+    """Reject stale admin actions before the resume is queued (409 Conflict)."""
+    if expected_updated_at is not None and not is_current_version(content, expected_updated_at):
+        raise HTTPException(
+            status_code=409,
+            detail="Content was modified since it was loaded; refresh and retry",
+        )
+
+
 @router.get("/", response_model=ContentListResponse)
 async def list_all_contents(
     status: str | None = None,
@@ -51,63 +65,139 @@ async def get_content_detail(content_id: str):
     return ContentResponse(**content)
 
 
-@router.post("/{content_id}/approve", response_model=ContentResponse)
-async def approve_content(
+async def _queue_decision(
+    request: Request,
     content_id: str,
-    body: ApproveRequest,
-    graph: CompiledStateGraph = Depends(get_graph),
-):
-    """Approve content and resume the paused pipeline."""
+    expected_updated_at: datetime | None,
+    idempotency_key: str | None,
+    resume: dict,
+    status: str,
+    **status_fields: str | None,
+) -> ResumeTicketResponse:
+    """Apply the decision to the content record and queue the graph resume.
+
+    A thread has at most one live resume job: the job's idempotency key is
+    per thread whatever ``Idempotency-Key`` the caller sends. Repeating the
+    decision returns that job's ticket; a different decision, or any
+    decision on content no longer pending, is a 409. A resume that failed
+    for good gives the decision back, and its key can be used again.
+    """
     content = await get_content_by_id(content_id)
     if content is None:
         raise HTTPException(status_code=404, detail="Content not found")
 
     thread_id = content["thread_id"]
-    config = {"configurable": {"thread_id": thread_id}}
+    key = f"{PIPELINE_RESUME}:{thread_id}"
+    queue = get_job_queue()
 
+    # A repeat gets the first ticket back, before its now-stale version is checked
+    existing = await queue.get_by_key(key)
+    if existing is not None and existing.status != "failed":
+        return _repeated(existing, content, resume)
+
+    if content["status"] != "pending":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Content is not awaiting a decision (status: {content['status']})",
+        )
+    _check_expected_version(content, expected_updated_at)
     try:
-        await graph.ainvoke(
-            Command(resume={"decision": "approved"}),
-            config=config,
+        updated = await update_content_status(
+            content_id, status, expected_updated_at=content["updated_at"], **status_fields
         )
-    except Exception as exc:
-        logger.exception("Failed to resume graph for content %s", content_id)
+    except ContentConflictError as exc:
+        existing = await queue.get_by_key(key)
+        if existing is not None and existing.status != "failed":
+            return _repeated(existing, await get_content_by_id(content_id) or content, resume)
         raise HTTPException(
-            status_code=500, detail=f"Graph resume failed: {exc}"
+            status_code=409,
+            detail="Content was modified since it was loaded; refresh and retry",
         ) from exc
 
-    updated = await update_content_status(
-        content_id, "approved", admin_feedback=body.feedback
+    job = await queue.enqueue(
+        PIPELINE_RESUME,
+        thread_id,
+        {
+            "resume": resume,
+            "content_id": content_id,
+            "previous_status": content["status"],
+            "request_key": idempotency_key,
+        },
+        priority="interactive",  # an admin is waiting on the outcome
+        idempotency_key=key,
+    )
+    await get_run_status_registry().resuming(thread_id)
+    publish_progress(
+        thread_id, "status", "admin_gate", pipeline_status=RESUMING, previous="awaiting_approval"
     )
-    return ContentResponse(**updated)
+    pool = getattr(request.app.state, "worker_pool", None)
+    if pool is not None:
+        pool.notify()
+    return _ticket(job, updated)
 
 
-@router.post("/{content_id}/reject", response_model=ContentResponse)
-async def reject_content(
+def _repeated(job: Job, content: dict, resume: dict) -> ResumeTicketResponse:
+    """Ticket of the live resume job, if ``resume`` repeats its decision."""
+    queued = job.payload["resume"]["decision"]
+    if queued != resume["decision"]:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Content already has a queued '{queued}' decision",
+        )
+    return _ticket(job, content, duplicate=True)
+
+
+def _ticket(job: Job, content: dict, *, duplicate: bool = False) -> ResumeTicketResponse:
+    return ResumeTicketResponse(
+        job_id=job.id,
+        thread_id=job.thread_id,
+        decision=job.payload["resume"]["decision"],
+        job_status=job.status,
+        duplicate=duplicate,
+        content=ContentResponse(**content),
+        status_url=f"/api/pipeline/status/{job.thread_id}",
+        stream_url=f"/api/pipeline/stream/{job.thread_id}",
+        job_url=f"/api/pipeline/jobs/{job.id}",
+    )
+
+
+@router.post("/{content_id}/approve", response_model=ResumeTicketResponse, status_code=202)
+async def approve_content(
     content_id: str,
-    body: RejectRequest,
-    graph: CompiledStateGraph = Depends(get_graph),
+    body: ApproveRequest,
+    request: Request,
+    idempotency_key: str | None = Header(default=None),
 ):
-    """Reject content and resume the paused pipeline with rejection."""
-    content = await get_content_by_id(content_id)
-    if content is None:
-        raise HTTPException(status_code=404, detail="Content not found")
+    """Approve content and queue the resume of the paused pipeline (202).
+
+    The content is marked approved immediately; publishing happens on a
+    job worker. Follow progress at the returned ``stream_url``.
+    """
+    return await _queue_decision(
+        request,
+        content_id,
+        body.expected_updated_at,
+        idempotency_key,
+        {"decision": "approved", "feedback": body.feedback},
+        "approved",
+        admin_feedback=body.feedback,
+    )
 
-    thread_id = content["thread_id"]
-    config = {"configurable": {"thread_id": thread_id}}
 
-    try:
-        await graph.ainvoke(
-            Command(resume={"decision": "rejected", "reason": body.reason}),
-            config=config,
-        )
-    except Exception as exc:
-        logger.exception("Failed to resume graph for content %s", content_id)
-        raise HTTPException(
-            status_code=500, detail=f"Graph resume failed: {exc}"
-        ) from exc
-
-    updated = await update_content_status(
-        content_id, "rejected", rejection_reason=body.reason
+@router.post("/{content_id}/reject", response_model=ResumeTicketResponse, status_code=202)
+async def reject_content(
+    content_id: str,
+    body: RejectRequest,
+    request: Request,
+    idempotency_key: str | None = Header(default=None),
+):
+    """Reject content and queue the resume of the paused pipeline with rejection (202)."""
+    return await _queue_decision(
+        request,
+        content_id,
+        body.expected_updated_at,
+        idempotency_key,
+        {"decision": "rejected", "reason": body.reason},
+        "rejected",
+        rejection_reason=body.reason,
     )
-    return ContentResponse(**updated)
@@ -5,13 +5,21 @@ from __future__ import annotations
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+from editorial_ai.observability import get_loop_monitor
+from editorial_ai.observability.metrics import CONTENT_TYPE, render_metrics
 
 router = APIRouter()
 
 
 @router.get("/health")
 async def health_check(request: Request):
-    """Probe Supabase, required tables, and checkpointer connectivity."""
+    """Probe Supabase, required tables, and checkpointer connectivity.
+
+    Also reports event-loop lag percentiles so blocking calls on the
+    API worker's loop are visible without a profiler.
+    """
     checks: dict = {}
     overall = "healthy"
     client = None
@@ -56,8 +64,17 @@ async def health_check(request: Request):
         checks["checkpointer"] = {"status": "unhealthy", "error": str(e)}
         overall = "unhealthy"
 
+    # 4. Event loop lag (informational — does not affect overall status)
+    checks["event_loop"] = get_loop_monitor().snapshot()
+
     return {
         "status": overall,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "checks": checks,
     }
+
+
+@router.get("/metrics")
+async def metrics() -> Response:
+    """Prometheus scrape endpoint (text exposition format)."""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
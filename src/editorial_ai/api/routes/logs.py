@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException
 
@@ -11,10 +12,12 @@ from editorial_ai.api.schemas import (
     LogsResponse,
     NodeRunLogResponse,
     PipelineRunSummaryResponse,
+    ProfileInfoResponse,
+    SpanResponse,
     TokenUsageResponse,
 )
 from editorial_ai.observability.models import PipelineRunSummary
-from editorial_ai.observability.storage import read_node_logs
+from editorial_ai.observability.storage import read_node_logs_async
 from editorial_ai.services.content_service import get_content_by_id
 
 logger = logging.getLogger(__name__)
@@ -22,6 +25,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter(dependencies=[Depends(verify_api_key)])
 
 
+def _offset_ms(run_start: datetime | None, ts: datetime) -> float:
+    if run_start is None:
+        return 0.0
+    return round((ts - run_start).total_seconds() * 1000, 3)
+
+
 @router.get("/{content_id}/logs", response_model=LogsResponse)
 async def get_content_logs(content_id: str, include_io: bool = True):
     """Return node-level execution logs for a content's pipeline run.
@@ -38,12 +47,13 @@ async def get_content_logs(content_id: str, include_io: bool = True):
     thread_id: str = content["thread_id"]
 
     # 2. Read node logs from JSONL storage
-    node_logs = read_node_logs(thread_id)
+    node_logs = await read_node_logs_async(thread_id)
 
     # 3. Sort chronologically
     node_logs.sort(key=lambda log: log.started_at)
 
-    # 4. Convert to response models
+    # 4. Convert to response models (offsets place nodes and spans on a waterfall)
+    run_start = node_logs[0].started_at if node_logs else None
     runs: list[NodeRunLogResponse] = []
     for log in node_logs:
         token_usage_resp = [
@@ -52,10 +62,24 @@ async def get_content_logs(content_id: str, include_io: bool = True):
                 completion_tokens=tu.completion_tokens,
                 total_tokens=tu.total_tokens,
                 model_name=tu.model_name,
+                routing_reason=tu.routing_reason,
+                routing_version=tu.routing_version,
+                cached_tokens=tu.cached_tokens,
+                images=tu.images,
+                cost_usd=tu.cost_usd,
+                price_version=tu.price_version,
             )
             for tu in log.token_usage
         ]
 
+        spans_resp = [
+            SpanResponse(
+                **span.model_dump(exclude={"started_at"}),
+                offset_ms=_offset_ms(run_start, span.started_at),
+            )
+            for span in log.spans
+        ]
+
         runs.append(
             NodeRunLogResponse(
                 node_name=log.node_name,
@@ -63,15 +87,24 @@ async def get_content_logs(content_id: str, include_io: bool = True):
                 started_at=log.started_at,
                 ended_at=log.ended_at,
                 duration_ms=log.duration_ms,
+                offset_ms=_offset_ms(run_start, log.started_at),
                 token_usage=token_usage_resp,
                 total_prompt_tokens=log.total_prompt_tokens,
                 total_completion_tokens=log.total_completion_tokens,
                 total_tokens=log.total_tokens,
                 prompt_chars=log.prompt_chars,
+                prompt_chars_untrimmed=log.prompt_chars_untrimmed,
+                prompt_trims=log.prompt_trims,
+                cost_usd=log.cost_usd,
                 error_type=log.error_type,
                 error_message=log.error_message,
                 input_state=log.input_state if include_io else None,
                 output_state=log.output_state if include_io else None,
+                snapshot_mode=log.snapshot_mode,
+                snapshot_bytes=log.snapshot_bytes,
+                spans=spans_resp,
+                profile=ProfileInfoResponse(**log.profile.model_dump()) if log.profile else None,
+                budget_decisions=log.budget_decisions,
             )
         )
 
@@ -89,6 +122,12 @@ async def get_content_logs(content_id: str, include_io: bool = True):
             status=agg.status,
             started_at=agg.started_at,
             ended_at=agg.ended_at,
+            total_cost_usd=agg.total_cost_usd,
+            published=agg.published,
+            cost_per_published_article=agg.cost_per_published_article,
+            revision_loops=agg.revision_loops,
+            revision_cost_usd=agg.revision_cost_usd,
+            cost_per_revision_loop=agg.cost_per_revision_loop,
         )
 
     return LogsResponse(
@@ -0,0 +1,175 @@
+"""Cross-run observability stats, job queue lanes and model routing endpoints."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from editorial_ai.api.deps import verify_api_key
+from editorial_ai.api.schemas import (
+    CacheStatsResponse,
+    LaneStatsResponse,
+    ObservabilityStatsResponse,
+    QueueStatsResponse,
+    RoutingConfigResponse,
+    RoutingHealthResponse,
+    RoutingReloadRequest,
+)
+from editorial_ai.config import settings
+from editorial_ai.io_executor import run_io
+from editorial_ai.jobs import get_job_queue
+from editorial_ai.observability.loop_monitor import percentile
+from editorial_ai.observability.stats_store import GROUP_BY_COLUMNS, get_stats_store
+from editorial_ai.priority import get_llm_gate
+from editorial_ai.routing import (
+    ModelRouter,
+    RoutingConfigError,
+    RoutingConfigReadOnlyError,
+    get_model_health,
+    get_model_router,
+    reload_model_router,
+    write_routing_config,
+)
+from editorial_ai.routing.model_router import config_path
+
+router = APIRouter(dependencies=[Depends(verify_api_key)])
+
+
+@router.get("/stats", response_model=ObservabilityStatsResponse)
+async def get_stats(
+    since: date | None = None,
+    until: date | None = None,
+    days: int = Query(default=7, ge=1, le=366),
+    node_name: str | None = None,
+    model_name: str | None = None,
+    routing_reason: str | None = None,
+    group_by: list[str] = Query(default=["node_name"]),
+):
+    """Duration percentiles, token and cost totals and cache-hit ratios across runs.
+
+    Query params:
+        since/until: Inclusive UTC day range (default: the last ``days`` days)
+        node_name/model_name/routing_reason: Optional filters
+        group_by: Any of node_name, model_name, routing_reason, day (repeatable)
+    """
+    unknown = [g for g in group_by if g not in GROUP_BY_COLUMNS]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid group_by {unknown}; expected any of {list(GROUP_BY_COLUMNS)}",
+        )
+    until = until or datetime.now(timezone.utc).date()
+    since = since or until - timedelta(days=days - 1)
+
+    result = await run_io(
+        get_stats_store().stats,
+        since=since,
+        until=until,
+        node_name=node_name,
+        model_name=model_name,
+        routing_reason=routing_reason,
+        group_by=group_by,
+    )
+    return ObservabilityStatsResponse(since=since, until=until, **result)
+
+
+@router.get("/cache", response_model=CacheStatsResponse)
+async def get_cache_stats(
+    since: date | None = None,
+    until: date | None = None,
+    days: int = Query(default=7, ge=1, le=366),
+):
+    """Share of prompt tokens served from cache, per route and model."""
+    until = until or datetime.now(timezone.utc).date()
+    since = since or until - timedelta(days=days - 1)
+    result = await run_io(get_stats_store().cache_stats, since=since, until=until)
+    return CacheStatsResponse(since=since, until=until, **result)
+
+
+def _lane_response(priority: str, stats: dict) -> LaneStatsResponse:
+    waits = stats["waits"]
+    counts = stats["counts"]
+    return LaneStatsResponse(
+        priority=priority,
+        queued=counts.get("queued", 0),
+        running=counts.get("running", 0),
+        started=len(waits),
+        wait_avg_s=round(sum(waits) / len(waits), 3) if waits else None,
+        wait_p50_s=round(percentile(waits, 50), 3) if waits else None,
+        wait_p95_s=round(percentile(waits, 95), 3) if waits else None,
+        wait_max_s=round(max(waits), 3) if waits else None,
+    )
+
+
+@router.get("/queue", response_model=QueueStatsResponse)
+async def get_queue_stats(hours: float = Query(default=24, gt=0, le=24 * 31)):
+    """Queue depth and queue wait (enqueue to first claim) per priority lane.
+
+    Waits cover jobs first claimed in the last ``hours``. The LLM gate
+    figures are this process's only.
+    """
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    lanes = await get_job_queue().lane_stats(since.timestamp())
+    gate = get_llm_gate()
+    return QueueStatsResponse(
+        since=since,
+        lanes=[_lane_response(priority, stats) for priority, stats in lanes.items()],
+        lane_weights=settings.job_lane_weights,
+        llm_max_concurrency=gate.limit,
+        llm_in_use=gate.in_use,
+        llm_waiting=gate.waiting,
+    )
+
+
+@router.get("/routing/health", response_model=RoutingHealthResponse)
+async def get_routing_health():
+    """EWMA latency, error/timeout rates and circuit state per model."""
+    return RoutingHealthResponse(
+        adaptive=get_model_router().adaptive,
+        models=get_model_health().snapshot(),
+    )
+
+
+def _routing_config_response(router: ModelRouter, *, applied: bool = True) -> RoutingConfigResponse:
+    return RoutingConfigResponse(
+        version=router.version,
+        path=str(router.path),
+        loaded_at=router.loaded_at if applied else None,
+        applied=applied,
+        adaptive=router.adaptive,
+        fallback_model=router.fallback_model,
+        routes={name: asdict(route) for name, route in router.routes.items()},
+    )
+
+
+@router.get("/routing", response_model=RoutingConfigResponse)
+async def get_routing_config():
+    """The active routing config and its version stamp."""
+    return _routing_config_response(get_model_router())
+
+
+@router.post("/routing/reload", response_model=RoutingConfigResponse)
+async def reload_routing_config(body: RoutingReloadRequest | None = None):
+    """Validate and hot-swap the routing config.
+
+    Without ``config`` the file on disk is reloaded; with it the file is
+    replaced first, which needs ROUTING_CONFIG_PATH (409 otherwise: the
+    packaged default is never overwritten). ``dry_run`` only validates. An
+    invalid config returns 422 and the current router stays active.
+    """
+    body = body or RoutingReloadRequest()
+    try:
+        if body.dry_run:
+            candidate = await run_io(ModelRouter, config_path(), data=body.config)
+            return _routing_config_response(candidate, applied=False)
+        if body.config is not None:
+            active = await run_io(write_routing_config, body.config)
+        else:
+            active = await run_io(reload_model_router)
+    except RoutingConfigError as exc:
+        raise HTTPException(status_code=422, detail=f"Invalid routing config: {exc}") from exc
+    except RoutingConfigReadOnlyError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return _routing_config_response(active)
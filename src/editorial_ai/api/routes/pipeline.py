@@ -1,12 +1,16 @@
-"""Pipeline trigger and status endpoints."""
+"""Pipeline trigger (single, batch and replay), status and live progress endpoints."""
 
 from __future__ import annotations
 
-import asyncio
+import json
 import logging
+import time
 import uuid
+from collections import Counter
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
 from langgraph.graph.state import CompiledStateGraph
 
 from editorial_ai.api.deps import get_graph, verify_api_key
@@ -16,13 +20,74 @@ from editorial_ai.api.routes.sources import (
     _fetch_products_by_ids,
     _build_curated_topics,
 )
-from editorial_ai.api.schemas import TriggerRequest, TriggerResponse
+from editorial_ai.api.schemas import (
+    BatchItemResponse,
+    BatchRunResponse,
+    BatchStatusResponse,
+    BatchTriggerRequest,
+    BatchTriggerResponse,
+    JobResponse,
+    ProfileArtifactResponse,
+    ProfileListResponse,
+    ReplayRequest,
+    ReplayResponse,
+    RunStatusListResponse,
+    RunStatusResponse,
+    TriggerRequest,
+    TriggerResponse,
+)
+from editorial_ai.batch import get_shared_work
+from editorial_ai.budget import build_budget
+from editorial_ai.config import settings
+from editorial_ai.io_executor import run_io
+from editorial_ai.jobs import PIPELINE_REPLAY, PIPELINE_RUN, get_job_queue
+from editorial_ai.observability.events import ProgressEvent, get_event_bus
+from editorial_ai.observability.run_status import (
+    RunStatus,
+    get_run_status_registry,
+    status_from_state,
+)
+from editorial_ai.observability.profiling import list_profile_artifacts
+from editorial_ai.replay import plan_replay
+from editorial_ai.routing import get_model_router
 from editorial_ai.services.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(dependencies=[Depends(verify_api_key)])
 
+_TRUTHY = {"1", "true", "yes", "on"}
+_PROFILE_FORMATS = {".prof": "pstats", ".collapsed": "collapsed"}
+_MAX_STATUS_IDS = 200
+
+
+def _wants_profile(body: TriggerRequest, x_profile: str | None) -> bool:
+    requested = body.profile or (x_profile or "").strip().lower() in _TRUTHY
+    if requested and not settings.profiling_enabled:
+        logger.warning("Profiling requested but PROFILING_ENABLED is false; ignoring")
+        return False
+    return requested
+
+
+def _check_model_overrides(overrides: dict[str, str] | None) -> None:
+    if not overrides:
+        return
+    routes = get_model_router().routes
+    unknown = sorted(route for route in overrides if route not in routes)
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"Unknown routes in model_overrides: {unknown}; "
+                f"expected any of {sorted(routes)}"
+            ),
+        )
+    empty = sorted(route for route, model in overrides.items() if not model.strip())
+    if empty:
+        raise HTTPException(
+            status_code=422, detail=f"Empty model names in model_overrides: {empty}"
+        )
+
 
 async def _resolve_db_sources(body: TriggerRequest) -> dict:
     """Resolve selected DB source IDs into pipeline-ready state."""
@@ -39,19 +104,16 @@ async def _resolve_db_sources(body: TriggerRequest) -> dict:
     }
 
 
-@router.post("/trigger", response_model=TriggerResponse)
-async def trigger_pipeline(
+def _initial_state(
     body: TriggerRequest,
-    graph: CompiledStateGraph = Depends(get_graph),
-):
-    """Start a new pipeline run. Returns immediately with thread_id for polling."""
-    thread_id = str(uuid.uuid4())
-    config = {"configurable": {"thread_id": thread_id}}
-
-    # Build initial state based on mode
+    thread_id: str,
+    *,
+    profiling: bool,
+    db_data: dict | None = None,
+    default_priority: str | None = None,
+) -> dict:
+    """Initial graph state for a trigger (``db_data``: resolved DB sources)."""
     if body.mode == "db_source":
-        # Resolve DB sources before launching pipeline
-        db_data = await _resolve_db_sources(body)
         initial_state = {
             "thread_id": thread_id,
             "curation_input": {
@@ -62,8 +124,8 @@ async def trigger_pipeline(
                 "mode": "db_source",
             },
             # Pre-populated from DB — curation and source nodes will skip
-            "curated_topics": db_data["curated_topics"],
-            "enriched_contexts": db_data["enriched_contexts"],
+            "curated_topics": (db_data or {}).get("curated_topics", []),
+            "enriched_contexts": (db_data or {}).get("enriched_contexts", []),
         }
     elif body.mode == "ai_db_search":
         initial_state = {
@@ -89,26 +151,414 @@ async def trigger_pipeline(
             },
         }
 
-    async def _run_pipeline() -> None:
-        try:
-            await graph.ainvoke(initial_state, config=config)
-        except Exception:
-            logger.exception("Pipeline failed for thread %s", thread_id)
+    if profiling:
+        initial_state["profile"] = True
+    budget = build_budget(**(body.budget.model_dump() if body.budget else {}))
+    if budget:
+        initial_state["budget"] = budget
+    if body.model_overrides:
+        initial_state["model_overrides"] = body.model_overrides
+    initial_state["priority"] = body.priority or default_priority or (
+        "interactive" if body.mode == "db_source" else "standard"
+    )
+    return initial_state
+
+
+@router.post("/trigger", response_model=TriggerResponse)
+async def trigger_pipeline(
+    body: TriggerRequest,
+    request: Request,
+    x_profile: str | None = Header(default=None),
+):
+    """Queue a new pipeline run. Returns immediately with thread_id for polling.
+
+    The run executes on a job worker (bounded concurrency, retried with
+    backoff, resumed from its checkpoint after a crash); ``job_id`` can be
+    polled at ``/api/pipeline/jobs/{job_id}``.
 
-    asyncio.create_task(_run_pipeline())
+    Set ``profile: true`` (or send ``X-Profile: 1``) to record per-node
+    profiles, listed at ``/api/pipeline/profiles/{thread_id}``.
+    ``model_overrides`` pins routing config routes to models for this run.
+
+    ``priority`` picks the scheduling lane (default: interactive for
+    ``db_source``, where an admin waits on the result, else standard); it
+    also orders the run's LLM calls at the capacity gate. ``tenant``
+    (default: the category) is the key for per-tenant running-job quotas.
+    """
+    _check_model_overrides(body.model_overrides)
+    thread_id = str(uuid.uuid4())
+    profiling = _wants_profile(body, x_profile)
+
+    # DB Source mode: resolve sources before launching the pipeline
+    db_data = await _resolve_db_sources(body) if body.mode == "db_source" else None
+    initial_state = _initial_state(body, thread_id, profiling=profiling, db_data=db_data)
+    priority = initial_state["priority"]
+
+    job = await get_job_queue().enqueue(
+        PIPELINE_RUN,
+        thread_id,
+        {"initial_state": initial_state},
+        priority=priority,
+        tenant=body.tenant or body.category,
+    )
+    await get_run_status_registry().enqueued(thread_id)
+    pool = getattr(request.app.state, "worker_pool", None)
+    if pool is not None:
+        pool.notify()
 
     return TriggerResponse(
         thread_id=thread_id,
-        message="Pipeline started, poll /api/pipeline/status/{thread_id} for progress",
+        message="Pipeline queued, poll /api/pipeline/status/{thread_id} for progress",
+        profiling=profiling,
+        job_id=job.id,
     )
 
 
-@router.get("/status/{thread_id}")
-async def pipeline_status(
-    thread_id: str,
-    graph: CompiledStateGraph = Depends(get_graph),
-):
-    """Return current pipeline status for progress polling."""
+@router.post("/replay", response_model=ReplayResponse, status_code=202)
+async def replay_pipeline(body: ReplayRequest, request: Request):
+    """Queue a new run forked from ``thread_id`` that recomputes from ``from_node`` on.
+
+    The new thread starts from the source run's input; nodes upstream of
+    ``from_node`` return their memoized outputs from the source run (see
+    ``editorial_ai.replay``), so only ``from_node`` and what follows it run.
+    404 when the source thread has no checkpoint, 422 when ``from_node`` is
+    unknown or never ran in it.
+    """
+    _check_model_overrides(body.model_overrides)
+    graph: CompiledStateGraph = get_graph(request)
+    try:
+        plan = await plan_replay(graph, body.thread_id, body.from_node)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    thread_id = str(uuid.uuid4())
+    profiling = body.profile and settings.profiling_enabled
+    initial_state = {**plan.initial_state, "thread_id": thread_id, "profile": profiling}
+    initial_state.pop("batch_id", None)
+    if body.model_overrides is not None:
+        initial_state["model_overrides"] = body.model_overrides
+    priority = body.priority or initial_state.get("priority") or "interactive"
+    initial_state["priority"] = priority
+
+    job = await get_job_queue().enqueue(
+        PIPELINE_REPLAY,
+        thread_id,
+        {
+            "initial_state": initial_state,
+            "source_thread_id": body.thread_id,
+            "from_node": body.from_node,
+        },
+        priority=priority,
+    )
+    await get_run_status_registry().enqueued(thread_id)
+    pool = getattr(request.app.state, "worker_pool", None)
+    if pool is not None:
+        pool.notify()
+
+    return ReplayResponse(
+        thread_id=thread_id,
+        source_thread_id=body.thread_id,
+        from_node=body.from_node,
+        reused_nodes=plan.reused_nodes,
+        job_id=job.id,
+        profiling=profiling,
+        status_url=f"/api/pipeline/status/{thread_id}",
+        stream_url=f"/api/pipeline/stream/{thread_id}",
+        job_url=f"/api/pipeline/jobs/{job.id}",
+    )
+
+
+async def _resolve_batch_db_sources(items: dict[int, TriggerRequest]) -> dict[int, dict]:
+    """Resolve the DB sources of many ``db_source`` items with one fetch per table."""
+    if not items:
+        return {}
+    client = await get_supabase_client()
+
+    def _union(field: str) -> list[str]:
+        return list(dict.fromkeys(i for item in items.values() for i in getattr(item, field) or []))
+
+    posts = {p["id"]: p for p in await _fetch_posts_by_ids(client, _union("selected_posts"))}
+    celebs = {c["id"]: c for c in await _fetch_celebs_by_ids(client, _union("selected_celebs"))}
+    products = {
+        p["id"]: p for p in await _fetch_products_by_ids(client, _union("selected_products"))
+    }
+
+    resolved = {}
+    for index, item in items.items():
+        item_posts = [posts[i] for i in item.selected_posts or [] if i in posts]
+        resolved[index] = {
+            "curated_topics": _build_curated_topics(
+                item_posts,
+                [celebs[i] for i in item.selected_celebs or [] if i in celebs],
+                [products[i] for i in item.selected_products or [] if i in products],
+                item.category,
+            ),
+            "enriched_contexts": item_posts,
+        }
+    return resolved
+
+
+@router.post("/trigger-batch", response_model=BatchTriggerResponse)
+async def trigger_batch(body: BatchTriggerRequest, request: Request):
+    """Queue one run per item under a new ``batch_id``.
+
+    Identical items get one run (``duplicate_of`` points at the first).
+    ``db_source`` items are resolved with one fetch per table for the
+    whole batch, and inside the runs the DB context, keyword expansions
+    and source searches are shared by the batch (``editorial_ai.batch``).
+    Items default to the batch lane. Progress and throughput:
+    ``/api/pipeline/batches/{batch_id}``.
+    """
+    if len(body.items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=422, detail=f"At most {settings.batch_max_items} items per batch"
+        )
+    for item in body.items:
+        _check_model_overrides(item.model_overrides)
+
+    batch_id = str(uuid.uuid4())
+    first_index: dict[str, int] = {}
+    duplicates: dict[int, int] = {}
+    for index, item in enumerate(body.items):
+        duplicates[index] = first_index.setdefault(item.model_dump_json(), index)
+    unique = [i for i, first in duplicates.items() if first == i]
+    db_data = await _resolve_batch_db_sources(
+        {i: body.items[i] for i in unique if body.items[i].mode == "db_source"}
+    )
+
+    queue = get_job_queue()
+    registry = get_run_status_registry()
+    runs: dict[int, BatchItemResponse] = {}
+    for index in unique:
+        item = body.items[index]
+        thread_id = str(uuid.uuid4())
+        initial_state = _initial_state(
+            item,
+            thread_id,
+            profiling=_wants_profile(item, None),
+            db_data=db_data.get(index),
+            default_priority=body.priority,
+        )
+        initial_state["batch_id"] = batch_id
+        job = await queue.enqueue(
+            PIPELINE_RUN,
+            thread_id,
+            {"initial_state": initial_state},
+            priority=initial_state["priority"],
+            tenant=item.tenant or body.tenant or item.category,
+            batch_id=batch_id,
+        )
+        await registry.enqueued(thread_id)
+        runs[index] = BatchItemResponse(index=index, thread_id=thread_id, job_id=job.id)
+    pool = getattr(request.app.state, "worker_pool", None)
+    if pool is not None:
+        pool.notify()
+
+    items = [
+        runs[index]
+        if first == index
+        else runs[first].model_copy(update={"index": index, "duplicate_of": first})
+        for index, first in duplicates.items()
+    ]
+    return BatchTriggerResponse(
+        batch_id=batch_id,
+        items=items,
+        queued=len(unique),
+        status_url=f"/api/pipeline/batches/{batch_id}",
+    )
+
+
+def _utc(ts: float | None) -> datetime | None:
+    return datetime.fromtimestamp(ts, tz=timezone.utc) if ts is not None else None
+
+
+@router.get("/batches/{batch_id}", response_model=BatchStatusResponse)
+async def batch_status(batch_id: str):
+    """Progress of a batch: runs by job and pipeline status, throughput, ETA.
+
+    A run is completed once its job succeeded (the graph reached the admin
+    gate or finished) or failed for good. Throughput counts completed runs
+    per minute since the first run started.
+    """
+    jobs = await get_job_queue().list_batch(batch_id)
+    if not jobs:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    statuses = await get_run_status_registry().get_many([j.thread_id for j in jobs])
+
+    job_counts = Counter(j.status for j in jobs)
+    completed = job_counts["succeeded"] + job_counts["failed"]
+    created = min(j.created_at for j in jobs)
+    starts = [j.started_at for j in jobs if j.started_at is not None]
+    first_start = min(starts) if starts else None
+    finished = max(j.updated_at for j in jobs) if completed == len(jobs) else None
+    end = finished or time.time()
+
+    throughput = eta = None
+    if first_start is not None and completed and end > first_start:
+        per_s = completed / (end - first_start)
+        throughput = per_s * 60
+        eta = (len(jobs) - completed) / per_s
+    waits = [j.queue_wait_s for j in jobs if j.queue_wait_s is not None]
+
+    return BatchStatusResponse(
+        batch_id=batch_id,
+        total=len(jobs),
+        jobs=dict(job_counts),
+        pipeline_statuses=dict(Counter(s.pipeline_status or "unknown" for s in statuses.values())),
+        completed=completed,
+        failed=job_counts["failed"],
+        progress=completed / len(jobs),
+        created_at=_utc(created),
+        first_started_at=_utc(first_start),
+        finished_at=_utc(finished),
+        elapsed_s=end - created,
+        throughput_per_min=throughput,
+        eta_s=eta,
+        queue_wait_avg_s=sum(waits) / len(waits) if waits else None,
+        queue_wait_max_s=max(waits) if waits else None,
+        shared_work=get_shared_work().stats(batch_id),
+        runs=[
+            BatchRunResponse(
+                thread_id=j.thread_id,
+                job_id=j.id,
+                job_status=j.status,
+                pipeline_status=(
+                    statuses[j.thread_id].pipeline_status if j.thread_id in statuses else None
+                ),
+                attempts=j.attempts,
+                last_error=j.last_error,
+            )
+            for j in jobs
+        ],
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """State of a queued pipeline job (attempts, lease, last error)."""
+    job = await get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(
+        job_id=job.id,
+        kind=job.kind,
+        thread_id=job.thread_id,
+        status=job.status,
+        priority=job.priority,
+        tenant=job.tenant,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        last_error=job.last_error,
+        created_at=datetime.fromtimestamp(job.created_at, tz=timezone.utc),
+        updated_at=datetime.fromtimestamp(job.updated_at, tz=timezone.utc),
+        run_after=datetime.fromtimestamp(job.run_after, tz=timezone.utc),
+        started_at=(
+            datetime.fromtimestamp(job.started_at, tz=timezone.utc) if job.started_at else None
+        ),
+        queue_wait_s=job.queue_wait_s,
+    )
+
+
+def _sse_message(event: ProgressEvent, event_id: int) -> str:
+    data = {
+        "thread_id": event.thread_id, "node_name": event.node_name, "ts": event.ts, **event.data
+    }
+    return f"id: {event_id}\nevent: {event.type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _progress_stream(thread_id: str, request: Request):
+    # Subscribe only once the response streams: a client gone before that
+    # leaves nothing behind, and the ``with`` unsubscribes on any exit
+    bus = get_event_bus()
+    with bus.subscribe(thread_id) as subscription:
+        initial = bus.last_status(thread_id)
+        event_id = 0
+        if initial is not None:
+            event_id += 1
+            yield _sse_message(initial, event_id)
+            if initial.settled:
+                return
+        while True:
+            event = await subscription.get(timeout=settings.progress_stream_keepalive_s)
+            if event is None:
+                if await request.is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            event_id += 1
+            yield _sse_message(event, event_id)
+            if event.settled:
+                return
+
+
+@router.get("/stream/{thread_id}")
+async def stream_pipeline(thread_id: str, request: Request):
+    """Live progress of a run as server-sent events (replaces polling ``/status``).
+
+    Events: ``node_started``, ``node_finished`` (status, duration_ms,
+    token counts, cost_usd, pipeline_status), ``status`` (pipeline_status
+    changes) and ``error``. The stream opens with the last status this
+    process saw for the thread, if any, and ends after a settled status
+    (awaiting_approval, published, failed). Comment lines keep idle
+    connections alive. Nothing is replayed: events before the connection
+    are not sent.
+    """
+    return StreamingResponse(
+        _progress_stream(thread_id, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _status_response(status: RunStatus) -> RunStatusResponse:
+    return RunStatusResponse(
+        thread_id=status.thread_id,
+        pipeline_status=status.pipeline_status or "unknown",
+        error_log=status.errors,
+        error_count=status.error_count,
+        has_draft=status.has_draft,
+        current_node=status.current_node,
+        node_state=status.node_state,
+        revision_count=status.revision_count,
+        started_at=datetime.fromtimestamp(status.started_at, tz=timezone.utc),
+        updated_at=datetime.fromtimestamp(status.updated_at, tz=timezone.utc),
+    )
+
+
+@router.get("/status", response_model=RunStatusListResponse)
+async def pipeline_statuses(ids: list[str] = Query(...)):
+    """Status of several runs at once: ``?ids=a,b`` or ``?ids=a&ids=b``.
+
+    Served from the run status registry only; threads it does not know
+    (runs from before it existed) are listed in ``missing``.
+    """
+    thread_ids = list(dict.fromkeys(i.strip() for raw in ids for i in raw.split(",") if i.strip()))
+    if len(thread_ids) > _MAX_STATUS_IDS:
+        raise HTTPException(
+            status_code=422, detail=f"At most {_MAX_STATUS_IDS} ids per request"
+        )
+    found = await get_run_status_registry().get_many(thread_ids)
+    return RunStatusListResponse(
+        statuses=[_status_response(found[t]) for t in thread_ids if t in found],
+        missing=[t for t in thread_ids if t not in found],
+    )
+
+
+@router.get("/status/{thread_id}", response_model=RunStatusResponse)
+async def pipeline_status(thread_id: str, request: Request):
+    """Return current pipeline status for progress polling (see also ``/stream``).
+
+    Read from the run status registry; only threads it has never seen
+    fall back to loading the checkpoint, which then seeds the registry.
+    """
+    registry = get_run_status_registry()
+    status = await registry.get(thread_id)
+    if status is not None:
+        return _status_response(status)
+
+    graph: CompiledStateGraph = get_graph(request)
     config = {"configurable": {"thread_id": thread_id}}
     try:
         state = await graph.aget_state(config)
@@ -117,13 +567,44 @@ async def pipeline_status(
             status_code=500, detail=f"Failed to get state: {exc}"
         ) from exc
 
-    if state is None or state.values is None:
+    if state is None or not state.values:
         raise HTTPException(status_code=404, detail="Thread not found")
 
-    values = state.values
-    return {
-        "thread_id": thread_id,
-        "pipeline_status": values.get("pipeline_status", "unknown"),
-        "error_log": values.get("error_log", []),
-        "has_draft": values.get("current_draft") is not None,
-    }
+    status = status_from_state(thread_id, state.values)
+    await registry.put(status)
+    return _status_response(status)
+
+
+def _profile_artifacts(thread_id: str) -> list[ProfileArtifactResponse]:
+    """Profile artifacts of a thread with their size and time (blocking)."""
+    artifacts = []
+    for path in list_profile_artifacts(thread_id):
+        st = path.stat()
+        artifacts.append(
+            ProfileArtifactResponse(
+                file=path.name,
+                node_name=path.stem.rsplit("-", 1)[0],
+                format=_PROFILE_FORMATS[path.suffix],
+                size_bytes=st.st_size,
+                created_at=datetime.fromtimestamp(st.st_mtime, tz=timezone.utc),
+            )
+        )
+    return artifacts
+
+
+@router.get("/profiles/{thread_id}", response_model=ProfileListResponse)
+async def list_profiles(thread_id: str):
+    """List profile artifacts recorded for a profiled run."""
+    artifacts = await run_io(_profile_artifacts, thread_id)
+    return ProfileListResponse(thread_id=thread_id, artifacts=artifacts)
+
+
+@router.get("/profiles/{thread_id}/{file_name}")
+async def get_profile(thread_id: str, file_name: str):
+    """Download one artifact (pstats for snakeviz, collapsed stacks for flamegraph.pl)."""
+    files = await run_io(list_profile_artifacts, thread_id)
+    path = next((p for p in files if p.name == file_name), None)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile artifact not found")
+    media_type = "text/plain" if path.suffix == ".collapsed" else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=path.name)
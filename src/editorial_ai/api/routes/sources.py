@@ -11,6 +11,7 @@ import logging
 from fastapi import APIRouter, Depends, Query
 
 from editorial_ai.api.deps import verify_api_key
+from editorial_ai.observability import supabase_query
 from editorial_ai.services.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
@@ -96,20 +97,24 @@ async def resolve_sources(body: dict):
 async def _search_posts(client, pattern: str, limit: int) -> list[dict]:
     """Search posts with joined solutions and metadata."""
     try:
-        response = await (
-            client.table("posts")
-            .select("id, image_url, media_type, title, artist_name, group_name, context, view_count, trending_score")
-            .or_(
-                f"artist_name.ilike.{pattern},"
-                f"group_name.ilike.{pattern},"
-                f"context.ilike.{pattern},"
-                f"title.ilike.{pattern}"
+        with supabase_query("posts"):
+            response = await (
+                client.table("posts")
+                .select(
+                    "id, image_url, media_type, title, artist_name, group_name, context, "
+                    "view_count, trending_score"
+                )
+                .or_(
+                    f"artist_name.ilike.{pattern},"
+                    f"group_name.ilike.{pattern},"
+                    f"context.ilike.{pattern},"
+                    f"title.ilike.{pattern}"
+                )
+                .eq("status", "active")
+                .order("trending_score", desc=True)
+                .limit(limit)
+                .execute()
             )
-            .eq("status", "active")
-            .order("trending_score", desc=True)
-            .limit(limit)
-            .execute()
-        )
     except Exception:
         logger.warning("Failed to search posts with pattern: %s", pattern)
         return []
@@ -126,17 +131,18 @@ async def _search_posts(client, pattern: str, limit: int) -> list[dict]:
 async def _search_celebs(client, pattern: str, limit: int) -> list[dict]:
     """Search celebs by name, name_en, description."""
     try:
-        response = await (
-            client.table("celebs")
-            .select("id, name, name_en, category, profile_image_url, description, tags")
-            .or_(
-                f"name.ilike.{pattern},"
-                f"name_en.ilike.{pattern},"
-                f"description.ilike.{pattern}"
+        with supabase_query("celebs"):
+            response = await (
+                client.table("celebs")
+                .select("id, name, name_en, category, profile_image_url, description, tags")
+                .or_(
+                    f"name.ilike.{pattern},"
+                    f"name_en.ilike.{pattern},"
+                    f"description.ilike.{pattern}"
+                )
+                .limit(limit)
+                .execute()
             )
-            .limit(limit)
-            .execute()
-        )
         return response.data or []
     except Exception:
         logger.warning("Failed to search celebs with pattern: %s", pattern)
@@ -146,17 +152,20 @@ async def _search_celebs(client, pattern: str, limit: int) -> list[dict]:
 async def _search_products(client, pattern: str, limit: int) -> list[dict]:
     """Search products by name, brand, description."""
     try:
-        response = await (
-            client.table("products")
-            .select("id, name, brand, category, price, image_url, description, product_url, tags")
-            .or_(
-                f"name.ilike.{pattern},"
-                f"brand.ilike.{pattern},"
-                f"description.ilike.{pattern}"
+        with supabase_query("products"):
+            response = await (
+                client.table("products")
+                .select(
+                    "id, name, brand, category, price, image_url, description, product_url, tags"
+                )
+                .or_(
+                    f"name.ilike.{pattern},"
+                    f"brand.ilike.{pattern},"
+                    f"description.ilike.{pattern}"
+                )
+                .limit(limit)
+                .execute()
             )
-            .limit(limit)
-            .execute()
-        )
         return response.data or []
     except Exception:
         logger.warning("Failed to search products with pattern: %s", pattern)
@@ -166,13 +175,16 @@ async def _search_products(client, pattern: str, limit: int) -> list[dict]:
 async def _fetch_solutions_for_post(client, post_id: str) -> list[dict]:
     """Fetch solutions linked to a post via spots, with flattened metadata."""
     try:
-        response = await (
-            client.table("spots")
-            .select("id, solutions(id, title, thumbnail_url, metadata, link_type, original_url)")
-            .eq("post_id", post_id)
-            .limit(10)
-            .execute()
-        )
+        with supabase_query("spots"):
+            response = await (
+                client.table("spots")
+                .select(
+                    "id, solutions(id, title, thumbnail_url, metadata, link_type, original_url)"
+                )
+                .eq("post_id", post_id)
+                .limit(10)
+                .execute()
+            )
     except Exception:
         return []
 
@@ -201,12 +213,16 @@ async def _fetch_posts_by_ids(client, post_ids: list[str]) -> list[dict]:
     if not post_ids:
         return []
     try:
-        response = await (
-            client.table("posts")
-            .select("id, image_url, media_type, title, artist_name, group_name, context, view_count, trending_score")
-            .in_("id", post_ids)
-            .execute()
-        )
+        with supabase_query("posts"):
+            response = await (
+                client.table("posts")
+                .select(
+                    "id, image_url, media_type, title, artist_name, group_name, context, "
+                    "view_count, trending_score"
+                )
+                .in_("id", post_ids)
+                .execute()
+            )
     except Exception:
         logger.warning("Failed to fetch posts by IDs")
         return []
@@ -222,12 +238,13 @@ async def _fetch_celebs_by_ids(client, celeb_ids: list[str]) -> list[dict]:
     if not celeb_ids:
         return []
     try:
-        response = await (
-            client.table("celebs")
-            .select("id, name, name_en, category, profile_image_url, description, tags")
-            .in_("id", celeb_ids)
-            .execute()
-        )
+        with supabase_query("celebs"):
+            response = await (
+                client.table("celebs")
+                .select("id, name, name_en, category, profile_image_url, description, tags")
+                .in_("id", celeb_ids)
+                .execute()
+            )
         return response.data or []
     except Exception:
         return []
@@ -238,12 +255,15 @@ async def _fetch_products_by_ids(client, product_ids: list[str]) -> list[dict]:
     if not product_ids:
         return []
     try:
-        response = await (
-            client.table("products")
-            .select("id, name, brand, category, price, image_url, description, product_url, tags")
-            .in_("id", product_ids)
-            .execute()
-        )
+        with supabase_query("products"):
+            response = await (
+                client.table("products")
+                .select(
+                    "id, name, brand, category, price, image_url, description, product_url, tags"
+                )
+                .in_("id", product_ids)
+                .execute()
+            )
         return response.data or []
     except Exception:
         return []
@@ -309,7 +329,9 @@ def _build_curated_topics(
 
     return [{
         "keyword": main_keyword,
-        "trend_background": ". ".join(trend_parts) if trend_parts else f"DB-sourced content for {category}",
+        "trend_background": (
+            ". ".join(trend_parts) if trend_parts else f"DB-sourced content for {category}"
+        ),
         "related_keywords": related_keywords[:10],
         "celebrities": celebrities,
     }]
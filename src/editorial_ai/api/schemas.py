@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ContentResponse(BaseModel):
@@ -36,12 +37,41 @@ class ApproveRequest(BaseModel):
     """Request body for approving content."""
 
     feedback: str | None = None
+    # Optimistic concurrency: updated_at the admin saw; mismatch -> 409
+    expected_updated_at: datetime | None = None
 
 
 class RejectRequest(BaseModel):
     """Request body for rejecting content. Reason is required."""
 
     reason: str
+    expected_updated_at: datetime | None = None
+
+
+class ResumeTicketResponse(BaseModel):
+    """Accepted admin decision; the paused run resumes on a job worker.
+
+    Follow ``stream_url`` (or poll ``status_url``/``job_url``) for completion.
+    ``duplicate`` is true when the request repeated one already accepted.
+    """
+
+    job_id: str
+    thread_id: str
+    decision: str
+    job_status: str
+    duplicate: bool = False
+    content: ContentResponse
+    status_url: str
+    stream_url: str
+    job_url: str
+
+
+class RunBudgetRequest(BaseModel):
+    """Per-run budget limits; unset fields fall back to RUN_BUDGET_* settings."""
+
+    max_tokens: int | None = Field(default=None, gt=0)
+    max_cost_usd: float | None = Field(default=None, gt=0)
+    max_wall_s: float | None = Field(default=None, gt=0)
 
 
 class TriggerRequest(BaseModel):
@@ -60,12 +90,164 @@ class TriggerRequest(BaseModel):
     selected_celebs: list[str] | None = None
     selected_products: list[str] | None = None
 
+    # Capture per-node cProfile/tracemalloc artifacts for this run
+    profile: bool = False
+
+    # Token/cost/time limits with progressive degradation (editorial_ai.budget)
+    budget: RunBudgetRequest | None = None
+
+    # Pin routes to models for this run, e.g. {"review": "gemini-2.5-flash-lite"}
+    model_overrides: dict[str, str] | None = None
+
+    # Scheduling lane; default interactive for db_source (an admin is waiting),
+    # standard otherwise
+    priority: Literal["interactive", "standard", "batch"] | None = None
+    # Quota key for JOB_TENANT_QUOTAS; defaults to the category
+    tenant: str | None = None
+
 
 class TriggerResponse(BaseModel):
     """Response after triggering a pipeline run."""
 
     thread_id: str
     message: str
+    profiling: bool = False
+    job_id: str | None = None
+
+
+class ReplayRequest(BaseModel):
+    """Fork a run into a new thread that recomputes from ``from_node`` on."""
+
+    thread_id: str
+    from_node: str
+    # Per-run settings for the new thread; unset ones are copied from the source run
+    model_overrides: dict[str, str] | None = None
+    profile: bool = False
+    priority: Literal["interactive", "standard", "batch"] | None = None
+
+
+class ReplayResponse(BaseModel):
+    """Queued replay; nodes in ``reused_nodes`` return the source run's outputs."""
+
+    thread_id: str
+    source_thread_id: str
+    from_node: str
+    reused_nodes: list[str]
+    job_id: str
+    profiling: bool = False
+    status_url: str
+    stream_url: str
+    job_url: str
+
+
+class BatchTriggerRequest(BaseModel):
+    """Queue many pipeline runs at once under one batch ID."""
+
+    items: list[TriggerRequest] = Field(min_length=1)
+    # Lane for items that don't set their own
+    priority: Literal["interactive", "standard", "batch"] = "batch"
+    # Quota key for items that don't set their own (default: the item's category)
+    tenant: str | None = None
+
+
+class BatchItemResponse(BaseModel):
+    """Run queued for one batch item; identical items share a run."""
+
+    index: int
+    thread_id: str
+    job_id: str
+    duplicate_of: int | None = None  # index of the identical item whose run this is
+
+
+class BatchTriggerResponse(BaseModel):
+    """Response after queueing a batch."""
+
+    batch_id: str
+    items: list[BatchItemResponse]
+    queued: int  # runs queued (items minus duplicates)
+    status_url: str
+
+
+class BatchRunResponse(BaseModel):
+    """One run of a batch."""
+
+    thread_id: str
+    job_id: str
+    job_status: str
+    pipeline_status: str | None = None
+    attempts: int
+    last_error: str | None = None
+
+
+class SharedWorkStatsResponse(BaseModel):
+    """Upstream work of one kind: computed once, then reused by other runs."""
+
+    computed: int = 0
+    reused: int = 0
+
+
+class BatchStatusResponse(BaseModel):
+    """Progress and throughput of a batch."""
+
+    batch_id: str
+    total: int
+    jobs: dict[str, int]  # runs by job status
+    pipeline_statuses: dict[str, int]  # runs by pipeline_status (run status registry)
+    completed: int  # succeeded or failed for good
+    failed: int
+    progress: float  # completed / total
+    created_at: datetime
+    first_started_at: datetime | None = None
+    finished_at: datetime | None = None
+    elapsed_s: float
+    throughput_per_min: float | None = None  # completed runs per minute since the first start
+    eta_s: float | None = None
+    queue_wait_avg_s: float | None = None
+    queue_wait_max_s: float | None = None
+    # Shared work seen by this process only (workers elsewhere keep their own)
+    shared_work: dict[str, SharedWorkStatsResponse] = Field(default_factory=dict)
+    runs: list[BatchRunResponse]
+
+
+class JobResponse(BaseModel):
+    """A queued pipeline job."""
+
+    job_id: str
+    kind: str
+    thread_id: str
+    status: str  # queued | running | succeeded | failed
+    priority: str
+    tenant: str | None = None
+    attempts: int
+    max_attempts: int
+    last_error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    run_after: datetime
+    started_at: datetime | None = None
+    queue_wait_s: float | None = None
+
+
+class RunStatusResponse(BaseModel):
+    """Compact status of a pipeline run (from the run status registry)."""
+
+    thread_id: str
+    pipeline_status: str
+    error_log: list[str] = Field(default_factory=list)  # most recent errors only
+    error_count: int = 0
+    has_draft: bool = False
+    current_node: str | None = None
+    node_state: str | None = None  # running | done | error
+    revision_count: int = 0
+    started_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class RunStatusListResponse(BaseModel):
+    """Bulk status read; ``missing`` lists thread IDs with no known run."""
+
+    statuses: list[RunStatusResponse]
+    missing: list[str] = Field(default_factory=list)
 
 
 class ErrorResponse(BaseModel):
@@ -84,6 +266,40 @@ class TokenUsageResponse(BaseModel):
     completion_tokens: int
     total_tokens: int
     model_name: str | None = None
+    routing_reason: str | None = None
+    routing_version: str | None = None
+    cached_tokens: int = 0
+    images: int = 0
+    cost_usd: float | None = None
+    price_version: str | None = None
+
+
+class SpanResponse(BaseModel):
+    """A sub-node span positioned on the run's waterfall."""
+
+    span_id: int
+    parent_id: int | None = None
+    depth: int = 0
+    name: str
+    kind: str
+    model: str | None = None
+    status: str
+    error_type: str | None = None
+    offset_ms: float  # from the start of the pipeline run
+    latency_ms: float
+    attempts: int = 1
+    request_chars: int = 0
+    response_chars: int = 0
+    cached_tokens: int = 0
+
+
+class ProfileInfoResponse(BaseModel):
+    """Profile summary for one node execution of a profiled run."""
+
+    peak_memory_bytes: int
+    cpu_ms: float
+    pstats_file: str | None = None
+    collapsed_file: str | None = None
 
 
 class NodeRunLogResponse(BaseModel):
@@ -94,15 +310,41 @@ class NodeRunLogResponse(BaseModel):
     started_at: datetime
     ended_at: datetime
     duration_ms: float
+    offset_ms: float = 0.0  # from the start of the pipeline run
     token_usage: list[TokenUsageResponse]
     total_prompt_tokens: int
     total_completion_tokens: int
     total_tokens: int
     prompt_chars: int
+    prompt_chars_untrimmed: int = 0
+    prompt_trims: list[dict] = []
+    cost_usd: float = 0.0
     error_type: str | None = None
     error_message: str | None = None
     input_state: dict | None = None
     output_state: dict | None = None
+    snapshot_mode: str | None = None
+    snapshot_bytes: int = 0
+    spans: list[SpanResponse] = []
+    profile: ProfileInfoResponse | None = None
+    budget_decisions: list[dict] = []
+
+
+class ProfileArtifactResponse(BaseModel):
+    """A downloadable profile artifact."""
+
+    file: str
+    node_name: str
+    format: str  # "pstats" | "collapsed"
+    size_bytes: int
+    created_at: datetime
+
+
+class ProfileListResponse(BaseModel):
+    """Profile artifacts recorded for a pipeline thread."""
+
+    thread_id: str
+    artifacts: list[ProfileArtifactResponse]
 
 
 class PipelineRunSummaryResponse(BaseModel):
@@ -117,6 +359,12 @@ class PipelineRunSummaryResponse(BaseModel):
     status: str
     started_at: datetime | None = None
     ended_at: datetime | None = None
+    total_cost_usd: float = 0.0
+    published: bool = False
+    cost_per_published_article: float | None = None
+    revision_loops: int = 0
+    revision_cost_usd: float = 0.0
+    cost_per_revision_loop: float | None = None
 
 
 class LogsResponse(BaseModel):
@@ -126,3 +374,153 @@ class LogsResponse(BaseModel):
     thread_id: str
     runs: list[NodeRunLogResponse]
     summary: PipelineRunSummaryResponse | None = None
+
+
+# --- Observability stats ---
+
+
+class StatsGroupResponse(BaseModel):
+    """Aggregated node run stats for one rollup group."""
+
+    node_name: str | None = None
+    model_name: str | None = None
+    routing_reason: str | None = None
+    day: str | None = None
+    runs: int
+    errors: int
+    avg_duration_ms: float | None = None
+    p50_duration_ms: float | None = None
+    p95_duration_ms: float | None = None
+    p99_duration_ms: float | None = None
+    llm_calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    cached_tokens: int
+    cache_hit_ratio: float | None = None
+    cost_usd: float = 0.0
+
+
+class StatsTotalsResponse(BaseModel):
+    """Totals across all groups in the requested window."""
+
+    runs: int = 0
+    errors: int = 0
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cached_tokens: int = 0
+    cache_hit_ratio: float | None = None
+    cost_usd: float = 0.0
+    published_articles: int = 0
+    tokens_per_published_article: float | None = None
+    cost_per_published_article: float | None = None
+
+
+class ObservabilityStatsResponse(BaseModel):
+    """Cross-run stats from the observability store."""
+
+    since: date
+    until: date
+    group_by: list[str]
+    groups: list[StatsGroupResponse]
+    totals: StatsTotalsResponse
+
+
+class RouteCacheStatsResponse(BaseModel):
+    """Prompt-cache usage of one route/model pair."""
+
+    route: str
+    model_name: str
+    llm_calls: int
+    prompt_tokens: int
+    cached_tokens: int
+    cache_hit_ratio: float | None = None
+
+
+class CacheStatsResponse(BaseModel):
+    """Cached-token ratio per route (explicit prefix caches and implicit caching)."""
+
+    since: date
+    until: date
+    routes: list[RouteCacheStatsResponse]
+    prompt_tokens: int
+    cached_tokens: int
+    cache_hit_ratio: float | None = None
+
+
+class LaneStatsResponse(BaseModel):
+    """Depth and queue wait of one priority lane."""
+
+    priority: str
+    queued: int = 0
+    running: int = 0
+    started: int = 0  # jobs first claimed in the window
+    wait_avg_s: float | None = None
+    wait_p50_s: float | None = None
+    wait_p95_s: float | None = None
+    wait_max_s: float | None = None
+
+
+class QueueStatsResponse(BaseModel):
+    """Pipeline job queue by priority lane, plus the LLM capacity gate."""
+
+    since: datetime
+    lanes: list[LaneStatsResponse]
+    lane_weights: dict[str, float]
+    llm_max_concurrency: int
+    llm_in_use: int
+    llm_waiting: int
+
+
+class ModelHealthResponse(BaseModel):
+    """Live health of one model as seen by adaptive routing."""
+
+    latency_ms: float | None = None
+    error_rate: float
+    timeout_rate: float
+    samples: int
+    available: bool
+    unavailable_for_s: float
+    unavailable_reason: str | None = None
+
+
+class RoutingHealthResponse(BaseModel):
+    """Per-model health used by the model router."""
+
+    adaptive: bool
+    models: dict[str, ModelHealthResponse]
+
+
+class RouteConfigResponse(BaseModel):
+    """One route of the active routing config."""
+
+    default_model: str
+    upgrade_model: str | None = None
+    upgrade_conditions: dict = Field(default_factory=dict)
+    budget_model: str | None = None
+    candidates: list[str] = Field(default_factory=list)
+    latency_slo_ms: float | None = None
+    max_prompt_tokens: int | None = None
+    small_prompt_model: str | None = None
+    small_prompt_max_tokens: int | None = None
+
+
+class RoutingConfigResponse(BaseModel):
+    """The active (or, for a dry run, validated) routing config."""
+
+    version: str
+    path: str
+    loaded_at: datetime | None = None
+    applied: bool = True
+    adaptive: bool
+    fallback_model: str
+    routes: dict[str, RouteConfigResponse]
+
+
+class RoutingReloadRequest(BaseModel):
+    """Reload the routing config from disk, or replace it with ``config``."""
+
+    config: str | None = None  # full routing_config.yaml contents
+    dry_run: bool = False  # validate only
@@ -0,0 +1,134 @@
+"""Pipeline batches and the upstream work their runs share.
+
+``POST /api/pipeline/trigger-batch`` queues one run per item under a
+``batch_id``. Runs of a batch repeat the same upstream reads: every
+``ai_curation`` run grounds its research on the same ``_build_db_context``
+summary, overlapping seeds expand the same keywords, and runs about the
+same artists search posts for the same terms and load the same posts'
+solutions.
+
+The batch ID travels in ``state["batch_id"]``; ``node_wrapper`` applies it
+with :func:`run_batch` while the node executes. Inside a batch,
+:func:`shared` runs each distinct piece of work once per process and
+hands every later (or concurrent) caller a copy of the result. Outside a
+batch it just calls the factory, so single runs behave as before.
+
+Results are kept for ``BATCH_SHARED_WORK_TTL_S``; failures are not kept,
+the next caller tries again. When the caller computing an entry is
+cancelled, a caller waiting on it computes it instead. Counters of computed vs reused work per batch
+feed the batch stats endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from editorial_ai.config import settings
+
+T = TypeVar("T")
+
+_batch_var: ContextVar[str | None] = ContextVar("run_batch", default=None)
+
+_STATS_MAX_BATCHES = 256
+
+
+def current_batch() -> str | None:
+    """Batch of the run executing in the current context, if any."""
+    return _batch_var.get()
+
+
+@contextlib.contextmanager
+def run_batch(batch_id: object) -> Iterator[None]:
+    """Share upstream work in the current context with the rest of ``batch_id``."""
+    token = _batch_var.set(batch_id if isinstance(batch_id, str) and batch_id else None)
+    try:
+        yield
+    finally:
+        _batch_var.reset(token)
+
+
+class SharedWork:
+    """Per-process single-flight memo of upstream work, scoped to a batch."""
+
+    def __init__(self, *, ttl_s: float | None = None, max_entries: int | None = None) -> None:
+        self.ttl_s = ttl_s if ttl_s is not None else settings.batch_shared_work_ttl_s
+        self.max_entries = max_entries or settings.batch_shared_work_max_entries
+        self._entries: OrderedDict[tuple, tuple[float, asyncio.Future[Any]]] = OrderedDict()
+        # batch_id -> name -> {"computed": n, "reused": n}
+        self._stats: OrderedDict[str, dict[str, dict[str, int]]] = OrderedDict()
+
+    async def run(self, name: str, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        batch_id = current_batch()
+        if batch_id is None:
+            return await factory()
+
+        entry_key = (batch_id, name, key)
+        while True:
+            now = time.monotonic()
+            entry = self._entries.get(entry_key)
+            if entry is None or entry[0] <= now:
+                break
+            try:
+                result = await asyncio.shield(entry[1])
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not entry[1].cancelled() or (task is not None and task.cancelling()):
+                    raise
+                continue  # the computing caller was cancelled: take the work over
+            self._count(batch_id, name, "reused")
+            return copy.deepcopy(result)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._entries[entry_key] = (now + self.ttl_s, future)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._count(batch_id, name, "computed")
+        try:
+            result = await factory()
+        except BaseException as exc:
+            if self._entries.get(entry_key, (0, None))[1] is future:
+                del self._entries[entry_key]
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                future.exception()  # waiters re-raise it; don't warn when there are none
+            raise
+        future.set_result(result)
+        return copy.deepcopy(result)
+
+    def _count(self, batch_id: str, name: str, outcome: str) -> None:
+        stats = self._stats.get(batch_id)
+        if stats is None:
+            stats = self._stats[batch_id] = defaultdict(lambda: {"computed": 0, "reused": 0})
+            while len(self._stats) > _STATS_MAX_BATCHES:
+                self._stats.popitem(last=False)
+        stats[name][outcome] += 1
+
+    def stats(self, batch_id: str) -> dict[str, dict[str, int]]:
+        """Computed vs reused work of ``batch_id`` in this process, by kind."""
+        return {name: dict(counts) for name, counts in self._stats.get(batch_id, {}).items()}
+
+
+_shared_instance: SharedWork | None = None
+
+
+def get_shared_work() -> SharedWork:
+    """Get or create the process-wide SharedWork."""
+    global _shared_instance  # noqa: PLW0603
+    if _shared_instance is None:
+        _shared_instance = SharedWork()
+    return _shared_instance
+
+
+async def shared(name: str, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+    """Run ``factory`` once per batch for (``name``, ``key``); see :class:`SharedWork`."""
+    return await get_shared_work().run(name, key, factory)
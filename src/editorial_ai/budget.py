@@ -0,0 +1,141 @@
+"""Per-run token, cost and wall-clock budgets with progressive degradation.
+
+A run gets a budget when ``TriggerRequest.budget`` or the ``RUN_BUDGET_*``
+settings set at least one limit. The limits live in ``state["budget"]``;
+``node_wrapper`` appends one ``budget_spent`` entry (tokens, cost, duration)
+per node, so spend accumulates across nodes and survives checkpoints.
+
+Spend is measured against each limit and the *lowest* remaining fraction
+picks the level. Each level keeps the degradations of the ones before it:
+
+==========  =====================  ===========================================
+level       remaining              degradation
+==========  =====================  ===========================================
+ok          > budget_low_fraction  none
+low         <= low fraction        skip Nano Banana (default template), no Pro
+                                   upgrades on editorial/review
+critical    <= critical fraction   no repair loop, review on its budget_model
+exhausted   <= 0                   failed review goes straight to admin_gate
+==========  =====================  ===========================================
+
+Wall clock is the sum of node durations, so time waiting on the admin
+gate does not count. Nodes that act on the level return the decisions in
+``budget_decisions``; ``node_wrapper`` copies them onto the NodeRunLog.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from editorial_ai.config import settings
+
+BudgetLevel = Literal["ok", "low", "critical", "exhausted"]
+
+_LEVEL_ORDER: dict[str, int] = {"ok": 0, "low": 1, "critical": 2, "exhausted": 3}
+
+# (limit key in state["budget"], spend key in budget_spent entries)
+_DIMENSIONS = (
+    ("max_tokens", "tokens"),
+    ("max_cost_usd", "cost_usd"),
+    ("max_wall_s", "wall_s"),
+)
+
+
+def build_budget(
+    *,
+    max_tokens: int | None = None,
+    max_cost_usd: float | None = None,
+    max_wall_s: float | None = None,
+) -> dict | None:
+    """Budget limits for a new run (request values override settings), or None."""
+    limits = {
+        "max_tokens": max_tokens if max_tokens is not None else settings.run_budget_max_tokens,
+        "max_cost_usd": (
+            max_cost_usd if max_cost_usd is not None else settings.run_budget_max_cost_usd
+        ),
+        "max_wall_s": max_wall_s if max_wall_s is not None else settings.run_budget_max_wall_s,
+    }
+    limits = {key: value for key, value in limits.items() if value}  # 0 = unlimited
+    return limits or None
+
+
+def spend_entry(node_name: str, *, tokens: int, cost_usd: float, duration_ms: float) -> dict:
+    """One ``budget_spent`` ledger entry (appended per node by node_wrapper)."""
+    return {
+        "node": node_name,
+        "tokens": tokens,
+        "cost_usd": cost_usd,
+        "wall_s": duration_ms / 1000,
+    }
+
+
+@dataclass(frozen=True)
+class BudgetStatus:
+    level: BudgetLevel
+    remaining: float  # lowest remaining fraction across limits (1.0 = untouched)
+    spent: dict[str, float]
+    limits: dict[str, float]
+
+    def at_least(self, level: BudgetLevel) -> bool:
+        return _LEVEL_ORDER[self.level] >= _LEVEL_ORDER[level]
+
+    def decision(self, node_name: str, action: str) -> dict:
+        """A ``budget_decisions`` entry recording a degradation taken by a node."""
+        return {
+            "node": node_name,
+            "action": action,
+            "level": self.level,
+            "remaining": round(self.remaining, 4),
+            "spent": {key: round(value, 6) for key, value in self.spent.items()},
+        }
+
+
+def split_budget(state: Any, parts: int) -> dict | None:
+    """Limits for one of ``parts`` parallel branches sharing what the run has left.
+
+    Each branch starts a ledger of its own against an equal share of the
+    remaining budget, so together the branches stay within the run's limits
+    (their wall time is charged without overlap, see ``node_wrapper``).
+    """
+    status = budget_status(state)
+    if status is None:
+        return None
+    share = {}
+    for limit_key, spent_key in _DIMENSIONS:
+        limit = status.limits.get(limit_key)
+        if limit is not None:
+            share[limit_key] = max(0.0, limit - status.spent[spent_key]) / max(1, parts)
+    return share
+
+
+def budget_status(state: Any) -> BudgetStatus | None:
+    """Current budget level for the run, or None when it has no budget."""
+    if not isinstance(state, dict):
+        return None
+    limits = state.get("budget")
+    if not limits:
+        return None
+
+    spent = {"tokens": 0.0, "cost_usd": 0.0, "wall_s": 0.0}
+    for entry in state.get("budget_spent") or []:
+        for key in spent:
+            spent[key] += entry.get(key) or 0
+
+    remaining = 1.0
+    for limit_key, spent_key in _DIMENSIONS:
+        limit = limits.get(limit_key)
+        if limit is None:
+            continue
+        fraction = 1 - spent[spent_key] / limit if limit > 0 else 0.0
+        remaining = min(remaining, fraction)
+
+    if remaining <= 0:
+        level: BudgetLevel = "exhausted"
+    elif remaining <= settings.budget_critical_fraction:
+        level = "critical"
+    elif remaining <= settings.budget_low_fraction:
+        level = "low"
+    else:
+        level = "ok"
+    return BudgetStatus(level=level, remaining=remaining, spent=spent, limits=dict(limits))
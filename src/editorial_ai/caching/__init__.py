@@ -1,5 +1,6 @@
 """Context caching for Gemini API calls on retry paths."""
 
 from editorial_ai.caching.cache_manager import CacheManager, get_cache_manager
+from editorial_ai.caching.registry import CacheEntry, CacheRegistry
 
-__all__ = ["CacheManager", "get_cache_manager"]
+__all__ = ["CacheEntry", "CacheManager", "CacheRegistry", "get_cache_manager"]
@@ -3,31 +3,82 @@
 Wraps google-genai client.caches API with:
 - get_or_create pattern (reuse existing cache within a pipeline run)
 - Minimum token threshold check (2048 tokens)
-- TTL-based lifecycle (3600s default)
+- TTL-based lifecycle (3600s default), tracked locally: a cache is reused
+  until shortly before its expiry without asking the API whether it still
+  exists
+- Background TTL extension for hot keys (reused often and close to expiry)
+- A persistent registry (``caching.registry``) so worker processes share
+  cache names, with LRU eviction once the entry count or estimated stored
+  tokens exceed CONTEXT_CACHE_MAX_ENTRIES / CONTEXT_CACHE_MAX_TOKENS
 - Fire-and-forget error handling (never breaks pipeline)
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
 from google import genai
 from google.genai import types
 
+from editorial_ai.caching.registry import CacheEntry, CacheRegistry
+from editorial_ai.config import settings
+from editorial_ai.io_executor import run_io
+
 logger = logging.getLogger(__name__)
 
 # Minimum tokens for cache to be worthwhile (below this, implicit caching handles it)
 MIN_CACHE_TOKENS = 2048
+# Gemini's own minimum for explicit caches, by model name prefix (others: MIN_CACHE_TOKENS)
+MIN_CACHE_TOKENS_BY_MODEL = {"gemini-2.5-flash": 1024, "gemini-2.5-pro": 4096}
 # Rough chars-to-tokens ratio for threshold estimation (conservative)
 CHARS_PER_TOKEN_ESTIMATE = 4
+# Treat a cache as gone this long before its local expiry (clock skew, in-flight calls)
+EXPIRY_MARGIN_S = 30.0
+# A key reused this many times is hot: extend its TTL in the background
+# once less than REFRESH_FRACTION of the TTL is left
+HOT_HITS = 3
+REFRESH_FRACTION = 0.25
+
+
+def min_cache_tokens(model: str) -> int:
+    """Smallest content worth an explicit cache on ``model``."""
+    name = model.removeprefix("models/")
+    matches = [prefix for prefix in MIN_CACHE_TOKENS_BY_MODEL if name.startswith(prefix)]
+    return MIN_CACHE_TOKENS_BY_MODEL[max(matches, key=len)] if matches else MIN_CACHE_TOKENS
+
+
+def _ttl_seconds(ttl: str) -> float:
+    """Parse a Gemini duration string ("3600s") into seconds."""
+    return float(ttl.rstrip("s"))
 
 
 class CacheManager:
-    """Manages explicit context caches for pipeline LLM calls."""
+    """Manages explicit context caches for pipeline LLM calls.
+
+    Without a ``registry`` caches are tracked in this process only.
+    """
 
-    def __init__(self, client: genai.Client) -> None:
+    def __init__(
+        self,
+        client: genai.Client,
+        *,
+        registry: CacheRegistry | None = None,
+        max_entries: int | None = None,
+        max_tokens: int | None = None,
+    ) -> None:
         self._client = client
-        self._active_caches: dict[str, str] = {}  # cache_key -> cache.name
+        self._registry = registry
+        self.max_entries = (
+            max_entries if max_entries is not None else settings.context_cache_max_entries
+        )
+        self.max_tokens = (
+            max_tokens if max_tokens is not None else settings.context_cache_max_tokens
+        )
+        self._active_caches: dict[tuple[str, str], CacheEntry] = {}  # (key, model) -> entry
+        self._refreshing: set[tuple[str, str]] = set()
+        self._tasks: set[asyncio.Task] = set()
 
     async def get_or_create(
         self,
@@ -37,9 +88,13 @@ class CacheManager:
         *,
         system_instruction: str | None = None,
         ttl: str = "3600s",
+        estimated_tokens: int | None = None,
     ) -> str | None:
         """Get existing cache or create new one. Returns cache name or None.
 
+        ``estimated_tokens`` replaces the character-count estimate of
+        ``contents`` in the threshold check (see :func:`min_cache_tokens`).
+
         Returns None if:
         - Content is below minimum token threshold
         - Cache creation fails (fire-and-forget)
@@ -48,25 +103,24 @@ class CacheManager:
         try:
             # Estimate token count from content length
             content_chars = self._estimate_chars(contents)
-            if content_chars < MIN_CACHE_TOKENS * CHARS_PER_TOKEN_ESTIMATE:
+            if estimated_tokens is None:
+                estimated_tokens = content_chars // CHARS_PER_TOKEN_ESTIMATE
+            min_tokens = min_cache_tokens(model)
+            if estimated_tokens < min_tokens:
                 logger.debug(
-                    "Content below cache threshold (%d chars < %d min), skipping cache for key=%s",
-                    content_chars,
-                    MIN_CACHE_TOKENS * CHARS_PER_TOKEN_ESTIMATE,
+                    "Content below cache threshold (~%d < %d tokens), skipping cache for key=%s",
+                    estimated_tokens,
+                    min_tokens,
                     cache_key,
                 )
                 return None
 
-            # Check existing cache
-            if cache_key in self._active_caches:
-                try:
-                    # Verify cache still exists (may have expired)
-                    self._client.caches.get(name=self._active_caches[cache_key])
-                    logger.debug("Reusing existing cache for key=%s", cache_key)
-                    return self._active_caches[cache_key]
-                except Exception:
-                    logger.debug("Cached entry expired for key=%s, recreating", cache_key)
-                    del self._active_caches[cache_key]
+            # Check existing cache (local expiry; no API round trip)
+            entry = await self._lookup(cache_key, model)
+            if entry is not None:
+                logger.debug("Reusing existing cache for key=%s", cache_key)
+                await self._on_hit(entry)
+                return entry.name
 
             # Normalize contents to list[Content]
             if isinstance(contents, str):
@@ -92,8 +146,24 @@ class CacheManager:
                 model=model,
                 config=config,
             )
-            self._active_caches[cache_key] = cache.name
+            now = time.time()
+            ttl_s = _ttl_seconds(ttl)
+            entry = CacheEntry(
+                cache_key=cache_key,
+                model=model,
+                name=cache.name,
+                tokens=self._stored_tokens(cache, content_chars),
+                ttl_s=ttl_s,
+                created_at=now,
+                expires_at=now + ttl_s,
+                last_used=now,
+            )
+            self._prune_expired(now)
+            self._active_caches[(cache_key, model)] = entry
+            if self._registry is not None:
+                await run_io(self._registry.put, entry)
             logger.info("Created cache for key=%s, name=%s", cache_key, cache.name)
+            await self._enforce_caps(keep=(cache_key, model))
             return cache.name
 
         except Exception:
@@ -104,6 +174,107 @@ class CacheManager:
             )
             return None
 
+    async def _lookup(self, cache_key: str, model: str) -> CacheEntry | None:
+        """A cache with enough TTL left, from this process or the registry."""
+        key = (cache_key, model)
+        entry = self._active_caches.get(key)
+        if entry is not None and entry.remaining_s() > EXPIRY_MARGIN_S:
+            return entry
+        if entry is not None:
+            logger.debug("Cached entry expired for key=%s, recreating", cache_key)
+            del self._active_caches[key]
+
+        # Another worker may have created (or extended) it
+        if self._registry is not None:
+            shared = await run_io(self._registry.get, cache_key, model)
+            if shared is not None and shared.remaining_s() > EXPIRY_MARGIN_S:
+                self._prune_expired()
+                self._active_caches[key] = shared
+                return shared
+        return None
+
+    def _prune_expired(self, now: float | None = None) -> None:
+        """Forget local entries past their expiry (Gemini has already dropped them).
+
+        Lookups only replace the key they ask for, so without this keys that
+        are never requested again would stay in ``_active_caches`` forever.
+        """
+        now = time.time() if now is None else now
+        expired = [key for key, e in self._active_caches.items() if e.remaining_s(now) <= 0]
+        for key in expired:
+            del self._active_caches[key]
+
+    async def _on_hit(self, entry: CacheEntry) -> None:
+        entry.hits += 1
+        entry.last_used = time.time()
+        if self._registry is not None:
+            await run_io(self._registry.touch, entry.cache_key, entry.model, entry.last_used)
+
+        key = (entry.cache_key, entry.model)
+        if (
+            entry.hits >= HOT_HITS
+            and entry.remaining_s() < entry.ttl_s * REFRESH_FRACTION
+            and key not in self._refreshing
+        ):
+            self._refreshing.add(key)
+            task = asyncio.get_running_loop().create_task(self._extend(entry))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _extend(self, entry: CacheEntry) -> None:
+        """Push a hot cache's expiry out by another TTL (background)."""
+        key = (entry.cache_key, entry.model)
+        try:
+            await self._client.aio.caches.update(
+                name=entry.name,
+                config=types.UpdateCachedContentConfig(ttl=f"{int(entry.ttl_s)}s"),
+            )
+            entry.expires_at = time.time() + entry.ttl_s
+            if self._registry is not None:
+                await run_io(self._registry.put, entry)
+            logger.debug("Extended cache for key=%s, name=%s", entry.cache_key, entry.name)
+        except Exception:
+            logger.warning("Cache TTL extension failed for key=%s", entry.cache_key, exc_info=True)
+        finally:
+            self._refreshing.discard(key)
+
+    async def _enforce_caps(self, *, keep: tuple[str, str]) -> None:
+        """Evict least recently used caches while over the entry or token cap."""
+        if self._registry is not None:
+            entries = await run_io(self._registry.entries)
+        else:
+            now = time.time()
+            entries = sorted(
+                (e for e in self._active_caches.values() if e.remaining_s(now) > 0),
+                key=lambda e: e.last_used,
+            )
+        count = len(entries)
+        tokens = sum(e.tokens for e in entries)
+        for entry in entries:
+            if count <= self.max_entries and tokens <= self.max_tokens:
+                break
+            if (entry.cache_key, entry.model) == keep:
+                continue
+            await self._evict(entry)
+            count -= 1
+            tokens -= entry.tokens
+
+    async def _evict(self, entry: CacheEntry) -> None:
+        self._active_caches.pop((entry.cache_key, entry.model), None)
+        if self._registry is not None:
+            await run_io(self._registry.delete, entry.cache_key, entry.model)
+        try:
+            await self._client.aio.caches.delete(name=entry.name)
+        except Exception:
+            logger.warning("Deleting evicted cache %s failed", entry.name, exc_info=True)
+        logger.info("Evicted cache for key=%s, name=%s", entry.cache_key, entry.name)
+
+    @staticmethod
+    def _stored_tokens(cache: object, content_chars: int) -> int:
+        usage = getattr(cache, "usage_metadata", None)
+        total = getattr(usage, "total_token_count", None)
+        return total if isinstance(total, int) else content_chars // CHARS_PER_TOKEN_ESTIMATE
+
     def _estimate_chars(self, contents: list[types.Content] | str) -> int:
         """Rough character count estimation for threshold check."""
         if isinstance(contents, str):
@@ -117,7 +288,10 @@ class CacheManager:
         return total
 
     def clear(self) -> None:
-        """Clear active cache references (does not delete server-side caches -- TTL handles that)."""
+        """Clear local cache references (does not delete server-side caches -- TTL handles that).
+
+        Caches registered by this or other workers are still found via the registry.
+        """
         self._active_caches.clear()
 
 
@@ -132,5 +306,10 @@ def get_cache_manager(client: genai.Client | None = None) -> CacheManager:
             from editorial_ai.services.curation_service import get_genai_client
 
             client = get_genai_client()
-        _manager_instance = CacheManager(client)
+        registry = (
+            CacheRegistry(settings.context_cache_registry_path)
+            if settings.context_cache_registry_path
+            else None
+        )
+        _manager_instance = CacheManager(client, registry=registry)
     return _manager_instance
@@ -0,0 +1,119 @@
+"""Persistent registry of explicit context caches shared across workers.
+
+Every worker process has its own CacheManager. This SQLite file lets
+them see each other's caches: a worker that misses locally finds a
+cache created elsewhere, and eviction caps apply to all workers
+together. Blocking: call methods via ``run_io``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from editorial_ai.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS context_caches (
+    cache_key TEXT NOT NULL,
+    model TEXT NOT NULL,
+    name TEXT NOT NULL,
+    tokens INTEGER NOT NULL DEFAULT 0,
+    ttl_s REAL NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (cache_key, model)
+);
+"""
+
+
+@dataclass
+class CacheEntry:
+    cache_key: str
+    model: str
+    name: str  # server-side cache name ("cachedContents/...")
+    tokens: int  # estimated stored tokens
+    ttl_s: float
+    created_at: float  # epoch seconds
+    expires_at: float
+    last_used: float
+    hits: int = 0  # local reuse count (not persisted)
+
+    def remaining_s(self, now: float | None = None) -> float:
+        return self.expires_at - (time.time() if now is None else now)
+
+
+_COLUMNS = "cache_key, model, name, tokens, ttl_s, created_at, expires_at, last_used"
+
+
+class CacheRegistry:
+    """SQLite table of live context caches, keyed by (cache_key, model)."""
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path or settings.context_cache_registry_path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, cache_key: str, model: str) -> CacheEntry | None:
+        """The unexpired entry for the key, if any worker registered one."""
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT {_COLUMNS} FROM context_caches "
+                "WHERE cache_key = ? AND model = ? AND expires_at > ?",
+                (cache_key, model, time.time()),
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def put(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self._connect().execute(
+                f"INSERT OR REPLACE INTO context_caches ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.cache_key, entry.model, entry.name, entry.tokens, entry.ttl_s,
+                    entry.created_at, entry.expires_at, entry.last_used,
+                ),
+            )
+
+    def touch(self, cache_key: str, model: str, last_used: float) -> None:
+        with self._lock:
+            self._connect().execute(
+                "UPDATE context_caches SET last_used = ? WHERE cache_key = ? AND model = ?",
+                (last_used, cache_key, model),
+            )
+
+    def delete(self, cache_key: str, model: str) -> None:
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM context_caches WHERE cache_key = ? AND model = ?",
+                (cache_key, model),
+            )
+
+    def entries(self) -> list[CacheEntry]:
+        """Live entries, least recently used first (expired rows are pruned)."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM context_caches WHERE expires_at <= ?", (time.time(),))
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM context_caches ORDER BY last_used"
+            ).fetchall()
+        return [CacheEntry(*row) for row in rows]
@@ -1,5 +1,7 @@
 """Application settings loaded from .env file or environment variables."""
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -15,6 +17,12 @@ class Settings(BaseSettings):
         default=None, alias="GOOGLE_GENAI_USE_VERTEXAI"
     )
     default_model: str = "gemini-2.5-flash"
+    # Adaptive model routing; None = use `adaptive.enabled` from routing_config.yaml
+    routing_adaptive: bool | None = None
+    # Routing config file (default: the packaged routing_config.yaml); polled for
+    # changes every routing_config_watch_interval_s (0 = no hot reload)
+    routing_config_path: str | None = None
+    routing_config_watch_interval_s: float = 5.0
 
     # Editorial Agent
     editorial_model: str = "gemini-2.5-flash"
@@ -26,6 +34,110 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0", alias="API_HOST")
     api_port: int = Field(default=8000, alias="API_PORT")
 
+    # Explicit context caches: registry shared by worker processes ("" = per
+    # process only) and LRU eviction caps
+    context_cache_registry_path: str = "data/context_caches.db"
+    context_cache_max_entries: int = 50
+    context_cache_max_tokens: int = 2_000_000
+    # Store static prompt prefixes (rubrics, block catalog) as explicit caches
+    # where the call allows it; prefix-first ordering applies regardless
+    prompt_prefix_cache_enabled: bool = True
+
+    # Pipeline job queue: Postgres (DATABASE_URL, FOR UPDATE SKIP LOCKED) or a
+    # local SQLite file; None = postgres when DATABASE_URL is set
+    job_queue_backend: Literal["postgres", "sqlite"] | None = None
+    job_queue_sqlite_path: str = "data/jobs.db"
+    # Pipeline runs executed concurrently by this process (0 = enqueue only)
+    job_worker_concurrency: int = 2
+    job_visibility_timeout_s: float = 300  # lease; extended while the job runs
+    job_poll_interval_s: float = 1.0
+    job_max_attempts: int = 3
+    job_retry_backoff_s: float = 10  # doubled per attempt
+    job_retry_backoff_max_s: float = 600
+    # Weighted fair queueing across priority lanes (claims per lane when all are backed up)
+    job_lane_weights: dict[str, float] = {"interactive": 8, "standard": 3, "batch": 1}
+    # Max running jobs per tenant (trigger `tenant`, else its category); 0 = unlimited,
+    # e.g. JOB_TENANT_QUOTAS='{"fashion": 4}'
+    job_tenant_quotas: dict[str, int] = {}
+    job_tenant_quota_default: int = 0
+    # Concurrent LLM calls per process (0 = unlimited); the reserved slots are
+    # only handed to interactive runs
+    llm_max_concurrency: int = 16
+    llm_interactive_reserved_slots: int = 4
+    # API process also runs jobs; false when `editorial-worker` processes do
+    api_job_workers: bool = True
+    # `editorial-worker` processes (0 = one per core), optionally pinned one per core
+    worker_processes: int = 1
+    worker_cpu_affinity: bool = False
+    # GET /metrics of each `editorial-worker` process: process i listens on
+    # port + i (0 = off; worker metrics are per process, not in the API's)
+    worker_metrics_port: int = 0
+    worker_metrics_host: str = "0.0.0.0"
+
+    # Local disk I/O (content JSON, layout images, node logs)
+    io_executor_max_workers: int = 4
+    loop_lag_sample_interval_ms: int = 100
+
+    # Node log sink: batched background writes + gzip compaction of idle threads
+    log_sink_batch_size: int = 50
+    log_sink_flush_interval_ms: int = 500
+    log_sink_max_queue: int = 10_000
+    log_compact_after_days: float = 7  # 0 disables compaction
+    log_compact_interval_hours: float = 6
+
+    # Cross-run stats store (SQLite) fed by the node log writers
+    observability_stats_enabled: bool = True
+    observability_db_path: str = "data/observability.db"
+    observability_raw_retention_days: int = 30  # raw runs; daily rollups are kept
+
+    # Per-run budgets (0 or unset = unlimited); TriggerRequest.budget overrides per run
+    run_budget_max_tokens: int | None = None
+    run_budget_max_cost_usd: float | None = None
+    # Node time with parallel nodes counted once; excludes waiting on the admin gate
+    run_budget_max_wall_s: float | None = None
+    # Remaining-fraction thresholds for degradation (see editorial_ai.budget)
+    budget_low_fraction: float = 0.5
+    budget_critical_fraction: float = 0.2
+
+    # LLM price table for cost accounting (defaults to observability/pricing.yaml)
+    pricing_table_path: str | None = None
+
+    # Node log state snapshots: off | keys | truncated | diff | full
+    node_snapshot_mode: Literal["off", "keys", "truncated", "diff", "full"] = "truncated"
+    # Per-node override, e.g. NODE_SNAPSHOT_MODES='{"editorial": "diff", "publish": "full"}'
+    node_snapshot_modes: dict[str, Literal["off", "keys", "truncated", "diff", "full"]] = {}
+    node_snapshot_max_str_chars: int = 256
+    node_snapshot_max_items: int = 10
+    node_snapshot_max_depth: int = 6
+
+    # Live progress events (GET /api/pipeline/stream): Postgres LISTEN/NOTIFY bridge
+    # between API and worker processes (None = on when DATABASE_URL is set)
+    progress_bridge_enabled: bool | None = None
+    progress_stream_keepalive_s: float = 15
+    progress_subscriber_queue: int = 1000  # per stream; oldest events dropped beyond
+
+    # Run status registry read by /api/pipeline/status: in-memory table backed by a
+    # pipeline_run_status table (None = postgres when DATABASE_URL is set)
+    run_status_backend: Literal["postgres", "sqlite"] | None = None
+    run_status_sqlite_path: str = "data/run_status.db"
+    run_status_cache_size: int = 10_000
+    run_status_cache_ttl_s: float = 1.0  # re-read from the table after this (other processes)
+    run_status_flush_interval_ms: int = 200
+
+    # Batches (POST /api/pipeline/trigger-batch): upstream work shared by a batch's runs
+    batch_max_items: int = 200
+    batch_shared_work_ttl_s: float = 3600
+    batch_shared_work_max_entries: int = 5000
+
+    # Topic fan-out: one editorial -> enrich -> review branch per curated topic
+    editorial_fanout_enabled: bool = False
+    editorial_fanout_max_topics: int = 3
+    editorial_fanout_concurrency: int = 2  # branches drafting at once, per run
+    editorial_draft_retention_days: float = 7  # stored branch drafts; 0 keeps them
+
+    # On-demand profiling (TriggerRequest.profile / X-Profile header); False ignores requests
+    profiling_enabled: bool = True
+
     # Supabase (REST API)
     supabase_url: str | None = Field(default=None, alias="SUPABASE_URL")
     supabase_service_role_key: str | None = Field(
@@ -1,11 +1,14 @@
 """Editorial pipeline graph definition.
 
 Defines the StateGraph topology with real node implementations and conditional edges.
-The graph follows: curation -> design_spec -> source -> editorial -> enrich -> review -> admin_gate -> publish
+The graph follows:
+curation -> (design_spec || source) -> editorial -> enrich -> review -> admin_gate -> publish
 with conditional routing after review (retry/fail) and admin_gate (revision/reject).
 Review node performs LLM-as-a-Judge evaluation (Phase 6).
 Admin gate uses LangGraph interrupt() for human-in-the-loop approval (Phase 7).
 Publish node finalizes approved content in Supabase (Phase 7).
+With fan-out enabled, editorial -> enrich -> review runs once per curated
+topic in parallel branches (see nodes.topic_fanout).
 """
 
 from __future__ import annotations
@@ -17,6 +20,7 @@ from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
+from editorial_ai.config import settings
 from editorial_ai.observability import node_wrapper
 from editorial_ai.nodes.admin_gate import admin_gate
 from editorial_ai.nodes.curation import curation_node
@@ -37,6 +41,16 @@ from editorial_ai.nodes.stubs import (
     stub_design_spec,  # noqa: F401 — kept for backward compat
     stub_source,  # noqa: F401 — kept for backward compat
 )
+from editorial_ai.nodes.topic_fanout import (
+    FANOUT_BRANCH,
+    FANOUT_COLLECT,
+    FANOUT_JOIN,
+    collect_drafts_node,
+    join_upstream,
+    route_after_collect,
+    route_topics,
+    topic_branch_node,
+)
 from editorial_ai.state import EditorialPipelineState
 
 
@@ -45,6 +59,8 @@ def route_after_review(state: EditorialPipelineState) -> str:
     review_result = state.get("review_result") or {}
     if review_result.get("passed"):
         return "admin_gate"
+    if state.get("budget_status") == "exhausted" and state.get("current_draft"):
+        return "admin_gate"  # budget degradation: no more revision loops
     if state.get("revision_count", 0) >= 3:
         return END
     return "editorial"
@@ -64,6 +80,7 @@ def build_graph(
     *,
     node_overrides: dict[str, Callable[..., Any]] | None = None,
     checkpointer: BaseCheckpointSaver | None = None,
+    fanout: bool | None = None,
 ) -> CompiledStateGraph:
     """Build and compile the editorial pipeline graph.
 
@@ -72,6 +89,8 @@ def build_graph(
             Useful for testing with mock nodes.
         checkpointer: Optional checkpoint saver for state persistence.
             When provided, graph state is saved after each node execution.
+        fanout: Draft one article per curated topic in parallel branches
+            instead of a single article. Defaults to EDITORIAL_FANOUT_ENABLED.
 
     Returns:
         Compiled StateGraph ready for invocation.
@@ -86,6 +105,10 @@ def build_graph(
         "admin_gate": admin_gate,
         "publish": publish_node,
     }
+    if fanout is None:
+        fanout = settings.editorial_fanout_enabled
+    if fanout:
+        nodes[FANOUT_COLLECT] = collect_drafts_node
     if node_overrides:
         nodes.update(node_overrides)
 
@@ -93,16 +116,20 @@ def build_graph(
     for name in list(nodes.keys()):
         nodes[name] = node_wrapper(name)(nodes[name])
 
+    if fanout:
+        return _build_fanout_graph(nodes, checkpointer)
+
     builder = StateGraph(EditorialPipelineState)
 
     for name, fn in nodes.items():
         builder.add_node(name, fn)
 
-    # Sequential edges
+    # Sequential edges; design_spec and source only need curated_topics,
+    # so they run in parallel and editorial waits for both
     builder.add_edge(START, "curation")
     builder.add_edge("curation", "design_spec")
-    builder.add_edge("design_spec", "source")
-    builder.add_edge("source", "editorial")
+    builder.add_edge("curation", "source")
+    builder.add_edge(["design_spec", "source"], "editorial")
     builder.add_edge("editorial", "enrich")
     builder.add_edge("enrich", "review")
 
@@ -120,5 +147,58 @@ def build_graph(
     return builder.compile(checkpointer=checkpointer)
 
 
+def _build_topic_branch(nodes: dict[str, Callable[..., Any]]) -> CompiledStateGraph:
+    """editorial -> enrich -> review with its revision loop, for one topic.
+
+    Ends where the main graph would go to admin_gate. Compiled without a
+    checkpointer: a branch interrupted by a crash drafts its topic again.
+    """
+    builder = StateGraph(EditorialPipelineState)
+    for name in ("editorial", "enrich", "review"):
+        builder.add_node(name, nodes[name])
+    builder.add_edge(START, "editorial")
+    builder.add_edge("editorial", "enrich")
+    builder.add_edge("enrich", "review")
+    builder.add_conditional_edges(
+        "review",
+        route_after_review,
+        {"admin_gate": END, "editorial": "editorial", END: END},
+    )
+    return builder.compile(checkpointer=False)
+
+
+def _build_fanout_graph(
+    nodes: dict[str, Callable[..., Any]],
+    checkpointer: BaseCheckpointSaver | None,
+) -> CompiledStateGraph:
+    """curation -> (design_spec || source) -> topic_article (per topic) -> collect_drafts -> ..."""
+    branch = _build_topic_branch(nodes)
+
+    builder = StateGraph(EditorialPipelineState)
+    for name in ("curation", "design_spec", "source", FANOUT_COLLECT, "admin_gate", "publish"):
+        builder.add_node(name, nodes[name])
+    # Not wrapped: the branch's own nodes are, and report under the run's thread
+    builder.add_node(FANOUT_BRANCH, topic_branch_node(branch))
+
+    builder.add_node(FANOUT_JOIN, join_upstream)
+
+    builder.add_edge(START, "curation")
+    builder.add_edge("curation", "design_spec")
+    builder.add_edge("curation", "source")
+    builder.add_edge(["design_spec", "source"], FANOUT_JOIN)
+    builder.add_conditional_edges(FANOUT_JOIN, route_topics, [FANOUT_BRANCH, FANOUT_COLLECT])
+    builder.add_edge(FANOUT_BRANCH, FANOUT_COLLECT)
+    builder.add_conditional_edges(FANOUT_COLLECT, route_after_collect, ["admin_gate", END])
+    # Revisions run inside the branches; a revision request after approval ends the run
+    builder.add_conditional_edges(
+        "admin_gate",
+        route_after_admin,
+        {"publish": "publish", "editorial": END, END: END},
+    )
+    builder.add_edge("publish", END)
+
+    return builder.compile(checkpointer=checkpointer)
+
+
 # Default compiled graph for production use
 graph = build_graph()
@@ -0,0 +1,58 @@
+"""Bounded thread pool for blocking disk I/O issued from async code paths.
+
+Content JSON files, layout images and JSONL node logs live on local disk.
+Writing them directly from a coroutine stalls every other task on the
+event loop (concurrent pipelines, admin polling), so async callers hand
+the blocking call to a small dedicated executor instead::
+
+    data = await run_io(path.read_text, encoding="utf-8")
+
+The pool is deliberately separate from the loop's default executor so a
+burst of file writes cannot starve ``asyncio.to_thread`` users (and vice
+versa), and its size caps how many threads touch the disk at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from editorial_ai.config import settings
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Return the shared I/O executor, creating it on first use."""
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.io_executor_max_workers),
+                    thread_name_prefix="editorial-io",
+                )
+    return _executor
+
+
+async def run_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking I/O callable on the bounded executor and await its result."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(fn, *args, **kwargs) if kwargs else functools.partial(fn, *args)
+    return await loop.run_in_executor(get_io_executor(), call)
+
+
+def shutdown_io_executor(*, wait: bool = True) -> None:
+    """Shut down the shared executor. A later ``run_io`` call recreates it."""
+    global _executor  # noqa: PLW0603
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
@@ -0,0 +1,48 @@
+"""Durable pipeline job queue and the worker pool that drains it."""
+
+from editorial_ai.jobs.handlers import (
+    JOB_HANDLERS,
+    PIPELINE_GATE,
+    PIPELINE_REPLAY,
+    PIPELINE_RESUME,
+    PIPELINE_RUN,
+    JobHandler,
+    gate_pipeline_job,
+    replay_pipeline_job,
+    resume_pipeline_job,
+    run_pipeline_job,
+)
+from editorial_ai.jobs.queue import (
+    Job,
+    JobQueue,
+    PostgresJobQueue,
+    SqliteJobQueue,
+    backoff_s,
+    create_job_queue,
+    get_job_queue,
+)
+from editorial_ai.jobs.scheduler import LaneScheduler, saturated_tenants
+from editorial_ai.jobs.worker import JobWorkerPool
+
+__all__ = [
+    "JOB_HANDLERS",
+    "PIPELINE_GATE",
+    "PIPELINE_REPLAY",
+    "PIPELINE_RESUME",
+    "PIPELINE_RUN",
+    "Job",
+    "JobHandler",
+    "JobQueue",
+    "JobWorkerPool",
+    "LaneScheduler",
+    "PostgresJobQueue",
+    "SqliteJobQueue",
+    "backoff_s",
+    "create_job_queue",
+    "gate_pipeline_job",
+    "get_job_queue",
+    "replay_pipeline_job",
+    "resume_pipeline_job",
+    "run_pipeline_job",
+    "saturated_tenants",
+]
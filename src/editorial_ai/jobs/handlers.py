@@ -0,0 +1,220 @@
+"""Job handlers: what a worker does with each job kind.
+
+Handlers must be safe to run again for the same job. A retried or
+reclaimed job may find the graph already part-way through (or finished)
+in the checkpointer, so it continues from the last checkpoint instead of
+starting the run over.
+
+``pipeline_resume`` jobs carry an admin decision for a run paused at
+``admin_gate``. The API applies the decision to the content record
+optimistically before queueing the job; if the resume fails for good the
+record is put back to its previous status so the admin can decide again.
+
+``pipeline_replay`` jobs run a thread forked from another run, reusing
+that run's node outputs upstream of the chosen node (``editorial_ai.replay``).
+
+``pipeline_gate`` jobs open the approval thread of an extra article a
+topic fan-out run drafted (see ``nodes.topic_fanout``).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from typing import Any
+
+from langgraph.types import Command
+
+from editorial_ai.jobs.queue import Job
+from editorial_ai.observability import flush_node_logs, pipeline_run
+from editorial_ai.observability.events import publish_progress
+from editorial_ai.observability.run_status import get_run_status_registry
+from editorial_ai.replay import plan_replay, replay_memo
+from editorial_ai.services.content_service import get_content_by_id, update_content_status
+from editorial_ai.services.draft_store import load_draft
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Any, Job], Awaitable[None]]
+
+PIPELINE_RUN = "pipeline_run"
+PIPELINE_RESUME = "pipeline_resume"
+PIPELINE_GATE = "pipeline_gate"
+PIPELINE_REPLAY = "pipeline_replay"
+
+
+def _is_settled(snapshot: Any) -> bool:
+    """Run finished, or paused at an interrupt (admin_gate) waiting for a human."""
+    if not snapshot.next:
+        return True
+    return _is_interrupted(snapshot)
+
+
+def _is_interrupted(snapshot: Any) -> bool:
+    return any(getattr(task, "interrupts", None) for task in snapshot.tasks or ())
+
+
+async def run_pipeline_job(graph: Any, job: Job) -> None:
+    """Start the run from ``payload["initial_state"]``, or resume its checkpoint."""
+    thread_id = job.thread_id
+    config = {"configurable": {"thread_id": thread_id}}
+    try:
+        snapshot = await graph.aget_state(config)
+        if snapshot is not None and snapshot.values:
+            if _is_settled(snapshot):
+                logger.info("Thread %s already settled; nothing to resume", thread_id)
+                return
+            logger.info(
+                "Resuming thread %s from checkpoint before %s (attempt %d)",
+                thread_id, list(snapshot.next), job.attempts,
+            )
+            graph_input = None
+        else:
+            graph_input = job.payload["initial_state"]
+        with pipeline_run():
+            await graph.ainvoke(graph_input, config=config)
+    finally:
+        await flush_node_logs(thread_id)
+
+
+async def replay_pipeline_job(graph: Any, job: Job) -> None:
+    """Run the forked thread with the source run's upstream outputs memoized.
+
+    The memo is rebuilt from the source thread's history on every attempt;
+    a retried job continues the forked thread from its own checkpoint.
+    """
+    plan = await plan_replay(
+        graph, job.payload["source_thread_id"], job.payload["from_node"]
+    )
+    with replay_memo(plan.memo):
+        await run_pipeline_job(graph, job)
+
+
+async def resume_pipeline_job(graph: Any, job: Job) -> None:
+    """Resume the paused run with ``payload["resume"]`` (the admin decision).
+
+    Only a thread still waiting at its interrupt receives the decision. A
+    thread that already moved on was resumed by an earlier attempt of this
+    job (or of an earlier job with the same decision), which died mid-run:
+    it continues from the checkpoint instead, and a finished thread is left
+    alone. A decision other than the one the run already acted on fails.
+    """
+    thread_id = job.thread_id
+    config = {"configurable": {"thread_id": thread_id}}
+    try:
+        snapshot = await graph.aget_state(config)
+        if snapshot is None or not snapshot.values:
+            raise LookupError(f"No checkpoint for thread {thread_id}")
+        if _is_interrupted(snapshot):
+            graph_input: Any = Command(resume=job.payload["resume"])
+        elif snapshot.next:
+            consumed = snapshot.values.get("admin_decision")
+            decision = job.payload["resume"]["decision"]
+            if consumed and consumed != decision:
+                raise ValueError(
+                    f"Thread {thread_id} already acted on '{consumed}'; "
+                    f"'{decision}' cannot be applied"
+                )
+            logger.info(
+                "Thread %s already resumed; continuing before %s (attempt %d)",
+                thread_id, list(snapshot.next), job.attempts,
+            )
+            graph_input = None
+        else:
+            logger.info("Thread %s already finished; nothing to resume", thread_id)
+            return
+        with pipeline_run():
+            await graph.ainvoke(graph_input, config=config)
+    except Exception:
+        if job.attempts >= job.max_attempts:
+            await _undo_decision(graph, job)
+        raise
+    finally:
+        await flush_node_logs(thread_id)
+
+
+async def gate_pipeline_job(graph: Any, job: Job) -> None:
+    """Open an approval thread for the stored draft ``payload["draft_ref"]``.
+
+    The new thread starts as if ``payload["as_node"]`` had just produced
+    the draft, so it runs admin_gate and waits for a decision like any
+    other run. A thread that already exists continues from its checkpoint.
+    """
+    thread_id = job.thread_id
+    config = {"configurable": {"thread_id": thread_id}}
+    try:
+        snapshot = await graph.aget_state(config)
+        if snapshot is None or not snapshot.values:
+            draft = await load_draft(job.payload["draft_ref"])
+            if draft is None:
+                raise LookupError(f"Draft {job.payload['draft_ref']} not found")
+            values = {
+                **job.payload.get("state", {}),
+                **draft,
+                "thread_id": thread_id,
+                "pipeline_status": "awaiting_approval",
+            }
+            await graph.aupdate_state(config, values, as_node=job.payload["as_node"])
+        elif _is_settled(snapshot):
+            logger.info("Thread %s already settled; nothing to open", thread_id)
+            return
+        with pipeline_run():
+            await graph.ainvoke(None, config=config)
+    finally:
+        await flush_node_logs(thread_id)
+
+
+async def _undo_decision(graph: Any, job: Job) -> None:
+    """Give the decision back to the admin once the resume failed for good.
+
+    At the gate the run is put back to awaiting approval. Past the gate the
+    decision was consumed and a later node failed: only the content record
+    is put back, so a repeated decision continues the run from there.
+    """
+    try:
+        snapshot = await graph.aget_state({"configurable": {"thread_id": job.thread_id}})
+    except Exception:  # noqa: BLE001
+        logger.warning("Failed to load state of thread %s", job.thread_id, exc_info=True)
+        return
+    if snapshot is None:
+        return
+    await _restore_content_status(job)
+    if not _is_interrupted(snapshot):
+        return  # the run itself stays failed
+    registry = get_run_status_registry()
+    status = await registry.get(job.thread_id)
+    if status is not None:
+        await registry.put(
+            replace(status, pipeline_status="awaiting_approval", updated_at=time.time())
+        )
+    publish_progress(
+        job.thread_id, "status", "admin_gate",
+        pipeline_status="awaiting_approval", previous=status.pipeline_status if status else None,
+    )
+
+
+async def _restore_content_status(job: Job) -> None:
+    """Put the content back to ``previous_status`` unless it moved past the decision."""
+    content_id = job.payload.get("content_id")
+    previous = job.payload.get("previous_status")
+    if not content_id or not previous:
+        return
+    try:
+        content = await get_content_by_id(content_id)
+        if content is None or content.get("status") != job.payload["resume"]["decision"]:
+            return  # already published, or decided again since
+        await update_content_status(
+            content_id, previous, expected_updated_at=content["updated_at"]
+        )
+    except Exception:  # noqa: BLE001
+        logger.warning("Failed to restore status of content %s", content_id, exc_info=True)
+
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    PIPELINE_RUN: run_pipeline_job,
+    PIPELINE_RESUME: resume_pipeline_job,
+    PIPELINE_GATE: gate_pipeline_job,
+    PIPELINE_REPLAY: replay_pipeline_job,
+}
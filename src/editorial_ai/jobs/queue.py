@@ -0,0 +1,716 @@
+"""Durable job queue for pipeline runs.
+
+A trigger enqueues a job row; worker slots (``jobs.worker``) claim jobs
+under a lease (visibility timeout), extend the lease while the job runs,
+and mark it succeeded or failed. A job whose worker dies keeps its lease
+until ``locked_until`` passes and is then claimed again; the graph resumes
+from its last checkpoint. Failures are retried with exponential backoff
+up to ``max_attempts``.
+
+Two backends share the same table layout and semantics:
+
+- :class:`PostgresJobQueue` — ``DATABASE_URL`` (the checkpointer's
+  database); concurrent workers claim with ``FOR UPDATE SKIP LOCKED``.
+- :class:`SqliteJobQueue` — local stand-in for development and tests;
+  claims are serialized by ``BEGIN IMMEDIATE``.
+
+Each job carries a priority lane (``editorial_ai.priority``) and a
+tenant. ``claim`` takes the worker's lane preference from its
+:class:`~editorial_ai.jobs.scheduler.LaneScheduler` and skips tenants at
+their running-job quota. ``started_at`` (first claim) minus ``created_at``
+is the job's queue wait, reported per lane by :meth:`JobQueue.lane_stats`.
+
+A job may carry an ``idempotency_key`` (unique): enqueueing the same key
+again returns the existing job instead of adding one, unless that job has
+failed for good, in which case it is reset and run again. Jobs queued by
+``trigger-batch`` carry a ``batch_id`` (:meth:`JobQueue.list_batch`).
+
+Timestamps are epoch seconds in both.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+from editorial_ai.config import settings
+from editorial_ai.io_executor import run_io
+from editorial_ai.jobs.scheduler import quotas_enabled, saturated_tenants
+from editorial_ai.priority import DEFAULT_PRIORITY, PRIORITIES, Priority, normalize_priority
+
+logger = logging.getLogger(__name__)
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+_COLUMNS = (
+    "id, kind, thread_id, payload, status, attempts, max_attempts, run_after, "
+    "locked_by, locked_until, last_error, created_at, updated_at, priority, tenant, started_at, "
+    "idempotency_key, batch_id"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pipeline_jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    thread_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    run_after DOUBLE PRECISION NOT NULL,
+    locked_by TEXT,
+    locked_until DOUBLE PRECISION,
+    last_error TEXT,
+    created_at DOUBLE PRECISION NOT NULL,
+    updated_at DOUBLE PRECISION NOT NULL,
+    priority TEXT NOT NULL DEFAULT 'standard',
+    tenant TEXT,
+    started_at DOUBLE PRECISION,
+    idempotency_key TEXT,
+    batch_id TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_pipeline_jobs_ready ON pipeline_jobs (status, run_after);
+CREATE INDEX IF NOT EXISTS ix_pipeline_jobs_thread ON pipeline_jobs (thread_id);
+"""
+
+# Need the migrated columns, so created after _ADDED_COLUMNS are applied
+_INDEXES = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_pipeline_jobs_idempotency "
+    "ON pipeline_jobs (idempotency_key)",
+    "CREATE INDEX IF NOT EXISTS ix_pipeline_jobs_batch ON pipeline_jobs (batch_id)",
+)
+
+# Claimable: queued and due, or running with an expired lease (dead worker)
+_READY = (
+    "(status = 'queued' AND run_after <= {now}) "
+    "OR (status = 'running' AND locked_until < {now} AND attempts < max_attempts)"
+)
+# Expired leases with no attempts left are failed instead of reclaimed
+_EXHAUSTED = "status = 'running' AND locked_until < {now} AND attempts >= max_attempts"
+
+# Columns added after the table first shipped; applied to existing databases
+_ADDED_COLUMNS = (
+    "priority TEXT NOT NULL DEFAULT 'standard'",
+    "tenant TEXT",
+    "started_at DOUBLE PRECISION",
+    "idempotency_key TEXT",
+    "batch_id TEXT",
+)
+
+# Same key again: keep the existing job, unless it failed for good (reset it)
+_ON_KEY_CONFLICT = (
+    "ON CONFLICT (idempotency_key) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in (c.strip() for c in _COLUMNS.split(",")))
+    + " WHERE pipeline_jobs.status = 'failed'"
+)
+
+# Tenants with live leases, for quota checks
+_RUNNING_BY_TENANT = (
+    "SELECT tenant, COUNT(*) FROM pipeline_jobs WHERE status = 'running' "
+    "AND locked_until >= {now} AND tenant IS NOT NULL GROUP BY tenant"
+)
+_LANE_COUNTS = "SELECT priority, status, COUNT(*) FROM pipeline_jobs GROUP BY priority, status"
+_WAITS = "SELECT priority, started_at - created_at FROM pipeline_jobs WHERE started_at >= {since}"
+
+
+def _order(lanes: Sequence[str] | None) -> str:
+    """Preferred lanes first (in the given order), then oldest due job."""
+    ranked = [lane for lane in dict.fromkeys(lanes or PRIORITIES) if lane in PRIORITIES]
+    cases = " ".join(f"WHEN '{lane}' THEN {i}" for i, lane in enumerate(ranked))
+    return f"ORDER BY CASE priority {cases} ELSE {len(ranked)} END, run_after, created_at"
+
+
+def _not_saturated(tenants: list[str], placeholder: str) -> str:
+    if not tenants:
+        return ""
+    return f" AND (tenant IS NULL OR tenant NOT IN ({', '.join([placeholder] * len(tenants))}))"
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str  # handler key, e.g. "pipeline_run"
+    thread_id: str
+    payload: dict[str, Any]
+    status: JobStatus
+    attempts: int  # claims so far (including the current one while running)
+    max_attempts: int
+    run_after: float  # not claimable before this (retry backoff)
+    locked_by: str | None = None
+    locked_until: float | None = None  # lease expiry while running
+    last_error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    priority: Priority = DEFAULT_PRIORITY
+    tenant: str | None = None  # quota key, defaults to the run's category
+    started_at: float | None = None  # first claim; queue wait = started_at - created_at
+    idempotency_key: str | None = None  # dedups enqueues of the same request
+    batch_id: str | None = None  # set by trigger-batch
+
+    @property
+    def queue_wait_s(self) -> float | None:
+        return None if self.started_at is None else self.started_at - self.created_at
+
+    @classmethod
+    def from_row(cls, row: tuple) -> Job:
+        values = list(row)
+        values[3] = json.loads(values[3])
+        return cls(*values)
+
+
+def backoff_s(attempts: int) -> float:
+    """Delay before retry number ``attempts`` (1-based), doubling up to the cap."""
+    base = settings.job_retry_backoff_s * 2 ** max(attempts - 1, 0)
+    return min(base, settings.job_retry_backoff_max_s)
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    # Initial states carry Supabase rows; stringify anything JSON can't encode
+    return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def _new_job(
+    kind: str,
+    thread_id: str,
+    payload: dict[str, Any],
+    max_attempts: int | None,
+    priority: Priority,
+    tenant: str | None,
+    idempotency_key: str | None,
+    batch_id: str | None,
+) -> Job:
+    now = time.time()
+    return Job(
+        id=str(uuid.uuid4()), kind=kind, thread_id=thread_id, payload=payload,
+        status="queued", attempts=0,
+        max_attempts=max_attempts or settings.job_max_attempts,
+        run_after=now, created_at=now, updated_at=now,
+        priority=normalize_priority(priority), tenant=tenant,
+        idempotency_key=idempotency_key, batch_id=batch_id,
+    )
+
+
+def _row(job: Job) -> tuple:
+    return (
+        job.id, job.kind, job.thread_id, _dumps(job.payload), job.status,
+        job.attempts, job.max_attempts, job.run_after, job.locked_by,
+        job.locked_until, job.last_error, job.created_at, job.updated_at,
+        job.priority, job.tenant, job.started_at, job.idempotency_key, job.batch_id,
+    )
+
+
+def _lane_stats(count_rows: list[tuple], wait_rows: list[tuple]) -> dict[str, dict[str, Any]]:
+    stats: dict[str, dict[str, Any]] = {lane: {"counts": {}, "waits": []} for lane in PRIORITIES}
+    for priority, status, count in count_rows:
+        stats.setdefault(priority, {"counts": {}, "waits": []})["counts"][status] = count
+    for priority, wait in wait_rows:
+        stats.setdefault(priority, {"counts": {}, "waits": []})["waits"].append(max(wait, 0.0))
+    return stats
+
+
+class JobQueue(ABC):
+    """Backend-independent queue API (all methods are coroutines)."""
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        kind: str,
+        thread_id: str,
+        payload: dict[str, Any],
+        *,
+        max_attempts: int | None = None,
+        priority: Priority = DEFAULT_PRIORITY,
+        tenant: str | None = None,
+        idempotency_key: str | None = None,
+        batch_id: str | None = None,
+    ) -> Job:
+        """Add a job; with ``idempotency_key``, the job already holding the key wins."""
+
+    @abstractmethod
+    async def claim(
+        self, worker_id: str, *, lease_s: float, lanes: Sequence[str] | None = None
+    ) -> Job | None:
+        """Lease the next ready job to ``worker_id``, or None if none is ready.
+
+        Jobs from ``lanes`` are preferred in that order (default: by
+        priority); jobs of tenants at their quota are skipped.
+        """
+
+    @abstractmethod
+    async def heartbeat(self, job_id: str, worker_id: str, *, lease_s: float) -> bool:
+        """Extend the lease. False if the worker no longer holds the job."""
+
+    @abstractmethod
+    async def complete(self, job_id: str, worker_id: str) -> bool: ...
+
+    @abstractmethod
+    async def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Record a failed attempt: requeue with backoff, or fail for good."""
+
+    @abstractmethod
+    async def release(self, job_id: str, worker_id: str) -> bool:
+        """Hand a job back unfinished (worker shutdown) without using up an attempt."""
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Job | None: ...
+
+    @abstractmethod
+    async def get_by_key(self, idempotency_key: str) -> Job | None: ...
+
+    @abstractmethod
+    async def list_batch(self, batch_id: str) -> list[Job]:
+        """Jobs of a batch, oldest first."""
+
+    @abstractmethod
+    async def counts(self) -> dict[str, int]:
+        """Number of jobs per status."""
+
+    @abstractmethod
+    async def lane_stats(self, since: float) -> dict[str, dict[str, Any]]:
+        """Per lane: ``counts`` by status and queue ``waits`` of jobs started since ``since``."""
+
+    async def close(self) -> None:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# SQLite
+# ---------------------------------------------------------------------------
+
+
+class SqliteJobQueue(JobQueue):
+    """Single-file queue for local runs; safe across processes on one host."""
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path or settings.job_queue_sqlite_path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.executescript(_SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(pipeline_jobs)")}
+            for column in _ADDED_COLUMNS:
+                if column.split()[0] not in existing:
+                    conn.execute(f"ALTER TABLE pipeline_jobs ADD COLUMN {column}")
+            for index in _INDEXES:
+                conn.execute(index)
+            self._conn = conn
+        return self._conn
+
+    def _enqueue(self, job: Job) -> Job:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                f"INSERT INTO pipeline_jobs ({_COLUMNS}) "
+                f"VALUES ({', '.join(['?'] * 18)}) {_ON_KEY_CONFLICT}",
+                _row(job),
+            )
+            if job.idempotency_key is None:
+                return job
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM pipeline_jobs WHERE idempotency_key = ?",
+                (job.idempotency_key,),
+            ).fetchone()
+        return Job.from_row(row)
+
+    def _claim(self, worker_id: str, lease_s: float, lanes: Sequence[str] | None) -> Job | None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE pipeline_jobs SET status = 'failed', locked_by = NULL, "
+                    "locked_until = NULL, last_error = 'lease expired on final attempt', "
+                    f"updated_at = ? WHERE {_EXHAUSTED.format(now='?')}",
+                    (now, now),
+                )
+                saturated = []
+                if quotas_enabled():
+                    running = conn.execute(_RUNNING_BY_TENANT.format(now="?"), (now,)).fetchall()
+                    saturated = saturated_tenants(dict(running))
+                row = conn.execute(
+                    f"SELECT id FROM pipeline_jobs WHERE ({_READY.format(now='?')})"
+                    f"{_not_saturated(saturated, '?')} {_order(lanes)} LIMIT 1",
+                    (now, now, *saturated),
+                ).fetchone()
+                job = None
+                if row is not None:
+                    conn.execute(
+                        "UPDATE pipeline_jobs SET status = 'running', attempts = attempts + 1, "
+                        "locked_by = ?, locked_until = ?, updated_at = ?, "
+                        "started_at = COALESCE(started_at, ?) WHERE id = ?",
+                        (worker_id, now + lease_s, now, now, row[0]),
+                    )
+                    job = Job.from_row(
+                        conn.execute(
+                            f"SELECT {_COLUMNS} FROM pipeline_jobs WHERE id = ?", (row[0],)
+                        ).fetchone()
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return job
+
+    def _update_owned(self, job_id: str, worker_id: str, assignments: str, params: tuple) -> bool:
+        with self._lock:
+            cur = self._connect().execute(
+                f"UPDATE pipeline_jobs SET {assignments}, updated_at = ? "
+                "WHERE id = ? AND locked_by = ? AND status = 'running'",
+                (*params, time.time(), job_id, worker_id),
+            )
+            return cur.rowcount == 1
+
+    def _fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT attempts, max_attempts FROM pipeline_jobs "
+                "WHERE id = ? AND locked_by = ? AND status = 'running'",
+                (job_id, worker_id),
+            ).fetchone()
+        if row is None:
+            return False
+        attempts, max_attempts = row
+        if attempts >= max_attempts:
+            return self._update_owned(
+                job_id, worker_id,
+                "status = 'failed', locked_by = NULL, locked_until = NULL, last_error = ?",
+                (error,),
+            )
+        return self._update_owned(
+            job_id, worker_id,
+            "status = 'queued', locked_by = NULL, locked_until = NULL, last_error = ?, "
+            "run_after = ?",
+            (error, time.time() + backoff_s(attempts)),
+        )
+
+    def _get(self, job_id: str) -> Job | None:
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT {_COLUMNS} FROM pipeline_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return Job.from_row(row) if row else None
+
+    def _get_by_key(self, idempotency_key: str) -> Job | None:
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT {_COLUMNS} FROM pipeline_jobs WHERE idempotency_key = ?",
+                (idempotency_key,),
+            ).fetchone()
+        return Job.from_row(row) if row else None
+
+    def _list_batch(self, batch_id: str) -> list[Job]:
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {_COLUMNS} FROM pipeline_jobs WHERE batch_id = ? ORDER BY created_at",
+                (batch_id,),
+            ).fetchall()
+        return [Job.from_row(row) for row in rows]
+
+    def _counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT status, COUNT(*) FROM pipeline_jobs GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    def _lane_stats(self, since: float) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            conn = self._connect()
+            counts = conn.execute(_LANE_COUNTS).fetchall()
+            waits = conn.execute(_WAITS.format(since="?"), (since,)).fetchall()
+        return _lane_stats(counts, waits)
+
+    async def enqueue(
+        self,
+        kind: str,
+        thread_id: str,
+        payload: dict[str, Any],
+        *,
+        max_attempts: int | None = None,
+        priority: Priority = DEFAULT_PRIORITY,
+        tenant: str | None = None,
+        idempotency_key: str | None = None,
+        batch_id: str | None = None,
+    ) -> Job:
+        job = _new_job(
+            kind, thread_id, payload, max_attempts, priority, tenant, idempotency_key, batch_id
+        )
+        return await run_io(self._enqueue, job)
+
+    async def claim(
+        self, worker_id: str, *, lease_s: float, lanes: Sequence[str] | None = None
+    ) -> Job | None:
+        return await run_io(self._claim, worker_id, lease_s, lanes)
+
+    async def heartbeat(self, job_id: str, worker_id: str, *, lease_s: float) -> bool:
+        return await run_io(
+            self._update_owned, job_id, worker_id, "locked_until = ?", (time.time() + lease_s,)
+        )
+
+    async def complete(self, job_id: str, worker_id: str) -> bool:
+        return await run_io(
+            self._update_owned, job_id, worker_id,
+            "status = 'succeeded', locked_by = NULL, locked_until = NULL", (),
+        )
+
+    async def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        return await run_io(self._fail, job_id, worker_id, error)
+
+    async def release(self, job_id: str, worker_id: str) -> bool:
+        return await run_io(
+            self._update_owned, job_id, worker_id,
+            "status = 'queued', locked_by = NULL, locked_until = NULL, "
+            "attempts = attempts - 1, run_after = ?",
+            (time.time(),),
+        )
+
+    async def get(self, job_id: str) -> Job | None:
+        return await run_io(self._get, job_id)
+
+    async def get_by_key(self, idempotency_key: str) -> Job | None:
+        return await run_io(self._get_by_key, idempotency_key)
+
+    async def list_batch(self, batch_id: str) -> list[Job]:
+        return await run_io(self._list_batch, batch_id)
+
+    async def counts(self) -> dict[str, int]:
+        return await run_io(self._counts)
+
+    async def lane_stats(self, since: float) -> dict[str, dict[str, Any]]:
+        return await run_io(self._lane_stats, since)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# ---------------------------------------------------------------------------
+# Postgres
+# ---------------------------------------------------------------------------
+
+
+class PostgresJobQueue(JobQueue):
+    """Queue table in the checkpointer's Postgres; safe across hosts."""
+
+    _POOL_MAX_SIZE = 4
+
+    def __init__(self, conninfo: str | None = None) -> None:
+        self.conninfo = conninfo or settings.database_url
+        if not self.conninfo:
+            raise ValueError("DATABASE_URL is required for the Postgres job queue.")
+        self._pool: Any = None
+        self._ready = False
+        self._init_lock = asyncio.Lock()
+
+    async def _connection(self) -> Any:
+        if not self._ready:
+            async with self._init_lock:  # worker slots share one pool and schema setup
+                await self._init()
+        return self._pool.connection()
+
+    async def _init(self) -> None:
+        if self._pool is None:
+            from psycopg_pool import AsyncConnectionPool
+
+            # Same connection settings as the checkpointer (Supabase pooler)
+            self._pool = AsyncConnectionPool(
+                self.conninfo,
+                min_size=1,
+                max_size=self._POOL_MAX_SIZE,
+                kwargs={"autocommit": True, "prepare_threshold": 0},
+                open=False,
+            )
+            await self._pool.open()
+        if not self._ready:
+            async with self._pool.connection() as conn:
+                await conn.execute(_SCHEMA)
+                for column in _ADDED_COLUMNS:
+                    await conn.execute(
+                        f"ALTER TABLE pipeline_jobs ADD COLUMN IF NOT EXISTS {column}"
+                    )
+                for index in _INDEXES:
+                    await conn.execute(index)
+            self._ready = True
+
+    async def _fetchone(self, sql: str, params: tuple) -> tuple | None:
+        async with await self._connection() as conn:
+            cur = await conn.execute(sql, params)
+            return await cur.fetchone() if cur.description else None
+
+    async def _update_owned(
+        self, job_id: str, worker_id: str, assignments: str, params: tuple
+    ) -> bool:
+        row = await self._fetchone(
+            f"UPDATE pipeline_jobs SET {assignments}, updated_at = %s "
+            "WHERE id = %s AND locked_by = %s AND status = 'running' RETURNING id",
+            (*params, time.time(), job_id, worker_id),
+        )
+        return row is not None
+
+    async def enqueue(
+        self,
+        kind: str,
+        thread_id: str,
+        payload: dict[str, Any],
+        *,
+        max_attempts: int | None = None,
+        priority: Priority = DEFAULT_PRIORITY,
+        tenant: str | None = None,
+        idempotency_key: str | None = None,
+        batch_id: str | None = None,
+    ) -> Job:
+        job = _new_job(
+            kind, thread_id, payload, max_attempts, priority, tenant, idempotency_key, batch_id
+        )
+        row = await self._fetchone(
+            f"INSERT INTO pipeline_jobs ({_COLUMNS}) VALUES ({', '.join(['%s'] * 18)}) "
+            f"{_ON_KEY_CONFLICT} RETURNING {_COLUMNS}",
+            _row(job),
+        )
+        if row is not None:
+            return Job.from_row(row)
+        # Key already held by a live job
+        existing = await self.get_by_key(job.idempotency_key or "")
+        return existing or job
+
+    async def claim(
+        self, worker_id: str, *, lease_s: float, lanes: Sequence[str] | None = None
+    ) -> Job | None:
+        now = time.time()
+        async with await self._connection() as conn:
+            await conn.execute(
+                "UPDATE pipeline_jobs SET status = 'failed', locked_by = NULL, "
+                "locked_until = NULL, last_error = 'lease expired on final attempt', "
+                f"updated_at = %s WHERE {_EXHAUSTED.format(now='%s')}",
+                (now, now),
+            )
+            # Quotas are checked before the claim, not under a lock: two workers
+            # racing for a tenant's last slot may overshoot it by one
+            saturated = []
+            if quotas_enabled():
+                cur = await conn.execute(_RUNNING_BY_TENANT.format(now="%s"), (now,))
+                saturated = saturated_tenants(dict(await cur.fetchall()))
+            cur = await conn.execute(
+                "UPDATE pipeline_jobs SET status = 'running', attempts = attempts + 1, "
+                "locked_by = %s, locked_until = %s, updated_at = %s, "
+                "started_at = COALESCE(started_at, %s) "
+                "WHERE id = (SELECT id FROM pipeline_jobs "
+                f"WHERE ({_READY.format(now='%s')}){_not_saturated(saturated, '%s')} "
+                f"{_order(lanes)} LIMIT 1 FOR UPDATE SKIP LOCKED) RETURNING {_COLUMNS}",
+                (worker_id, now + lease_s, now, now, now, now, *saturated),
+            )
+            row = await cur.fetchone()
+        return Job.from_row(row) if row else None
+
+    async def heartbeat(self, job_id: str, worker_id: str, *, lease_s: float) -> bool:
+        return await self._update_owned(
+            job_id, worker_id, "locked_until = %s", (time.time() + lease_s,)
+        )
+
+    async def complete(self, job_id: str, worker_id: str) -> bool:
+        return await self._update_owned(
+            job_id, worker_id, "status = 'succeeded', locked_by = NULL, locked_until = NULL", ()
+        )
+
+    async def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        row = await self._fetchone(
+            "SELECT attempts FROM pipeline_jobs "
+            "WHERE id = %s AND locked_by = %s AND status = 'running'",
+            (job_id, worker_id),
+        )
+        if row is None:
+            return False
+        return await self._update_owned(
+            job_id, worker_id,
+            "status = CASE WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END, "
+            "locked_by = NULL, locked_until = NULL, last_error = %s, run_after = %s",
+            (error, time.time() + backoff_s(row[0])),
+        )
+
+    async def release(self, job_id: str, worker_id: str) -> bool:
+        return await self._update_owned(
+            job_id, worker_id,
+            "status = 'queued', locked_by = NULL, locked_until = NULL, "
+            "attempts = attempts - 1, run_after = %s",
+            (time.time(),),
+        )
+
+    async def get(self, job_id: str) -> Job | None:
+        row = await self._fetchone(
+            f"SELECT {_COLUMNS} FROM pipeline_jobs WHERE id = %s", (job_id,)
+        )
+        return Job.from_row(row) if row else None
+
+    async def get_by_key(self, idempotency_key: str) -> Job | None:
+        row = await self._fetchone(
+            f"SELECT {_COLUMNS} FROM pipeline_jobs WHERE idempotency_key = %s",
+            (idempotency_key,),
+        )
+        return Job.from_row(row) if row else None
+
+    async def list_batch(self, batch_id: str) -> list[Job]:
+        async with await self._connection() as conn:
+            cur = await conn.execute(
+                f"SELECT {_COLUMNS} FROM pipeline_jobs WHERE batch_id = %s ORDER BY created_at",
+                (batch_id,),
+            )
+            rows = await cur.fetchall()
+        return [Job.from_row(row) for row in rows]
+
+    async def counts(self) -> dict[str, int]:
+        async with await self._connection() as conn:
+            cur = await conn.execute("SELECT status, COUNT(*) FROM pipeline_jobs GROUP BY status")
+            rows = await cur.fetchall()
+        return {status: count for status, count in rows}
+
+    async def lane_stats(self, since: float) -> dict[str, dict[str, Any]]:
+        async with await self._connection() as conn:
+            cur = await conn.execute(_LANE_COUNTS)
+            counts = await cur.fetchall()
+            cur = await conn.execute(_WAITS.format(since="%s"), (since,))
+            waits = await cur.fetchall()
+        return _lane_stats(counts, waits)
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            self._ready = False
+
+
+_queue_instance: JobQueue | None = None
+
+
+def create_job_queue() -> JobQueue:
+    """Build the configured backend (Postgres when DATABASE_URL is set)."""
+    backend = settings.job_queue_backend or ("postgres" if settings.database_url else "sqlite")
+    if backend == "postgres":
+        return PostgresJobQueue()
+    return SqliteJobQueue()
+
+
+def get_job_queue() -> JobQueue:
+    """Get or create the process-wide JobQueue."""
+    global _queue_instance  # noqa: PLW0603
+    if _queue_instance is None:
+        _queue_instance = create_job_queue()
+    return _queue_instance
@@ -0,0 +1,206 @@
+"""Worker pool that executes queued pipeline jobs.
+
+``concurrency`` slots each claim one job at a time, so at most that many
+graphs run in this process however many triggers arrive. While a job runs
+its lease is extended every third of the visibility timeout; a worker that
+dies stops extending it and the job is reclaimed once the lease expires.
+A worker that finds its lease lost (it stalled past the timeout and the
+job may already run elsewhere) cancels the handler instead of finishing
+the graph a second time.
+
+Slots claim through the pool's :class:`LaneScheduler`, so the pool as a
+whole serves the priority lanes in proportion to ``JOB_LANE_WEIGHTS``.
+
+Graceful shutdown cancels running jobs and hands them back to the queue
+without using up an attempt; the next worker resumes them from the last
+checkpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import uuid
+from typing import Any
+
+from editorial_ai.config import settings
+from editorial_ai.jobs.handlers import JOB_HANDLERS, JobHandler
+from editorial_ai.jobs.queue import Job, JobQueue, get_job_queue
+from editorial_ai.jobs.scheduler import LaneScheduler
+from editorial_ai.observability.events import SETTLED_STATUSES, publish_progress
+from editorial_ai.observability.metrics import JOB_QUEUE_WAIT
+from editorial_ai.observability.run_status import get_run_status_registry
+
+logger = logging.getLogger(__name__)
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobWorkerPool:
+    """Claims jobs from the queue and runs them with bounded concurrency."""
+
+    def __init__(
+        self,
+        graph: Any,
+        *,
+        queue: JobQueue | None = None,
+        concurrency: int | None = None,
+        lease_s: float | None = None,
+        poll_interval_s: float | None = None,
+        handlers: dict[str, JobHandler] | None = None,
+        worker_id: str | None = None,
+        scheduler: LaneScheduler | None = None,
+    ) -> None:
+        self.graph = graph
+        self.queue = queue or get_job_queue()
+        self.concurrency = (
+            concurrency if concurrency is not None else settings.job_worker_concurrency
+        )
+        self.lease_s = lease_s if lease_s is not None else settings.job_visibility_timeout_s
+        self.poll_interval_s = (
+            poll_interval_s if poll_interval_s is not None else settings.job_poll_interval_s
+        )
+        self.handlers = handlers if handlers is not None else JOB_HANDLERS
+        self.worker_id = worker_id or _default_worker_id()
+        self.scheduler = scheduler or LaneScheduler()
+        self._slots: list[asyncio.Task[None]] = []
+        self._wakeup = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return any(not t.done() for t in self._slots)
+
+    def start(self) -> None:
+        """Start the worker slots on the running loop (no-op if disabled or running)."""
+        if self.concurrency <= 0 or self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._slots = [
+            loop.create_task(self._slot(), name=f"job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        logger.info("Job worker %s started with %d slots", self.worker_id, self.concurrency)
+
+    def notify(self) -> None:
+        """Wake idle slots now instead of at the next poll (new job enqueued)."""
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        slots, self._slots = self._slots, []
+        for task in slots:
+            task.cancel()
+        for task in slots:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def run_once(self) -> Job | None:
+        """Claim and run one ready job. Returns it, or None if the queue was empty."""
+        job = await self.queue.claim(
+            self.worker_id, lease_s=self.lease_s, lanes=self.scheduler.order()
+        )
+        if job is None:
+            return None
+        self.scheduler.charge(job.priority)
+        if job.attempts == 1 and job.queue_wait_s is not None:
+            JOB_QUEUE_WAIT.labels(job.priority).observe(job.queue_wait_s)
+        await self._execute(job)
+        return job
+
+    async def _slot(self) -> None:
+        while True:
+            try:
+                job = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.warning("Job worker slot error; backing off", exc_info=True)
+                job = None
+            if job is None:
+                self._wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_s)
+
+    async def _execute(self, job: Job) -> None:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            await self._fail(job, f"no handler for job kind {job.kind!r}")
+            return
+
+        loop = asyncio.get_running_loop()
+        run = loop.create_task(handler(self.graph, job), name=f"job-{job.id}")
+        lease_lost = asyncio.Event()
+        heartbeat = loop.create_task(self._heartbeat(job, run, lease_lost))
+        try:
+            await run
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if lease_lost.is_set() and not (current and current.cancelling()):
+                # The job is no longer ours: nothing to release, complete or fail
+                logger.warning(
+                    "Stopped job %s (thread %s) after losing its lease", job.id, job.thread_id
+                )
+                return
+            # Shutdown: give the job back so another worker resumes it promptly
+            with contextlib.suppress(Exception):
+                await asyncio.shield(self.queue.release(job.id, self.worker_id))
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Job %s (%s, thread %s) failed", job.id, job.kind, job.thread_id)
+            await self._fail(job, f"{type(exc).__name__}: {exc}")
+        else:
+            if not await self.queue.complete(job.id, self.worker_id):
+                logger.warning("Job %s finished after its lease was lost", job.id)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _fail(self, job: Job, error: str) -> None:
+        if not await self.queue.fail(job.id, self.worker_id, error):
+            return
+        if job.attempts >= job.max_attempts:
+            await _settle_failed(job, error)
+
+    async def _heartbeat(
+        self, job: Job, run: asyncio.Task[Any], lease_lost: asyncio.Event
+    ) -> None:
+        interval = max(self.lease_s / 3, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.queue.heartbeat(job.id, self.worker_id, lease_s=self.lease_s):
+                    logger.warning(
+                        "Lost lease on job %s (thread %s); cancelling it", job.id, job.thread_id
+                    )
+                    lease_lost.set()
+                    run.cancel()
+                    return
+            except Exception:  # noqa: BLE001
+                logger.warning("Heartbeat for job %s failed", job.id, exc_info=True)
+
+
+async def _settle_failed(job: Job, error: str) -> None:
+    """Publish a terminal ``failed`` status for a job that will not be retried.
+
+    Without it a run whose node raised never reaches a settled status and
+    ``/stream`` subscribers wait forever. A run the handler already settled
+    (a resume handed back to the admin) keeps its status.
+    """
+    registry = get_run_status_registry()
+    try:
+        current = await registry.get(job.thread_id)
+        if current is not None and current.pipeline_status in SETTLED_STATUSES:
+            return
+        await registry.failed(job.thread_id, f"job {job.kind} failed: {error}")
+    except Exception:  # noqa: BLE001
+        logger.warning("Failed to record failure of thread %s", job.thread_id, exc_info=True)
+        current = None
+    publish_progress(
+        job.thread_id, "status", None,
+        pipeline_status="failed", previous=current.pipeline_status if current else None,
+    )
@@ -23,7 +23,8 @@ async def admin_gate(state: EditorialPipelineState) -> dict:
     """Pause pipeline for admin approval via LangGraph interrupt.
 
     Flow:
-    1. Save content to Supabase as pending (upsert = idempotent on re-execution)
+    1. Save content to Supabase as pending (upsert = idempotent on re-execution;
+       a record the admin already decided on keeps its status)
     2. Set pipeline_status to awaiting_approval
     3. Call interrupt() with snapshot for admin review
     4. On resume, branch on admin decision
@@ -12,7 +12,8 @@ import re
 
 from google.genai import types
 
-from editorial_ai.observability import record_token_usage
+from editorial_ai.batch import shared
+from editorial_ai.observability import llm_call
 from editorial_ai.routing import get_model_router
 from editorial_ai.services.curation_service import CurationService, get_genai_client
 from editorial_ai.state import EditorialPipelineState
@@ -43,23 +44,16 @@ async def _expand_keyword_for_db(keyword: str) -> dict:
         "Return ONLY valid JSON."
     )
 
-    response = await client.aio.models.generate_content(
-        model=decision.model,
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.3,
-        ),
-    )
-
-    if hasattr(response, "usage_metadata") and response.usage_metadata:
-        record_token_usage(
-            prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-            completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-            total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-            model_name=decision.model,
-            routing_reason=decision.reason,
+    async with llm_call("curation_db_expand", decision) as call:
+        response = await client.aio.models.generate_content(
+            model=decision.model,
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                temperature=0.3,
+            ),
         )
+        call.record(response, request=prompt)
 
     raw_text = response.text or "{}"
     # Strip markdown fences if present
@@ -124,7 +118,9 @@ async def curation_node(state: EditorialPipelineState) -> dict:
     # AI DB Search mode: expand keyword into DB search terms via lightweight LLM call
     if curation_input.get("mode") == "ai_db_search":
         try:
-            topic_dict = await _expand_keyword_for_db(keyword)
+            topic_dict = await shared(
+                "db_keyword_expansion", keyword, lambda: _expand_keyword_for_db(keyword)
+            )
             logger.info(
                 "AI DB Search: expanded '%s' into %d search terms",
                 keyword,
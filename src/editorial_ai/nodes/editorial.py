@@ -3,6 +3,11 @@
 Thin wrapper around EditorialService: reads curated_topics from state,
 calls the service, writes MagazineLayout JSON back to state.
 Also saves the Nano Banana layout image locally and as base64 in state.
+
+The trend context is trimmed to the editorial_content prompt budget
+(``prompts.budgeter``): the primary topic, keywords and instructions are
+always kept; other topic backgrounds and DB posts are ranked by
+relevance to the keywords.
 """
 
 from __future__ import annotations
@@ -11,7 +16,14 @@ import base64
 import logging
 from pathlib import Path
 
+from editorial_ai.budget import budget_status
+from editorial_ai.io_executor import run_io
 from editorial_ai.models.design_spec import DesignSpec
+from editorial_ai.prompts.budgeter import ContextChunk, estimate_tokens, fit_context, query_terms
+from editorial_ai.prompts.editorial import (
+    build_content_generation_prompt,
+    build_content_generation_prompt_with_feedback,
+)
 from editorial_ai.services.curation_service import get_genai_client
 from editorial_ai.services.editorial_service import EditorialService
 from editorial_ai.state import EditorialPipelineState
@@ -21,6 +33,58 @@ logger = logging.getLogger(__name__)
 _LAYOUT_IMAGES_DIR = Path("data/layout_images")
 
 
+def _write_layout_image(thread_id: str, image_bytes: bytes) -> Path:
+    """Write the layout image to disk (blocking — call via run_io)."""
+    _LAYOUT_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    img_path = _LAYOUT_IMAGES_DIR / f"{thread_id}.png"
+    img_path.write_bytes(image_bytes)
+    return img_path
+
+
+def _trend_context_chunks(
+    curated_topics: list[dict], enriched_contexts: list[dict], keywords: list[str]
+) -> list[ContextChunk]:
+    """Trend context pieces: topic backgrounds, keywords, DB posts."""
+    chunks = [
+        ContextChunk(bg, required=i == 0)
+        for i, topic in enumerate(curated_topics)
+        if (bg := topic.get("trend_background", ""))
+    ]
+    if keywords:
+        chunks.append(ContextChunk("Keywords: " + ", ".join(keywords), required=True))
+
+    # Real posts data if available from source node
+    if enriched_contexts:
+        chunks.append(
+            ContextChunk(
+                "\n--- 실제 데이터 (DB에서 가져온 포스트/상품 정보) ---",
+                required=True,
+            )
+        )
+        for ctx in enriched_contexts[:10]:
+            artist = ctx.get("artist_name") or "unknown"
+            group = ctx.get("group_name") or ""
+            image_url = ctx.get("image_url") or ""
+            post = f"아티스트: {artist} ({group}), 이미지: {image_url}"
+            for sol in ctx.get("solutions", [])[:3]:
+                sol_title = sol.get("title") or ""
+                if sol_title:
+                    post += f"\n  - 상품: {sol_title}"
+                    meta = sol.get("metadata") or {}
+                    kws = meta.get("keywords", [])
+                    if kws:
+                        post += f" (키워드: {', '.join(kws[:5])})"
+            chunks.append(ContextChunk(post))
+        chunks.append(
+            ContextChunk(
+                "\n위 실제 데이터를 콘텐츠에 적극 반영하세요. "
+                "실제 아티스트 이름과 상품을 언급하세요.",
+                required=True,
+            )
+        )
+    return chunks
+
+
 async def editorial_node(state: EditorialPipelineState) -> dict:
     """LangGraph node: generate editorial content from curated topics.
 
@@ -37,13 +101,8 @@ async def editorial_node(state: EditorialPipelineState) -> dict:
             "current_draft": None,
         }
 
-    # Build trend context from all topics
-    backgrounds = []
     keywords = []
     for topic in curated_topics:
-        bg = topic.get("trend_background", "")
-        if bg:
-            backgrounds.append(bg)
         kw = topic.get("keyword", "")
         if kw:
             keywords.append(kw)
@@ -51,29 +110,6 @@ async def editorial_node(state: EditorialPipelineState) -> dict:
             if rk:
                 keywords.append(rk)
 
-    trend_context = "\n".join(backgrounds)
-    if keywords:
-        trend_context += "\nKeywords: " + ", ".join(keywords)
-
-    # Append real posts data if available from source node
-    enriched_contexts = state.get("enriched_contexts") or []
-    if enriched_contexts:
-        trend_context += "\n\n--- 실제 데이터 (DB에서 가져온 포스트/상품 정보) ---\n"
-        for ctx in enriched_contexts[:10]:
-            artist = ctx.get("artist_name") or "unknown"
-            group = ctx.get("group_name") or ""
-            image_url = ctx.get("image_url") or ""
-            trend_context += f"\n아티스트: {artist} ({group}), 이미지: {image_url}"
-            for sol in ctx.get("solutions", [])[:3]:
-                sol_title = sol.get("title") or ""
-                if sol_title:
-                    trend_context += f"\n  - 상품: {sol_title}"
-                    meta = sol.get("metadata") or {}
-                    kws = meta.get("keywords", [])
-                    if kws:
-                        trend_context += f" (키워드: {', '.join(kws[:5])})"
-        trend_context += "\n\n위 실제 데이터를 콘텐츠에 적극 반영하세요. 실제 아티스트 이름과 상품을 언급하세요."
-
     # Use first topic keyword or fall back to curation_input seed keyword
     primary_keyword = curated_topics[0].get("keyword", "")
     if not primary_keyword:
@@ -84,13 +120,47 @@ async def editorial_node(state: EditorialPipelineState) -> dict:
     feedback_history = state.get("feedback_history") or []
     previous_draft = state.get("current_draft") if feedback_history else None
 
+    # Build trend context from all topics, trimmed to the prompt budget
+    enriched_contexts = state.get("enriched_contexts") or []
+    if feedback_history:
+        template = build_content_generation_prompt_with_feedback(
+            primary_keyword, "", feedback_history, previous_draft
+        )
+    else:
+        template = build_content_generation_prompt(primary_keyword, "")
+    trend_context = fit_context(
+        "editorial_content",
+        _trend_context_chunks(curated_topics, enriched_contexts, keywords),
+        terms=query_terms(primary_keyword, *keywords),
+        reserve_tokens=estimate_tokens(template),
+    ).text
+
     revision_count = state.get("revision_count", 0)
     # NOTE: explicit caching disabled — cached_content + response_schema causes
     # Gemini API to hang indefinitely.  Implicit caching still applies.
     cache_name = None
 
+    # Budget degradation: skip Nano Banana when low, no repair loop when critical
+    budget = budget_status(state)
+    budget_update: dict = {}
+    generate_image = True
+    max_repair_attempts: int | None = None
+    if budget is not None:
+        decisions = []
+        if budget.at_least("low"):
+            generate_image = False
+            decisions.append(budget.decision("editorial", "skip_layout_image"))
+        if budget.at_least("critical"):
+            max_repair_attempts = 0
+            decisions.append(budget.decision("editorial", "skip_repair_loop"))
+        budget_update = {"budget_status": budget.level}
+        if decisions:
+            budget_update["budget_decisions"] = decisions
+
     try:
-        service = EditorialService(get_genai_client())
+        service = EditorialService(
+            get_genai_client(), max_repair_attempts=max_repair_attempts
+        )
         layout, image_bytes = await service.create_editorial(
             primary_keyword,
             trend_context,
@@ -99,6 +169,8 @@ async def editorial_node(state: EditorialPipelineState) -> dict:
             revision_count=revision_count,
             cache_name=cache_name,
             enriched_contexts=enriched_contexts,
+            budget_level=budget.level if budget else None,
+            generate_image=generate_image,
         )
         # Inject design_spec into layout so it persists in layout_json
         design_spec = state.get("design_spec")
@@ -111,15 +183,16 @@ async def editorial_node(state: EditorialPipelineState) -> dict:
             layout_image_base64 = base64.b64encode(image_bytes).decode("ascii")
             # Save to local file for debugging
             thread_id = state.get("thread_id") or "unknown"
-            _LAYOUT_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
-            img_path = _LAYOUT_IMAGES_DIR / f"{thread_id}.png"
-            img_path.write_bytes(image_bytes)
+            if state.get("topic_index") is not None:  # fan-out branch of the run
+                thread_id = f"{thread_id}-topic-{state['topic_index']}"
+            img_path = await run_io(_write_layout_image, thread_id, image_bytes)
             logger.info("Saved layout image: %s (%d bytes)", img_path, len(image_bytes))
 
         return {
             "current_draft": layout.model_dump(),
             "layout_image_base64": layout_image_base64,
             "pipeline_status": "reviewing",
+            **budget_update,
         }
     except Exception as e:  # noqa: BLE001
         logger.exception("Editorial node failed for keyword=%s", primary_keyword)
@@ -127,4 +200,5 @@ async def editorial_node(state: EditorialPipelineState) -> dict:
             "pipeline_status": "failed",
             "error_log": [f"Editorial failed: {type(e).__name__}: {e!s}"],
             "current_draft": None,
+            **budget_update,
         }
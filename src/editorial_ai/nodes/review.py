@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 
+from editorial_ai.budget import budget_status
 from editorial_ai.rubrics import classify_content_type, get_rubric
 from editorial_ai.services.curation_service import get_genai_client
 from editorial_ai.services.review_service import ReviewService
@@ -29,6 +30,8 @@ async def review_node(state: EditorialPipelineState) -> dict:
     On fail: increments revision_count, appends to feedback_history
     On escalation (revision_count >= MAX_REVISIONS and still failing):
         sets pipeline_status = "failed", appends to error_log
+    On fail with the run budget exhausted: no further revisions; the draft
+        goes to admin_gate with pipeline_status = "awaiting_approval"
     """
     current_draft = state.get("current_draft")
     if not current_draft:
@@ -55,9 +58,17 @@ async def review_node(state: EditorialPipelineState) -> dict:
 
     revision_count = state.get("revision_count", 0)
     # NOTE: explicit caching disabled — cached_content + response_schema causes
-    # Gemini API to hang indefinitely.  Implicit caching still applies.
+    # Gemini API to hang indefinitely.  Implicit caching still applies, and
+    # ReviewService caches the static rubric prefix itself (prompts.assembly).
     cache_name = None
 
+    budget = budget_status(state)
+    budget_update: dict = {}
+    if budget is not None:
+        budget_update["budget_status"] = budget.level
+        if budget.at_least("critical"):
+            budget_update["budget_decisions"] = [budget.decision("review", "review_budget_model")]
+
     try:
         service = ReviewService(get_genai_client())
         result = await service.evaluate(
@@ -66,10 +77,12 @@ async def review_node(state: EditorialPipelineState) -> dict:
             rubric_config=rubric_config,
             revision_count=revision_count,
             cache_name=cache_name,
+            budget_level=budget.level if budget else None,
         )
     except Exception as e:  # noqa: BLE001
         logger.exception("Review node failed")
         return {
+            **budget_update,
             "review_result": {"passed": False},
             "revision_count": state.get("revision_count", 0) + 1,
             "feedback_history": [
@@ -79,10 +92,21 @@ async def review_node(state: EditorialPipelineState) -> dict:
         }
 
     result_dict = result.model_dump()
-    update: dict = {"review_result": result_dict}
+    update: dict = {"review_result": result_dict, **budget_update}
 
     if result.passed:
         update["pipeline_status"] = "awaiting_approval"
+    elif budget is not None and budget.level == "exhausted":
+        # Out of budget: no more revision loops, let the admin decide
+        update["pipeline_status"] = "awaiting_approval"
+        update["budget_decisions"] = [
+            *budget_update.get("budget_decisions", []),
+            budget.decision("review", "skip_revisions"),
+        ]
+        update["error_log"] = [
+            f"Budget exhausted: sending failed draft to admin_gate without revision. "
+            f"Last failure: {result.summary}"
+        ]
     else:
         new_revision_count = state.get("revision_count", 0) + 1
         update["revision_count"] = new_revision_count
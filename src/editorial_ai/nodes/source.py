@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import logging
 
+from editorial_ai.batch import shared
+from editorial_ai.observability import supabase_query
 from editorial_ai.services.supabase_client import get_supabase_client
 from editorial_ai.state import EditorialPipelineState
 
@@ -178,27 +180,18 @@ async def _fetch_posts_with_solutions(
         if len(all_posts) >= max_posts:
             break
 
-        pattern = f"%{term}%"
         try:
-            response = await (
-                client.table("posts")
-                .select("id, image_url, media_type, title, artist_name, group_name, context, view_count, trending_score")
-                .or_(
-                    f"artist_name.ilike.{pattern},"
-                    f"group_name.ilike.{pattern},"
-                    f"context.ilike.{pattern},"
-                    f"title.ilike.{pattern}"
-                )
-                .eq("status", "active")
-                .order("view_count", desc=True)
-                .limit(limit_per_term)
-                .execute()
+            # Runs of a batch about the same artists share these searches
+            posts = await shared(
+                "posts_search",
+                (term, limit_per_term),
+                lambda t=term: _search_posts(client, t, limit_per_term),
             )
         except Exception:  # noqa: BLE001
             logger.warning("Failed to search posts for term: %s", term)
             continue
 
-        for post in response.data:
+        for post in posts:
             post_id = post["id"]
             if post_id in seen_ids:
                 continue
@@ -209,7 +202,9 @@ async def _fetch_posts_with_solutions(
     contexts: list[dict] = []
     for post in all_posts[:max_posts]:
         post_id = post["id"]
-        solutions = await _fetch_solutions_for_post(client, post_id)
+        solutions = await shared(
+            "post_solutions", post_id, lambda p=post_id: _fetch_solutions_for_post(client, p)
+        )
         contexts.append({
             "post_id": post_id,
             "image_url": post.get("image_url"),
@@ -223,16 +218,43 @@ async def _fetch_posts_with_solutions(
     return contexts
 
 
-async def _fetch_solutions_for_post(client, post_id: str) -> list[dict]:
-    """Fetch solutions linked to a post via spots."""
-    try:
+async def _search_posts(client, term: str, limit: int) -> list[dict]:
+    """Active posts whose artist, group, context or title mention ``term``."""
+    pattern = f"%{term}%"
+    with supabase_query("posts"):
         response = await (
-            client.table("spots")
-            .select("id, solutions(id, title, thumbnail_url, metadata, link_type, original_url)")
-            .eq("post_id", post_id)
-            .limit(10)
+            client.table("posts")
+            .select(
+                "id, image_url, media_type, title, artist_name, group_name, context, "
+                "view_count, trending_score"
+            )
+            .or_(
+                f"artist_name.ilike.{pattern},"
+                f"group_name.ilike.{pattern},"
+                f"context.ilike.{pattern},"
+                f"title.ilike.{pattern}"
+            )
+            .eq("status", "active")
+            .order("view_count", desc=True)
+            .limit(limit)
             .execute()
         )
+    return response.data
+
+
+async def _fetch_solutions_for_post(client, post_id: str) -> list[dict]:
+    """Fetch solutions linked to a post via spots."""
+    try:
+        with supabase_query("spots"):
+            response = await (
+                client.table("spots")
+                .select(
+                    "id, solutions(id, title, thumbnail_url, metadata, link_type, original_url)"
+                )
+                .eq("post_id", post_id)
+                .limit(10)
+                .execute()
+            )
     except Exception:  # noqa: BLE001
         logger.warning("Failed to fetch spots/solutions for post: %s", post_id)
         return []
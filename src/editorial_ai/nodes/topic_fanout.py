@@ -0,0 +1,230 @@
+"""Topic fan-out: one article per curated topic from a single curation pass.
+
+With ``EDITORIAL_FANOUT_ENABLED`` the graph (see ``build_graph(fanout=...)``)
+replaces the editorial -> enrich -> review chain by:
+
+    (design_spec || source) --> upstream_ready --Send per topic--> topic_article (x N)
+        --> collect_drafts --> admin_gate
+
+- :func:`route_topics` sends one branch per qualifying topic (not
+  ``low_quality``, at most ``EDITORIAL_FANOUT_MAX_TOPICS``). Each branch gets
+  only the keys it needs plus its single topic; the source fetch runs once
+  upstream and every branch drafts from the same ``enriched_contexts``. A
+  budgeted run gives each branch an equal share of what it has left.
+- ``topic_article`` runs the editorial -> enrich -> review loop for its topic
+  (the usual nodes, revision loop included). At most
+  ``EDITORIAL_FANOUT_CONCURRENCY`` branches of a run draft at once. The draft
+  goes to the draft store; state keeps a reference in ``topic_drafts``.
+- :func:`collect_drafts_node` takes the first ready draft (curation order)
+  through this run's admin_gate and queues a ``pipeline_gate`` job for every
+  other ready draft, which opens its own approval thread
+  ``{thread_id}-topic-{index}``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langgraph.graph import END
+from langgraph.types import Send
+
+from editorial_ai.budget import split_budget
+from editorial_ai.config import settings
+from editorial_ai.jobs import PIPELINE_GATE, get_job_queue
+from editorial_ai.observability.run_status import get_run_status_registry
+from editorial_ai.priority import normalize_priority
+from editorial_ai.services.draft_store import load_draft, save_draft
+from editorial_ai.state import EditorialPipelineState
+
+logger = logging.getLogger(__name__)
+
+FANOUT_BRANCH = "topic_article"
+FANOUT_COLLECT = "collect_drafts"
+FANOUT_JOIN = "upstream_ready"
+
+# Parent keys a branch drafts from (the rest of the run state stays behind)
+_BRANCH_KEYS = (
+    "thread_id",
+    "curation_input",
+    "design_spec",
+    "enriched_contexts",
+    "profile",
+    "model_overrides",
+    "priority",
+    "batch_id",
+)
+# Keys an extra topic's approval thread starts from, besides its draft
+_GATE_KEYS = ("design_spec", "profile", "model_overrides", "priority", "batch_id")
+# Branch output stored in the draft store
+_DRAFT_KEYS = ("current_draft", "layout_image_base64", "review_result", "revision_count")
+
+_branch_slots: weakref.WeakValueDictionary[str, asyncio.Semaphore] = weakref.WeakValueDictionary()
+
+
+def _branch_slot(thread_id: str) -> asyncio.Semaphore:
+    """Per-run semaphore bounding how many branches draft at once."""
+    slot = _branch_slots.get(thread_id)
+    if slot is None:
+        slot = asyncio.Semaphore(max(1, settings.editorial_fanout_concurrency))
+        _branch_slots[thread_id] = slot
+    return slot
+
+
+def topic_thread_id(thread_id: str, topic_index: int) -> str:
+    """Thread (and draft key) of the article drafted for topic ``topic_index``."""
+    return f"{thread_id}-topic-{topic_index}"
+
+
+def qualifying_topics(state: EditorialPipelineState) -> list[tuple[int, dict]]:
+    """(index, topic) pairs that get their own branch, in curation order."""
+    topics = state.get("curated_topics") or []
+    picked = [
+        (i, topic)
+        for i, topic in enumerate(topics)
+        if topic.get("keyword") and not topic.get("low_quality")
+    ]
+    if not picked and topics:
+        picked = [(0, topics[0])]  # all low quality: draft the top one, as editorial would
+    return picked[: max(1, settings.editorial_fanout_max_topics)]
+
+
+def join_upstream(state: EditorialPipelineState) -> dict:
+    """Join point of design_spec and source; branches are sent from here."""
+    return {}
+
+
+def route_topics(state: EditorialPipelineState) -> list[Send] | str:
+    """Send one ``topic_article`` branch per qualifying topic."""
+    picked = qualifying_topics(state)
+    if not picked:
+        return FANOUT_COLLECT
+    base = {key: state[key] for key in _BRANCH_KEYS if state.get(key) is not None}
+    budget = split_budget(state, len(picked))
+    if budget is not None:
+        base.update(budget=budget, budget_spent=[])
+    return [
+        Send(
+            FANOUT_BRANCH,
+            {
+                **base,
+                "curated_topics": [topic],
+                "topic_index": index,
+                "revision_count": 0,
+                "pipeline_status": "drafting",
+            },
+        )
+        for index, topic in picked
+    ]
+
+
+def topic_branch_node(
+    branch: Any,
+) -> Callable[[EditorialPipelineState], Awaitable[dict]]:
+    """Graph node running the compiled editorial -> enrich -> review ``branch``."""
+
+    async def topic_article(state: EditorialPipelineState) -> dict:
+        thread_id = state.get("thread_id") or "unknown"
+        index = state.get("topic_index") or 0
+        keyword = (state.get("curated_topics") or [{}])[0].get("keyword", "")
+
+        async with _branch_slot(thread_id):
+            final = await branch.ainvoke(state)
+
+        draft = final.get("current_draft")
+        ref = None
+        if draft:
+            ref = await save_draft(
+                thread_id,
+                f"topic-{index}",
+                {key: final.get(key) for key in _DRAFT_KEYS},
+            )
+        review_result = final.get("review_result") or {}
+        entry = {
+            "topic_index": index,
+            "keyword": keyword,
+            "draft_ref": ref,
+            "ready": bool(draft) and final.get("pipeline_status") == "awaiting_approval",
+            "passed": bool(review_result.get("passed")),
+            "revision_count": final.get("revision_count", 0),
+        }
+        return {
+            "topic_drafts": [entry],
+            "budget_spent": final.get("budget_spent") or [],  # the branch's own ledger
+            "budget_decisions": final.get("budget_decisions") or [],
+            "error_log": [f"[{keyword}] {err}" for err in final.get("error_log") or []],
+        }
+
+    return topic_article
+
+
+async def _queue_topic_gate(state: EditorialPipelineState, entry: dict) -> str:
+    """Queue the job opening the approval thread of an extra topic's draft."""
+    thread_id = state.get("thread_id") or "unknown"
+    index = entry["topic_index"]
+    child = topic_thread_id(thread_id, index)
+    topics = state.get("curated_topics") or []
+    seed = {key: state[key] for key in _GATE_KEYS if state.get(key) is not None}
+    seed["curation_input"] = {
+        **(state.get("curation_input") or {}),
+        "seed_keyword": entry.get("keyword", ""),
+    }
+    seed["curated_topics"] = [topics[index]] if index < len(topics) else []
+    seed["topic_index"] = index
+
+    await get_job_queue().enqueue(
+        PIPELINE_GATE,
+        child,
+        {
+            "parent_thread_id": thread_id,
+            "draft_ref": entry["draft_ref"],
+            "as_node": FANOUT_COLLECT,
+            "state": seed,
+        },
+        priority=normalize_priority(state.get("priority")),
+        idempotency_key=f"{PIPELINE_GATE}:{child}",
+        batch_id=state.get("batch_id"),
+    )
+    await get_run_status_registry().enqueued(child)
+    return child
+
+
+async def collect_drafts_node(state: EditorialPipelineState) -> dict:
+    """Take the first ready draft to admin_gate; queue approval threads for the rest."""
+    entries = sorted(state.get("topic_drafts") or [], key=lambda e: e["topic_index"])
+    ready = [e for e in entries if e.get("ready") and e.get("draft_ref")]
+    if not ready:
+        return {
+            "pipeline_status": "failed",
+            "current_draft": None,
+            "error_log": [
+                f"Topic fan-out: no draft ready for approval out of {len(entries)} topic(s)"
+            ],
+        }
+
+    primary, *others = ready
+    draft = await load_draft(primary["draft_ref"])
+    if draft is None:
+        raise LookupError(f"Draft {primary['draft_ref']} not found")
+
+    for entry in others:
+        child = await _queue_topic_gate(state, entry)
+        logger.info(
+            "Queued approval thread %s for topic %r", child, entry.get("keyword")
+        )
+
+    return {
+        **draft,
+        "topic_index": primary["topic_index"],
+        "pipeline_status": "awaiting_approval",
+    }
+
+
+def route_after_collect(state: EditorialPipelineState) -> str:
+    """Go to admin_gate when a draft was collected, else end the run."""
+    if state.get("current_draft") and state.get("pipeline_status") == "awaiting_approval":
+        return "admin_gate"
+    return END
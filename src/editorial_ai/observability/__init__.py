@@ -5,22 +5,70 @@ from editorial_ai.observability.collector import (
     record_token_usage,
     reset_token_collector,
 )
+from editorial_ai.observability.events import (
+    EventBus,
+    ProgressEvent,
+    get_event_bus,
+    publish_progress,
+)
+from editorial_ai.observability.instrument import (
+    LLMCall,
+    llm_call,
+    pipeline_run,
+    supabase_query,
+)
+from editorial_ai.observability.log_sink import LogSink, get_log_sink
+from editorial_ai.observability.loop_monitor import LoopLagMonitor, get_loop_monitor
 from editorial_ai.observability.models import (
     NodeRunLog,
     PipelineRunSummary,
     TokenUsage,
 )
 from editorial_ai.observability.node_wrapper import node_wrapper
-from editorial_ai.observability.storage import append_node_log, read_node_logs
+from editorial_ai.observability.run_status import (
+    RunStatus,
+    RunStatusRegistry,
+    get_run_status_registry,
+)
+from editorial_ai.observability.stats_store import StatsStore, get_stats_store
+from editorial_ai.observability.storage import (
+    append_node_log,
+    append_node_log_async,
+    compact_old_logs,
+    flush_node_logs,
+    read_node_logs,
+    read_node_logs_async,
+)
 
 __all__ = [
+    "EventBus",
+    "LLMCall",
+    "LogSink",
+    "LoopLagMonitor",
     "NodeRunLog",
     "PipelineRunSummary",
+    "ProgressEvent",
+    "RunStatus",
+    "RunStatusRegistry",
+    "StatsStore",
     "TokenUsage",
     "append_node_log",
+    "append_node_log_async",
+    "compact_old_logs",
+    "flush_node_logs",
+    "get_event_bus",
+    "get_log_sink",
+    "get_loop_monitor",
+    "get_run_status_registry",
+    "get_stats_store",
     "harvest_tokens",
+    "llm_call",
+    "pipeline_run",
+    "publish_progress",
     "read_node_logs",
+    "read_node_logs_async",
     "record_token_usage",
     "node_wrapper",
     "reset_token_collector",
+    "supabase_query",
 ]
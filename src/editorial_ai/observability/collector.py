@@ -4,6 +4,10 @@ Usage pattern (called by node_wrapper):
     reset_token_collector()     # start of node
     ...                         # LLM calls invoke record_token_usage()
     tokens = harvest_tokens()   # end of node — returns and clears
+
+Prompt trims by the prompt budgeter (``prompts.budgeter``) are collected
+the same way with reset_prompt_trims / record_prompt_trim /
+harvest_prompt_trims.
 """
 
 from __future__ import annotations
@@ -11,13 +15,16 @@ from __future__ import annotations
 import logging
 from contextvars import ContextVar
 
+from editorial_ai.observability.metrics import LLM_COST, LLM_TOKENS
 from editorial_ai.observability.models import TokenUsage
+from editorial_ai.observability.pricing import get_price_table
 
 logger = logging.getLogger(__name__)
 
 _token_usage_var: ContextVar[list[TokenUsage]] = ContextVar(
     "_token_usage_var", default=[]
 )
+_prompt_trims_var: ContextVar[list[dict] | None] = ContextVar("_prompt_trims_var", default=None)
 
 
 def reset_token_collector() -> None:
@@ -31,13 +38,25 @@ def record_token_usage(
     total_tokens: int,
     model_name: str | None = None,
     routing_reason: str | None = None,
+    routing_version: str | None = None,
     cached_tokens: int = 0,
+    route: str | None = None,
+    latency_ms: float | None = None,
+    images: int = 0,
 ) -> None:
-    """Append a TokenUsage entry to the current context.
+    """Append a priced TokenUsage entry to the current context and the metrics.
 
     Fire-and-forget: logs warning on failure, never raises.
     """
     try:
+        table = get_price_table()
+        cost = table.cost(
+            model_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            images=images,
+        )
         usage = TokenUsage(
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
@@ -45,7 +64,19 @@ def record_token_usage(
             cached_tokens=cached_tokens,
             model_name=model_name,
             routing_reason=routing_reason,
+            routing_version=routing_version,
+            route=route,
+            latency_ms=latency_ms,
+            images=images,
+            cost_usd=cost,
+            price_version=table.version,
         )
+        model = model_name or "unknown"
+        LLM_TOKENS.labels(model, "prompt_cached").observe(cached_tokens)
+        LLM_TOKENS.labels(model, "prompt_uncached").observe(prompt_tokens - cached_tokens)
+        LLM_TOKENS.labels(model, "completion").observe(completion_tokens)
+        if cost:
+            LLM_COST.labels(model, route or "unknown").inc(cost)
         current = _token_usage_var.get()
         # ContextVar default returns the same list object, so we need
         # to create a new list if it's the default empty list to avoid
@@ -72,3 +103,29 @@ def harvest_tokens() -> list[TokenUsage]:
     except Exception:
         logger.warning("Failed to harvest tokens", exc_info=True)
         return []
+
+
+def reset_prompt_trims() -> None:
+    """Start collecting prompt trims for the current node."""
+    _prompt_trims_var.set([])
+
+
+def record_prompt_trim(route: str, chars_before: int, chars_after: int, dropped: int) -> None:
+    """Note that a prompt's context was trimmed (no-op outside a node)."""
+    trims = _prompt_trims_var.get()
+    if trims is not None:
+        trims.append(
+            {
+                "route": route,
+                "chars_before": chars_before,
+                "chars_after": chars_after,
+                "dropped_chunks": dropped,
+            }
+        )
+
+
+def harvest_prompt_trims() -> list[dict]:
+    """Return the prompt trims recorded for the current node and stop collecting."""
+    trims = _prompt_trims_var.get() or []
+    _prompt_trims_var.set(None)
+    return trims
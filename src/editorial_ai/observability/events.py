@@ -0,0 +1,262 @@
+"""Live pipeline progress events: in-process pub/sub with a Postgres bridge.
+
+``node_wrapper`` publishes an event when a node starts and when it
+finishes (duration, tokens, cost, the pipeline_status it wrote), plus
+``status`` events when a node changes ``pipeline_status`` and ``error``
+events for node exceptions and new ``error_log`` entries.
+``GET /api/pipeline/stream/{thread_id}`` subscribes to the thread and
+relays the events as server-sent events, so the admin UI no longer polls
+``/status`` (which loads the whole checkpoint, draft and layout image
+included, to return four fields).
+
+Subscribers live in the API process, but with ``editorial-worker``
+processes the graphs run elsewhere. With the bridge on
+(``PROGRESS_BRIDGE_ENABLED``, default: when DATABASE_URL is set) every
+process also sends its events with ``pg_notify`` on the
+``editorial_progress`` channel and LISTENs on it, delivering other
+processes' events to its own subscribers. Events carry their origin so a
+process skips its own notifications. NOTIFY payloads are limited to
+8000 bytes; error text is truncated to stay well below that.
+
+Delivery is best effort and nothing is persisted: a slow subscriber's
+queue drops its oldest events. Like the rest of observability, publishing
+never raises into or blocks the node.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal
+
+from editorial_ai.config import settings
+
+logger = logging.getLogger(__name__)
+
+EventType = Literal["node_started", "node_finished", "status", "error"]
+
+CHANNEL = "editorial_progress"
+# pipeline_status values after which a run makes no progress until an admin acts
+SETTLED_STATUSES = frozenset({"awaiting_approval", "published", "failed"})
+MAX_ERROR_CHARS = 500
+
+_LAST_STATUS_MAX = 1024
+_OUTBOX_MAX = 10_000
+_NOTIFY_MAX_BYTES = 7900
+_RECONNECT_DELAY_S = 5.0
+
+
+@dataclass
+class ProgressEvent:
+    thread_id: str
+    type: EventType
+    node_name: str | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    ts: float = field(default_factory=time.time)
+    origin: str = ""  # publishing EventBus, for skipping our own notifications
+
+    @property
+    def settled(self) -> bool:
+        return self.type == "status" and self.data.get("pipeline_status") in SETTLED_STATUSES
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, default=str)
+
+    @classmethod
+    def from_json(cls, raw: str) -> ProgressEvent:
+        return cls(**json.loads(raw))
+
+
+class Subscription:
+    """Bounded queue of one thread's events for one listener."""
+
+    def __init__(self, bus: EventBus, thread_id: str, max_queue: int) -> None:
+        self.bus = bus
+        self.thread_id = thread_id
+        self.dropped = 0
+        self._queue: asyncio.Queue[ProgressEvent] = asyncio.Queue(maxsize=max_queue)
+
+    def put(self, event: ProgressEvent) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()  # slow reader: drop the oldest event
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float | None = None) -> ProgressEvent | None:
+        """Next event, or None after ``timeout`` seconds without one."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+    def __enter__(self) -> Subscription:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class EventBus:
+    """Per-process fan-out of progress events to subscribers, bridged via Postgres."""
+
+    def __init__(
+        self,
+        *,
+        bridge: bool | None = None,
+        conninfo: str | None = None,
+        max_queue: int | None = None,
+    ) -> None:
+        self.conninfo = conninfo or settings.database_url
+        if bridge is None:
+            bridge = settings.progress_bridge_enabled
+        self.bridge = bool(self.conninfo) if bridge is None else bridge and bool(self.conninfo)
+        self.max_queue = max_queue or settings.progress_subscriber_queue
+        self.origin = uuid.uuid4().hex[:12]
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+        self._last_status: OrderedDict[str, ProgressEvent] = OrderedDict()
+        self._outbox: asyncio.Queue[str] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not t.done() for t in self._tasks)
+
+    def subscribe(self, thread_id: str) -> Subscription:
+        subscription = Subscription(self, thread_id, self.max_queue)
+        self._subscribers[thread_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.thread_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.thread_id]
+
+    def subscriber_count(self, thread_id: str) -> int:
+        return len(self._subscribers.get(thread_id, ()))
+
+    def last_status(self, thread_id: str) -> ProgressEvent | None:
+        """Latest ``status`` event this process has seen for the thread."""
+        return self._last_status.get(thread_id)
+
+    def publish(self, event: ProgressEvent) -> None:
+        """Deliver to local subscribers and, with the bridge running, to other processes."""
+        try:
+            event.origin = self.origin
+            self._dispatch(event)
+            if self._outbox is not None and self.running:
+                payload = event.to_json()
+                if len(payload.encode()) > _NOTIFY_MAX_BYTES:
+                    logger.warning("Progress event for %s too large to bridge", event.thread_id)
+                    return
+                self._outbox.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("Progress bridge outbox full; event not sent to other processes")
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to publish progress event", exc_info=True)
+
+    def receive(self, payload: str) -> None:
+        """Handle a NOTIFY payload from the bridge."""
+        try:
+            event = ProgressEvent.from_json(payload)
+        except Exception:  # noqa: BLE001
+            logger.warning("Ignoring malformed progress notification", exc_info=True)
+            return
+        if event.origin != self.origin:
+            self._dispatch(event)
+
+    def _dispatch(self, event: ProgressEvent) -> None:
+        if event.type == "status":
+            self._last_status[event.thread_id] = event
+            self._last_status.move_to_end(event.thread_id)
+            while len(self._last_status) > _LAST_STATUS_MAX:
+                self._last_status.popitem(last=False)
+        for subscription in list(self._subscribers.get(event.thread_id, ())):
+            subscription.put(event)
+
+    # --- Postgres bridge ---
+
+    def start(self) -> None:
+        """Start the LISTEN and NOTIFY tasks (no-op without the bridge or if running)."""
+        if not self.bridge or self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._outbox = asyncio.Queue(maxsize=_OUTBOX_MAX)
+        self._tasks = [
+            loop.create_task(self._listen(), name="progress-listen"),
+            loop.create_task(self._notify(), name="progress-notify"),
+        ]
+        logger.info("Progress event bridge started on channel %s", CHANNEL)
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._outbox = None
+
+    async def _connect(self) -> Any:
+        import psycopg
+
+        # Same connection settings as the checkpointer (Supabase session pooler)
+        return await psycopg.AsyncConnection.connect(
+            self.conninfo, autocommit=True, prepare_threshold=0
+        )
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with await self._connect() as conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    async for notify in conn.notifies():
+                        self.receive(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.warning("Progress LISTEN connection failed; reconnecting", exc_info=True)
+            await asyncio.sleep(_RECONNECT_DELAY_S)
+
+    async def _notify(self) -> None:
+        assert self._outbox is not None
+        outbox = self._outbox
+        while True:
+            try:
+                async with await self._connect() as conn:
+                    while True:
+                        payload = await outbox.get()
+                        await conn.execute("SELECT pg_notify(%s, %s)", (CHANNEL, payload))
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.warning("Progress NOTIFY connection failed; reconnecting", exc_info=True)
+            await asyncio.sleep(_RECONNECT_DELAY_S)
+
+
+_bus_instance: EventBus | None = None
+
+
+def get_event_bus() -> EventBus:
+    """Get or create the process-wide EventBus."""
+    global _bus_instance  # noqa: PLW0603
+    if _bus_instance is None:
+        _bus_instance = EventBus()
+    return _bus_instance
+
+
+def publish_progress(
+    thread_id: str, event_type: EventType, node_name: str | None = None, **data: Any
+) -> None:
+    """Publish a progress event on the process-wide bus (never raises)."""
+    get_event_bus().publish(ProgressEvent(thread_id, event_type, node_name, data))
@@ -0,0 +1,195 @@
+"""Instrumentation helpers for LLM calls, Supabase queries and pipeline runs.
+
+These feed the Prometheus metrics (``observability.metrics``), the
+node's span waterfall (``observability.spans``) and, for LLM calls, the
+per-node token collector and the model health used by adaptive routing
+(``routing.health``). Like the rest of observability they never
+raise into the instrumented code.
+
+``async with llm_call(...)`` first waits for a slot at the LLM capacity
+gate in the run's priority lane (``editorial_ai.priority``); the wait is
+not part of the call's span or latency. Plain ``with`` skips the gate.
+
+Usage::
+
+    decision = get_model_router().resolve("curation_research")
+    async with llm_call("curation_research", decision) as call:
+        response = await client.aio.models.generate_content(
+            model=decision.model, contents=prompt, ...
+        )
+        call.record(response, request=prompt)
+
+    with supabase_query("posts"):
+        resp = await client.table("posts").select("*").execute()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+from editorial_ai.observability.collector import record_token_usage
+from editorial_ai.observability.metrics import (
+    LLM_CALL_DURATION,
+    LLM_CAPACITY_WAIT,
+    PIPELINES_IN_FLIGHT,
+    SUPABASE_QUERY_DURATION,
+)
+from editorial_ai.observability.spans import Span, payload_chars
+from editorial_ai.priority import LLMCapacityGate, current_priority, get_llm_gate
+from editorial_ai.routing.health import get_model_health, is_unavailable_error
+
+logger = logging.getLogger(__name__)
+
+
+def _count(metadata: Any, field: str) -> int:
+    value = getattr(metadata, field, 0)
+    return value if isinstance(value, int) else 0
+
+
+class LLMCall:
+    """Times one LLM API call as a span and records its token usage."""
+
+    __slots__ = ("route", "model", "reason", "version", "_span", "_gate")
+
+    def __init__(
+        self, route: str, model: str, reason: str | None, version: str | None = None
+    ) -> None:
+        self.route = route
+        self.model = model
+        self.reason = reason
+        self.version = version
+        self._span = Span(route, "llm", model=model)
+        self._gate: LLMCapacityGate | None = None
+
+    def __enter__(self) -> LLMCall:
+        self._span.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        try:
+            latency_ms = self._span.elapsed_ms()
+            outcome = "error" if exc_type is not None else "ok"
+            LLM_CALL_DURATION.labels(self.model, self.route, outcome).observe(latency_ms / 1000)
+            _observe_health(self.model, latency_ms, exc)
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to record LLM call latency", exc_info=True)
+        self._span.__exit__(exc_type, exc, tb)
+
+    async def __aenter__(self) -> LLMCall:
+        gate = get_llm_gate()
+        priority = current_priority()
+        waited = await gate.acquire(priority)
+        self._gate = gate
+        try:
+            LLM_CAPACITY_WAIT.labels(priority).observe(waited)
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to record LLM capacity wait", exc_info=True)
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        try:
+            self.__exit__(exc_type, exc, tb)
+        finally:
+            gate, self._gate = self._gate, None
+            if gate is not None:
+                gate.release()
+
+    def record(self, response: Any, *, request: Any = None) -> None:
+        """Record ``response.usage_metadata`` (if any) and payload sizes."""
+        span = self._span
+        try:
+            span.request_chars = payload_chars(request)
+            span.response_chars = _response_chars(response)
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to size LLM payloads", exc_info=True)
+        metadata = getattr(response, "usage_metadata", None)
+        if not metadata:
+            return
+        cached = _count(metadata, "cached_content_token_count")
+        span.cached_tokens = cached
+        record_token_usage(
+            prompt_tokens=_count(metadata, "prompt_token_count"),
+            completion_tokens=_count(metadata, "candidates_token_count"),
+            total_tokens=_count(metadata, "total_token_count"),
+            cached_tokens=cached,
+            model_name=self.model,
+            routing_reason=self.reason,
+            routing_version=self.version,
+            route=self.route,
+            latency_ms=span.elapsed_ms(),
+            images=_response_images(response),
+        )
+
+
+def _observe_health(model: str, latency_ms: float, exc: BaseException | None) -> None:
+    health = get_model_health()
+    if exc is None:
+        health.observe(model, latency_ms, "ok")
+    elif isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        health.observe(model, latency_ms, "timeout")
+    elif isinstance(exc, asyncio.CancelledError):
+        return  # caller gave up; says nothing about the model
+    else:
+        health.observe(model, latency_ms, "error")
+        if is_unavailable_error(exc):
+            health.mark_unavailable(model, f"{type(exc).__name__}: {str(exc)[:200]}")
+
+
+def _response_chars(response: Any) -> int:
+    """Size of the candidates' parts (text chars, inline data bytes)."""
+    total = 0
+    for candidate in getattr(response, "candidates", None) or []:
+        content = getattr(candidate, "content", None)
+        total += payload_chars(list(getattr(content, "parts", None) or []))
+    return total
+
+
+def _response_images(response: Any) -> int:
+    """Number of generated images (``inline_data`` image parts) in a response."""
+    count = 0
+    for candidate in getattr(response, "candidates", None) or []:
+        content = getattr(candidate, "content", None)
+        for part in getattr(content, "parts", None) or []:
+            mime = getattr(getattr(part, "inline_data", None), "mime_type", None)
+            if isinstance(mime, str) and mime.startswith("image/"):
+                count += 1
+    return count
+
+
+def llm_call(route: str, decision: Any) -> LLMCall:
+    """Context manager timing an LLM call made with a ``RoutingDecision``."""
+    return LLMCall(
+        route,
+        decision.model,
+        getattr(decision, "reason", None),
+        getattr(decision, "version", None),
+    )
+
+
+@contextlib.contextmanager
+def supabase_query(table: str) -> Iterator[Span]:
+    """Time a Supabase REST query against ``table`` as a span."""
+    outcome = "error"
+    with Span(table, "supabase") as span:
+        try:
+            yield span
+            outcome = "ok"
+        finally:
+            try:
+                SUPABASE_QUERY_DURATION.labels(table, outcome).observe(span.elapsed_ms() / 1000)
+            except Exception:  # noqa: BLE001
+                logger.warning("Failed to record Supabase query latency", exc_info=True)
+
+
+@contextlib.contextmanager
+def pipeline_run() -> Iterator[None]:
+    """Count a graph invocation (new run or admin resume) as in flight."""
+    PIPELINES_IN_FLIGHT.inc()
+    try:
+        yield
+    finally:
+        PIPELINES_IN_FLIGHT.dec()
@@ -0,0 +1,197 @@
+"""Background batched writer for node execution logs.
+
+``append_node_log`` opens, appends and closes the thread's JSONL file once
+per node. With many concurrent pipelines that is a lot of small writes on
+the I/O executor. The sink instead queues ``NodeRunLog`` records and a
+single writer task flushes them in batches — when ``batch_size`` records
+are pending or ``flush_interval_s`` has passed — grouping lines per thread
+file. Pipeline completion calls :meth:`LogSink.flush` with ``fsync=True``
+so a finished run is durable on disk.
+
+The sink also compacts old threads: JSONL files not modified for
+``compact_after_days`` are gzipped to ``{thread_id}.jsonl.gz`` (read back
+transparently by ``read_node_logs``), raw runs past their retention
+are pruned from the stats store, and old fan-out drafts are removed.
+
+Like the rest of observability, the sink never raises into callers; a full
+queue or a stopped sink makes ``submit`` return False so the caller can
+fall back to a direct write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+
+from editorial_ai.config import settings
+from editorial_ai.io_executor import run_io
+from editorial_ai.observability.models import NodeRunLog
+from editorial_ai.observability.stats_store import get_stats_store
+
+logger = logging.getLogger(__name__)
+
+
+class LogSink:
+    """Queue + writer task that appends node logs in batches."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int | None = None,
+        flush_interval_s: float | None = None,
+        max_queue: int | None = None,
+        compact_after_days: float | None = None,
+        compact_interval_s: float | None = None,
+    ) -> None:
+        self.batch_size = batch_size or settings.log_sink_batch_size
+        self.flush_interval_s = (
+            flush_interval_s
+            if flush_interval_s is not None
+            else settings.log_sink_flush_interval_ms / 1000
+        )
+        self.max_queue = max_queue or settings.log_sink_max_queue
+        self.compact_after_days = (
+            compact_after_days
+            if compact_after_days is not None
+            else settings.log_compact_after_days
+        )
+        self.compact_interval_s = (
+            compact_interval_s
+            if compact_interval_s is not None
+            else settings.log_compact_interval_hours * 3600
+        )
+        self._queue: asyncio.Queue[NodeRunLog] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._pending: list[NodeRunLog] = []
+        self._write_lock: asyncio.Lock | None = None
+        self._last_compaction = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the writer task on the running loop (idempotent)."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._write_lock = asyncio.Lock()
+        self._pending = []
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(), name="node-log-sink"
+        )
+
+    def submit(self, log: NodeRunLog) -> bool:
+        """Queue a log for the writer. Returns False if the caller should write it."""
+        if not self.running or self._queue is None:
+            return False
+        try:
+            self._queue.put_nowait(log)
+        except asyncio.QueueFull:
+            logger.warning("Node log sink queue full; writing %s directly", log.thread_id)
+            return False
+        return True
+
+    async def flush(self, thread_id: str | None = None, *, fsync: bool = False) -> None:
+        """Write everything queued so far; optionally fsync ``thread_id``'s file."""
+        if self._queue is None or self._write_lock is None:
+            return
+        self._drain_queue()
+        await self._write_pending(fsync_threads={thread_id} if fsync and thread_id else None)
+
+    async def stop(self) -> None:
+        """Drain the queue, fsync everything written and stop the writer."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._queue is not None and self._write_lock is not None:
+            self._drain_queue()
+            threads = {log.thread_id for log in self._pending}
+            await self._write_pending(fsync_threads=threads)
+        self._queue = None
+
+    # --- internals ---------------------------------------------------------
+
+    def _drain_queue(self) -> None:
+        assert self._queue is not None
+        while True:
+            try:
+                self._pending.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def _write_pending(self, *, fsync_threads: set[str] | None = None) -> None:
+        from editorial_ai.observability.storage import write_log_batch
+
+        assert self._write_lock is not None
+        async with self._write_lock:
+            batch, self._pending = self._pending, []
+            if not batch and not fsync_threads:
+                return
+            grouped: dict[str, list[NodeRunLog]] = defaultdict(list)
+            for log in batch:
+                grouped[log.thread_id].append(log)
+            try:
+                await run_io(write_log_batch, dict(grouped), fsync_threads or set())
+            except Exception:
+                logger.warning("Node log sink failed to write %d logs", len(batch), exc_info=True)
+
+    async def _maybe_compact(self) -> None:
+        from editorial_ai.observability.storage import compact_old_logs
+        from editorial_ai.services.draft_store import sweep_old_drafts
+
+        now = time.monotonic()
+        if self._last_compaction and now - self._last_compaction < self.compact_interval_s:
+            return
+        self._last_compaction = now
+        if self.compact_after_days > 0:
+            try:
+                await run_io(compact_old_logs, self.compact_after_days)
+            except Exception:
+                logger.warning("Node log compaction failed", exc_info=True)
+        if settings.observability_stats_enabled:
+            try:
+                await run_io(get_stats_store().prune_runs)
+            except Exception:
+                logger.warning("Stats store pruning failed", exc_info=True)
+        if settings.editorial_draft_retention_days > 0:
+            try:
+                await run_io(sweep_old_drafts, settings.editorial_draft_retention_days)
+            except Exception:
+                logger.warning("Stored draft sweep failed", exc_info=True)
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        await self._maybe_compact()
+        deadline = loop.time() + self.flush_interval_s
+        while True:
+            timeout = max(0.0, deadline - loop.time())
+            try:
+                log = await asyncio.wait_for(self._queue.get(), timeout)
+                self._pending.append(log)
+                self._drain_queue()
+            except asyncio.TimeoutError:
+                pass
+            if len(self._pending) >= self.batch_size or loop.time() >= deadline:
+                if self._pending:
+                    await self._write_pending()
+                await self._maybe_compact()
+                deadline = loop.time() + self.flush_interval_s
+
+
+_sink: LogSink | None = None
+
+
+def get_log_sink() -> LogSink:
+    """Return the process-wide log sink (created lazily, not started)."""
+    global _sink  # noqa: PLW0603
+    if _sink is None:
+        _sink = LogSink()
+    return _sink
@@ -0,0 +1,103 @@
+"""Event-loop lag monitor.
+
+A background task repeatedly sleeps for a fixed interval and records how
+late it wakes up. Any blocking call on the loop (synchronous file I/O,
+heavy JSON serialization, ...) shows up directly as lag, so the p99 of
+these samples is the number to watch when moving work off the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+from collections import deque
+
+from editorial_ai.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Keep the last ~10 minutes of samples at the default 100ms interval
+_DEFAULT_WINDOW = 6000
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 < q <= 100). Returns 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class LoopLagMonitor:
+    """Samples event-loop scheduling lag into a bounded ring buffer."""
+
+    def __init__(
+        self,
+        interval_s: float | None = None,
+        *,
+        window: int = _DEFAULT_WINDOW,
+    ) -> None:
+        self.interval_s = (
+            interval_s
+            if interval_s is not None
+            else settings.loop_lag_sample_interval_ms / 1000
+        )
+        self._samples: deque[float] = deque(maxlen=window)
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running loop (no-op if already running)."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(), name="loop-lag-monitor"
+        )
+
+    async def stop(self) -> None:
+        """Stop sampling. Collected samples are kept for a final snapshot."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_s
+            await asyncio.sleep(self.interval_s)
+            self._samples.append(max(0.0, loop.time() - expected) * 1000)
+
+    def reset(self) -> None:
+        self._samples.clear()
+
+    def snapshot(self) -> dict:
+        """Return lag statistics in milliseconds over the current window."""
+        samples = list(self._samples)
+        return {
+            "samples": len(samples),
+            "interval_ms": self.interval_s * 1000,
+            "p50_ms": round(percentile(samples, 50), 3),
+            "p95_ms": round(percentile(samples, 95), 3),
+            "p99_ms": round(percentile(samples, 99), 3),
+            "max_ms": round(max(samples), 3) if samples else 0.0,
+        }
+
+
+_monitor_instance: LoopLagMonitor | None = None
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    """Get or create the process-wide LoopLagMonitor."""
+    global _monitor_instance  # noqa: PLW0603
+    if _monitor_instance is None:
+        _monitor_instance = LoopLagMonitor()
+    return _monitor_instance
@@ -0,0 +1,354 @@
+"""Always-on Prometheus metrics with a minimal in-process registry.
+
+The pipeline has no metrics dependency, so this module implements the
+small part of the Prometheus client that we need: counters, gauges and
+fixed-bucket histograms with labels, rendered in the text exposition
+format by ``GET /metrics``.
+
+Metrics are per process. The API serves its own on ``GET /metrics``;
+``editorial-worker`` processes, which run the graphs when
+``API_JOB_WORKERS=false``, serve theirs with :class:`MetricsServer`.
+
+Hot-path cost is kept to a bisect and a few attribute increments:
+
+- Bucket bounds are preallocated per metric; each labelled child owns a
+  fixed-size list of bucket counts.
+- ``labels()`` returns a cached child. Callers with static labels bind
+  the child once (``node_wrapper`` does it at decoration time) so an
+  observation does no dict lookups or tuple building.
+
+Observations happen on the event loop; increments are not locked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Seconds; node and LLM latencies span milliseconds to minutes.
+NODE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60, 120)
+DB_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+QUEUE_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+TOKEN_BUCKETS = (100, 250, 500, 1_000, 2_000, 4_000, 8_000, 16_000, 32_000, 64_000, 128_000)
+
+
+def _fmt(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+
+    @abstractmethod
+    def _new_child(self) -> object: ...
+
+    def labels(self, *values: str):  # noqa: ANN201
+        """Return the child for these label values (created once, then cached)."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _samples(self) -> list[str]:
+        """Exposition lines of every child, without HELP/TYPE."""
+
+    def render(self) -> str:
+        head = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        return head + "".join(line + "\n" for line in self._samples())
+
+    def clear(self) -> None:
+        """Zero every child in place (bound children stay valid)."""
+        for child in self._children.values():
+            child.reset()  # type: ignore[attr-defined]
+
+
+class _ValueChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def reset(self) -> None:
+        self.value = 0.0
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _ValueChild:
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}_total{_label_str(self.labelnames, key)} {_fmt(child.value)}"
+            for key, child in self._children.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _ValueChild:
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_label_str(self.labelnames, key)} {_fmt(child.value)}"
+            for key, child in self._children.items()
+        ]
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def reset(self) -> None:
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram (cumulative buckets are computed at render time)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float],
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _samples(self) -> list[str]:
+        lines: list[str] = []
+        bounds = (*self.buckets, math.inf)
+        for key, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(bounds, child.counts):
+                cumulative += count
+                le = f'le="{_fmt(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_label_str(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _label_str(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_fmt(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        return "".join(metric.render() for metric in self._metrics.values())
+
+    def clear(self) -> None:
+        """Zero all recorded samples (tests)."""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+NODE_DURATION = REGISTRY.register(Histogram(
+    "editorial_node_duration_seconds",
+    "Pipeline node execution time (status: success, error, or parked at an interrupt).",
+    ("node_name", "status"),
+    buckets=NODE_BUCKETS,
+))
+LLM_CALL_DURATION = REGISTRY.register(Histogram(
+    "editorial_llm_call_duration_seconds",
+    "LLM API call latency by model and routing route.",
+    ("model", "route", "outcome"),
+    buckets=LLM_BUCKETS,
+))
+LLM_TOKENS = REGISTRY.register(Histogram(
+    "editorial_llm_call_tokens",
+    "Tokens per LLM call by model and kind (prompt_cached, prompt_uncached, completion).",
+    ("model", "kind"),
+    buckets=TOKEN_BUCKETS,
+))
+LLM_COST = REGISTRY.register(Counter(
+    "editorial_llm_cost_usd",
+    "Estimated LLM spend in USD (observability/pricing.yaml) by model and route.",
+    ("model", "route"),
+))
+SUPABASE_QUERY_DURATION = REGISTRY.register(Histogram(
+    "editorial_supabase_query_duration_seconds",
+    "Supabase REST query latency by table.",
+    ("table", "outcome"),
+    buckets=DB_BUCKETS,
+))
+PIPELINES_IN_FLIGHT = REGISTRY.register(Gauge(
+    "editorial_pipelines_in_flight",
+    "Graph invocations (new runs and admin resumes) currently executing.",
+))
+JOB_QUEUE_WAIT = REGISTRY.register(Histogram(
+    "editorial_job_queue_wait_seconds",
+    "Time from enqueue to first claim of a pipeline job, by priority lane.",
+    ("priority",),
+    buckets=QUEUE_BUCKETS,
+))
+LLM_CAPACITY_WAIT = REGISTRY.register(Histogram(
+    "editorial_llm_capacity_wait_seconds",
+    "Time LLM calls waited for a slot at the capacity gate, by priority lane.",
+    ("priority",),
+    buckets=LLM_BUCKETS,
+))
+REVISION_LOOPS = REGISTRY.register(Counter(
+    "editorial_revision_loops",
+    "Review failures that sent the draft back to editorial.",
+))
+
+# Unlabelled series are exported as 0 before their first update
+PIPELINES_IN_FLIGHT.labels()
+REVISION_LOOPS.labels()
+
+
+def render_metrics() -> str:
+    """Render every registered metric for ``GET /metrics``."""
+    return REGISTRY.render()
+
+
+class MetricsServer:
+    """Bare HTTP server answering ``GET /metrics`` for a process without the API.
+
+    One request per connection, no keep-alive: enough for a Prometheus
+    scrape without pulling in a web framework.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        """Start listening; returns the bound port (``port=0`` picks a free one)."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Serving metrics on http://%s:%d/metrics", self.host, self.port)
+        return self.port
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readline(), 10)
+            while await asyncio.wait_for(reader.readline(), 10) not in (b"\r\n", b""):
+                pass  # headers are not needed
+            method, path, *_ = request.decode("latin-1").split() or ("", "")
+            if method == "GET" and path.split("?", 1)[0] == "/metrics":
+                status, content_type, body = "200 OK", CONTENT_TYPE, render_metrics().encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b"Not Found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except (TimeoutError, ConnectionError, ValueError):
+            pass  # a broken scrape only loses that sample
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
@@ -6,6 +6,7 @@ snapshots at the per-node level.
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
 from typing import Literal
 
@@ -21,6 +22,40 @@ class TokenUsage(BaseModel):
     cached_tokens: int = 0
     model_name: str | None = None
     routing_reason: str | None = None
+    routing_version: str | None = None  # routing config version (ModelRouter.version)
+    route: str | None = None  # model router key, e.g. "curation_research"
+    latency_ms: float | None = None
+    images: int = 0  # generated images in the response
+    cost_usd: float | None = None  # None when the model is not in the price table
+    price_version: str | None = None
+
+
+class SpanRecord(BaseModel):
+    """A timed sub-node operation (LLM call, Supabase query)."""
+
+    span_id: int
+    parent_id: int | None = None
+    depth: int = 0
+    name: str  # model router key for LLM calls, table name for Supabase
+    kind: str = "internal"  # "llm" | "supabase" | "internal"
+    model: str | None = None
+    status: Literal["ok", "error"] = "ok"
+    error_type: str | None = None
+    started_at: datetime
+    latency_ms: float = 0.0
+    attempts: int = 1  # tenacity attempt number of this call
+    request_chars: int = 0
+    response_chars: int = 0
+    cached_tokens: int = 0
+
+
+class ProfileInfo(BaseModel):
+    """Summary of an on-demand node profile (artifacts under data/logs/profiles)."""
+
+    peak_memory_bytes: int = 0  # tracemalloc peak during the node
+    cpu_ms: float = 0.0  # total time cProfile attributed to functions
+    pstats_file: str | None = None
+    collapsed_file: str | None = None
 
 
 class NodeRunLog(BaseModel):
@@ -29,6 +64,8 @@ class NodeRunLog(BaseModel):
     thread_id: str
     node_name: str
     status: Literal["success", "error", "skipped"]
+    pipeline_status: str | None = None  # pipeline_status written by this node, if any
+    topic_index: int | None = None  # fan-out branch (nodes.topic_fanout); None outside one
     started_at: datetime
     ended_at: datetime
     duration_ms: float = 0.0
@@ -38,11 +75,25 @@ class NodeRunLog(BaseModel):
     total_prompt_tokens: int = 0
     total_completion_tokens: int = 0
     total_tokens: int = 0
-    prompt_chars: int = 0
+    prompt_chars: int = 0  # request chars of the node's LLM calls, as sent
+    prompt_chars_untrimmed: int = 0  # the same before prompt budget trimming
+    prompt_trims: list[dict] = []  # one entry per trimmed prompt (prompts.budgeter)
+    cost_usd: float = 0.0  # sum of priced token_usage entries
+
+    # Sub-node spans, ordered by start time
+    spans: list[SpanRecord] = []
+
+    # Set only for runs triggered with profiling enabled
+    profile: ProfileInfo | None = None
+
+    # Degradations this node applied because of the run budget (editorial_ai.budget)
+    budget_decisions: list[dict] = []
 
-    # State snapshots
+    # State snapshots (shape depends on snapshot_mode, see observability.snapshot)
     input_state: dict | None = None
     output_state: dict | None = None
+    snapshot_mode: str | None = None
+    snapshot_bytes: int = 0  # serialized size of input_state + output_state
 
     # Error details
     error_type: str | None = None
@@ -84,10 +135,35 @@ class NodeRunLog(BaseModel):
                 data["total_completion_tokens"] = completion_sum
             if "total_tokens" not in data:
                 data["total_tokens"] = total_sum
+            if "cost_usd" not in data:
+                data["cost_usd"] = sum(
+                    (u.get("cost_usd") if isinstance(u, dict) else u.cost_usd) or 0.0
+                    for u in usages
+                )
+
+        # Prompt sizes: as sent (LLM span request chars) and before trimming
+        if not data.get("prompt_chars"):
+            data["prompt_chars"] = sum(
+                _field(s, "request_chars") or 0
+                for s in data.get("spans") or []
+                if _field(s, "kind") == "llm"
+            )
+        if not data.get("prompt_chars_untrimmed"):
+            data["prompt_chars_untrimmed"] = data["prompt_chars"] + sum(
+                _field(t, "chars_before") - _field(t, "chars_after")
+                for t in data.get("prompt_trims") or []
+            )
 
         return data
 
 
+def _field(item: object, name: str):  # noqa: ANN202
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+_REVISION_LOOP_NODES = frozenset({"editorial", "enrich", "review"})
+
+
 class PipelineRunSummary(BaseModel):
     """Aggregated summary of an entire pipeline run."""
 
@@ -101,6 +177,15 @@ class PipelineRunSummary(BaseModel):
     started_at: datetime | None = None
     ended_at: datetime | None = None
 
+    # Cost (USD, from the price table version stamped on each call)
+    total_cost_usd: float = 0.0
+    published: bool = False
+    cost_per_published_article: float | None = None
+    # Editorial passes after the first (review retries and admin revisions)
+    revision_loops: int = 0
+    revision_cost_usd: float = 0.0  # editorial/enrich/review runs in those loops
+    cost_per_revision_loop: float | None = None
+
     @classmethod
     def from_logs(
         cls, thread_id: str, logs: list[NodeRunLog]
@@ -130,6 +215,22 @@ class PipelineRunSummary(BaseModel):
             "failed" if has_error else "completed"
         )
 
+        total_cost = sum(log.cost_usd for log in logs)
+        published = any(log.pipeline_status == "published" for log in logs)
+
+        # Each editorial run after the first in a branch (a fan-out topic, or
+        # the run itself without fan-out) opens a revision loop; its
+        # editorial -> enrich -> review runs are charged to the loop.
+        ordered = sorted(logs, key=lambda log: log.started_at)
+        editorial_runs: Counter[int | None] = Counter()
+        revision_cost = 0.0
+        for log in ordered:
+            if log.node_name == "editorial":
+                editorial_runs[log.topic_index] += 1
+            if editorial_runs[log.topic_index] > 1 and log.node_name in _REVISION_LOOP_NODES:
+                revision_cost += log.cost_usd
+        revision_loops = sum(max(runs - 1, 0) for runs in editorial_runs.values())
+
         return cls(
             thread_id=thread_id,
             node_count=len(logs),
@@ -140,4 +241,10 @@ class PipelineRunSummary(BaseModel):
             status=status,
             started_at=started,
             ended_at=ended,
+            total_cost_usd=total_cost,
+            published=published,
+            cost_per_published_article=total_cost if published else None,
+            revision_loops=revision_loops,
+            revision_cost_usd=revision_cost,
+            cost_per_revision_loop=revision_cost / revision_loops if revision_loops else None,
         )
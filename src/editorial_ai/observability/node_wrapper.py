@@ -2,9 +2,22 @@
 
 Wraps each pipeline node to capture:
 - Timing (started_at, ended_at, duration_ms)
-- State snapshots (input/output as JSON-safe dicts)
+- State snapshots (input/output, shaped by the node's snapshot mode)
 - Token usage (harvested from ContextVar collector)
+- Sub-node spans for LLM and Supabase calls (harvested the same way)
+- Prompt budget trims (prompt size before/after trimming)
 - Error details (type, message, traceback)
+- Prometheus node duration and revision-loop metrics
+- cProfile/tracemalloc artifacts when the run asked for profiling
+- Run budget spend (``budget_spent`` ledger entry) and budget decisions
+- Live progress events for ``/api/pipeline/stream`` (``observability.events``)
+- The thread's compact run status for ``/api/pipeline/status`` (``observability.run_status``)
+
+It also applies the run's ``model_overrides`` to model routing and its
+``priority`` lane to the LLM capacity gate while the node executes, and
+scopes shared upstream work to the run's ``batch_id`` (``editorial_ai.batch``).
+During a replay (``editorial_ai.replay``) a node whose input matches the
+replayed run returns its memoized output instead of executing.
 
 All instrumentation is fire-and-forget: wrapper failures never interrupt
 pipeline execution. Node errors ARE re-raised after logging.
@@ -14,165 +27,340 @@ from __future__ import annotations
 
 import asyncio
 import functools
-import json
 import logging
+import time
 import traceback
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any
 
-from editorial_ai.observability.collector import harvest_tokens, reset_token_collector
-from editorial_ai.observability.models import NodeRunLog
-from editorial_ai.observability.storage import append_node_log
+from editorial_ai.batch import run_batch
+from editorial_ai.budget import spend_entry
+from editorial_ai.io_executor import run_io
+from editorial_ai.observability.collector import (
+    harvest_prompt_trims,
+    harvest_tokens,
+    reset_prompt_trims,
+    reset_token_collector,
+)
+from editorial_ai.observability.events import MAX_ERROR_CHARS, publish_progress
+from editorial_ai.observability.metrics import NODE_DURATION, REVISION_LOOPS
+from editorial_ai.observability.models import NodeRunLog, ProfileInfo
+from editorial_ai.observability.profiling import NodeProfiler, is_profiled
+from editorial_ai.observability.run_status import get_run_status_registry, is_park
+from editorial_ai.observability.snapshot import (
+    json_size,
+    resolve_snapshot_mode,
+    snapshot_input,
+    snapshot_output,
+)
+from editorial_ai.observability.spans import harvest_spans, reset_span_collector
+from editorial_ai.observability.storage import append_node_log_async
+from editorial_ai.priority import run_priority
+from editorial_ai.replay import memoized_output
+from editorial_ai.routing.model_router import route_overrides
 
 logger = logging.getLogger(__name__)
 
+# thread_id -> perf_counter time up to which the run's wall budget is charged.
+# Nodes running in parallel (design_spec || source, fan-out branches) overlap;
+# each only charges the part of its run past what was already charged.
+_wall_charged: OrderedDict[str, float] = OrderedDict()
+_WALL_CHARGED_MAX = 10_000
 
-def _safe_serialize(obj: Any) -> dict | None:
-    """Convert an object to a JSON-safe dict.
 
-    Handles Pydantic models, bytes, datetimes, etc. via ``default=str``.
-    Returns ``{"_serialization_error": ...}`` on failure rather than raising.
-    """
+def _take_input_snapshot(state: Any, mode: str) -> dict | None:
     try:
-        return json.loads(json.dumps(obj, default=str))  # type: ignore[return-value]
+        return snapshot_input(state, mode)
     except Exception as exc:  # noqa: BLE001
         return {"_serialization_error": str(exc)}
 
 
-def node_wrapper(node_name: str):
-    """Decorator factory that wraps a LangGraph node function with observability.
+def _is_revision(state: Any, result: Any) -> bool:
+    """True when the node bumped revision_count (review sent the draft back)."""
+    if not isinstance(result, dict) or "revision_count" not in result:
+        return False
+    before = state.get("revision_count", 0) if isinstance(state, dict) else 0
+    return (result["revision_count"] or 0) > (before or 0)
 
-    Usage::
 
-        wrapped = node_wrapper("curation")(curation_node)
-    """
+def _thread_id(state: Any) -> str:
+    return (state.get("thread_id") or "unknown") if isinstance(state, dict) else "unknown"
 
-    def decorator(fn):  # noqa: ANN001, ANN202
-        if asyncio.iscoroutinefunction(fn):
 
-            @functools.wraps(fn)
-            async def async_wrapper(state: dict, *args: Any, **kwargs: Any) -> Any:
-                # --- Instrumentation pre-flight ---
-                try:
-                    reset_token_collector()
-                except Exception:  # noqa: BLE001
-                    logger.warning("node_wrapper: reset_token_collector failed", exc_info=True)
+def _has_thread(state: Any) -> bool:
+    return isinstance(state, dict) and bool(state.get("thread_id"))
 
-                started_at = datetime.now(timezone.utc)
-                input_state = _safe_serialize(state)
 
-                # --- Execute the node ---
-                error_to_raise: BaseException | None = None
-                result: Any = None
-                try:
-                    result = await fn(state, *args, **kwargs)
-                except BaseException as exc:
-                    error_to_raise = exc
+def _model_overrides(state: Any) -> dict[str, str] | None:
+    return state.get("model_overrides") if isinstance(state, dict) else None
 
-                # --- Instrumentation post-flight ---
-                try:
-                    ended_at = datetime.now(timezone.utc)
-                    token_usage = harvest_tokens()
-                    output_state = _safe_serialize(result) if error_to_raise is None else None
-
-                    # Build error fields
-                    error_type: str | None = None
-                    error_message: str | None = None
-                    error_tb: str | None = None
-                    if error_to_raise is not None:
-                        error_type = type(error_to_raise).__name__
-                        error_message = str(error_to_raise)
-                        tb_lines = traceback.format_exc().strip().splitlines()
-                        error_tb = "\n".join(tb_lines[:5])
-
-                    log = NodeRunLog(
-                        thread_id=state.get("thread_id", "unknown") if isinstance(state, dict) else "unknown",
-                        node_name=node_name,
-                        status="error" if error_to_raise else "success",
-                        started_at=started_at,
-                        ended_at=ended_at,
-                        token_usage=token_usage,
-                        input_state=input_state,
-                        output_state=output_state,
-                        error_type=error_type,
-                        error_message=error_message,
-                        error_traceback=error_tb,
-                    )
-                    append_node_log(log)
-                except Exception:  # noqa: BLE001
-                    logger.warning(
-                        "node_wrapper: post-flight instrumentation failed for node=%s",
-                        node_name,
-                        exc_info=True,
-                    )
 
-                # --- Re-raise node errors ---
-                if error_to_raise is not None:
-                    raise error_to_raise
+def _priority(state: Any) -> str | None:
+    return state.get("priority") if isinstance(state, dict) else None
 
-                return result
 
-            return async_wrapper
+def _batch(state: Any) -> str | None:
+    return state.get("batch_id") if isinstance(state, dict) else None
 
-        else:
-            # Sync node support (wrap in async for uniform handling)
-            @functools.wraps(fn)
-            async def sync_wrapper(state: dict, *args: Any, **kwargs: Any) -> Any:
-                try:
-                    reset_token_collector()
-                except Exception:  # noqa: BLE001
-                    logger.warning("node_wrapper: reset_token_collector failed", exc_info=True)
 
-                started_at = datetime.now(timezone.utc)
-                input_state = _safe_serialize(state)
+def _start_profiler(state: Any, node_name: str) -> NodeProfiler | None:
+    try:
+        profiler = NodeProfiler(_thread_id(state), node_name)
+        return profiler if profiler.start() else None
+    except Exception:  # noqa: BLE001
+        logger.warning("node_wrapper: starting profiler failed", exc_info=True)
+        return None
+
+
+async def _finish_profiler(profiler: NodeProfiler, started_at: datetime) -> ProfileInfo | None:
+    stopped = profiler.stop()
+    if stopped is None:
+        return None
+    return await run_io(profiler.write, *stopped, started_at)
+
+
+async def _record_run(
+    node_name: str,
+    state: Any,
+    mode: str,
+    started_at: datetime,
+    input_state: dict | None,
+    result: Any,
+    error: BaseException | None,
+    profile: ProfileInfo | None = None,
+) -> NodeRunLog:
+    """Build the NodeRunLog for one execution and hand it to storage."""
+    if is_park(error):
+        error = None  # admin_gate waiting for a decision is not a failure
+    ended_at = datetime.now(timezone.utc)
+    token_usage = harvest_tokens()
+    spans = harvest_spans()
+    prompt_trims = harvest_prompt_trims()
+    output_state = snapshot_output(result, state, mode) if error is None else None
+
+    error_type: str | None = None
+    error_message: str | None = None
+    error_tb: str | None = None
+    if error is not None:
+        error_type = type(error).__name__
+        error_message = str(error)
+        tb_lines = "".join(
+            traceback.format_exception(type(error), error, error.__traceback__)
+        ).strip().splitlines()
+        error_tb = "\n".join(tb_lines[:5])
+
+    log = NodeRunLog(
+        thread_id=_thread_id(state),
+        node_name=node_name,
+        status="error" if error is not None else "success",
+        pipeline_status=result.get("pipeline_status") if isinstance(result, dict) else None,
+        topic_index=state.get("topic_index") if isinstance(state, dict) else None,
+        started_at=started_at,
+        ended_at=ended_at,
+        token_usage=token_usage,
+        spans=spans,
+        prompt_trims=prompt_trims,
+        profile=profile,
+        budget_decisions=(result.get("budget_decisions") or []) if isinstance(result, dict) else [],
+        input_state=input_state,
+        output_state=output_state,
+        snapshot_mode=mode,
+        snapshot_bytes=json_size(input_state) + json_size(output_state),
+        error_type=error_type,
+        error_message=error_message,
+        error_traceback=error_tb,
+    )
+    await append_node_log_async(log)
+    return log
+
+
+def _charge_wall(thread_id: str, start: float, end: float) -> float:
+    """Seconds of [start, end] not yet charged to the thread's wall budget."""
+    charged = _wall_charged.get(thread_id, 0.0)
+    wall_s = max(0.0, end - max(start, charged))
+    _wall_charged[thread_id] = max(charged, end)
+    _wall_charged.move_to_end(thread_id)
+    while len(_wall_charged) > _WALL_CHARGED_MAX:
+        _wall_charged.popitem(last=False)
+    return wall_s
+
+
+def _with_budget_spend(
+    state: Any, result: Any, log: NodeRunLog | None, start: float, end: float
+) -> Any:
+    """Append this node's spend to the run's budget ledger (budgeted runs only).
+
+    Tokens and cost are the node's own; wall time is only the part that did
+    not overlap a parallel node, so the ledger sums to the run's elapsed time.
+    """
+    if log is None or not isinstance(result, dict) or not isinstance(state, dict):
+        return result
+    if not state.get("budget"):
+        return result
+    wall_s = _charge_wall(_thread_id(state), start, end)
+    entry = spend_entry(
+        log.node_name, tokens=log.total_tokens, cost_usd=log.cost_usd, duration_ms=wall_s * 1000
+    )
+    return {**result, "budget_spent": [entry]}
+
+
+def _publish_finished(
+    node_name: str,
+    state: Any,
+    result: Any,
+    error: BaseException | None,
+    log: NodeRunLog | None,
+    elapsed_s: float,
+) -> None:
+    """Progress events for a finished node: tokens and timing, errors, status change."""
+    if is_park(error):
+        error = None  # admin_gate waiting for a decision is not a failure
+    thread_id = _thread_id(state)
+    new_status = result.get("pipeline_status") if isinstance(result, dict) else None
+    publish_progress(
+        thread_id,
+        "node_finished",
+        node_name,
+        status="error" if error is not None else "success",
+        duration_ms=round(elapsed_s * 1000, 1),
+        prompt_tokens=log.total_prompt_tokens if log else 0,
+        completion_tokens=log.total_completion_tokens if log else 0,
+        total_tokens=log.total_tokens if log else 0,
+        cost_usd=log.cost_usd if log else 0.0,
+        pipeline_status=new_status,
+    )
+    if error is not None:
+        publish_progress(
+            thread_id, "error", node_name,
+            error_type=type(error).__name__, message=str(error)[:MAX_ERROR_CHARS],
+        )
+    errors = result.get("error_log") if isinstance(result, dict) else None
+    for message in errors or []:
+        publish_progress(thread_id, "error", node_name, message=str(message)[:MAX_ERROR_CHARS])
+    previous = state.get("pipeline_status") if isinstance(state, dict) else None
+    if new_status and new_status != previous:
+        publish_progress(
+            thread_id, "status", node_name, pipeline_status=new_status, previous=previous
+        )
+
 
-                error_to_raise: BaseException | None = None
-                result: Any = None
-                try:
-                    result = fn(state, *args, **kwargs)
-                except BaseException as exc:
-                    error_to_raise = exc
+def node_wrapper(node_name: str):
+    """Decorator factory that wraps a LangGraph node function with observability.
+
+    Sync node functions are wrapped in an async wrapper for uniform handling.
+
+    Usage::
+
+        wrapped = node_wrapper("curation")(curation_node)
+    """
 
+    def decorator(fn):  # noqa: ANN001, ANN202
+        is_async = asyncio.iscoroutinefunction(fn)
+        # Bind metric children once so the hot path only observes
+        duration_ok = NODE_DURATION.labels(node_name, "success")
+        duration_err = NODE_DURATION.labels(node_name, "error")
+        duration_parked = NODE_DURATION.labels(node_name, "parked")
+
+        @functools.wraps(fn)
+        async def wrapper(state: dict, *args: Any, **kwargs: Any) -> Any:
+            # --- Instrumentation pre-flight ---
+            try:
+                reset_token_collector()
+                reset_span_collector()
+                reset_prompt_trims()
+            except Exception:  # noqa: BLE001
+                logger.warning("node_wrapper: resetting collectors failed", exc_info=True)
+
+            mode = resolve_snapshot_mode(node_name)
+            started_at = datetime.now(timezone.utc)
+            input_state = _take_input_snapshot(state, mode)
+            publish_progress(
+                _thread_id(state), "node_started", node_name, started_at=started_at.isoformat()
+            )
+            if _has_thread(state):
                 try:
-                    ended_at = datetime.now(timezone.utc)
-                    token_usage = harvest_tokens()
-                    output_state = _safe_serialize(result) if error_to_raise is None else None
-
-                    error_type: str | None = None
-                    error_message: str | None = None
-                    error_tb: str | None = None
-                    if error_to_raise is not None:
-                        error_type = type(error_to_raise).__name__
-                        error_message = str(error_to_raise)
-                        tb_lines = traceback.format_exc().strip().splitlines()
-                        error_tb = "\n".join(tb_lines[:5])
-
-                    log = NodeRunLog(
-                        thread_id=state.get("thread_id", "unknown") if isinstance(state, dict) else "unknown",
-                        node_name=node_name,
-                        status="error" if error_to_raise else "success",
-                        started_at=started_at,
-                        ended_at=ended_at,
-                        token_usage=token_usage,
-                        input_state=input_state,
-                        output_state=output_state,
-                        error_type=error_type,
-                        error_message=error_message,
-                        error_traceback=error_tb,
+                    await get_run_status_registry().node_started(
+                        state["thread_id"], node_name, state
                     )
-                    append_node_log(log)
+                except Exception:  # noqa: BLE001
+                    logger.warning("node_wrapper: run status update failed", exc_info=True)
+            profiler = _start_profiler(state, node_name) if is_profiled(state) else None
+
+            # --- Execute the node ---
+            error_to_raise: BaseException | None = None
+            result: Any = None
+            t0 = time.perf_counter()
+            try:
+                with (
+                    route_overrides(_model_overrides(state)),
+                    run_priority(_priority(state)),
+                    run_batch(_batch(state)),
+                ):
+                    memoized = memoized_output(node_name, state)
+                    if memoized is not None:
+                        result = memoized
+                    elif is_async:
+                        result = await fn(state, *args, **kwargs)
+                    else:
+                        result = fn(state, *args, **kwargs)
+            except BaseException as exc:
+                error_to_raise = exc
+            elapsed = time.perf_counter() - t0
+
+            profile: ProfileInfo | None = None
+            if profiler is not None:
+                try:
+                    profile = await _finish_profiler(profiler, started_at)
                 except Exception:  # noqa: BLE001
                     logger.warning(
-                        "node_wrapper: post-flight instrumentation failed for node=%s",
-                        node_name,
-                        exc_info=True,
+                        "node_wrapper: writing profile failed for node=%s", node_name, exc_info=True
                     )
 
-                if error_to_raise is not None:
-                    raise error_to_raise
+            # --- Instrumentation post-flight ---
+            try:
+                if is_park(error_to_raise):
+                    duration_parked.observe(elapsed)  # admin_gate waiting for a decision
+                else:
+                    (duration_err if error_to_raise is not None else duration_ok).observe(elapsed)
+                if _is_revision(state, result):
+                    REVISION_LOOPS.inc()
+            except Exception:  # noqa: BLE001
+                logger.warning("node_wrapper: metrics failed for node=%s", node_name, exc_info=True)
+
+            log: NodeRunLog | None = None
+            try:
+                log = await _record_run(
+                    node_name, state, mode, started_at, input_state, result, error_to_raise,
+                    profile,
+                )
+            except Exception:  # noqa: BLE001
+                logger.warning(
+                    "node_wrapper: post-flight instrumentation failed for node=%s",
+                    node_name,
+                    exc_info=True,
+                )
+
+            try:
+                _publish_finished(node_name, state, result, error_to_raise, log, elapsed)
+            except Exception:  # noqa: BLE001
+                logger.warning(
+                    "node_wrapper: progress events failed for node=%s", node_name, exc_info=True
+                )
+            if _has_thread(state):
+                try:
+                    await get_run_status_registry().node_finished(
+                        state["thread_id"], node_name, state, result, error_to_raise
+                    )
+                except Exception:  # noqa: BLE001
+                    logger.warning("node_wrapper: run status update failed", exc_info=True)
+
+            # --- Re-raise node errors ---
+            if error_to_raise is not None:
+                raise error_to_raise
 
-                return result
+            return _with_budget_spend(state, result, log, t0, t0 + elapsed)
 
-            return sync_wrapper
+        return wrapper
 
     return decorator
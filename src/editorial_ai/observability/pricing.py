@@ -0,0 +1,121 @@
+"""Versioned model price table and per-call cost calculation.
+
+Prices live in ``pricing.yaml`` next to this module (override with
+``PRICING_TABLE_PATH``). ``record_token_usage`` prices every LLM call as
+it is recorded, so each ``TokenUsage`` carries ``cost_usd`` and the table
+``price_version`` it was computed with; node and run costs are sums.
+
+Calls to models missing from the table get ``cost_usd=None`` (logged
+once per model) rather than a guessed price.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from editorial_ai.config import settings
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PRICING_PATH = Path(__file__).parent / "pricing.yaml"
+
+_PER_MTOK = 1_000_000
+
+
+@dataclass(frozen=True)
+class TokenRates:
+    input: float
+    output: float
+    cached_input: float
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    rates: TokenRates
+    long_context_threshold: int | None = None
+    long_context: TokenRates | None = None
+    image: float = 0.0  # USD per generated image
+    image_output_tokens: int = 0  # output tokens billed by ``image`` instead
+
+
+def _rates(cfg: dict) -> TokenRates:
+    return TokenRates(
+        input=float(cfg["input"]),
+        output=float(cfg["output"]),
+        cached_input=float(cfg.get("cached_input", cfg["input"])),
+    )
+
+
+class PriceTable:
+    """Per-model prices loaded from YAML."""
+
+    def __init__(self, config_path: Path | str | None = None) -> None:
+        path = Path(config_path) if config_path else _DEFAULT_PRICING_PATH
+        with open(path) as f:
+            raw = yaml.safe_load(f)
+
+        self.version: str = str(raw.get("version", "unversioned"))
+        self.currency: str = raw.get("currency", "USD")
+        self._models: dict[str, ModelPrice] = {}
+        self._warned: set[str] = set()
+
+        for model, cfg in raw.get("models", {}).items():
+            long_ctx = cfg.get("long_context")
+            self._models[model] = ModelPrice(
+                rates=_rates(cfg),
+                long_context_threshold=long_ctx.get("threshold_tokens") if long_ctx else None,
+                long_context=_rates(long_ctx) if long_ctx else None,
+                image=float(cfg.get("image", 0.0)),
+                image_output_tokens=int(cfg.get("image_output_tokens", 0)),
+            )
+
+    def price(self, model: str | None) -> ModelPrice | None:
+        return self._models.get(model) if model else None
+
+    def cost(
+        self,
+        model: str | None,
+        *,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_tokens: int = 0,
+        images: int = 0,
+    ) -> float | None:
+        """USD cost of one call, or None when the model is not priced."""
+        price = self.price(model)
+        if price is None:
+            if model not in self._warned:
+                self._warned.add(model or "")
+                logger.warning("No price for model %r in table %s", model, self.version)
+            return None
+
+        rates = price.rates
+        if (
+            price.long_context is not None
+            and price.long_context_threshold is not None
+            and prompt_tokens > price.long_context_threshold
+        ):
+            rates = price.long_context
+
+        cached = min(max(cached_tokens, 0), prompt_tokens)
+        text_output = max(completion_tokens - images * price.image_output_tokens, 0)
+        return (
+            (prompt_tokens - cached) * rates.input
+            + cached * rates.cached_input
+            + text_output * rates.output
+        ) / _PER_MTOK + images * price.image
+
+
+_table: PriceTable | None = None
+
+
+def get_price_table() -> PriceTable:
+    """Get or create the singleton PriceTable."""
+    global _table  # noqa: PLW0603
+    if _table is None:
+        _table = PriceTable(settings.pricing_table_path)
+    return _table
@@ -0,0 +1,189 @@
+"""On-demand per-node profiling for individual pipeline runs.
+
+A run is profiled when it is triggered with ``profile: true`` (or the
+``X-Profile`` header); the flag is stored in pipeline state so admin
+resumes of the same thread are profiled too. For each node execution
+``node_wrapper`` then runs:
+
+- ``cProfile`` (deterministic) on the event-loop thread, and
+- ``tracemalloc`` for the peak traced memory during the node.
+
+Artifacts are written next to the thread's node logs::
+
+    data/logs/profiles/{thread_id}/{node}-{epoch_ms}.prof       # pstats dump
+    data/logs/profiles/{thread_id}/{node}-{epoch_ms}.collapsed  # flamegraph.pl input
+
+Caveats: only one profiler can be active per interpreter, so while one
+node is being profiled, concurrently running profiled nodes are skipped
+(logged). cProfile sees everything that runs on the loop thread during
+the node, including other pipelines' coroutines; work offloaded to
+``run_io`` threads is not captured. Unprofiled runs pay a single dict
+lookup in ``node_wrapper``.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import pstats
+import threading
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from editorial_ai.config import settings
+from editorial_ai.observability.models import ProfileInfo
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SUFFIXES = (".prof", ".collapsed")
+
+# cProfile (sys.monitoring on 3.12) and tracemalloc are process-wide
+_active = threading.Lock()
+
+_MAX_STACK_DEPTH = 128
+
+
+def is_profiled(state: object) -> bool:
+    """True when this run asked for profiling and profiling is allowed."""
+    return (
+        isinstance(state, dict)
+        and bool(state.get("profile"))
+        and settings.profiling_enabled
+    )
+
+
+def profile_dir(thread_id: str) -> Path:
+    """Directory holding a thread's profile artifacts (not created)."""
+    return Path("data/logs/profiles") / thread_id
+
+
+def _func_label(func: tuple[str, int, str]) -> str:
+    filename, lineno, name = func
+    if filename == "~":  # builtins: ('~', 0, "<built-in method ...>")
+        label = name
+    else:
+        label = f"{os.path.basename(filename)}:{name}:{lineno}"
+    return label.replace(";", ",").replace(" ", "_")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> list[str]:
+    """Approximate collapsed stacks (``a;b;c <microseconds>``) from pstats.
+
+    pstats keeps caller/callee edges, not full stacks, so stacks are rebuilt
+    by walking from the roots and splitting each callee's time across its
+    callers by their share of its cumulative time.
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+    children: dict[tuple, list[tuple[tuple, float]]] = defaultdict(list)
+    roots = []
+    for func, (_cc, _nc, _tt, ct, callers) in raw.items():
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            share = edge[3] / ct if ct else 0.0
+            children[caller].append((func, share))
+
+    weights: dict[str, float] = defaultdict(float)
+
+    def walk(func: tuple, weight: float, path: tuple[tuple, ...]) -> None:
+        labels = path + (func,)
+        self_us = raw[func][2] * weight * 1e6
+        if self_us >= 1:
+            weights[";".join(_func_label(f) for f in labels)] += self_us
+        if len(labels) >= _MAX_STACK_DEPTH:
+            return
+        for child, share in children.get(func, ()):
+            if child in labels or share <= 0:
+                continue
+            walk(child, weight * share, labels)
+
+    for root in roots:
+        walk(root, 1.0, ())
+    return [f"{stack} {round(us)}" for stack, us in sorted(weights.items()) if round(us) > 0]
+
+
+class NodeProfiler:
+    """cProfile + tracemalloc around one node execution."""
+
+    def __init__(self, thread_id: str, node_name: str) -> None:
+        self.thread_id = thread_id
+        self.node_name = node_name
+        self._profiler: cProfile.Profile | None = None
+        self._started_tracemalloc = False
+
+    def start(self) -> bool:
+        """Begin profiling; False if another profile is already running."""
+        if not _active.acquire(blocking=False):
+            logger.warning(
+                "Profiling skipped for %s/%s: another node is being profiled",
+                self.thread_id,
+                self.node_name,
+            )
+            return False
+        try:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        except Exception:
+            logger.warning("Failed to start profiler for %s", self.node_name, exc_info=True)
+            self._release()
+            return False
+        return True
+
+    def stop(self) -> tuple[cProfile.Profile, int] | None:
+        """Stop profiling; returns the profiler and peak traced bytes."""
+        if self._profiler is None:
+            return None
+        profiler = self._profiler
+        try:
+            profiler.disable()
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            self._release()
+        return profiler, peak
+
+    def _release(self) -> None:
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        _active.release()
+
+    def write(
+        self, profiler: cProfile.Profile, peak: int, started_at: datetime
+    ) -> ProfileInfo:
+        """Write pstats and collapsed-stack artifacts (blocking; use run_io)."""
+        d = profile_dir(self.thread_id)
+        d.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.node_name}-{int(started_at.timestamp() * 1000)}"
+
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(d / f"{stem}.prof")
+        (d / f"{stem}.collapsed").write_text(
+            "\n".join(collapsed_stacks(stats)) + "\n", encoding="utf-8"
+        )
+        return ProfileInfo(
+            peak_memory_bytes=peak,
+            cpu_ms=round(stats.total_tt * 1000, 3),  # type: ignore[attr-defined]
+            pstats_file=f"{stem}.prof",
+            collapsed_file=f"{stem}.collapsed",
+        )
+
+
+def list_profile_artifacts(thread_id: str) -> list[Path]:
+    """Profile artifacts for a thread, oldest first."""
+    if thread_id in ("", ".", ".."):
+        return []
+    d = profile_dir(thread_id)
+    if not d.is_dir():
+        return []
+    files = [p for p in d.iterdir() if p.is_file() and p.suffix in PROFILE_SUFFIXES]
+    return sorted(files, key=lambda p: (p.stat().st_mtime, p.name))
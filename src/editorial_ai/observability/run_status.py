@@ -0,0 +1,494 @@
+"""Compact per-thread run status, so status reads never touch the checkpointer.
+
+``graph.aget_state`` loads and deserializes the whole checkpoint (draft,
+base64 layout image) to answer ``/status``. Instead ``node_wrapper``
+keeps a small :class:`RunStatus` record per thread — pipeline_status,
+current node, revision_count, error count and the last few errors,
+has_draft, timestamps — in an in-memory LRU table, and a background
+flusher upserts changed records into the ``pipeline_run_status`` table
+(Postgres with DATABASE_URL, else SQLite) every
+``RUN_STATUS_FLUSH_INTERVAL_MS``.
+
+Reads are served from memory. An entry older than ``RUN_STATUS_CACHE_TTL_S``
+is refreshed from the table first, so the API sees records written by
+``editorial-worker`` processes; rows only replace a newer local record
+if their ``updated_at`` is later. A hit costs a dict lookup; a refresh
+is one primary-key query (one ``IN`` query for a bulk read).
+
+Records are derived from the node's input state plus its result rather
+than accumulated, so a process that resumes a thread mid-run writes the
+same values the original one would have.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Literal
+
+from langgraph.errors import GraphBubbleUp
+
+from editorial_ai.config import settings
+from editorial_ai.io_executor import run_io
+
+logger = logging.getLogger(__name__)
+
+NodeState = Literal["running", "done", "error"]
+
+QUEUED = "queued"  # pipeline_status before the first node runs
+RESUMING = "resuming"  # admin decision queued, not yet picked up by a worker
+MAX_ERRORS = 10  # error messages kept per record (error_count counts all)
+MAX_ERROR_CHARS = 500
+
+
+def is_park(error: BaseException | None) -> bool:
+    """The node paused the run (admin_gate's interrupt) rather than failing."""
+    return isinstance(error, GraphBubbleUp)
+
+
+_COLUMNS = (
+    "thread_id, pipeline_status, current_node, node_state, revision_count, "
+    "error_count, errors, has_draft, started_at, updated_at"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pipeline_run_status (
+    thread_id TEXT PRIMARY KEY,
+    pipeline_status TEXT,
+    current_node TEXT,
+    node_state TEXT,
+    revision_count INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    errors TEXT NOT NULL DEFAULT '[]',
+    has_draft BOOLEAN NOT NULL DEFAULT FALSE,
+    started_at DOUBLE PRECISION NOT NULL,
+    updated_at DOUBLE PRECISION NOT NULL
+);
+"""
+
+# Last writer (by updated_at) wins; started_at is kept from the first write
+_UPSERT = (
+    f"INSERT INTO pipeline_run_status ({_COLUMNS}) VALUES ({{values}}) "
+    "ON CONFLICT (thread_id) DO UPDATE SET "
+    "pipeline_status = excluded.pipeline_status, current_node = excluded.current_node, "
+    "node_state = excluded.node_state, revision_count = excluded.revision_count, "
+    "error_count = excluded.error_count, errors = excluded.errors, "
+    "has_draft = excluded.has_draft, updated_at = excluded.updated_at "
+    "WHERE pipeline_run_status.updated_at <= excluded.updated_at"
+)
+
+
+@dataclass
+class RunStatus:
+    thread_id: str
+    pipeline_status: str | None = None
+    current_node: str | None = None  # running node, or the last one to finish
+    node_state: NodeState | None = None
+    revision_count: int = 0
+    error_count: int = 0
+    errors: list[str] = field(default_factory=list)  # newest last, at most MAX_ERRORS
+    has_draft: bool = False
+    started_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def to_row(self) -> tuple:
+        return (
+            self.thread_id, self.pipeline_status, self.current_node, self.node_state,
+            self.revision_count, self.error_count, json.dumps(self.errors, ensure_ascii=False),
+            self.has_draft, self.started_at, self.updated_at,
+        )
+
+    @classmethod
+    def from_row(cls, row: tuple) -> RunStatus:
+        values = list(row)
+        values[6] = json.loads(values[6] or "[]")
+        values[7] = bool(values[7])
+        return cls(*values)
+
+
+def _errors(messages: list[Any]) -> list[str]:
+    return [str(m)[:MAX_ERROR_CHARS] for m in messages[-MAX_ERRORS:]]
+
+
+def status_from_state(thread_id: str, state: dict, *, started_at: float | None = None) -> RunStatus:
+    """Record describing a checkpointed (or node input) state."""
+    error_log = state.get("error_log") or []
+    now = time.time()
+    return RunStatus(
+        thread_id=thread_id,
+        pipeline_status=state.get("pipeline_status") or QUEUED,
+        revision_count=state.get("revision_count") or 0,
+        error_count=len(error_log),
+        errors=_errors(error_log),
+        has_draft=state.get("current_draft") is not None,
+        started_at=started_at or now,
+        updated_at=now,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Backing tables
+# ---------------------------------------------------------------------------
+
+
+class RunStatusStore(ABC):
+    @abstractmethod
+    async def upsert(self, records: list[RunStatus]) -> None: ...
+
+    @abstractmethod
+    async def get_many(self, thread_ids: list[str]) -> dict[str, RunStatus]: ...
+
+    async def close(self) -> None:
+        return None
+
+
+class SqliteRunStatusStore(RunStatusStore):
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path or settings.run_status_sqlite_path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _upsert(self, records: list[RunStatus]) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    _UPSERT.format(values=", ".join("?" * 10)), [r.to_row() for r in records]
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _get_many(self, thread_ids: list[str]) -> dict[str, RunStatus]:
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {_COLUMNS} FROM pipeline_run_status "
+                f"WHERE thread_id IN ({', '.join('?' * len(thread_ids))})",
+                thread_ids,
+            ).fetchall()
+        return {row[0]: RunStatus.from_row(row) for row in rows}
+
+    async def upsert(self, records: list[RunStatus]) -> None:
+        if records:
+            await run_io(self._upsert, records)
+
+    async def get_many(self, thread_ids: list[str]) -> dict[str, RunStatus]:
+        if not thread_ids:
+            return {}
+        return await run_io(self._get_many, thread_ids)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class PostgresRunStatusStore(RunStatusStore):
+    _POOL_MAX_SIZE = 2
+
+    def __init__(self, conninfo: str | None = None) -> None:
+        self.conninfo = conninfo or settings.database_url
+        if not self.conninfo:
+            raise ValueError("DATABASE_URL is required for the Postgres run status store.")
+        self._pool: Any = None
+        self._ready = False
+
+    async def _connection(self) -> Any:
+        if self._pool is None:
+            from psycopg_pool import AsyncConnectionPool
+
+            # Same connection settings as the checkpointer (Supabase pooler)
+            self._pool = AsyncConnectionPool(
+                self.conninfo,
+                min_size=1,
+                max_size=self._POOL_MAX_SIZE,
+                kwargs={"autocommit": True, "prepare_threshold": 0},
+                open=False,
+            )
+            await self._pool.open()
+        if not self._ready:
+            async with self._pool.connection() as conn:
+                await conn.execute(_SCHEMA)
+            self._ready = True
+        return self._pool.connection()
+
+    async def upsert(self, records: list[RunStatus]) -> None:
+        if not records:
+            return
+        async with await self._connection() as conn, conn.cursor() as cur:
+            await cur.executemany(
+                _UPSERT.format(values=", ".join(["%s"] * 10)), [r.to_row() for r in records]
+            )
+
+    async def get_many(self, thread_ids: list[str]) -> dict[str, RunStatus]:
+        if not thread_ids:
+            return {}
+        async with await self._connection() as conn:
+            cur = await conn.execute(
+                f"SELECT {_COLUMNS} FROM pipeline_run_status WHERE thread_id = ANY(%s)",
+                (thread_ids,),
+            )
+            rows = await cur.fetchall()
+        return {row[0]: RunStatus.from_row(row) for row in rows}
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            self._ready = False
+
+
+def create_run_status_store() -> RunStatusStore:
+    """Build the configured backend (Postgres when DATABASE_URL is set)."""
+    backend = settings.run_status_backend or ("postgres" if settings.database_url else "sqlite")
+    if backend == "postgres":
+        return PostgresRunStatusStore()
+    return SqliteRunStatusStore()
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Entry:
+    status: RunStatus
+    checked_at: float  # last local write or table read (monotonic)
+
+
+class RunStatusRegistry:
+    """In-memory status table with write-behind to a :class:`RunStatusStore`."""
+
+    def __init__(
+        self,
+        store: RunStatusStore | None = None,
+        *,
+        max_entries: int | None = None,
+        ttl_s: float | None = None,
+        flush_interval_s: float | None = None,
+    ) -> None:
+        self._store = store
+        self.max_entries = max_entries or settings.run_status_cache_size
+        self.ttl_s = ttl_s if ttl_s is not None else settings.run_status_cache_ttl_s
+        self.flush_interval_s = (
+            flush_interval_s
+            if flush_interval_s is not None
+            else settings.run_status_flush_interval_ms / 1000
+        )
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._dirty: dict[str, RunStatus] = {}
+        # thread_id -> nodes running right now, in start order (parallel nodes overlap)
+        self._running: dict[str, list[str]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def store(self) -> RunStatusStore:
+        if self._store is None:
+            self._store = create_run_status_store()
+        return self._store
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # --- writes ---
+
+    async def put(self, status: RunStatus) -> None:
+        """Record ``status`` locally and persist it (batched while the flusher runs)."""
+        self._remember(status)
+        if self.running:
+            self._dirty[status.thread_id] = status
+            return
+        try:
+            await self.store.upsert([status])
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to persist run status for %s", status.thread_id, exc_info=True)
+
+    async def enqueued(self, thread_id: str) -> None:
+        await self.put(RunStatus(thread_id=thread_id, pipeline_status=QUEUED))
+
+    async def resuming(self, thread_id: str) -> None:
+        current = await self.get(thread_id)
+        status = current or RunStatus(thread_id=thread_id)
+        await self.put(
+            replace(status, pipeline_status=RESUMING, node_state=None, updated_at=time.time())
+        )
+
+    async def failed(self, thread_id: str, message: str) -> RunStatus | None:
+        """Mark the run failed for good; returns the status it replaced."""
+        current = await self.get(thread_id)
+        status = current or RunStatus(thread_id=thread_id)
+        await self.put(
+            replace(
+                status,
+                pipeline_status="failed",
+                node_state=None,
+                error_count=status.error_count + 1,
+                errors=_errors([*status.errors, message]),
+                updated_at=time.time(),
+            )
+        )
+        return current
+
+    async def node_started(self, thread_id: str, node_name: str, state: dict) -> None:
+        previous = self._entries.get(thread_id)
+        status = status_from_state(
+            thread_id, state, started_at=previous.status.started_at if previous else None
+        )
+        status.current_node = node_name
+        status.node_state = "running"
+        self._running.setdefault(thread_id, []).append(node_name)
+        await self.put(status)
+
+    async def node_finished(
+        self,
+        thread_id: str,
+        node_name: str,
+        state: dict,
+        result: Any,
+        error: BaseException | None,
+    ) -> None:
+        if is_park(error):
+            error = None  # parked for approval: the node is done, nothing failed
+        entry = self._entries.get(thread_id)
+        base = entry.status if entry else status_from_state(thread_id, state)
+        update = result if isinstance(result, dict) else {}
+        new_errors = list(update.get("error_log") or [])
+        if error is not None:
+            new_errors.append(f"{node_name}: {type(error).__name__}: {error}")
+        state_errors = state.get("error_log") or []
+        # A node still running in parallel stays the current one
+        still_running = self._running.get(thread_id, [])
+        if node_name in still_running:
+            still_running.remove(node_name)
+        if not still_running:
+            self._running.pop(thread_id, None)
+        if still_running and error is None:
+            current_node, node_state = still_running[-1], "running"
+        else:
+            current_node, node_state = node_name, ("error" if error is not None else "done")
+        status = replace(
+            base,
+            pipeline_status=update.get("pipeline_status") or base.pipeline_status,
+            current_node=current_node,
+            node_state=node_state,
+            revision_count=update.get("revision_count", state.get("revision_count")) or 0,
+            error_count=len(state_errors) + len(new_errors),
+            errors=_errors([*state_errors, *new_errors]),
+            has_draft=(
+                update["current_draft"] is not None
+                if "current_draft" in update
+                else state.get("current_draft") is not None
+            ),
+            updated_at=time.time(),
+        )
+        await self.put(status)
+
+    def _remember(self, status: RunStatus) -> None:
+        self._entries[status.thread_id] = _Entry(status, time.monotonic())
+        self._entries.move_to_end(status.thread_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # --- reads ---
+
+    async def get(self, thread_id: str) -> RunStatus | None:
+        return (await self.get_many([thread_id])).get(thread_id)
+
+    async def get_many(self, thread_ids: list[str]) -> dict[str, RunStatus]:
+        """Statuses of the known threads among ``thread_ids`` (unknown ones are omitted)."""
+        now = time.monotonic()
+        found: dict[str, RunStatus] = {}
+        stale: list[str] = []
+        for thread_id in dict.fromkeys(thread_ids):
+            entry = self._entries.get(thread_id)
+            if entry is not None and now - entry.checked_at <= self.ttl_s:
+                found[thread_id] = entry.status
+            else:
+                stale.append(thread_id)
+        if not stale:
+            return found
+
+        try:
+            rows = await self.store.get_many(stale)
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to read run statuses", exc_info=True)
+            rows = {}
+        for thread_id in stale:
+            entry = self._entries.get(thread_id)
+            row = rows.get(thread_id)
+            local = entry.status if entry is not None else None
+            newest = row if local is None or (row and row.updated_at > local.updated_at) else local
+            if newest is not None:
+                self._remember(newest)
+                found[thread_id] = newest
+        return found
+
+    # --- flusher ---
+
+    def start(self) -> None:
+        """Start the write-behind flusher on the running loop (idempotent)."""
+        if self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="run-status-flush")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        if self._store is not None:
+            await self._store.close()
+
+    async def flush(self) -> None:
+        dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+        try:
+            await self.store.upsert(list(dirty.values()))
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to persist %d run statuses", len(dirty), exc_info=True)
+            for thread_id, status in dirty.items():
+                self._dirty.setdefault(thread_id, status)  # retry next round
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_s)
+            await self.flush()
+
+
+_registry_instance: RunStatusRegistry | None = None
+
+
+def get_run_status_registry() -> RunStatusRegistry:
+    """Get or create the process-wide RunStatusRegistry."""
+    global _registry_instance  # noqa: PLW0603
+    if _registry_instance is None:
+        _registry_instance = RunStatusRegistry()
+    return _registry_instance
@@ -0,0 +1,236 @@
+"""State snapshot strategies for node execution logs.
+
+Serializing the full pipeline state for every node (draft, enriched
+contexts, base64 layout image, feedback history) dominates both wrapper
+overhead and ``data/logs`` volume. The snapshot mode decides how much of
+each node's input/output is kept:
+
+- ``off``       — nothing
+- ``keys``      — key names with a one-word type/size summary
+- ``truncated`` — full structure, long strings and lists capped
+- ``diff``      — input as keys; output as a JSON-Patch style structural
+                  diff against the previous value of each written key
+- ``full``      — everything (previous behaviour)
+
+The mode is chosen per node via ``settings.node_snapshot_modes`` with
+``settings.node_snapshot_mode`` as the default.
+"""
+
+from __future__ import annotations
+
+import json
+import typing
+from typing import Any, Literal
+
+from editorial_ai.config import settings
+
+SnapshotMode = Literal["off", "keys", "truncated", "diff", "full"]
+
+SNAPSHOT_MODES: tuple[str, ...] = typing.get_args(SnapshotMode)
+
+# Hard cap on diff operations per node so a rewritten draft stays small
+MAX_DIFF_OPS = 200
+
+_append_keys: frozenset[str] | None = None
+
+
+def resolve_snapshot_mode(node_name: str) -> str:
+    """Return the configured snapshot mode for a node."""
+    mode = settings.node_snapshot_modes.get(node_name, settings.node_snapshot_mode)
+    return mode if mode in SNAPSHOT_MODES else "truncated"
+
+
+def _reducer_keys() -> frozenset[str]:
+    """State keys with an append reducer — node output for these is a delta."""
+    global _append_keys  # noqa: PLW0603
+    if _append_keys is None:
+        from editorial_ai.state import EditorialPipelineState
+
+        hints = typing.get_type_hints(EditorialPipelineState, include_extras=True)
+        _append_keys = frozenset(
+            key for key, hint in hints.items() if getattr(hint, "__metadata__", None)
+        )
+    return _append_keys
+
+
+def json_size(obj: Any) -> int:
+    """UTF-8 size of ``obj`` as compact JSON (0 for None)."""
+    if obj is None:
+        return 0
+    try:
+        return len(json.dumps(obj, default=str, ensure_ascii=False).encode("utf-8"))
+    except Exception:  # noqa: BLE001
+        return 0
+
+
+def full_snapshot(obj: Any) -> dict | None:
+    """Convert an object to a JSON-safe dict.
+
+    Handles Pydantic models, bytes, datetimes, etc. via ``default=str``.
+    Returns ``{"_serialization_error": ...}`` on failure rather than raising.
+    """
+    try:
+        return json.loads(json.dumps(obj, default=str))  # type: ignore[no-any-return]
+    except Exception as exc:  # noqa: BLE001
+        return {"_serialization_error": str(exc)}
+
+
+def _describe(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        return f"str[{len(value)}]"
+    if isinstance(value, dict):
+        return f"dict[{len(value)}]"
+    if isinstance(value, (list, tuple)):
+        return f"list[{len(value)}]"
+    return type(value).__name__
+
+
+def keys_snapshot(obj: Any) -> dict | None:
+    """Key names with a type/size summary, e.g. ``{"current_draft": "dict[6]"}``."""
+    if obj is None:
+        return None
+    if not isinstance(obj, dict):
+        return {"_type": _describe(obj)}
+    return {"_keys": {str(k): _describe(v) for k, v in obj.items()}}
+
+
+def truncate(
+    obj: Any,
+    *,
+    max_str: int | None = None,
+    max_items: int | None = None,
+    max_depth: int | None = None,
+    _depth: int = 0,
+) -> Any:
+    """Return a JSON-safe copy of ``obj`` with strings, lists and depth capped."""
+    max_str = settings.node_snapshot_max_str_chars if max_str is None else max_str
+    max_items = settings.node_snapshot_max_items if max_items is None else max_items
+    max_depth = settings.node_snapshot_max_depth if max_depth is None else max_depth
+
+    if obj is None or isinstance(obj, (bool, int, float)):
+        return obj
+    if isinstance(obj, str):
+        if len(obj) <= max_str:
+            return obj
+        return f"{obj[:max_str]}…[+{len(obj) - max_str} chars]"
+    if isinstance(obj, (bytes, bytearray)):
+        return f"<{len(obj)} bytes>"
+    if isinstance(obj, dict):
+        if _depth >= max_depth:
+            return f"<dict with {len(obj)} keys>"
+        return {
+            str(k): truncate(
+                v, max_str=max_str, max_items=max_items, max_depth=max_depth, _depth=_depth + 1
+            )
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        if _depth >= max_depth:
+            return f"<list with {len(obj)} items>"
+        items = [
+            truncate(
+                v, max_str=max_str, max_items=max_items, max_depth=max_depth, _depth=_depth + 1
+            )
+            for v in obj[:max_items]
+        ]
+        if len(obj) > max_items:
+            items.append(f"…[+{len(obj) - max_items} items]")
+        return items
+    if hasattr(obj, "model_dump"):
+        obj = obj.model_dump()
+    else:
+        obj = str(obj)
+    return truncate(obj, max_str=max_str, max_items=max_items, max_depth=max_depth, _depth=_depth)
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _diff(old: Any, new: Any, path: str, ops: list[dict]) -> None:
+    if len(ops) > MAX_DIFF_OPS:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": truncate(value)})
+            else:
+                _diff(old[key], value, child, ops)
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        for i in range(min(len(old), len(new))):
+            _diff(old[i], new[i], f"{path}/{i}", ops)
+        for i in range(len(old), len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": truncate(new[i])})
+        for i in range(len(old) - 1, len(new) - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        return
+    if old != new:
+        ops.append({"op": "replace", "path": path, "value": truncate(new)})
+
+
+def diff_snapshot(previous: Any, output: Any) -> dict | None:
+    """Structural diff of a node's output against the previous state values.
+
+    Keys with append reducers (``error_log``, ``feedback_history``, ...) are
+    reported as ``append`` ops since the node returns only the new items.
+    """
+    if output is None:
+        return None
+    if not isinstance(output, dict):
+        return {"_value": truncate(output)}
+    previous = previous if isinstance(previous, dict) else {}
+    append_keys = _reducer_keys()
+    ops: list[dict] = []
+    unchanged: list[str] = []
+    for key, value in output.items():
+        path = f"/{_escape(key)}"
+        if key in append_keys:
+            ops.append({"op": "append", "path": path, "value": truncate(value)})
+            continue
+        if key not in previous:
+            ops.append({"op": "add", "path": path, "value": truncate(value)})
+            continue
+        before = len(ops)
+        _diff(previous[key], value, path, ops)
+        if len(ops) == before:
+            unchanged.append(key)
+
+    snapshot: dict = {"_diff": ops[:MAX_DIFF_OPS]}
+    if len(ops) > MAX_DIFF_OPS:
+        snapshot["_diff_truncated"] = True
+    if unchanged:
+        snapshot["_unchanged"] = unchanged
+    return snapshot
+
+
+def snapshot_input(state: Any, mode: str) -> dict | None:
+    """Snapshot a node's input state according to ``mode``."""
+    if mode == "off":
+        return None
+    if mode == "full":
+        return full_snapshot(state)
+    if mode == "truncated":
+        value = truncate(state)
+        return value if isinstance(value, dict) else {"_value": value}
+    # keys and diff both keep only the input's shape
+    return keys_snapshot(state)
+
+
+def snapshot_output(result: Any, state: Any, mode: str) -> dict | None:
+    """Snapshot a node's output according to ``mode`` (``state`` is its input)."""
+    if result is None or mode == "off":
+        return None
+    if mode == "full":
+        return full_snapshot(result)
+    if mode == "keys":
+        return keys_snapshot(result)
+    if mode == "diff":
+        return diff_snapshot(state, result)
+    value = truncate(result)
+    return value if isinstance(value, dict) else {"_value": value}
@@ -0,0 +1,147 @@
+"""Sub-node spans for LLM and Supabase calls.
+
+A node like ``editorial`` makes several LLM calls (content generation,
+Nano Banana, vision parse, repair). Spans record each of them with its
+latency, retry attempt and payload sizes so a slow node can be broken
+down in ``/api/contents/{id}/logs``.
+
+Usage pattern (same shape as the token collector):
+    reset_span_collector()      # node_wrapper, start of node
+    with Span("review", "llm"): # llm_call / supabase_query open spans
+        ...
+    spans = harvest_spans()     # node_wrapper, end of node
+
+The open-span stack lives in a ContextVar holding an immutable tuple, so
+tasks spawned with ``asyncio.gather`` inherit their parent span without
+sharing a stack. Finished spans go to the node's collector list, which
+those tasks do share. Outside a node, spans are timed but not kept.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any
+
+from editorial_ai.observability.models import SpanRecord
+
+logger = logging.getLogger(__name__)
+
+_span_stack_var: ContextVar[tuple[int, ...]] = ContextVar("_span_stack_var", default=())
+_spans_var: ContextVar[list[SpanRecord] | None] = ContextVar("_spans_var", default=None)
+# Set by the tenacity ``before`` hook; consumed by the next LLM span.
+_attempt_var: ContextVar[int] = ContextVar("_attempt_var", default=1)
+
+_span_ids = itertools.count(1)
+
+
+def reset_span_collector() -> None:
+    """Start collecting spans for the current node."""
+    _spans_var.set([])
+    _span_stack_var.set(())
+
+
+def harvest_spans() -> list[SpanRecord]:
+    """Return the spans recorded for the current node and stop collecting."""
+    try:
+        spans = _spans_var.get() or []
+        _spans_var.set(None)
+        return sorted(spans, key=lambda s: s.started_at)
+    except Exception:  # noqa: BLE001
+        logger.warning("Failed to harvest spans", exc_info=True)
+        return []
+
+
+def note_attempt(retry_state: Any) -> None:
+    """tenacity ``before`` hook: remember which attempt the next call is."""
+    _attempt_var.set(getattr(retry_state, "attempt_number", 1) or 1)
+
+
+def _consume_attempt() -> int:
+    attempt = _attempt_var.get()
+    if attempt != 1:
+        _attempt_var.set(1)
+    return attempt
+
+
+def payload_chars(payload: Any) -> int:
+    """Approximate size of a request/response payload in characters (bytes for binary)."""
+    if payload is None:
+        return 0
+    if isinstance(payload, str):
+        return len(payload)
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, (list, tuple)):
+        return sum(payload_chars(item) for item in payload)
+    text = getattr(payload, "text", None)
+    if isinstance(text, str):
+        return len(text)
+    inline = getattr(payload, "inline_data", None)
+    data = getattr(inline, "data", None)
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    return 0
+
+
+class Span:
+    """Times one operation and records it into the current node's spans."""
+
+    __slots__ = (
+        "name", "kind", "model", "attempts", "request_chars", "response_chars",
+        "cached_tokens", "_id", "_parent", "_depth", "_started_at", "_t0", "_token",
+    )
+
+    def __init__(self, name: str, kind: str = "internal", *, model: str | None = None) -> None:
+        self.name = name
+        self.kind = kind
+        self.model = model
+        self.attempts = _consume_attempt() if kind == "llm" else 1
+        self.request_chars = 0
+        self.response_chars = 0
+        self.cached_tokens = 0
+
+    def __enter__(self) -> Span:
+        stack = _span_stack_var.get()
+        self._id = next(_span_ids)
+        self._parent = stack[-1] if stack else None
+        self._depth = len(stack)
+        self._token = _span_stack_var.set((*stack, self._id))
+        self._started_at = datetime.now(timezone.utc)
+        self._t0 = time.perf_counter()
+        return self
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        latency_ms = self.elapsed_ms()
+        try:
+            _span_stack_var.reset(self._token)
+        except ValueError:  # exited in a different context; drop our frame
+            _span_stack_var.set(_span_stack_var.get()[:-1])
+        spans = _spans_var.get()
+        if spans is None:
+            return
+        try:
+            spans.append(SpanRecord(
+                span_id=self._id,
+                parent_id=self._parent,
+                depth=self._depth,
+                name=self.name,
+                kind=self.kind,
+                model=self.model,
+                status="error" if exc_type is not None else "ok",
+                error_type=exc_type.__name__ if exc_type is not None else None,
+                started_at=self._started_at,
+                latency_ms=latency_ms,
+                attempts=self.attempts,
+                request_chars=self.request_chars,
+                response_chars=self.response_chars,
+                cached_tokens=self.cached_tokens,
+            ))
+        except Exception:  # noqa: BLE001
+            logger.warning("Failed to record span %s", self.name, exc_info=True)
@@ -0,0 +1,409 @@
+"""Embedded SQLite store for cross-run observability queries.
+
+JSONL logs answer "what happened in this thread"; this store answers
+"p95 ``editorial`` duration this week by model" or "tokens / cost per
+published article" without scanning every log file.
+
+Three tables, written together by the log writers in ``storage``:
+
+- ``node_runs`` — one row per node execution (kept for
+  ``observability_raw_retention_days``), used for percentiles and per-thread
+  totals. ``model_name`` / ``routing_reason`` are those of the node's first
+  LLM call.
+- ``daily_rollups`` — counters pre-aggregated by
+  (day, node_name, model_name, routing_reason), kept indefinitely. Tokens
+  are attributed to the model/route of each call; runs, errors and duration
+  to the node's first route.
+- ``route_rollups`` — prompt and cached tokens by (day, route, model_name),
+  where route is the model router key of each LLM call, for prompt-cache
+  hit ratios per prompt (``cache_stats``).
+
+All methods are blocking — call them on the I/O executor (``run_io``).
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from editorial_ai.config import settings
+from editorial_ai.observability.loop_monitor import percentile
+from editorial_ai.observability.models import NodeRunLog
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS node_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    thread_id TEXT NOT NULL,
+    node_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    pipeline_status TEXT,
+    day TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    model_name TEXT NOT NULL DEFAULT '',
+    routing_reason TEXT NOT NULL DEFAULT '',
+    llm_calls INTEGER NOT NULL DEFAULT 0,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_tokens INTEGER NOT NULL DEFAULT 0,
+    cost_usd REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_node_runs_day_node ON node_runs (day, node_name);
+CREATE INDEX IF NOT EXISTS ix_node_runs_thread ON node_runs (thread_id);
+
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    day TEXT NOT NULL,
+    node_name TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    routing_reason TEXT NOT NULL,
+    runs INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    duration_ms_sum REAL NOT NULL DEFAULT 0,
+    llm_calls INTEGER NOT NULL DEFAULT 0,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_tokens INTEGER NOT NULL DEFAULT 0,
+    cost_usd REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, node_name, model_name, routing_reason)
+);
+
+CREATE TABLE IF NOT EXISTS route_rollups (
+    day TEXT NOT NULL,
+    route TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    llm_calls INTEGER NOT NULL DEFAULT 0,
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    cached_tokens INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, route, model_name)
+);
+"""
+
+_ROUTE_ROLLUP_UPSERT = """
+INSERT INTO route_rollups (day, route, model_name, llm_calls, prompt_tokens, cached_tokens)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (day, route, model_name) DO UPDATE SET
+    llm_calls = llm_calls + excluded.llm_calls,
+    prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+    cached_tokens = cached_tokens + excluded.cached_tokens
+"""
+
+_ROLLUP_UPSERT = """
+INSERT INTO daily_rollups (
+    day, node_name, model_name, routing_reason, runs, errors, duration_ms_sum,
+    llm_calls, prompt_tokens, completion_tokens, total_tokens, cached_tokens, cost_usd
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (day, node_name, model_name, routing_reason) DO UPDATE SET
+    runs = runs + excluded.runs,
+    errors = errors + excluded.errors,
+    duration_ms_sum = duration_ms_sum + excluded.duration_ms_sum,
+    llm_calls = llm_calls + excluded.llm_calls,
+    prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+    completion_tokens = completion_tokens + excluded.completion_tokens,
+    total_tokens = total_tokens + excluded.total_tokens,
+    cached_tokens = cached_tokens + excluded.cached_tokens,
+    cost_usd = cost_usd + excluded.cost_usd
+"""
+
+# Columns added after the first release; ALTERed into existing databases
+_ADDED_COLUMNS = {
+    "node_runs": ("cost_usd REAL NOT NULL DEFAULT 0",),
+    "daily_rollups": ("cost_usd REAL NOT NULL DEFAULT 0",),
+}
+
+# Rollup dimensions accepted by ``stats(group_by=...)``
+GROUP_BY_COLUMNS = ("node_name", "model_name", "routing_reason", "day")
+
+
+def _day(ts: datetime) -> str:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc).date().isoformat()
+
+
+def _primary_route(log: NodeRunLog) -> tuple[str, str]:
+    if not log.token_usage:
+        return "", ""
+    first = log.token_usage[0]
+    return first.model_name or "", first.routing_reason or ""
+
+
+def _ratio(numerator: float, denominator: float) -> float | None:
+    return round(numerator / denominator, 4) if denominator else None
+
+
+class StatsStore:
+    """SQLite-backed node run index with daily rollups."""
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path or settings.observability_db_path)
+        self._conn: sqlite3.Connection | None = None
+        # One connection shared by executor threads; sqlite3 serializes
+        # nothing for us, so we do.
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            for table, columns in _ADDED_COLUMNS.items():
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                for column in columns:
+                    if column.split()[0] not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- writes -----------------------------------------------------------
+
+    def record_runs(self, logs: Iterable[NodeRunLog]) -> int:
+        """Index a batch of node logs and fold them into the daily rollups."""
+        run_rows: list[tuple] = []
+        rollups: dict[tuple[str, str, str, str], list[float]] = defaultdict(
+            lambda: [0, 0, 0.0, 0, 0, 0, 0, 0, 0.0]
+        )
+        route_rollups: dict[tuple[str, str, str], list[int]] = defaultdict(lambda: [0, 0, 0])
+        for log in logs:
+            day = _day(log.started_at)
+            model, reason = _primary_route(log)
+            cached = sum(u.cached_tokens for u in log.token_usage)
+            run_rows.append((
+                log.thread_id, log.node_name, log.status, log.pipeline_status, day,
+                log.started_at.isoformat(), log.duration_ms, model, reason,
+                len(log.token_usage), log.total_prompt_tokens,
+                log.total_completion_tokens, log.total_tokens, cached, log.cost_usd,
+            ))
+            primary = rollups[(day, log.node_name, model, reason)]
+            primary[0] += 1
+            primary[1] += log.status == "error"
+            primary[2] += log.duration_ms
+            for usage in log.token_usage:
+                acc = rollups[
+                    (day, log.node_name, usage.model_name or "", usage.routing_reason or "")
+                ]
+                acc[3] += 1
+                acc[4] += usage.prompt_tokens
+                acc[5] += usage.completion_tokens
+                acc[6] += usage.total_tokens
+                acc[7] += usage.cached_tokens
+                acc[8] += usage.cost_usd or 0.0
+                per_route = route_rollups[(day, usage.route or "", usage.model_name or "")]
+                per_route[0] += 1
+                per_route[1] += usage.prompt_tokens
+                per_route[2] += usage.cached_tokens
+        if not run_rows:
+            return 0
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT INTO node_runs (thread_id, node_name, status, pipeline_status, "
+                    "day, started_at, duration_ms, model_name, routing_reason, llm_calls, "
+                    "prompt_tokens, completion_tokens, total_tokens, cached_tokens, cost_usd) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    run_rows,
+                )
+                conn.executemany(
+                    _ROLLUP_UPSERT, [(*key, *values) for key, values in rollups.items()]
+                )
+                conn.executemany(
+                    _ROUTE_ROLLUP_UPSERT,
+                    [(*key, *values) for key, values in route_rollups.items()],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return len(run_rows)
+
+    def prune_runs(self, retention_days: int | None = None) -> int:
+        """Drop raw runs older than the retention window (rollups are kept)."""
+        days = settings.observability_raw_retention_days if retention_days is None else retention_days
+        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=days)).isoformat()
+        with self._lock:
+            cur = self._connect().execute("DELETE FROM node_runs WHERE day < ?", (cutoff,))
+            return cur.rowcount
+
+    # --- reads ------------------------------------------------------------
+
+    def stats(
+        self,
+        *,
+        since: date | None = None,
+        until: date | None = None,
+        node_name: str | None = None,
+        model_name: str | None = None,
+        routing_reason: str | None = None,
+        group_by: Iterable[str] = ("node_name",),
+    ) -> dict:
+        """Aggregate stats for a day range, grouped by rollup dimensions.
+
+        Duration percentiles come from raw runs (so they only reach back
+        as far as the retention window); counters come from the rollups.
+        """
+        group = [g for g in group_by if g in GROUP_BY_COLUMNS]
+        where = ["1=1"]
+        params: list = []
+        if since is not None:
+            where.append("day >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            where.append("day <= ?")
+            params.append(until.isoformat())
+        # Published articles are counted over the day range only
+        day_clause, day_params = " AND ".join(where), list(params)
+        for column, value in (
+            ("node_name", node_name),
+            ("model_name", model_name),
+            ("routing_reason", routing_reason),
+        ):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(value)
+        clause = " AND ".join(where)
+        key_cols = ", ".join(group) if group else "'all'"
+
+        with self._lock:
+            conn = self._connect()
+            rollup_rows = conn.execute(
+                f"SELECT {key_cols}, SUM(runs), SUM(errors), SUM(duration_ms_sum), "
+                "SUM(llm_calls), SUM(prompt_tokens), SUM(completion_tokens), "
+                f"SUM(total_tokens), SUM(cached_tokens), SUM(cost_usd) "
+                f"FROM daily_rollups WHERE {clause} "
+                f"GROUP BY {key_cols} ORDER BY {key_cols}",
+                params,
+            ).fetchall()
+            duration_rows = conn.execute(
+                f"SELECT {key_cols}, duration_ms FROM node_runs WHERE {clause}", params
+            ).fetchall()
+            published = conn.execute(
+                f"SELECT DISTINCT thread_id FROM node_runs WHERE {day_clause} "
+                "AND pipeline_status = 'published'",
+                day_params,
+            ).fetchall()
+            published_ids = [row[0] for row in published]
+            published_tokens, published_cost = 0, 0.0
+            if published_ids:
+                marks = ", ".join("?" * len(published_ids))
+                published_tokens, published_cost = conn.execute(
+                    f"SELECT COALESCE(SUM(total_tokens), 0), COALESCE(SUM(cost_usd), 0) "
+                    f"FROM node_runs WHERE thread_id IN ({marks})",
+                    published_ids,
+                ).fetchone()
+
+        n_keys = max(len(group), 1)
+        durations: dict[tuple, list[float]] = defaultdict(list)
+        for row in duration_rows:
+            durations[tuple(row[:n_keys])].append(row[n_keys])
+
+        groups: list[dict] = []
+        totals = defaultdict(float)
+        totals_cost = 0.0
+        for row in rollup_rows:
+            key = tuple(row[:n_keys])
+            runs, errors, dur_sum, calls, prompt, completion, total, cached, cost = row[n_keys:]
+            samples = sorted(durations.get(key, []))
+            entry: dict = dict(zip(group, key)) if group else {}
+            entry.update({
+                "runs": runs,
+                "errors": errors,
+                "avg_duration_ms": round(dur_sum / runs, 2) if runs else None,
+                "p50_duration_ms": round(percentile(samples, 50), 2) if samples else None,
+                "p95_duration_ms": round(percentile(samples, 95), 2) if samples else None,
+                "p99_duration_ms": round(percentile(samples, 99), 2) if samples else None,
+                "llm_calls": calls,
+                "prompt_tokens": prompt,
+                "completion_tokens": completion,
+                "total_tokens": total,
+                "cached_tokens": cached,
+                "cache_hit_ratio": _ratio(cached, prompt),
+                "cost_usd": round(cost, 6),
+            })
+            groups.append(entry)
+            for name, value in (
+                ("runs", runs), ("errors", errors), ("llm_calls", calls),
+                ("prompt_tokens", prompt), ("completion_tokens", completion),
+                ("total_tokens", total), ("cached_tokens", cached),
+            ):
+                totals[name] += value
+            totals_cost += cost
+
+        summary = {name: int(value) for name, value in totals.items()}
+        summary["cost_usd"] = round(totals_cost, 6)
+        summary["cache_hit_ratio"] = _ratio(totals["cached_tokens"], totals["prompt_tokens"])
+        summary["published_articles"] = len(published_ids)
+        summary["tokens_per_published_article"] = (
+            round(published_tokens / len(published_ids), 1) if published_ids else None
+        )
+        summary["cost_per_published_article"] = (
+            round(published_cost / len(published_ids), 6) if published_ids else None
+        )
+        return {"group_by": group, "groups": groups, "totals": summary}
+
+    def cache_stats(self, *, since: date | None = None, until: date | None = None) -> dict:
+        """Cached share of prompt tokens per route and model for a day range."""
+        where = ["1=1"]
+        params: list = []
+        if since is not None:
+            where.append("day >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            where.append("day <= ?")
+            params.append(until.isoformat())
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT route, model_name, SUM(llm_calls), SUM(prompt_tokens), "
+                f"SUM(cached_tokens) FROM route_rollups WHERE {' AND '.join(where)} "
+                "GROUP BY route, model_name ORDER BY route, model_name",
+                params,
+            ).fetchall()
+
+        routes = [
+            {
+                "route": route,
+                "model_name": model,
+                "llm_calls": calls,
+                "prompt_tokens": prompt,
+                "cached_tokens": cached,
+                "cache_hit_ratio": _ratio(cached, prompt),
+            }
+            for route, model, calls, prompt, cached in rows
+        ]
+        prompt_total = sum(r["prompt_tokens"] for r in routes)
+        cached_total = sum(r["cached_tokens"] for r in routes)
+        return {
+            "routes": routes,
+            "prompt_tokens": prompt_total,
+            "cached_tokens": cached_total,
+            "cache_hit_ratio": _ratio(cached_total, prompt_total),
+        }
+
+
+_store: StatsStore | None = None
+
+
+def get_stats_store() -> StatsStore:
+    """Return the process-wide stats store (opened lazily)."""
+    global _store  # noqa: PLW0603
+    if _store is None:
+        _store = StatsStore()
+    return _store
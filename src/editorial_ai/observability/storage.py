@@ -2,17 +2,46 @@
 
 All operations are fire-and-forget: failures log warnings but never raise.
 One JSONL file per thread: data/logs/{thread_id}.jsonl
+Threads idle for ``log_compact_after_days`` are gzipped to
+data/logs/{thread_id}.jsonl.gz; reads merge both files transparently.
+
+The ``*_async`` variants are what async code paths (node_wrapper, API
+routes) should call: appends go through the batched ``LogSink`` when it is
+running and otherwise run on the bounded I/O executor.
 """
 
 from __future__ import annotations
 
+import gzip
 import logging
+import os
+import shutil
+import threading
+import time
 from pathlib import Path
 
+from editorial_ai.config import settings
+from editorial_ai.io_executor import run_io
+from editorial_ai.observability.log_sink import get_log_sink
 from editorial_ai.observability.models import NodeRunLog
+from editorial_ai.observability.stats_store import get_stats_store
 
 logger = logging.getLogger(__name__)
 
+# Appends for one thread may come from several executor threads; a line can
+# be larger than the file buffer, so serialize writers per file. Readers take
+# the lock too: compaction writes the .gz before removing the live file.
+_path_locks: dict[Path, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    with _path_locks_guard:
+        lock = _path_locks.get(path)
+        if lock is None:
+            lock = _path_locks[path] = threading.Lock()
+        return lock
+
 
 def _log_dir() -> Path:
     """Return the log directory, creating it if needed."""
@@ -26,6 +55,20 @@ def _log_path(thread_id: str) -> Path:
     return _log_dir() / f"{thread_id}.jsonl"
 
 
+def _compacted_path(path: Path) -> Path:
+    return path.with_name(path.name + ".gz")
+
+
+def _index_stats(logs: list[NodeRunLog]) -> None:
+    """Feed written logs into the cross-run stats store (never raises)."""
+    if not logs or not settings.observability_stats_enabled:
+        return
+    try:
+        get_stats_store().record_runs(logs)
+    except Exception:
+        logger.warning("Failed to index %d node logs in stats store", len(logs), exc_info=True)
+
+
 def append_node_log(log: NodeRunLog) -> None:
     """Append one NodeRunLog as a JSON line to the thread's JSONL file.
 
@@ -33,32 +76,152 @@ def append_node_log(log: NodeRunLog) -> None:
     """
     try:
         path = _log_path(log.thread_id)
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(log.model_dump_json() + "\n")
+        line = log.model_dump_json() + "\n"
+        with _lock_for(path), open(path, "a", encoding="utf-8") as f:
+            f.write(line)
     except Exception:
         logger.warning(
             "Failed to append node log for thread %s", log.thread_id, exc_info=True
         )
+        return
+    _index_stats([log])
+
+
+def write_log_batch(
+    batch: dict[str, list[NodeRunLog]], fsync_threads: set[str] | None = None
+) -> None:
+    """Append several logs per thread with one open per file (blocking).
+
+    Threads in ``fsync_threads`` are fsynced after the write, even if they
+    have no new lines in this batch. Failures for one thread are logged and
+    do not affect the others.
+    """
+    fsync_threads = fsync_threads or set()
+    written: list[NodeRunLog] = []
+    for thread_id in set(batch) | fsync_threads:
+        logs = batch.get(thread_id, [])
+        try:
+            path = _log_path(thread_id)
+            if not logs and not path.exists():
+                continue
+            payload = "".join(log.model_dump_json() + "\n" for log in logs)
+            with _lock_for(path), open(path, "a", encoding="utf-8") as f:
+                f.write(payload)
+                if thread_id in fsync_threads:
+                    f.flush()
+                    os.fsync(f.fileno())
+            written.extend(logs)
+        except Exception:
+            logger.warning(
+                "Failed to write %d node logs for thread %s", len(logs), thread_id, exc_info=True
+            )
+    _index_stats(written)
+
+
+def _read_lines(f) -> list[NodeRunLog]:  # noqa: ANN001
+    logs: list[NodeRunLog] = []
+    for line in f:
+        line = line.strip()
+        if line:
+            logs.append(NodeRunLog.model_validate_json(line))
+    return logs
 
 
 def read_node_logs(thread_id: str) -> list[NodeRunLog]:
-    """Read all NodeRunLog entries from a thread's JSONL file.
+    """Read all NodeRunLog entries for a thread (compacted ``.gz`` first, then live).
 
-    Returns empty list if file doesn't exist or on any error. Never raises.
+    Returns empty list if no file exists or on any error. Never raises.
     """
     try:
         path = _log_path(thread_id)
-        if not path.exists():
-            return []
+        compacted = _compacted_path(path)
         logs: list[NodeRunLog] = []
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    logs.append(NodeRunLog.model_validate_json(line))
+        with _lock_for(path):
+            if compacted.exists():
+                with gzip.open(compacted, "rt", encoding="utf-8") as f:
+                    logs.extend(_read_lines(f))
+            if path.exists():
+                with open(path, encoding="utf-8") as f:
+                    logs.extend(_read_lines(f))
         return logs
     except Exception:
         logger.warning(
             "Failed to read node logs for thread %s", thread_id, exc_info=True
         )
         return []
+
+
+def compact_old_logs(max_age_days: float) -> int:
+    """Gzip thread logs not modified for ``max_age_days`` (blocking).
+
+    Lines appended after a previous compaction (e.g. a run resumed days
+    later) are merged into the existing ``.gz``. Returns the number of
+    threads compacted. Never raises.
+    """
+    compacted_count = 0
+    cutoff = time.time() - max_age_days * 86400
+    try:
+        paths = list(_log_dir().glob("*.jsonl"))
+    except Exception:
+        logger.warning("Failed to list node logs for compaction", exc_info=True)
+        return 0
+    for path in paths:
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+            target = _compacted_path(path)
+            tmp = path.with_name(f".{target.name}.tmp")
+            with _lock_for(path):
+                with gzip.open(tmp, "wb") as out:
+                    if target.exists():
+                        with gzip.open(target, "rb") as previous:
+                            shutil.copyfileobj(previous, out)
+                    with open(path, "rb") as live:
+                        shutil.copyfileobj(live, out)
+                os.replace(tmp, target)
+                path.unlink()
+            compacted_count += 1
+        except Exception:
+            logger.warning("Failed to compact node log %s", path, exc_info=True)
+    if compacted_count:
+        logger.info("Compacted %d node log files", compacted_count)
+    return compacted_count
+
+
+async def append_node_log_async(log: NodeRunLog) -> None:
+    """Async variant of :func:`append_node_log` that never blocks the event loop.
+
+    Queued on the batched log sink when it is running; written directly on
+    the I/O executor otherwise.
+    """
+    try:
+        if get_log_sink().submit(log):
+            return
+        await run_io(append_node_log, log)
+    except Exception:
+        logger.warning(
+            "Failed to schedule node log append for thread %s", log.thread_id, exc_info=True
+        )
+
+
+async def flush_node_logs(thread_id: str, *, fsync: bool = True) -> None:
+    """Make a thread's queued logs durable (called when a pipeline run ends)."""
+    try:
+        await get_log_sink().flush(thread_id, fsync=fsync)
+    except Exception:
+        logger.warning("Failed to flush node logs for thread %s", thread_id, exc_info=True)
+
+
+async def read_node_logs_async(thread_id: str) -> list[NodeRunLog]:
+    """Async variant of :func:`read_node_logs` that never blocks the event loop.
+
+    Pending batched writes are flushed first so readers see every log.
+    """
+    try:
+        await get_log_sink().flush(thread_id)
+        return await run_io(read_node_logs, thread_id)
+    except Exception:
+        logger.warning(
+            "Failed to schedule node log read for thread %s", thread_id, exc_info=True
+        )
+        return []
@@ -0,0 +1,143 @@
+"""Run priority lanes and the LLM capacity gate.
+
+Every pipeline run belongs to one lane:
+
+- ``interactive`` — an admin is waiting on the result (``db_source`` triggers)
+- ``standard`` — other API triggers
+- ``batch`` — bulk runs (``scripts/run_pipeline_multi.py``)
+
+The job queue picks the next job by weighted fair queueing across lanes
+(``jobs.scheduler``). Inside a run the lane travels in
+``state["priority"]``; ``node_wrapper`` applies it with
+:func:`run_priority` and ``llm_call`` takes a slot from the process's
+:class:`LLMCapacityGate` before calling the model.
+
+The gate caps concurrent LLM calls (``LLM_MAX_CONCURRENCY``), hands a
+freed slot to the highest-priority waiter first and keeps
+``LLM_INTERACTIVE_RESERVED_SLOTS`` that only interactive calls may take,
+so a backlog of batch runs cannot hold all the model capacity when an
+admin triggers a run. Calls already in flight are never cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Literal
+
+from editorial_ai.config import settings
+
+Priority = Literal["interactive", "standard", "batch"]
+
+# Highest first
+PRIORITIES: tuple[Priority, ...] = ("interactive", "standard", "batch")
+DEFAULT_PRIORITY: Priority = "standard"
+
+_priority_var: ContextVar[Priority] = ContextVar("run_priority", default=DEFAULT_PRIORITY)
+
+
+def normalize_priority(value: object) -> Priority:
+    """``value`` if it names a lane, else the default lane."""
+    return value if value in PRIORITIES else DEFAULT_PRIORITY  # type: ignore[return-value]
+
+
+def priority_rank(priority: str) -> int:
+    """0 for interactive, growing towards batch."""
+    return PRIORITIES.index(normalize_priority(priority))
+
+
+def current_priority() -> Priority:
+    """Lane of the run executing in the current context."""
+    return _priority_var.get()
+
+
+@contextlib.contextmanager
+def run_priority(priority: object) -> Iterator[None]:
+    """Attribute LLM calls in the current context to ``priority``."""
+    token = _priority_var.set(normalize_priority(priority))
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+class LLMCapacityGate:
+    """Priority semaphore for concurrent LLM calls in one process.
+
+    ``limit`` <= 0 disables the gate. Waiters are served strictly by lane,
+    then arrival; a lower lane never overtakes a waiting higher one.
+    """
+
+    def __init__(self, limit: int, reserved: int = 0) -> None:
+        self.limit = limit
+        # At least one slot stays open to every lane
+        self.reserved = max(0, min(reserved, limit - 1))
+        self.in_use = 0
+        self._waiters: list[tuple[int, int, Priority, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for *_, fut in self._waiters if not fut.done())
+
+    def _admits(self, priority: Priority) -> bool:
+        free = self.limit - self.in_use
+        return free > 0 if priority == "interactive" else free > self.reserved
+
+    def _drop_done(self) -> None:
+        while self._waiters and self._waiters[0][3].done():
+            heapq.heappop(self._waiters)
+
+    async def acquire(self, priority: Priority = DEFAULT_PRIORITY) -> float:
+        """Take a slot for a call in ``priority``. Returns seconds spent waiting."""
+        if self.limit <= 0:
+            return 0.0
+        priority = normalize_priority(priority)
+        rank = priority_rank(priority)
+        self._drop_done()
+        ahead = bool(self._waiters) and self._waiters[0][0] <= rank
+        if not ahead and self._admits(priority):
+            self.in_use += 1
+            return 0.0
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._seq), priority, fut))
+        started = time.perf_counter()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self.release()  # granted just as the caller gave up
+            raise
+        return time.perf_counter() - started
+
+    def release(self) -> None:
+        """Return a slot and hand it to the highest-priority admissible waiter."""
+        if self.limit <= 0:
+            return
+        self.in_use = max(self.in_use - 1, 0)
+        while True:
+            self._drop_done()
+            if not self._waiters or not self._admits(self._waiters[0][2]):
+                return
+            *_, fut = heapq.heappop(self._waiters)
+            self.in_use += 1
+            fut.set_result(None)
+
+
+_gate_instance: LLMCapacityGate | None = None
+
+
+def get_llm_gate() -> LLMCapacityGate:
+    """Get or create the process-wide LLM capacity gate."""
+    global _gate_instance  # noqa: PLW0603
+    if _gate_instance is None:
+        _gate_instance = LLMCapacityGate(
+            settings.llm_max_concurrency, settings.llm_interactive_reserved_slots
+        )
+    return _gate_instance
@@ -0,0 +1,87 @@
+"""Prompt assembly: stable cacheable prefix + per-call dynamic suffix.
+
+Prompt builders return :class:`PromptParts`: the prefix holds text that is
+identical across calls (role, rubric criteria, block catalog, output
+format), the suffix holds the draft/keyword/context of this call.
+
+:func:`assemble` decides how to send them:
+
+- Explicit caching — when the call allows it (no ``response_schema``:
+  ``cached_content + response_schema`` hangs the Gemini API) and the
+  prefix's estimated token count reaches the model's cache minimum, the
+  prefix is stored once per (route, model) through the shared
+  :class:`~editorial_ai.caching.CacheManager` and only the suffix is sent.
+- Implicit caching — otherwise the full text is sent prefix first, so
+  Gemini's implicit prefix cache can match it across calls.
+
+Either way the cached share shows up in ``TokenUsage.cached_tokens`` and in
+``GET /api/observability/cache`` per route.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass
+
+from google import genai
+
+from editorial_ai.caching.cache_manager import get_cache_manager, min_cache_tokens
+from editorial_ai.config import settings
+from editorial_ai.prompts.budgeter import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+PREFIX_SEPARATOR = "\n\n"
+
+
+@dataclass(frozen=True)
+class PromptParts:
+    prefix: str  # static across calls: instructions, catalogs, rubric, output format
+    suffix: str  # this call's inputs
+
+    @property
+    def text(self) -> str:
+        """The full prompt, prefix first."""
+        return f"{self.prefix}{PREFIX_SEPARATOR}{self.suffix}" if self.suffix else self.prefix
+
+    @property
+    def prefix_key(self) -> str:
+        """Content hash of the prefix; changes whenever the prefix text does."""
+        return hashlib.sha256(self.prefix.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class AssembledPrompt:
+    contents: str  # text to send as ``contents``
+    cached_content: str | None  # cache name holding the prefix, if any
+    prompt: str  # full logical prompt (for size estimates and span logging)
+
+
+async def assemble(
+    route: str,
+    model: str,
+    parts: PromptParts,
+    *,
+    client: genai.Client,
+    explicit_cache: bool = True,
+) -> AssembledPrompt:
+    """Send the prefix from an explicit cache when possible, else prefix first.
+
+    ``explicit_cache=False`` for calls that use ``response_schema``. Cache
+    failures fall back to the full text (fire-and-forget, as in CacheManager).
+    """
+    full = parts.text
+    if not explicit_cache or not settings.prompt_prefix_cache_enabled or not parts.suffix:
+        return AssembledPrompt(full, None, full)
+    prefix_tokens = estimate_tokens(parts.prefix)
+    if prefix_tokens < min_cache_tokens(model):
+        return AssembledPrompt(full, None, full)
+
+    cache_name = await get_cache_manager(client).get_or_create(
+        f"prefix:{route}:{parts.prefix_key}", model, parts.prefix, estimated_tokens=prefix_tokens
+    )
+    if cache_name is None:
+        return AssembledPrompt(full, None, full)
+    logger.debug("Serving %s prompt prefix from cache %s", route, cache_name)
+    return AssembledPrompt(parts.suffix, cache_name, full)
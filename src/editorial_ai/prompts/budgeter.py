@@ -0,0 +1,112 @@
+"""Prompt budgeter: token estimates and relevance-ranked context trimming.
+
+Context that grows with the run (topic backgrounds, DB posts, curated
+topics in the judge prompt) is passed as :class:`ContextChunk` items.
+:func:`fit_context` keeps required chunks, then the most relevant ones
+until the route's ``max_prompt_tokens`` (routing_config.yaml) is reached,
+and joins the survivors in their original order.
+
+Every trim is reported to the node's prompt-trim collector, so the
+NodeRunLog shows prompt size before and after trimming.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+
+from editorial_ai.observability.collector import record_prompt_trim
+from editorial_ai.routing import get_model_router
+
+# Gemini tokenizes Latin text at roughly 4 chars/token and Hangul/CJK at
+# roughly 1.5 chars/token; close enough for budgeting, not for billing.
+_ASCII_CHARS_PER_TOKEN = 4.0
+_WIDE_CHARS_PER_TOKEN = 1.5
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text`` for budgeting decisions."""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    wide_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / _ASCII_CHARS_PER_TOKEN + wide_chars / _WIDE_CHARS_PER_TOKEN)
+
+
+@dataclass
+class ContextChunk:
+    text: str
+    required: bool = False  # always kept (instructions, the primary topic)
+    weight: float = 1.0  # multiplies relevance; earlier/primary sources rank higher
+
+
+@dataclass(frozen=True)
+class FitResult:
+    text: str
+    chars_before: int
+    chars_after: int
+    dropped: int  # chunks left out
+
+    @property
+    def trimmed(self) -> bool:
+        return self.dropped > 0
+
+
+def relevance(text: str, terms: set[str]) -> float:
+    """Share of ``terms`` that occur in ``text`` (case-insensitive substring,
+    so Korean terms still match with particles attached)."""
+    if not terms:
+        return 0.0
+    lowered = text.lower()
+    return sum(1 for term in terms if term in lowered) / len(terms)
+
+
+def query_terms(*texts: str) -> set[str]:
+    """Lower-cased words of the given texts, used to rank chunks."""
+    return {w.lower() for text in texts if text for w in _WORD_RE.findall(text) if len(w) > 1}
+
+
+def fit_context(
+    route: str,
+    chunks: list[ContextChunk],
+    *,
+    terms: set[str],
+    reserve_tokens: int = 0,
+    separator: str = "\n",
+) -> FitResult:
+    """Join ``chunks`` into at most the route's prompt budget.
+
+    ``reserve_tokens`` is the rest of the prompt (template, draft), which
+    the context has to share the budget with. Routes without
+    ``max_prompt_tokens`` keep everything.
+    """
+    full = separator.join(c.text for c in chunks)
+    limit = get_model_router().max_prompt_tokens(route)
+    if limit is None or estimate_tokens(full) + reserve_tokens <= limit:
+        return FitResult(full, len(full), len(full), 0)
+
+    available = limit - reserve_tokens
+    keep: set[int] = set()
+    used = 0
+    for i, chunk in enumerate(chunks):
+        if chunk.required:
+            keep.add(i)
+            used += estimate_tokens(chunk.text)
+
+    ranked = sorted(
+        (i for i, c in enumerate(chunks) if not c.required),
+        key=lambda i: (-relevance(chunks[i].text, terms) * chunks[i].weight, i),
+    )
+    for i in ranked:
+        cost = estimate_tokens(chunks[i].text)
+        if used + cost <= available:
+            keep.add(i)
+            used += cost
+
+    text = separator.join(c.text for i, c in enumerate(chunks) if i in keep)
+    result = FitResult(text, len(full), len(text), len(chunks) - len(keep))
+    record_prompt_trim(route, result.chars_before, result.chars_after, result.dropped)
+    return result
@@ -6,8 +6,14 @@ Five prompt builders for the 3-step editorial pipeline:
 3. build_layout_image_prompt — Nano Banana image generation for layout design
 4. build_layout_parsing_prompt — Vision AI to parse layout image into block JSON
 5. build_output_repair_prompt — Fix malformed JSON using Gemini
+
+The content and layout-parsing prompts also come as ``*_parts`` builders
+that put the static instructions first (``prompts.assembly``), so
+repeated calls share a cacheable prefix.
 """
 
+from editorial_ai.prompts.assembly import PromptParts
+
 
 def build_content_generation_prompt(keyword: str, trend_context: str) -> str:
     """Build prompt for Gemini structured output to generate editorial content.
@@ -15,12 +21,18 @@ def build_content_generation_prompt(keyword: str, trend_context: str) -> str:
     Instructs Gemini to produce a Korean fashion editorial article (~500 chars)
     that matches the EditorialContent schema.
     """
-    return f"""당신은 패션 매거진 에디터입니다.
-세련되고, 정보가 풍부하며, 읽는 재미가 있는 에디토리얼 콘텐츠를 작성합니다.
+    return build_content_generation_prompt_parts(keyword, trend_context).text
 
-다음 키워드와 트렌드 배경을 바탕으로 패션 에디토리얼 콘텐츠를 작성해주세요.
 
-키워드: {keyword}
+def build_content_generation_prompt_parts(keyword: str, trend_context: str) -> PromptParts:
+    """Content prompt split into static style-guide prefix and keyword/trend suffix.
+
+    The output conditions follow the keyword because they quote it: the
+    ``keyword`` field must repeat it literally.
+    """
+    return PromptParts(
+        _CONTENT_GENERATION_PREFIX,
+        f"""키워드: {keyword}
 
 트렌드 배경:
 {trend_context}
@@ -32,15 +44,27 @@ def build_content_generation_prompt(keyword: str, trend_context: str) -> str:
 - pull_quotes: 인상적인 인용문 1~2개 (본문에서 발췌하거나 새로 작성)
 - product_mentions: 관련 상품/브랜드 언급 (name, brand, context 포함).
   실제 패션 브랜드와 제품을 언급하세요.
-- celeb_mentions: 관련 셀럽/인플루언서 언급 (name, context 포함). 실제 인물을 언급하세요.
+- celeb_mentions: 관련 셀럽/인플루언서 언급 (name, context 포함). \
+실제 인물을 언급하세요.
 - hashtags: 관련 해시태그 3~5개 (# 없이 텍스트만)
 - credits: 크레딧 정보 (role, name). 최소 1개 (예: AI Editor / decoded editorial)
 - keyword: "{keyword}"
 
-톤: 패션 매거진 에디터 톤 - 세련되고, 트렌디하며, 독자의 흥미를 끄는 문체
-언어: 한국어 (영어 고유명사는 영어 그대로 사용 가능)
+반드시 유효한 JSON만 출력하세요. \
+마크다운 코드 펜스나 추가 설명을 포함하지 마세요.""",
+    )
+
 
-반드시 유효한 JSON만 출력하세요. 마크다운 코드 펜스나 추가 설명을 포함하지 마세요."""
+_CONTENT_GENERATION_PREFIX = """당신은 패션 매거진 에디터입니다.
+세련되고, 정보가 풍부하며, \
+읽는 재미가 있는 에디토리얼 콘텐츠를 작성합니다.
+
+다음 키워드와 트렌드 배경을 바탕으로 \
+패션 에디토리얼 콘텐츠를 작성해주세요.
+
+톤: 패션 매거진 에디터 톤 - \
+세련되고, 트렌디하며, 독자의 흥미를 끄는 문체
+언어: 한국어 (영어 고유명사는 영어 그대로 사용 가능)"""
 
 
 def build_content_generation_prompt_with_feedback(
@@ -125,10 +149,14 @@ def build_layout_parsing_prompt(keyword: str, block_types: list[str]) -> str:
     Instructs Gemini Vision to analyze the magazine layout image and extract
     an ordered list of block definitions.
     """
-    block_types_str = ", ".join(f'"{bt}"' for bt in block_types)
-    return f"""이 매거진 레이아웃 디자인 이미지를 분석하여, 블록 구조를 JSON으로 추출해주세요.
+    return build_layout_parsing_prompt_parts(keyword, block_types).text
 
-키워드: {keyword}
+
+def build_layout_parsing_prompt_parts(keyword: str, block_types: list[str]) -> PromptParts:
+    """Layout parsing prompt: block catalog and guides first, keyword last."""
+    block_types_str = ", ".join(f'"{bt}"' for bt in block_types)
+    prefix = f"""\
+이 매거진 레이아웃 디자인 이미지를 분석하여, 블록 구조를 JSON으로 추출해주세요.
 
 사용 가능한 블록 타입: [{block_types_str}]
 
@@ -190,6 +218,7 @@ pull_quote, product_showcase, celeb_feature, divider 블록을 반드시 포함
 pull_quote, product_showcase, celeb_feature 블록을 각각 최소 1개씩 포함하세요.
 
 반드시 유효한 JSON 배열만 출력하세요."""
+    return PromptParts(prefix, f"키워드: {keyword}")
 
 
 def build_output_repair_prompt(model_name: str, raw_json: str, error_message: str) -> str:
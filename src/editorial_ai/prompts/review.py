@@ -2,12 +2,17 @@
 
 Single prompt builder for semantic evaluation of editorial drafts.
 Format validation is handled deterministically by Pydantic -- NOT by the LLM.
+
+The rubric part of the prompt comes first and does not depend on the
+draft, so it is a cacheable prefix (see ``prompts.assembly``).
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from editorial_ai.prompts.assembly import PromptParts
+
 if TYPE_CHECKING:
     from editorial_ai.rubrics.registry import RubricConfig
 
@@ -49,22 +54,48 @@ def build_review_prompt(
     Returns:
         Prompt string for Gemini structured output.
     """
-    if rubric_config is None:
-        return _build_default_prompt(draft_json, curated_topics_json)
+    return build_review_prompt_parts(
+        draft_json, curated_topics_json, rubric_config=rubric_config
+    ).text
 
-    criteria_section = _build_criteria_section(rubric_config)
-    criteria_names = _build_output_criteria_names(rubric_config)
-    criteria_count = len(rubric_config.criteria)
 
-    return f"""당신은 전문 에디터로서 콘텐츠 초안을 검수합니다.
-아래의 에디토리얼 초안(Draft)을 큐레이션 데이터(Ground Truth)와 대조하여 평가해주세요.
+def build_review_prompt_parts(
+    draft_json: str,
+    curated_topics_json: str,
+    *,
+    rubric_config: RubricConfig | None = None,
+) -> PromptParts:
+    """Review prompt split into the per-rubric static prefix and the draft suffix.
+
+    The prefix (role, criteria, additions, output format) is identical for
+    every draft judged with the same rubric, so it can be cached.
+    """
+    if rubric_config is None:
+        prefix = _DEFAULT_PREFIX
+    else:
+        prefix = _build_rubric_prefix(rubric_config)
+    return PromptParts(prefix, _build_suffix(draft_json, curated_topics_json))
+
 
-## 에디토리얼 초안 (Draft)
+def _build_suffix(draft_json: str, curated_topics_json: str) -> str:
+    return f"""## 에디토리얼 초안 (Draft)
 {draft_json}
 
 ## 큐레이션 데이터 (Ground Truth)
 {curated_topics_json}
 
+위 초안을 평가 기준에 따라 평가하고, 반드시 유효한 JSON만 출력하세요."""
+
+
+def _build_rubric_prefix(rubric_config: RubricConfig) -> str:
+    criteria_section = _build_criteria_section(rubric_config)
+    criteria_names = _build_output_criteria_names(rubric_config)
+    criteria_count = len(rubric_config.criteria)
+
+    return f"""당신은 전문 에디터로서 콘텐츠 초안을 검수합니다.
+아래에 주어지는 에디토리얼 초안(Draft)을 \
+큐레이션 데이터(Ground Truth)와 대조하여 평가해주세요.
+
 ## 평가 기준
 
 {criteria_section}
@@ -85,21 +116,14 @@ def build_review_prompt(
 - passed: 모든 기준이 통과하면 true, 하나라도 실패하면 false
 - criteria: 위 {criteria_count}개 기준 결과 배열
 - summary: 전체 평가 요약 (1-2문장, 한국어)
-- suggestions: 개선 제안 목록 (실패한 기준에 대해)
+- suggestions: 개선 제안 목록 (실패한 기준에 대해)"""
 
-반드시 유효한 JSON만 출력하세요."""
 
-
-def _build_default_prompt(draft_json: str, curated_topics_json: str) -> str:
-    """Original hardcoded 3-criteria prompt (backward compatible)."""
-    return f"""당신은 패션 매거진 편집장으로서 에디토리얼 초안을 검수합니다.
-아래의 에디토리얼 초안(Draft)을 큐레이션 데이터(Ground Truth)와 대조하여 평가해주세요.
-
-## 에디토리얼 초안 (Draft)
-{draft_json}
-
-## 큐레이션 데이터 (Ground Truth)
-{curated_topics_json}
+# Original hardcoded 3-criteria prompt (backward compatible)
+_DEFAULT_PREFIX = """\
+당신은 패션 매거진 편집장으로서 에디토리얼 초안을 검수합니다.
+아래에 주어지는 에디토리얼 초안(Draft)을 \
+큐레이션 데이터(Ground Truth)와 대조하여 평가해주세요.
 
 ## 평가 기준
 
@@ -135,6 +159,4 @@ def _build_default_prompt(draft_json: str, curated_topics_json: str) -> str:
 - passed: 모든 기준이 통과하면 true, 하나라도 실패하면 false
 - criteria: 위 3개 기준 결과 배열
 - summary: 전체 평가 요약 (1-2문장, 한국어)
-- suggestions: 개선 제안 목록 (실패한 기준에 대해)
-
-반드시 유효한 JSON만 출력하세요."""
+- suggestions: 개선 제안 목록 (실패한 기준에 대해)"""
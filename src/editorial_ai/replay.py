@@ -0,0 +1,143 @@
+"""Replay a finished (or paused) run from a chosen node on a new thread.
+
+``POST /api/pipeline/replay`` forks a thread: the new run starts from the
+source thread's original input, but every node upstream of ``from_node``
+returns the output it produced in the source run instead of executing
+again. ``from_node`` and everything after it run for real, so iterating on
+a prompt or reproducing an incident in ``editorial`` skips curation's
+grounded search, design_spec and the Supabase fetches.
+
+Memoized outputs come from the source thread's checkpoint history (each
+step keeps its tasks' writes) and are keyed by node and a hash of the
+node's input state. Keys that differ between the runs without changing
+what a node computes (thread ID, profiling, lane, budget ledger) are left
+out of the hash. A node whose input does not match anything in the source
+run executes normally, so memoization never returns a stale output.
+
+The memo is applied with :func:`replay_memo` while the replay job runs;
+``node_wrapper`` asks :func:`memoized_output` before calling a node.
+``admin_gate`` and ``publish`` always run: their effects (the pending
+content record, publishing) belong to the new thread.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import hashlib
+import json
+import logging
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Differ between a run and its replay without changing what nodes compute
+_VOLATILE_KEYS = frozenset({
+    "thread_id",
+    "profile",
+    "model_overrides",
+    "priority",
+    "batch_id",
+    "budget_spent",
+    "budget_status",
+    "budget_decisions",
+})
+# Added to every output by node_wrapper; the replay records its own spend
+_WRAPPER_KEYS = ("budget_spent",)
+# Side effects belong to the new thread
+NEVER_MEMOIZED = frozenset({"admin_gate", "publish"})
+
+_memo_var: ContextVar[dict[tuple[str, str], dict] | None] = ContextVar(
+    "replay_memo", default=None
+)
+
+
+def state_hash(state: dict) -> str:
+    """Stable hash of the parts of ``state`` a node's output depends on."""
+    stable = {key: value for key, value in state.items() if key not in _VOLATILE_KEYS}
+    encoded = json.dumps(stable, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ReplayPlan:
+    """What a replay of ``source_thread_id`` from ``from_node`` starts with."""
+
+    source_thread_id: str
+    from_node: str
+    initial_state: dict
+    # (node, input state hash) -> the node's output in the source run
+    memo: dict[tuple[str, str], dict] = field(default_factory=dict)
+
+    @property
+    def reused_nodes(self) -> list[str]:
+        return sorted({node for node, _ in self.memo})
+
+
+async def plan_replay(graph: Any, thread_id: str, from_node: str) -> ReplayPlan:
+    """Collect the source run's input and the node outputs upstream of ``from_node``.
+
+    Raises:
+        LookupError: the thread has no checkpoints.
+        ValueError: ``from_node`` is not a graph node or never ran in the thread.
+    """
+    if from_node not in graph.nodes or from_node.startswith("__"):
+        raise ValueError(f"Unknown node {from_node!r}")
+
+    config = {"configurable": {"thread_id": thread_id}}
+    history = [snapshot async for snapshot in graph.aget_state_history(config)]
+    if not history:
+        raise LookupError(f"No checkpoint for thread {thread_id}")
+
+    initial_state: dict | None = None
+    memo: dict[tuple[str, str], dict] = {}
+    reached = False
+    for snapshot in reversed(history):  # oldest first
+        tasks = snapshot.tasks or ()
+        if initial_state is None:
+            start = next((t for t in tasks if t.name == "__start__"), None)
+            if start is not None and isinstance(start.result, dict):
+                initial_state = dict(start.result)
+            continue
+        reached = any(task.name == from_node for task in tasks)
+        key_hash = state_hash(snapshot.values)
+        for task in tasks:
+            if task.name == from_node or task.name in NEVER_MEMOIZED:
+                continue
+            if not isinstance(task.result, dict):
+                continue  # not finished in the source run
+            output = {k: v for k, v in task.result.items() if k not in _WRAPPER_KEYS}
+            memo.setdefault((task.name, key_hash), output)
+        if reached:
+            break
+
+    if initial_state is None:
+        raise LookupError(f"No input checkpoint for thread {thread_id}")
+    if not reached:
+        raise ValueError(f"Node {from_node!r} never ran in thread {thread_id}")
+    return ReplayPlan(thread_id, from_node, initial_state, memo)
+
+
+@contextlib.contextmanager
+def replay_memo(memo: dict[tuple[str, str], dict] | None) -> Iterator[None]:
+    """Serve memoized node outputs in the current context (see module docstring)."""
+    token = _memo_var.set(memo or None)
+    try:
+        yield
+    finally:
+        _memo_var.reset(token)
+
+
+def memoized_output(node_name: str, state: Any) -> dict | None:
+    """The node's output from the replayed run for this exact input, if any."""
+    memo = _memo_var.get()
+    if not memo or node_name in NEVER_MEMOIZED or not isinstance(state, dict):
+        return None
+    output = memo.get((node_name, state_hash(state)))
+    if output is None:
+        return None
+    logger.info("Replay: reusing memoized output of %s", node_name)
+    return copy.deepcopy(output)
@@ -1,7 +1,27 @@
+from editorial_ai.routing.health import ModelHealthTracker, get_model_health
 from editorial_ai.routing.model_router import (
     ModelRouter,
+    RoutingConfigError,
+    RoutingConfigReadOnlyError,
     RoutingDecision,
     get_model_router,
+    reload_model_router,
+    route_overrides,
+    write_routing_config,
 )
+from editorial_ai.routing.watcher import RoutingConfigWatcher, get_routing_watcher
 
-__all__ = ["ModelRouter", "RoutingDecision", "get_model_router"]
+__all__ = [
+    "ModelHealthTracker",
+    "ModelRouter",
+    "RoutingConfigError",
+    "RoutingConfigReadOnlyError",
+    "RoutingConfigWatcher",
+    "RoutingDecision",
+    "get_model_health",
+    "get_model_router",
+    "get_routing_watcher",
+    "reload_model_router",
+    "route_overrides",
+    "write_routing_config",
+]
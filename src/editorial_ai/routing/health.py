@@ -0,0 +1,140 @@
+"""Live per-model health for adaptive routing.
+
+Every LLM call reports its outcome here (``observability.instrument.LLMCall``
+does it on exit). Per model we keep exponentially weighted moving averages
+of latency (successful calls), error rate and timeout rate, plus a circuit
+breaker for hard failures (404 / model not supported) that takes a model
+out of rotation for a cooldown.
+
+``ModelRouter`` uses :meth:`ModelHealthTracker.issue` to decide whether a
+route's chosen model is degrading and which candidate to fail over to.
+
+Observations happen on the event loop; updates are not locked.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Literal
+
+logger = logging.getLogger(__name__)
+
+Outcome = Literal["ok", "error", "timeout"]
+HealthIssue = Literal["unavailable", "error_rate", "timeout_rate", "slo"]
+
+
+@dataclass
+class ModelHealth:
+    latency_ms: float | None = None  # EWMA over successful calls
+    error_rate: float = 0.0  # EWMA of 1/0 per call
+    timeout_rate: float = 0.0
+    samples: int = 0
+    last_seen: float = 0.0  # monotonic
+    unavailable_until: float = 0.0  # monotonic; circuit open while in the future
+    unavailable_reason: str | None = None
+
+
+@dataclass(frozen=True)
+class HealthPolicy:
+    """Thresholds from the ``adaptive`` block of routing_config.yaml."""
+
+    ewma_alpha: float = 0.2
+    min_samples: int = 5
+    max_error_rate: float = 0.3
+    max_timeout_rate: float = 0.2
+    # A degraded model idle this long gets one probe call again
+    recovery_s: float = 120.0
+    unavailable_cooldown_s: float = 600.0
+
+
+def is_unavailable_error(exc: BaseException) -> bool:
+    """True for errors meaning the model itself cannot serve (404 / unsupported)."""
+    if getattr(exc, "code", None) == 404:
+        return True
+    text = str(exc).lower()
+    return "model" in text and ("404" in text or "not found" in text or "not supported" in text)
+
+
+class ModelHealthTracker:
+    """EWMA latency / error / timeout tracking and a circuit breaker per model."""
+
+    def __init__(self, policy: HealthPolicy | None = None) -> None:
+        self.policy = policy or HealthPolicy()
+        self._models: dict[str, ModelHealth] = {}
+
+    def _get(self, model: str) -> ModelHealth:
+        health = self._models.get(model)
+        if health is None:
+            health = self._models[model] = ModelHealth()
+        return health
+
+    def observe(self, model: str, latency_ms: float, outcome: Outcome) -> None:
+        """Fold one call outcome into the model's moving averages."""
+        h = self._get(model)
+        alpha = self.policy.ewma_alpha
+        if outcome == "ok":
+            h.latency_ms = (
+                latency_ms if h.latency_ms is None
+                else alpha * latency_ms + (1 - alpha) * h.latency_ms
+            )
+        h.error_rate = alpha * (outcome != "ok") + (1 - alpha) * h.error_rate
+        h.timeout_rate = alpha * (outcome == "timeout") + (1 - alpha) * h.timeout_rate
+        h.samples += 1
+        h.last_seen = time.monotonic()
+
+    def mark_unavailable(self, model: str, reason: str, cooldown_s: float | None = None) -> None:
+        """Open the circuit for ``model`` (skipped by routing until the cooldown ends)."""
+        h = self._get(model)
+        cooldown = self.policy.unavailable_cooldown_s if cooldown_s is None else cooldown_s
+        h.unavailable_until = time.monotonic() + cooldown
+        h.unavailable_reason = reason
+        logger.warning("Model %s marked unavailable for %.0fs: %s", model, cooldown, reason)
+
+    def is_available(self, model: str) -> bool:
+        h = self._models.get(model)
+        return h is None or h.unavailable_until <= time.monotonic()
+
+    def issue(self, model: str, latency_slo_ms: float | None = None) -> HealthIssue | None:
+        """Why ``model`` should not be used right now, or None when it is healthy."""
+        if not self.is_available(model):
+            return "unavailable"
+        h = self._models.get(model)
+        if h is None or h.samples < self.policy.min_samples:
+            return None
+        if time.monotonic() - h.last_seen >= self.policy.recovery_s:
+            return None  # idle long enough: let a call probe it again
+        if h.timeout_rate > self.policy.max_timeout_rate:
+            return "timeout_rate"
+        if h.error_rate > self.policy.max_error_rate:
+            return "error_rate"
+        if latency_slo_ms is not None and h.latency_ms is not None and h.latency_ms > latency_slo_ms:
+            return "slo"
+        return None
+
+    def snapshot(self) -> dict[str, dict]:
+        """Current health per model (for the routing health endpoint)."""
+        now = time.monotonic()
+        result = {}
+        for model, h in self._models.items():
+            entry = asdict(h)
+            entry["available"] = h.unavailable_until <= now
+            entry["unavailable_for_s"] = max(round(h.unavailable_until - now, 1), 0.0)
+            del entry["unavailable_until"], entry["last_seen"]
+            result[model] = entry
+        return result
+
+    def reset(self) -> None:
+        self._models.clear()
+
+
+_tracker: ModelHealthTracker | None = None
+
+
+def get_model_health() -> ModelHealthTracker:
+    """Get or create the process-wide ModelHealthTracker."""
+    global _tracker  # noqa: PLW0603
+    if _tracker is None:
+        _tracker = ModelHealthTracker()
+    return _tracker
@@ -1,88 +1,437 @@
 """Config-driven model router for dynamic Gemini model selection.
 
 Maps pipeline node names to Gemini models based on task complexity,
-with conditional upgrade to higher-tier models on retries.
+with conditional upgrade to higher-tier models on retries and budget
+downgrades when a run is short on budget (see ``editorial_ai.budget``).
+Routes with ``small_prompt_model`` use it for prompts estimated at or
+under ``small_prompt_max_tokens``; ``max_prompt_tokens`` is the budget
+the prompt budgeter (``prompts.budgeter``) trims context to.
+
+Adaptive mode (``adaptive.enabled`` in the YAML, or ROUTING_ADAPTIVE)
+then checks the chosen model against live health (``routing.health``):
+if it is failing, timing out or over the route's ``latency_slo_ms``, the
+first healthy model from the route's ``candidates`` is used instead and
+the reason becomes ``adaptive:<issue>``. Models whose circuit is open
+(404 / unsupported) are skipped in every mode.
+
+The config is hot-reloadable: :func:`reload_model_router` (called by the
+file watcher in ``routing.watcher`` and the admin API) validates the new
+file into a fresh router and swaps the singleton, so a resolve sees
+either the old or the new config, never a mix. Every decision carries
+the config ``version`` it was made with.
+
+Per-run model overrides (``TriggerRequest.model_overrides``) are applied
+through :func:`route_overrides`, which ``node_wrapper`` sets around each
+node; an overridden route resolves to its override with reason
+``override``.
 """
 
+import contextlib
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import os
+import threading
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
+from editorial_ai.config import settings
+from editorial_ai.routing.health import HealthPolicy, ModelHealthTracker, get_model_health
+
 logger = logging.getLogger(__name__)
 
 _DEFAULT_CONFIG_PATH = Path(__file__).parent / "routing_config.yaml"
 
+_ROUTE_KEYS = {
+    "default_model",
+    "upgrade_model",
+    "upgrade_conditions",
+    "budget_model",
+    "candidates",
+    "latency_slo_ms",
+    "max_prompt_tokens",
+    "small_prompt_model",
+    "small_prompt_max_tokens",
+}
+_POLICY_KEYS = {f.name for f in fields(HealthPolicy)}
+
+_overrides_var: ContextVar[dict[str, str] | None] = ContextVar("route_overrides", default=None)
+
+
+class RoutingConfigError(ValueError):
+    """The routing config failed validation (the current router stays active)."""
+
+
+class RoutingConfigReadOnlyError(RuntimeError):
+    """No writable routing config: ROUTING_CONFIG_PATH is unset."""
+
+
+def _validate(raw: object) -> None:
+    """Raise RoutingConfigError unless ``raw`` is a usable routing config."""
+    if not isinstance(raw, dict):
+        raise RoutingConfigError("routing config must be a mapping")
+
+    def model_name(where: str, value: object) -> None:
+        if not isinstance(value, str) or not value.strip():
+            raise RoutingConfigError(f"{where} must be a non-empty model name")
+
+    defaults = raw.get("defaults") or {}
+    if not isinstance(defaults, dict):
+        raise RoutingConfigError("defaults must be a mapping")
+    if "model" in defaults:
+        model_name("defaults.model", defaults["model"])
+
+    adaptive = raw.get("adaptive") or {}
+    if not isinstance(adaptive, dict):
+        raise RoutingConfigError("adaptive must be a mapping")
+    unknown = set(adaptive) - _POLICY_KEYS - {"enabled"}
+    if unknown:
+        raise RoutingConfigError(f"adaptive: unknown keys {sorted(unknown)}")
+    for key in _POLICY_KEYS & set(adaptive):
+        if not isinstance(adaptive[key], (int, float)) or adaptive[key] < 0:
+            raise RoutingConfigError(f"adaptive.{key} must be a non-negative number")
+
+    nodes = raw.get("nodes")
+    if not isinstance(nodes, dict) or not nodes:
+        raise RoutingConfigError("nodes must be a non-empty mapping")
+    for node_name, cfg in nodes.items():
+        if not isinstance(cfg, dict):
+            raise RoutingConfigError(f"nodes.{node_name} must be a mapping")
+        unknown = set(cfg) - _ROUTE_KEYS
+        if unknown:
+            raise RoutingConfigError(f"nodes.{node_name}: unknown keys {sorted(unknown)}")
+        model_name(f"nodes.{node_name}.default_model", cfg.get("default_model"))
+        for key in ("upgrade_model", "budget_model", "small_prompt_model"):
+            if cfg.get(key) is not None:
+                model_name(f"nodes.{node_name}.{key}", cfg[key])
+        conditions = cfg.get("upgrade_conditions") or {}
+        min_rev = conditions.get("min_revision_count") if isinstance(conditions, dict) else None
+        if not isinstance(conditions, dict) or (
+            min_rev is not None and (not isinstance(min_rev, int) or min_rev < 0)
+        ):
+            raise RoutingConfigError(
+                f"nodes.{node_name}.upgrade_conditions.min_revision_count "
+                "must be a non-negative integer"
+            )
+        candidates = cfg.get("candidates") or []
+        if not isinstance(candidates, list):
+            raise RoutingConfigError(f"nodes.{node_name}.candidates must be a list")
+        for candidate in candidates:
+            model_name(f"nodes.{node_name}.candidates", candidate)
+        for key in ("max_prompt_tokens", "small_prompt_max_tokens"):
+            value = cfg.get(key)
+            if value is not None and (not isinstance(value, int) or value <= 0):
+                raise RoutingConfigError(f"nodes.{node_name}.{key} must be a positive integer")
+        if (cfg.get("small_prompt_model") is None) != (cfg.get("small_prompt_max_tokens") is None):
+            raise RoutingConfigError(
+                f"nodes.{node_name}: small_prompt_model and small_prompt_max_tokens go together"
+            )
+        slo = cfg.get("latency_slo_ms")
+        if slo is not None and (not isinstance(slo, (int, float)) or slo <= 0):
+            raise RoutingConfigError(f"nodes.{node_name}.latency_slo_ms must be positive")
+
+
+def _parse_config(data: bytes | str) -> dict:
+    """Parse and validate routing config YAML; raises RoutingConfigError."""
+    try:
+        raw = yaml.safe_load(data)
+    except yaml.YAMLError as exc:
+        raise RoutingConfigError(f"invalid YAML: {exc}") from exc
+    _validate(raw)
+    return raw
+
+
+def config_version(data: bytes | str) -> str:
+    """Version stamp of a routing config: a short hash of its contents."""
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def config_path() -> Path:
+    """The routing config in use (ROUTING_CONFIG_PATH or the packaged YAML)."""
+    if settings.routing_config_path:
+        return Path(settings.routing_config_path)
+    return _DEFAULT_CONFIG_PATH
+
 
 @dataclass
 class ModelRoute:
     default_model: str
     upgrade_model: str | None = None
     upgrade_conditions: dict = field(default_factory=dict)
+    budget_model: str | None = None  # used once the run budget is critical
+    candidates: list[str] = field(default_factory=list)  # failover order
+    latency_slo_ms: float | None = None
+    max_prompt_tokens: int | None = None  # prompt budgeter trims context to this
+    small_prompt_model: str | None = None  # used for prompts <= small_prompt_max_tokens
+    small_prompt_max_tokens: int | None = None
 
 
 @dataclass
 class RoutingDecision:
     model: str
-    reason: str  # "default", "upgrade:revision>=2", "fallback"
+    # "default", "upgrade:revision>=2", "budget:critical", "prompt_tokens<=4000",
+    # "adaptive:error_rate", "override", "fallback"
+    reason: str
+    version: str | None = None  # routing config version the decision was made with
 
 
 class ModelRouter:
-    """Resolves (node_name, context) -> model_name from YAML config."""
+    """Resolves (node_name, context) -> model_name from YAML config.
+
+    ``data`` builds the router from config contents instead of reading
+    ``config_path``. Raises RoutingConfigError (or OSError) when the config
+    cannot be loaded.
+    """
 
-    def __init__(self, config_path: Path | str | None = None) -> None:
-        path = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
-        with open(path) as f:
-            raw = yaml.safe_load(f)
+    def __init__(
+        self,
+        config_path: Path | str | None = None,
+        *,
+        health: ModelHealthTracker | None = None,
+        data: bytes | str | None = None,
+    ) -> None:
+        self.path = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
+        if data is None:
+            data = self.path.read_bytes()
+        raw = _parse_config(data)
 
+        self.version = config_version(data)
+        self.loaded_at = datetime.now(timezone.utc)
         self._fallback_model = raw.get("defaults", {}).get("model", "gemini-2.5-flash")
         self._routes: dict[str, ModelRoute] = {}
 
+        adaptive = dict(raw.get("adaptive") or {})
+        self._adaptive = (
+            settings.routing_adaptive
+            if settings.routing_adaptive is not None
+            else bool(adaptive.pop("enabled", False))
+        )
+        adaptive.pop("enabled", None)
+        self.health_policy = HealthPolicy(**adaptive)
+        self._health = health or get_model_health()
+
         for node_name, cfg in raw.get("nodes", {}).items():
             self._routes[node_name] = ModelRoute(
                 default_model=cfg["default_model"],
                 upgrade_model=cfg.get("upgrade_model"),
                 upgrade_conditions=cfg.get("upgrade_conditions", {}),
+                budget_model=cfg.get("budget_model"),
+                candidates=list(cfg.get("candidates", [])),
+                latency_slo_ms=cfg.get("latency_slo_ms"),
+                max_prompt_tokens=cfg.get("max_prompt_tokens"),
+                small_prompt_model=cfg.get("small_prompt_model"),
+                small_prompt_max_tokens=cfg.get("small_prompt_max_tokens"),
             )
 
+    def apply_health_policy(self) -> None:
+        """Make this config's ``adaptive`` thresholds the health tracker's policy.
+
+        The tracker is shared, so only the router being installed applies
+        it (see :func:`get_model_router` and :func:`reload_model_router`).
+        """
+        self._health.policy = self.health_policy
+
     def resolve(
         self,
         node_name: str,
         *,
         revision_count: int = 0,
+        budget_level: str | None = None,
+        prompt_tokens: int | None = None,
     ) -> RoutingDecision:
         """Resolve a model for the given node and context.
 
-        Returns a RoutingDecision with model name and reason string.
+        ``budget_level`` ("ok" | "low" | "critical" | "exhausted") suppresses
+        upgrades from "low" on and switches to the route's budget_model from
+        "critical" on. ``prompt_tokens`` (estimated) picks the route's
+        small_prompt_model for short prompts when no upgrade applies.
+
+        A per-run override for ``node_name`` (see :func:`route_overrides`)
+        takes precedence over everything else.
+
+        Returns a RoutingDecision with model name, reason and config version.
         """
+        override = self._override(node_name)
+        if override is not None:
+            return override
+
         route = self._routes.get(node_name)
         if not route:
-            return RoutingDecision(model=self._fallback_model, reason="fallback")
+            return RoutingDecision(
+                model=self._fallback_model, reason="fallback", version=self.version
+            )
+
+        if budget_level in ("critical", "exhausted") and route.budget_model:
+            return self.adapt(
+                node_name,
+                RoutingDecision(model=route.budget_model, reason=f"budget:{budget_level}"),
+            )
 
         # Check upgrade conditions
         if route.upgrade_model and route.upgrade_conditions:
             min_rev = route.upgrade_conditions.get("min_revision_count")
             if min_rev is not None and revision_count >= min_rev:
+                if budget_level in ("low", "critical", "exhausted"):
+                    return self.adapt(
+                        node_name,
+                        RoutingDecision(model=route.default_model, reason="budget:no_upgrade"),
+                    )
+                return self.adapt(
+                    node_name,
+                    RoutingDecision(
+                        model=route.upgrade_model,
+                        reason=f"upgrade:revision>={min_rev}",
+                    ),
+                )
+
+        if (
+            route.small_prompt_model
+            and route.small_prompt_max_tokens is not None
+            and prompt_tokens is not None
+            and prompt_tokens <= route.small_prompt_max_tokens
+        ):
+            return self.adapt(
+                node_name,
+                RoutingDecision(
+                    model=route.small_prompt_model,
+                    reason=f"prompt_tokens<={route.small_prompt_max_tokens}",
+                ),
+            )
+
+        return self.adapt(node_name, RoutingDecision(model=route.default_model, reason="default"))
+
+    def adapt(self, node_name: str, decision: RoutingDecision) -> RoutingDecision:
+        """Fail over from ``decision.model`` to a healthy candidate if needed.
+
+        Also used directly for models chosen outside the router (the
+        Nano Banana model comes from settings), so per-run overrides and
+        the version stamp are applied here too.
+        """
+        override = self._override(node_name)
+        if override is not None:
+            return override
+        decision = replace(decision, version=self.version)
+
+        route = self._routes.get(node_name)
+        slo = route.latency_slo_ms if route else None
+        issue = (
+            self._health.issue(decision.model, slo)
+            if self._adaptive
+            else ("unavailable" if not self._health.is_available(decision.model) else None)
+        )
+        if issue is None or route is None:
+            return decision
+
+        for candidate in route.candidates:
+            if candidate == decision.model:
+                continue
+            healthy = (
+                self._health.issue(candidate, slo) is None
+                if self._adaptive
+                else self._health.is_available(candidate)
+            )
+            if healthy:
+                logger.info(
+                    "Routing %s: %s -> %s (%s)", node_name, decision.model, candidate, issue
+                )
                 return RoutingDecision(
-                    model=route.upgrade_model,
-                    reason=f"upgrade:revision>={min_rev}",
+                    model=candidate, reason=f"adaptive:{issue}", version=self.version
                 )
+        return decision
 
-        return RoutingDecision(model=route.default_model, reason="default")
+    def _override(self, node_name: str) -> RoutingDecision | None:
+        model = (_overrides_var.get() or {}).get(node_name)
+        if not model:
+            return None
+        return RoutingDecision(model=model, reason="override", version=self.version)
+
+    def max_prompt_tokens(self, node_name: str) -> int | None:
+        """Prompt budget for ``node_name`` (None = no trimming)."""
+        route = self._routes.get(node_name)
+        return route.max_prompt_tokens if route else None
+
+    @property
+    def routes(self) -> dict[str, ModelRoute]:
+        return dict(self._routes)
+
+    @property
+    def adaptive(self) -> bool:
+        return self._adaptive
 
     @property
     def fallback_model(self) -> str:
         return self._fallback_model
 
 
+@contextlib.contextmanager
+def route_overrides(overrides: dict[str, str] | None) -> Iterator[None]:
+    """Resolve the given routes to fixed models for the current context."""
+    token = _overrides_var.set(dict(overrides) if overrides else None)
+    try:
+        yield
+    finally:
+        _overrides_var.reset(token)
+
+
 # Module-level singleton
 _router_instance: ModelRouter | None = None
+_reload_lock = threading.Lock()
 
 
 def get_model_router() -> ModelRouter:
     """Get or create the singleton ModelRouter."""
     global _router_instance
     if _router_instance is None:
-        _router_instance = ModelRouter()
+        with _reload_lock:
+            if _router_instance is None:
+                router = ModelRouter(config_path())
+                router.apply_health_policy()
+                _router_instance = router
     return _router_instance
+
+
+def reload_model_router(path: Path | str | None = None) -> ModelRouter:
+    """Load and validate the routing config, then swap it in atomically.
+
+    Raises RoutingConfigError (or OSError) and keeps the current router
+    when the new config is invalid. Blocking file I/O: call via ``run_io``.
+    """
+    global _router_instance
+    router = ModelRouter(path or config_path())
+    with _reload_lock:
+        previous = _router_instance
+        router.apply_health_policy()
+        _router_instance = router
+    if previous is None or previous.version != router.version:
+        logger.info(
+            "Routing config %s loaded (version %s, %d routes)",
+            router.path, router.version, len(router.routes),
+        )
+    return router
+
+
+def write_routing_config(data: str) -> ModelRouter:
+    """Validate ``data``, replace the config file with it and reload.
+
+    The file is written to a temp file and renamed over the config, so the
+    watcher never sees a partial write. Blocking: call via ``run_io``.
+
+    Raises RoutingConfigReadOnlyError without ROUTING_CONFIG_PATH: the
+    packaged YAML is part of the installed code and is never overwritten.
+    """
+    if not settings.routing_config_path:
+        raise RoutingConfigReadOnlyError(
+            "Set ROUTING_CONFIG_PATH to replace the routing config over the API"
+        )
+    path = config_path()
+    ModelRouter(path, data=data)  # validate only
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(data, encoding="utf-8")
+    os.replace(tmp, path)
+    return reload_model_router(path)
@@ -0,0 +1,92 @@
+"""Hot reload of the routing config on file change.
+
+A background task polls the config file's mtime/size every
+``routing_config_watch_interval_s`` and calls ``reload_model_router``
+when it changes. A config that fails validation is logged and ignored;
+the current router keeps serving until a valid file appears.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+
+from editorial_ai.config import settings
+from editorial_ai.io_executor import run_io
+from editorial_ai.routing.model_router import config_path, reload_model_router
+
+logger = logging.getLogger(__name__)
+
+
+def _stat_key() -> tuple[float, int] | None:
+    try:
+        st = os.stat(config_path())
+    except OSError:
+        return None
+    return st.st_mtime, st.st_size
+
+
+class RoutingConfigWatcher:
+    """Polls the routing config and hot-swaps the router when it changes."""
+
+    def __init__(self, interval_s: float | None = None) -> None:
+        self.interval_s = (
+            interval_s if interval_s is not None else settings.routing_config_watch_interval_s
+        )
+        self._task: asyncio.Task[None] | None = None
+        self._last: tuple[float, int] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start watching on the running loop (no-op if disabled or running)."""
+        if self.interval_s <= 0 or self.running:
+            return
+        self._last = _stat_key()
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(), name="routing-config-watcher"
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def check(self) -> bool:
+        """Reload if the file changed since the last check. True when swapped."""
+        current = await run_io(_stat_key)
+        if current is None or current == self._last:
+            return False
+        self._last = current
+        try:
+            await run_io(reload_model_router)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Routing config reload rejected, keeping current router: %s", exc)
+            return False
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            try:
+                await self.check()
+            except Exception:  # noqa: BLE001
+                logger.warning("Routing config watcher check failed", exc_info=True)
+
+
+_watcher_instance: RoutingConfigWatcher | None = None
+
+
+def get_routing_watcher() -> RoutingConfigWatcher:
+    """Get or create the process-wide RoutingConfigWatcher."""
+    global _watcher_instance  # noqa: PLW0603
+    if _watcher_instance is None:
+        _watcher_instance = RoutingConfigWatcher()
+    return _watcher_instance
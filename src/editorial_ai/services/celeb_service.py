@@ -1,15 +1,18 @@
 """Read-only service functions for the celebs table."""
 
+from editorial_ai.batch import shared
 from editorial_ai.models.celeb import Celeb
+from editorial_ai.observability import supabase_query
 from editorial_ai.services.supabase_client import get_supabase_client
 
 
 async def get_celeb_by_id(celeb_id: str) -> Celeb | None:
     """Fetch a single celeb by ID. Returns None if not found."""
     client = await get_supabase_client()
-    response = await (
-        client.table("celebs").select("*").eq("id", celeb_id).maybe_single().execute()
-    )
+    with supabase_query("celebs"):
+        response = await (
+            client.table("celebs").select("*").eq("id", celeb_id).maybe_single().execute()
+        )
     if response is None or response.data is None:
         return None
     return Celeb.model_validate(response.data)
@@ -18,9 +21,10 @@ async def get_celeb_by_id(celeb_id: str) -> Celeb | None:
 async def search_celebs(query: str, *, limit: int = 10) -> list[Celeb]:
     """Search celebs by name (case-insensitive partial match)."""
     client = await get_supabase_client()
-    response = await (
-        client.table("celebs").select("*").ilike("name", f"%{query}%").limit(limit).execute()
-    )
+    with supabase_query("celebs"):
+        response = await (
+            client.table("celebs").select("*").ilike("name", f"%{query}%").limit(limit).execute()
+        )
     return [Celeb.model_validate(row) for row in response.data]
 
 
@@ -33,17 +37,24 @@ async def search_celebs_multi(queries: list[str], *, limit: int = 10) -> list[Ce
     if not queries:
         return []
     client = await get_supabase_client()
+
+    async def _search(query: str) -> list[dict]:
+        pattern = f"%{query}%"
+        with supabase_query("celebs"):
+            response = await (
+                client.table("celebs")
+                .select("*")
+                .or_(f"name.ilike.{pattern},name_en.ilike.{pattern},description.ilike.{pattern}")
+                .limit(limit)
+                .execute()
+            )
+        return response.data
+
     all_results: list[Celeb] = []
     for query in queries:
-        pattern = f"%{query}%"
-        response = await (
-            client.table("celebs")
-            .select("*")
-            .or_(f"name.ilike.{pattern},name_en.ilike.{pattern},description.ilike.{pattern}")
-            .limit(limit)
-            .execute()
-        )
-        all_results.extend(Celeb.model_validate(row) for row in response.data)
+        # Runs of a batch about the same people/brands share these searches
+        rows = await shared("celebs_search", (query, limit), lambda q=query: _search(q))
+        all_results.extend(Celeb.model_validate(row) for row in rows)
     return _deduplicate_by_id(all_results)
 
 
@@ -2,20 +2,63 @@
 
 Stores content as individual JSON files in data/contents/{id}.json.
 PRD Supabase is read-only (reference only) — generated content is saved locally.
+
+Disk access runs on the bounded I/O executor (``run_io``) so listing and
+saving content never blocks the event loop shared with running pipelines.
+
+Concurrency and crash safety:
+- Writes go to a temp file in the same directory, are fsynced, then
+  atomically renamed over the target — readers never see a half-written file.
+- Read-modify-write updates hold a per-record asyncio lock (in-process) and
+  an ``flock`` on a sidecar lock file (across worker processes).
+- ``updated_at`` is strictly increasing per record and doubles as an
+  optimistic version: callers may pass ``expected_updated_at`` to get
+  compare-and-swap semantics (``ContentConflictError`` on mismatch).
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
 import logging
+import os
 import uuid
-from datetime import datetime, timezone
+import weakref
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from editorial_ai.io_executor import run_io
+
+try:  # POSIX only; without it, locking is per-process
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 _CONTENTS_DIR = Path("data/contents")
 
+# Statuses an admin decision (or publishing) put on a record; upserts keep them
+_DECIDED_STATUSES = frozenset({"approved", "rejected", "published"})
+
+# Per-record asyncio locks; entries disappear once no coroutine holds them.
+_record_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+class ContentConflictError(Exception):
+    """Raised when an ``expected_updated_at`` compare-and-swap fails."""
+
+    def __init__(self, content_id: str, expected: str, actual: str | None) -> None:
+        super().__init__(
+            f"Content {content_id} was modified concurrently "
+            f"(expected updated_at={expected}, actual={actual})"
+        )
+        self.content_id = content_id
+        self.expected = expected
+        self.actual = actual
+
 
 def _ensure_dir() -> Path:
     _CONTENTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -26,19 +69,134 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _parse_ts(value: str | datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _next_updated_at(previous: str | None) -> str:
+    """Return a timestamp strictly greater than ``previous`` (clock ties bump 1µs)."""
+    now = datetime.now(timezone.utc)
+    prev = _parse_ts(previous)
+    if prev is not None and now <= prev:
+        now = prev + timedelta(microseconds=1)
+    return now.isoformat()
+
+
+def _same_version(expected: str | datetime, actual: str | None) -> bool:
+    expected_ts, actual_ts = _parse_ts(expected), _parse_ts(actual)
+    if expected_ts is None or actual_ts is None:
+        return str(expected) == str(actual)
+    return expected_ts == actual_ts
+
+
 def _load(path: Path) -> dict | None:
     try:
         return json.loads(path.read_text(encoding="utf-8"))
-    except (FileNotFoundError, json.JSONDecodeError):
+    except FileNotFoundError:
         return None
+    except json.JSONDecodeError:
+        # Atomic writes make this unexpected — surface it instead of hiding it.
+        logger.warning("Corrupt content file skipped: %s", path, exc_info=True)
+        return None
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist the rename itself (best effort; not supported on every platform)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def _save(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+    """Crash-safe write: temp file + fsync + atomic rename."""
+    payload = json.dumps(data, ensure_ascii=False, indent=2, default=str)
+    tmp = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            tmp.unlink()
+        raise
+    _fsync_dir(path.parent)
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive cross-process lock on a sidecar ``.{name}.lock`` file."""
+    if fcntl is None:
+        yield
+        return
+    lock_path = path.parent / f".{path.name}.lock"
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _update_record(
+    path: Path,
+    mutate: Callable[[dict], None],
+    expected_updated_at: str | datetime | None,
+) -> dict | None:
+    """Locked read-modify-write of one record (blocking — call via run_io).
+
+    Returns the updated record, or None when the record does not exist.
+    """
+    with _file_lock(path):
+        data = _load(path)
+        if data is None:
+            return None
+        if expected_updated_at is not None and not _same_version(
+            expected_updated_at, data.get("updated_at")
+        ):
+            raise ContentConflictError(
+                data.get("id", path.stem), str(expected_updated_at), data.get("updated_at")
+            )
+        mutate(data)
+        data["updated_at"] = _next_updated_at(data.get("updated_at"))
+        _save(path, data)
+        return data
 
 
-def _all_contents() -> list[dict]:
-    """Load all content files, sorted by created_at desc."""
+def _record_lock(key: str) -> asyncio.Lock:
+    lock = _record_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _record_locks[key] = lock
+    return lock
+
+
+async def _aload(path: Path) -> dict | None:
+    return await run_io(_load, path)
+
+
+async def _asave(path: Path, data: dict) -> None:
+    await run_io(_save, path, data)
+
+
+def _scan_contents() -> list[dict]:
+    """Load all content files, sorted by created_at desc (blocking)."""
     d = _ensure_dir()
     items: list[dict] = []
     for p in d.glob("*.json"):
@@ -49,6 +207,11 @@ def _all_contents() -> list[dict]:
     return items
 
 
+async def _all_contents() -> list[dict]:
+    """Load all content files, sorted by created_at desc."""
+    return await run_io(_scan_contents)
+
+
 # --- Public API (same signatures as before, kept async for compatibility) ---
 
 
@@ -63,49 +226,60 @@ async def save_pending_content(
     """Save or update pending content for a given thread (upsert on thread_id).
 
     Idempotent: if content for the thread already exists, it overwrites.
+    Serialized per thread_id so concurrent upserts never create duplicates.
+    A record that already carries a decision (approved, rejected, published)
+    is returned untouched: admin_gate re-runs this upsert when it resumes.
     """
-    d = _ensure_dir()
-
-    # Check if thread_id already exists (upsert)
-    existing = await get_content_by_thread_id(thread_id)
-    if existing:
-        content_id = existing["id"]
+    async with _record_lock(f"thread:{thread_id}"):
+        d = await run_io(_ensure_dir)
+
+        # Check if thread_id already exists (upsert)
+        existing = await get_content_by_thread_id(thread_id)
+        if existing and existing.get("status") in _DECIDED_STATUSES:
+            return existing
+        if existing:
+            content_id = existing["id"]
+            update_data: dict = {
+                "status": "pending",
+                "title": title,
+                "keyword": keyword,
+                "layout_json": layout_json,
+                "review_summary": review_summary,
+            }
+            if layout_image_base64 is not None:
+                update_data["layout_image_base64"] = layout_image_base64
+
+            async with _record_lock(content_id):
+                updated = await run_io(
+                    _update_record,
+                    d / f"{content_id}.json",
+                    lambda data: data.update(update_data),
+                    None,
+                )
+            if updated is not None:
+                return updated
+
+        # New content
+        content_id = str(uuid.uuid4())
         now = _now_iso()
-        update_data: dict = {
+        data = {
+            "id": content_id,
+            "thread_id": thread_id,
             "status": "pending",
             "title": title,
             "keyword": keyword,
             "layout_json": layout_json,
+            "layout_image_base64": layout_image_base64,
             "review_summary": review_summary,
+            "rejection_reason": None,
+            "admin_feedback": None,
+            "created_at": now,
             "updated_at": now,
+            "published_at": None,
         }
-        if layout_image_base64 is not None:
-            update_data["layout_image_base64"] = layout_image_base64
-        existing.update(update_data)
-        _save(d / f"{content_id}.json", existing)
-        return existing
-
-    # New content
-    content_id = str(uuid.uuid4())
-    now = _now_iso()
-    data = {
-        "id": content_id,
-        "thread_id": thread_id,
-        "status": "pending",
-        "title": title,
-        "keyword": keyword,
-        "layout_json": layout_json,
-        "layout_image_base64": layout_image_base64,
-        "review_summary": review_summary,
-        "rejection_reason": None,
-        "admin_feedback": None,
-        "created_at": now,
-        "updated_at": now,
-        "published_at": None,
-    }
-    _save(d / f"{content_id}.json", data)
-    logger.info("Saved pending content: id=%s, thread_id=%s", content_id, thread_id)
-    return data
+        await _asave(d / f"{content_id}.json", data)
+        logger.info("Saved pending content: id=%s, thread_id=%s", content_id, thread_id)
+        return data
 
 
 async def update_content_status(
@@ -114,35 +288,48 @@ async def update_content_status(
     *,
     rejection_reason: str | None = None,
     admin_feedback: str | None = None,
+    expected_updated_at: str | datetime | None = None,
 ) -> dict:
-    """Update the status of a content entry."""
-    d = _ensure_dir()
-    path = d / f"{content_id}.json"
-    data = _load(path)
+    """Update the status of a content entry.
+
+    When ``expected_updated_at`` is given, the update only applies if the
+    stored ``updated_at`` still matches (compare-and-swap); otherwise
+    ``ContentConflictError`` is raised and nothing is written.
+    """
+
+    def _mutate(data: dict) -> None:
+        data["status"] = status
+        if rejection_reason is not None:
+            data["rejection_reason"] = rejection_reason
+        if admin_feedback is not None:
+            data["admin_feedback"] = admin_feedback
+        if status == "published":
+            data["published_at"] = _now_iso()
+
+    async with _record_lock(content_id):
+        d = await run_io(_ensure_dir)
+        data = await run_io(
+            _update_record, d / f"{content_id}.json", _mutate, expected_updated_at
+        )
     if not data:
         raise FileNotFoundError(f"Content {content_id} not found")
+    return data
 
-    data["status"] = status
-    data["updated_at"] = _now_iso()
-    if rejection_reason is not None:
-        data["rejection_reason"] = rejection_reason
-    if admin_feedback is not None:
-        data["admin_feedback"] = admin_feedback
-    if status == "published":
-        data["published_at"] = _now_iso()
 
-    _save(path, data)
-    return data
+def is_current_version(content: dict, expected_updated_at: str | datetime) -> bool:
+    """True if ``content`` still carries the ``updated_at`` the caller last saw."""
+    return _same_version(expected_updated_at, content.get("updated_at"))
 
 
 async def get_content_by_id(content_id: str) -> dict | None:
     """Fetch a single content entry by its UUID."""
-    return _load(_ensure_dir() / f"{content_id}.json")
+    d = await run_io(_ensure_dir)
+    return await _aload(d / f"{content_id}.json")
 
 
 async def get_content_by_thread_id(thread_id: str) -> dict | None:
     """Fetch a single content entry by LangGraph thread_id."""
-    for item in _all_contents():
+    for item in await _all_contents():
         if item.get("thread_id") == thread_id:
             return item
     return None
@@ -152,7 +339,7 @@ async def list_contents(
     *, status: str | None = None, limit: int = 50, offset: int = 0
 ) -> list[dict]:
     """List content entries, optionally filtered by status, ordered by created_at desc."""
-    items = _all_contents()
+    items = await _all_contents()
     if status is not None:
         items = [i for i in items if i.get("status") == status]
     return items[offset : offset + limit]
@@ -160,7 +347,7 @@ async def list_contents(
 
 async def list_contents_count(*, status: str | None = None) -> int:
     """Count content entries, optionally filtered by status."""
-    items = _all_contents()
+    items = await _all_contents()
     if status is not None:
         items = [i for i in items if i.get("status") == status]
     return len(items)
@@ -16,9 +16,11 @@ from google import genai
 from google.genai import errors, types
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from editorial_ai.batch import shared
 from editorial_ai.config import settings
 from editorial_ai.models.curation import CuratedTopic, CurationResult, GroundingSource
-from editorial_ai.observability import record_token_usage
+from editorial_ai.observability import llm_call, supabase_query
+from editorial_ai.observability.spans import note_attempt
 from editorial_ai.routing import get_model_router
 from editorial_ai.prompts.curation import (
     build_extraction_prompt,
@@ -34,6 +36,7 @@ retry_on_api_error = retry(
     wait=wait_exponential(multiplier=1, min=1, max=60),
     stop=stop_after_attempt(3),
     reraise=True,
+    before=note_attempt,  # tags the attempt number on the call's span
 )
 
 
@@ -121,22 +124,17 @@ class CurationService:
         anchors its research to available DB data.
         """
         decision = get_model_router().resolve("curation_research")
-        response = await self.client.aio.models.generate_content(
-            model=decision.model,
-            contents=build_trend_research_prompt(keyword, db_context=db_context),
-            config=types.GenerateContentConfig(
-                tools=[types.Tool(google_search=types.GoogleSearch())],
-                temperature=0.7,
-            ),
-        )
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            record_token_usage(
-                prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                model_name=decision.model,
-                routing_reason=decision.reason,
+        prompt = build_trend_research_prompt(keyword, db_context=db_context)
+        async with llm_call("curation_research", decision) as call:
+            response = await self.client.aio.models.generate_content(
+                model=decision.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    tools=[types.Tool(google_search=types.GoogleSearch())],
+                    temperature=0.7,
+                ),
             )
+            call.record(response, request=prompt)
         text = response.text or ""
         sources = _extract_grounding_sources(response)
         return text, sources
@@ -148,22 +146,17 @@ class CurationService:
         Returns a list of 3-7 sub-topic keyword strings.
         """
         decision = get_model_router().resolve("curation_subtopics")
-        response = await self.client.aio.models.generate_content(
-            model=decision.model,
-            contents=build_subtopic_expansion_prompt(keyword, trend_background),
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                temperature=0.3,
-            ),
-        )
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            record_token_usage(
-                prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                model_name=decision.model,
-                routing_reason=decision.reason,
+        prompt = build_subtopic_expansion_prompt(keyword, trend_background)
+        async with llm_call("curation_subtopics", decision) as call:
+            response = await self.client.aio.models.generate_content(
+                model=decision.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    temperature=0.3,
+                ),
             )
+            call.record(response, request=prompt)
         try:
             raw_text = response.text or "[]"
             subtopics = json.loads(_strip_markdown_fences(raw_text))
@@ -189,22 +182,17 @@ class CurationService:
         low_quality=True with defaults if parsing fails.
         """
         decision = get_model_router().resolve("curation_extract")
-        response = await self.client.aio.models.generate_content(
-            model=decision.model,
-            contents=build_extraction_prompt(keyword, raw_research),
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                temperature=0.0,
-            ),
-        )
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            record_token_usage(
-                prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                model_name=decision.model,
-                routing_reason=decision.reason,
+        prompt = build_extraction_prompt(keyword, raw_research)
+        async with llm_call("curation_extract", decision) as call:
+            response = await self.client.aio.models.generate_content(
+                model=decision.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    temperature=0.0,
+                ),
             )
+            call.record(response, request=prompt)
         raw_text = response.text or "{}"
         # Try parsing, with markdown fence fallback
         for text_candidate in [raw_text, _strip_markdown_fences(raw_text)]:
@@ -256,8 +244,8 @@ class CurationService:
         5. Filter by relevance threshold
         6. Return aggregated CurationResult
         """
-        # Step 0: Build DB context for prompt grounding
-        db_context = await _build_db_context()
+        # Step 0: Build DB context for prompt grounding (once per batch)
+        db_context = await shared("db_context", None, _build_db_context)
 
         # Step 1: Initial research on seed keyword
         raw_research, seed_sources = await self.research_trend(
@@ -310,14 +298,15 @@ async def _build_db_context() -> str:
         client = await get_supabase_client()
 
         # Get artist/group distribution
-        artists_resp = await (
-            client.table("posts")
-            .select("artist_name, group_name")
-            .eq("status", "active")
-            .not_.is_("artist_name", "null")
-            .limit(500)
-            .execute()
-        )
+        with supabase_query("posts"):
+            artists_resp = await (
+                client.table("posts")
+                .select("artist_name, group_name")
+                .eq("status", "active")
+                .not_.is_("artist_name", "null")
+                .limit(500)
+                .execute()
+            )
 
         # Count by group and artist
         group_artists: dict[str, set[str]] = {}
@@ -328,14 +317,15 @@ async def _build_db_context() -> str:
                 group_artists.setdefault(group, set()).add(artist)
 
         # Get top brands from solutions
-        brands_resp = await (
-            client.table("solutions")
-            .select("title")
-            .not_.is_("title", "null")
-            .neq("title", "")
-            .limit(200)
-            .execute()
-        )
+        with supabase_query("solutions"):
+            brands_resp = await (
+                client.table("solutions")
+                .select("title")
+                .not_.is_("title", "null")
+                .neq("title", "")
+                .limit(200)
+                .execute()
+            )
 
         brand_counts: dict[str, int] = {}
         for row in brands_resp.data:
@@ -13,7 +13,7 @@ from google.genai import types
 
 from editorial_ai.config import settings
 from editorial_ai.models.design_spec import DesignSpec, default_design_spec
-from editorial_ai.observability import record_token_usage
+from editorial_ai.observability import llm_call
 from editorial_ai.routing import get_model_router
 from editorial_ai.prompts.design_spec import build_design_spec_prompt
 from editorial_ai.services.curation_service import get_genai_client
@@ -53,28 +53,17 @@ class DesignSpecService:
         try:
             prompt = build_design_spec_prompt(keyword, category)
             decision = get_model_router().resolve("design_spec")
-            response = await self.client.aio.models.generate_content(
-                model=decision.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=DesignSpec,
-                    temperature=0.7,
-                ),
-            )
-
-            # Record token usage
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                record_token_usage(
-                    prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                    completion_tokens=getattr(
-                        response.usage_metadata, "candidates_token_count", 0
-                    )
-                    or 0,
-                    total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                    model_name=decision.model,
-                    routing_reason=decision.reason,
+            async with llm_call("design_spec", decision) as call:
+                response = await self.client.aio.models.generate_content(
+                    model=decision.model,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_mime_type="application/json",
+                        response_schema=DesignSpec,
+                        temperature=0.7,
+                    ),
                 )
+                call.record(response, request=prompt)
 
             raw_text = response.text or "{}"
             spec = DesignSpec.model_validate_json(raw_text)
@@ -0,0 +1,97 @@
+"""Out-of-state storage for drafts produced by topic fan-out branches.
+
+A fan-out run drafts several articles in parallel. Putting every draft
+(layout JSON plus base64 layout image) into graph state would copy them
+into each checkpoint, so branches store their result here and the state
+only carries the returned reference.
+
+Drafts are JSON files under ``data/drafts/{thread_id}/``; writes go
+through ``run_io`` like the content store. A draft is only read until its
+approval thread has been opened from it, so :func:`sweep_old_drafts`
+(run by the node log sink's periodic maintenance) removes thread
+directories untouched for ``EDITORIAL_DRAFT_RETENTION_DAYS``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+from editorial_ai.io_executor import run_io
+
+logger = logging.getLogger(__name__)
+
+_DRAFTS_DIR = Path("data/drafts")
+
+
+def draft_ref(thread_id: str, key: str) -> str:
+    """Reference of the ``key`` draft of ``thread_id``."""
+    return f"{thread_id}/{key}"
+
+
+def _path(ref: str) -> Path:
+    thread_id, _, key = ref.rpartition("/")
+    if not thread_id or not key or ".." in ref:
+        raise ValueError(f"Invalid draft reference: {ref!r}")
+    return _DRAFTS_DIR / thread_id / f"{key}.json"
+
+
+def _write(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, default=str), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _read(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+async def save_draft(thread_id: str, key: str, data: dict) -> str:
+    """Store ``data`` as the ``key`` draft of ``thread_id``; returns its reference."""
+    ref = draft_ref(thread_id, key)
+    await run_io(_write, _path(ref), data)
+    return ref
+
+
+async def load_draft(ref: str) -> dict | None:
+    """Load a stored draft, or None if there is none under ``ref``."""
+    return await run_io(_read, _path(ref))
+
+
+def sweep_old_drafts(max_age_days: float) -> int:
+    """Remove thread draft directories not written for ``max_age_days`` (blocking).
+
+    Returns the number of directories removed. Never raises.
+    """
+    removed = 0
+    cutoff = time.time() - max_age_days * 86400
+    try:
+        thread_dirs = [path for path in _DRAFTS_DIR.iterdir() if path.is_dir()]
+    except FileNotFoundError:
+        return 0
+    except Exception:
+        logger.warning("Failed to list stored drafts", exc_info=True)
+        return 0
+    for thread_dir in thread_dirs:
+        try:
+            newest = max(
+                (f.stat().st_mtime for f in thread_dir.iterdir()),
+                default=thread_dir.stat().st_mtime,
+            )
+            if newest > cutoff:
+                continue
+            shutil.rmtree(thread_dir)
+            removed += 1
+        except Exception:
+            logger.warning("Failed to remove drafts in %s", thread_dir, exc_info=True)
+    if removed:
+        logger.info("Removed stored drafts of %d threads", removed)
+    return removed
@@ -22,8 +22,9 @@ from editorial_ai.config import settings
 from editorial_ai.models.editorial import (
     EditorialContent,
 )
-from editorial_ai.observability import record_token_usage
-from editorial_ai.routing import get_model_router
+from editorial_ai.observability import llm_call
+from editorial_ai.routing import RoutingDecision, get_model_router
+from editorial_ai.routing.health import get_model_health, is_unavailable_error
 from editorial_ai.models.layout import (
     BodyTextBlock,
     CelebFeatureBlock,
@@ -39,11 +40,13 @@ from editorial_ai.models.layout import (
     PullQuoteBlock,
     create_default_template,
 )
+from editorial_ai.prompts.assembly import assemble
+from editorial_ai.prompts.budgeter import estimate_tokens
 from editorial_ai.prompts.editorial import (
     build_content_generation_prompt,
     build_content_generation_prompt_with_feedback,
     build_layout_image_prompt,
-    build_layout_parsing_prompt,
+    build_layout_parsing_prompt_parts,
     build_output_repair_prompt,
 )
 from editorial_ai.services.curation_service import (
@@ -98,7 +101,6 @@ class EditorialService:
             if max_repair_attempts is not None
             else settings.editorial_max_repair_attempts
         )
-        self._image_model_available = True  # circuit breaker for image gen
 
     @retry_on_api_error
     async def generate_content(
@@ -110,6 +112,7 @@ class EditorialService:
         previous_draft: dict | None = None,
         revision_count: int = 0,
         cache_name: str | None = None,
+        budget_level: str | None = None,
     ) -> EditorialContent:
         """Step 1: Generate editorial content via Gemini structured output.
 
@@ -129,7 +132,12 @@ class EditorialService:
         else:
             prompt = build_content_generation_prompt(keyword, trend_context)
 
-        decision = get_model_router().resolve("editorial_content", revision_count=revision_count)
+        decision = get_model_router().resolve(
+            "editorial_content",
+            revision_count=revision_count,
+            budget_level=budget_level,
+            prompt_tokens=estimate_tokens(prompt),
+        )
         config = types.GenerateContentConfig(
             response_mime_type="application/json",
             response_schema=EditorialContent,
@@ -138,20 +146,13 @@ class EditorialService:
         if cache_name:
             config.cached_content = cache_name
 
-        response = await self.client.aio.models.generate_content(
-            model=decision.model,
-            contents=prompt,
-            config=config,
-        )
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            record_token_usage(
-                prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                cached_tokens=getattr(response.usage_metadata, "cached_content_token_count", 0) or 0,
-                model_name=decision.model,
-                routing_reason=decision.reason,
+        async with llm_call("editorial_content", decision) as call:
+            response = await self.client.aio.models.generate_content(
+                model=decision.model,
+                contents=prompt,
+                config=config,
             )
+            call.record(response, request=prompt)
 
         raw_json = response.text or "{}"
 
@@ -182,7 +183,12 @@ class EditorialService:
         Returns image bytes on success, None on failure.
         Caller should fall back to default template on None.
         """
-        if not self._image_model_available:
+        # Fails over to a configured candidate if the model is unavailable
+        # (404 circuit breaker) or, in adaptive mode, degrading
+        decision = get_model_router().adapt(
+            "editorial_layout_image", RoutingDecision(model=self.image_model, reason="default")
+        )
+        if not get_model_health().is_available(decision.model):
             logger.debug(
                 "Skipping Nano Banana (model unavailable), using default template for keyword=%s",
                 keyword,
@@ -192,22 +198,16 @@ class EditorialService:
         prompt = build_layout_image_prompt(keyword, title, num_sections)
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.image_model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_modalities=["IMAGE", "TEXT"],
-                    temperature=1.0,
-                ),
-            )
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                record_token_usage(
-                    prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                    completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                    total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                    cached_tokens=getattr(response.usage_metadata, "cached_content_token_count", 0) or 0,
-                    model_name=self.image_model,
+            async with llm_call("editorial_layout_image", decision) as call:
+                response = await self.client.aio.models.generate_content(
+                    model=decision.model,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        response_modalities=["IMAGE", "TEXT"],
+                        temperature=1.0,
+                    ),
                 )
+                call.record(response, request=prompt)
 
             candidates = response.candidates
             if not candidates:
@@ -231,13 +231,12 @@ class EditorialService:
             )
             return None
         except Exception as exc:  # noqa: BLE001
-            exc_str = str(exc).lower()
-            if "404" in exc_str or "not found" in exc_str or "not supported" in exc_str:
-                self._image_model_available = False
+            if is_unavailable_error(exc):
+                # llm_call already opened the circuit for this model
                 logger.warning(
                     "Nano Banana model '%s' not available (404/not supported). "
-                    "Disabling image generation for this session. Falling back to default template.",
-                    self.image_model,
+                    "Falling back to default template.",
+                    decision.model,
                 )
             else:
                 logger.warning(
@@ -257,33 +256,34 @@ class EditorialService:
         Returns a list of block definitions like [{"type": "hero", "order": 0}, ...]
         or None on failure.
         """
-        prompt = build_layout_parsing_prompt(keyword, BLOCK_TYPES)
+        parts = build_layout_parsing_prompt_parts(keyword, BLOCK_TYPES)
         decision = get_model_router().resolve("editorial_layout_parse")
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=decision.model,
-                contents=[
-                    prompt,
-                    types.Part.from_bytes(
-                        data=image_bytes,
-                        mime_type="image/png",
-                    ),
-                ],
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    temperature=0.0,
-                ),
+            # Block catalog is a static prefix; no response_schema, so it may be cached
+            assembled = await assemble(
+                "editorial_layout_parse", decision.model, parts, client=self.client
             )
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                record_token_usage(
-                    prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                    completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                    total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                    cached_tokens=getattr(response.usage_metadata, "cached_content_token_count", 0) or 0,
-                    model_name=decision.model,
-                    routing_reason=decision.reason,
+            prompt = assembled.prompt
+            config = types.GenerateContentConfig(
+                response_mime_type="application/json",
+                temperature=0.0,
+            )
+            if assembled.cached_content:
+                config.cached_content = assembled.cached_content
+            async with llm_call("editorial_layout_parse", decision) as call:
+                response = await self.client.aio.models.generate_content(
+                    model=decision.model,
+                    contents=[
+                        assembled.contents,
+                        types.Part.from_bytes(
+                            data=image_bytes,
+                            mime_type="image/png",
+                        ),
+                    ],
+                    config=config,
                 )
+                call.record(response, request=(prompt, image_bytes))
 
             raw_text = response.text or "[]"
             import json
@@ -329,23 +329,16 @@ class EditorialService:
         )
 
         decision = get_model_router().resolve("editorial_repair")
-        response = await self.client.aio.models.generate_content(
-            model=decision.model,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                temperature=0.0,
-            ),
-        )
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            record_token_usage(
-                prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                cached_tokens=getattr(response.usage_metadata, "cached_content_token_count", 0) or 0,
-                model_name=decision.model,
-                routing_reason=decision.reason,
+        async with llm_call("editorial_repair", decision) as call:
+            response = await self.client.aio.models.generate_content(
+                model=decision.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    temperature=0.0,
+                ),
             )
+            call.record(response, request=prompt)
 
         return response.text or "{}"
 
@@ -475,6 +468,8 @@ class EditorialService:
         revision_count: int = 0,
         cache_name: str | None = None,
         enriched_contexts: list[dict] | None = None,
+        budget_level: str | None = None,
+        generate_image: bool = True,
     ) -> tuple[MagazineLayout, bytes | None]:
         """Full pipeline entry point for editorial generation.
 
@@ -488,6 +483,9 @@ class EditorialService:
 
         When feedback_history is provided (retry iteration), passes it through
         to generate_content for feedback-aware prompt construction.
+
+        ``generate_image=False`` skips steps b-d (budget degradation) and uses
+        the default template; ``budget_level`` is passed to the model router.
         """
         # Step 1: Generate editorial content
         content = await self.generate_content(
@@ -497,16 +495,19 @@ class EditorialService:
             previous_draft=previous_draft,
             revision_count=revision_count,
             cache_name=cache_name,
+            budget_level=budget_level,
         )
 
         # Step 2 + 3: Try Nano Banana + Vision pipeline
         layout: MagazineLayout | None = None
 
-        image_bytes = await self.generate_layout_image(
-            keyword,
-            content.title,
-            num_sections=8,
-        )
+        image_bytes: bytes | None = None
+        if generate_image:
+            image_bytes = await self.generate_layout_image(
+                keyword,
+                content.title,
+                num_sections=8,
+            )
 
         if image_bytes is not None:
             parsed_blocks = await self.parse_layout_image(
@@ -18,9 +18,10 @@ from copy import deepcopy
 from google import genai
 from google.genai import types
 
+from editorial_ai.batch import shared
 from editorial_ai.config import settings
 from editorial_ai.models.celeb import Celeb
-from editorial_ai.observability import record_token_usage
+from editorial_ai.observability import llm_call
 from editorial_ai.routing import get_model_router
 from editorial_ai.models.editorial import EditorialContent
 from editorial_ai.models.layout import (
@@ -74,22 +75,16 @@ async def expand_keywords(client: genai.Client, keyword: str) -> list[str]:
     """
     prompt = build_keyword_expansion_prompt(keyword)
     decision = get_model_router().resolve("enrich_keywords")
-    response = await client.aio.models.generate_content(
-        model=decision.model,
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.3,
-        ),
-    )
-    if hasattr(response, "usage_metadata") and response.usage_metadata:
-        record_token_usage(
-            prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-            completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-            total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-            model_name=decision.model,
-            routing_reason=decision.reason,
+    async with llm_call("enrich_keywords", decision) as call:
+        response = await client.aio.models.generate_content(
+            model=decision.model,
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                temperature=0.3,
+            ),
         )
+        call.record(response, request=prompt)
     try:
         raw = _strip_markdown_fences(response.text or "[]")
         terms = json.loads(raw)
@@ -131,23 +126,17 @@ async def regenerate_with_enrichment(
 
     try:
         decision = get_model_router().resolve("enrich_regenerate")
-        response = await client.aio.models.generate_content(
-            model=decision.model,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=EditorialContent,
-                temperature=0.7,
-            ),
-        )
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            record_token_usage(
-                prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                model_name=decision.model,
-                routing_reason=decision.reason,
+        async with llm_call("enrich_regenerate", decision) as call:
+            response = await client.aio.models.generate_content(
+                model=decision.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=EditorialContent,
+                    temperature=0.7,
+                ),
             )
+            call.record(response, request=prompt)
         raw_text = response.text or "{}"
         return EditorialContent.model_validate_json(
             _strip_markdown_fences(raw_text),
@@ -231,7 +220,9 @@ async def enrich_editorial_content(layout: MagazineLayout) -> MagazineLayout:
 
     # 2. Expand keywords via Gemini
     client = get_genai_client()
-    expanded = await expand_keywords(client, layout.keyword)
+    expanded = await shared(
+        "keyword_expansion", layout.keyword, lambda: expand_keywords(client, layout.keyword)
+    )
 
     # 3. Combine mention names + expanded keywords as search terms
     celeb_search_terms = celeb_names + expanded
@@ -1,15 +1,18 @@
 """Read-only service functions for the products table."""
 
+from editorial_ai.batch import shared
 from editorial_ai.models.product import Product
+from editorial_ai.observability import supabase_query
 from editorial_ai.services.supabase_client import get_supabase_client
 
 
 async def get_product_by_id(product_id: str) -> Product | None:
     """Fetch a single product by ID. Returns None if not found."""
     client = await get_supabase_client()
-    response = await (
-        client.table("products").select("*").eq("id", product_id).maybe_single().execute()
-    )
+    with supabase_query("products"):
+        response = await (
+            client.table("products").select("*").eq("id", product_id).maybe_single().execute()
+        )
     if response is None or response.data is None:
         return None
     return Product.model_validate(response.data)
@@ -18,9 +21,10 @@ async def get_product_by_id(product_id: str) -> Product | None:
 async def search_products(query: str, *, limit: int = 10) -> list[Product]:
     """Search products by name (case-insensitive partial match)."""
     client = await get_supabase_client()
-    response = await (
-        client.table("products").select("*").ilike("name", f"%{query}%").limit(limit).execute()
-    )
+    with supabase_query("products"):
+        response = await (
+            client.table("products").select("*").ilike("name", f"%{query}%").limit(limit).execute()
+        )
     return [Product.model_validate(row) for row in response.data]
 
 
@@ -33,17 +37,24 @@ async def search_products_multi(queries: list[str], *, limit: int = 10) -> list[
     if not queries:
         return []
     client = await get_supabase_client()
+
+    async def _search(query: str) -> list[dict]:
+        pattern = f"%{query}%"
+        with supabase_query("products"):
+            response = await (
+                client.table("products")
+                .select("*")
+                .or_(f"name.ilike.{pattern},brand.ilike.{pattern},description.ilike.{pattern}")
+                .limit(limit)
+                .execute()
+            )
+        return response.data
+
     all_results: list[Product] = []
     for query in queries:
-        pattern = f"%{query}%"
-        response = await (
-            client.table("products")
-            .select("*")
-            .or_(f"name.ilike.{pattern},brand.ilike.{pattern},description.ilike.{pattern}")
-            .limit(limit)
-            .execute()
-        )
-        all_results.extend(Product.model_validate(row) for row in response.data)
+        # Runs of a batch about the same people/brands share these searches
+        rows = await shared("products_search", (query, limit), lambda q=query: _search(q))
+        all_results.extend(Product.model_validate(row) for row in rows)
     return _deduplicate_by_id(all_results)
 
 
@@ -4,6 +4,9 @@ Evaluation pipeline:
 1. Format validation -- deterministic via Pydantic MagazineLayout.model_validate()
 2. Semantic evaluation -- LLM-as-a-Judge for hallucination, fact_accuracy, content_completeness
 3. Overall result -- aggregates all criteria, any failure = overall fail
+
+The draft is always judged in full; curated topics beyond the first are
+ranked by relevance to the draft and trimmed to the review prompt budget.
 """
 
 from __future__ import annotations
@@ -19,10 +22,12 @@ from pydantic import ValidationError
 
 from editorial_ai.config import settings
 from editorial_ai.models.layout import BodyTextBlock, MagazineLayout
-from editorial_ai.observability import record_token_usage
+from editorial_ai.observability import llm_call
 from editorial_ai.routing import get_model_router
 from editorial_ai.models.review import CriterionResult, ReviewResult
-from editorial_ai.prompts.review import build_review_prompt
+from editorial_ai.prompts.budgeter import ContextChunk, estimate_tokens, fit_context, query_terms
+from editorial_ai.prompts.assembly import assemble
+from editorial_ai.prompts.review import build_review_prompt, build_review_prompt_parts
 from editorial_ai.services.curation_service import (
     _strip_markdown_fences,
     get_genai_client,
@@ -103,48 +108,55 @@ class ReviewService:
         rubric_config: RubricConfig | None = None,
         revision_count: int = 0,
         cache_name: str | None = None,
+        budget_level: str | None = None,
     ) -> list[CriterionResult]:
         """LLM-as-a-Judge for semantic evaluation.
 
         Calls Gemini with response_mime_type only (no response_schema to avoid
         Gemini API hangs), wrapped in a timeout. If the call hangs or parsing
         fails, returns a lenient pass to avoid blocking the pipeline.
+
+        The rubric part of the prompt is a static prefix: served from an
+        explicit cache when it is large enough (``prompts.assembly``), and
+        sent first otherwise so implicit caching can match it.
         """
-        prompt = build_review_prompt(
+        parts = build_review_prompt_parts(
             draft_json, curated_topics_json, rubric_config=rubric_config
         )
 
-        decision = get_model_router().resolve("review", revision_count=revision_count)
+        decision = get_model_router().resolve(
+            "review",
+            revision_count=revision_count,
+            budget_level=budget_level,
+            prompt_tokens=estimate_tokens(parts.text),
+        )
+        # No response_schema here, so the rubric prefix can be an explicit cache
+        assembled = await assemble(
+            "review", decision.model, parts, client=self.client, explicit_cache=not cache_name
+        )
+        prompt = assembled.prompt
         config = types.GenerateContentConfig(
             response_mime_type="application/json",
             temperature=0.0,
         )
-        if cache_name:
-            config.cached_content = cache_name
+        if cache_name or assembled.cached_content:
+            config.cached_content = cache_name or assembled.cached_content
 
         try:
-            response = await asyncio.wait_for(
-                self.client.aio.models.generate_content(
-                    model=decision.model,
-                    contents=prompt,
-                    config=config,
-                ),
-                timeout=self._REVIEW_TIMEOUT,
-            )
+            async with llm_call("review", decision) as call:
+                response = await asyncio.wait_for(
+                    self.client.aio.models.generate_content(
+                        model=decision.model,
+                        contents=assembled.contents,
+                        config=config,
+                    ),
+                    timeout=self._REVIEW_TIMEOUT,
+                )
+                call.record(response, request=prompt)
         except asyncio.TimeoutError:
             logger.warning("Review LLM call timed out after %ds, returning lenient pass", self._REVIEW_TIMEOUT)
             return self._lenient_pass("LLM review timed out")
 
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            record_token_usage(
-                prompt_tokens=getattr(response.usage_metadata, "prompt_token_count", 0) or 0,
-                completion_tokens=getattr(response.usage_metadata, "candidates_token_count", 0) or 0,
-                total_tokens=getattr(response.usage_metadata, "total_token_count", 0) or 0,
-                cached_tokens=getattr(response.usage_metadata, "cached_content_token_count", 0) or 0,
-                model_name=decision.model,
-                routing_reason=decision.reason,
-            )
-
         raw_text = response.text or "{}"
         stripped = _strip_markdown_fences(raw_text)
 
@@ -160,6 +172,29 @@ class ReviewService:
         logger.warning("Failed to parse ReviewResult JSON, returning lenient pass. Raw: %s", stripped[:200])
         return self._lenient_pass("LLM review response could not be parsed")
 
+    @staticmethod
+    def _fit_topics_json(
+        draft: dict,
+        draft_json: str,
+        curated_topics: list[dict],
+        rubric_config: RubricConfig | None,
+    ) -> str:
+        """Curated topics as a JSON array, trimmed to the review prompt budget."""
+        chunks = [
+            ContextChunk(json.dumps(topic, ensure_ascii=False), required=i == 0)
+            for i, topic in enumerate(curated_topics)
+        ]
+        fit = fit_context(
+            "review",
+            chunks,
+            terms=query_terms(str(draft.get("keyword") or ""), str(draft.get("title") or "")),
+            reserve_tokens=estimate_tokens(
+                build_review_prompt(draft_json, "", rubric_config=rubric_config)
+            ),
+            separator=", ",
+        )
+        return f"[{fit.text}]"
+
     @staticmethod
     def _lenient_pass(reason: str) -> list[CriterionResult]:
         """Return lenient pass criteria when review cannot complete."""
@@ -176,6 +211,7 @@ class ReviewService:
         rubric_config: RubricConfig | None = None,
         revision_count: int = 0,
         cache_name: str | None = None,
+        budget_level: str | None = None,
     ) -> ReviewResult:
         """Full evaluation entry point: format (Pydantic) + LLM (semantic).
 
@@ -189,13 +225,14 @@ class ReviewService:
 
         # Step 2: LLM semantic evaluation
         draft_json = json.dumps(draft, ensure_ascii=False)
-        topics_json = json.dumps(curated_topics, ensure_ascii=False)
+        topics_json = self._fit_topics_json(draft, draft_json, curated_topics, rubric_config)
         llm_criteria = await self.evaluate_with_llm(
             draft_json,
             topics_json,
             rubric_config=rubric_config,
             revision_count=revision_count,
             cache_name=cache_name,
+            budget_level=budget_level,
         )
 
         # Step 3: Combine all criteria
@@ -6,7 +6,25 @@ Lean state principle: store IDs and references only, not full payloads.
 from __future__ import annotations
 
 import operator
-from typing import Annotated, Literal, TypedDict
+from typing import Annotated, Literal, TypedDict, TypeVar
+
+T = TypeVar("T")
+
+_BUDGET_LEVELS = ("ok", "low", "critical", "exhausted")
+
+
+# design_spec and source run in parallel (same step), so any plain key both
+# may write needs a reducer: LangGraph rejects two writes to a last-value key.
+def latest(current: T, update: T) -> T:
+    """Last write wins, also when parallel nodes write in the same step."""
+    return update
+
+
+def worst_budget_level(current: str | None, update: str | None) -> str | None:
+    """Keep the most severe budget level reported by parallel nodes."""
+    if current is None or update is None:
+        return update if update is not None else current
+    return max(current, update, key=_BUDGET_LEVELS.index)
 
 
 class EditorialPipelineState(TypedDict):
@@ -28,6 +46,11 @@ class EditorialPipelineState(TypedDict):
     current_draft_id: str | None
     tool_calls_log: Annotated[list[dict], operator.add]
 
+    # Topic fan-out (see nodes.topic_fanout): branch topic, and one draft
+    # reference per branch collected via operator.add
+    topic_index: int | None
+    topic_drafts: Annotated[list[dict], operator.add]
+
     # Review Phase
     review_result: dict | None
     revision_count: int
@@ -35,19 +58,39 @@ class EditorialPipelineState(TypedDict):
 
     # Thread tracking (set by API trigger, used by admin_gate for Supabase upsert)
     thread_id: str | None
+    # Set by API trigger when the run should be profiled (see observability.profiling)
+    profile: bool
+    # Per-run {route: model} overrides applied by the model router (A/B runs)
+    model_overrides: dict[str, str] | None
+    # Scheduling lane, also used for LLM capacity (see editorial_ai.priority)
+    priority: Literal["interactive", "standard", "batch"] | None
+    # Set for runs queued by trigger-batch; scopes shared upstream work (editorial_ai.batch)
+    batch_id: str | None
 
     # Admin Gate
     admin_decision: Literal["approved", "rejected", "revision_requested"] | None
     admin_feedback: str | None
 
+    # Run budget (see editorial_ai.budget): limits, per-node spend ledger,
+    # latest level and the degradations taken because of it
+    budget: dict | None
+    budget_spent: Annotated[list[dict], operator.add]
+    budget_status: Annotated[
+        Literal["ok", "low", "critical", "exhausted"] | None, worst_budget_level
+    ]
+    budget_decisions: Annotated[list[dict], operator.add]
+
     # Pipeline Meta
-    pipeline_status: Literal[
-        "curating",
-        "sourcing",
-        "drafting",
-        "reviewing",
-        "awaiting_approval",
-        "published",
-        "failed",
+    pipeline_status: Annotated[
+        Literal[
+            "curating",
+            "sourcing",
+            "drafting",
+            "reviewing",
+            "awaiting_approval",
+            "published",
+            "failed",
+        ],
+        latest,
     ]
     error_log: Annotated[list[str], operator.add]
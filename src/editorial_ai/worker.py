@@ -0,0 +1,250 @@
+"""Standalone pipeline worker: N processes draining the job queue.
+
+Graph execution is CPU-heavy in places (node log serialization, layout
+validation, base64 image encoding). Run in the API process it competes
+with admin traffic for the one event loop, so production runs the API
+with ``API_JOB_WORKERS=false`` (enqueue and read state only) and the
+graphs in worker processes::
+
+    uv run editorial-worker --processes 4
+
+Each process has its own event loop, checkpointer connection, Gemini and
+Supabase clients and ``JOB_WORKER_CONCURRENCY`` job slots; progress
+events reach the API's SSE streams over the Postgres LISTEN/NOTIFY bridge
+(``observability.events``). With
+``WORKER_CPU_AFFINITY`` process *i* is pinned to core *i* mod cores
+(Linux only).
+
+Metrics live in the process that records them, so the API's
+``GET /metrics`` shows none of the pipeline series the workers record.
+With ``WORKER_METRICS_PORT`` set, process *i* serves its own
+``GET /metrics`` on that port + *i*; scrape every worker port alongside
+the API.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import os
+import signal
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any
+
+from editorial_ai.config import settings
+from editorial_ai.io_executor import shutdown_io_executor
+from editorial_ai.jobs import JobHandler, JobWorkerPool, get_job_queue
+from editorial_ai.observability import (
+    get_event_bus,
+    get_log_sink,
+    get_loop_monitor,
+    get_run_status_registry,
+)
+from editorial_ai.observability.metrics import MetricsServer
+from editorial_ai.routing import get_routing_watcher
+
+logger = logging.getLogger(__name__)
+
+GraphFactory = Callable[[], AbstractAsyncContextManager[Any]]
+
+
+@asynccontextmanager
+async def pipeline_graph():
+    """Checkpointer-backed graph for the lifetime of a worker process."""
+    from editorial_ai.checkpointer import create_checkpointer
+    from editorial_ai.graph import build_graph
+
+    async with create_checkpointer() as checkpointer:
+        await checkpointer.setup()
+        yield build_graph(checkpointer=checkpointer)
+
+
+def process_count(requested: int | None = None) -> int:
+    """Worker processes to run: explicit, else WORKER_PROCESSES (0 = one per core)."""
+    n = requested if requested is not None else settings.worker_processes
+    return n if n > 0 else os.cpu_count() or 1
+
+
+def pin_to_core(index: int) -> int | None:
+    """Pin this process to core ``index`` mod available cores. Returns the core."""
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("CPU affinity is not supported on this platform; not pinning")
+        return None
+    cores = sorted(os.sched_getaffinity(0))
+    core = cores[index % len(cores)]
+    os.sched_setaffinity(0, {core})
+    return core
+
+
+async def serve(
+    *,
+    graph_factory: GraphFactory = pipeline_graph,
+    handlers: dict[str, JobHandler] | None = None,
+    concurrency: int | None = None,
+    stop: asyncio.Event | None = None,
+    metrics_port: int | None = None,
+) -> None:
+    """Run a job worker pool in this process until ``stop`` is set (or SIGTERM/SIGINT).
+
+    ``metrics_port`` (default ``WORKER_METRICS_PORT``; 0 = off) serves this
+    process's ``GET /metrics``.
+    """
+    stop = stop or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    signals = []
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with contextlib.suppress(NotImplementedError, RuntimeError):
+            loop.add_signal_handler(sig, stop.set)
+            signals.append(sig)
+
+    loop_monitor = get_loop_monitor()
+    loop_monitor.start()
+    log_sink = get_log_sink()
+    log_sink.start()
+    routing_watcher = get_routing_watcher()
+    routing_watcher.start()
+    event_bus = get_event_bus()
+    event_bus.start()
+    run_status = get_run_status_registry()
+    run_status.start()
+    port = settings.worker_metrics_port if metrics_port is None else metrics_port
+    metrics_server = MetricsServer(settings.worker_metrics_host, port) if port else None
+    try:
+        if metrics_server is not None:
+            await metrics_server.start()
+        async with graph_factory() as graph:
+            pool = JobWorkerPool(graph, concurrency=concurrency, handlers=handlers)
+            pool.start()
+            try:
+                await stop.wait()
+            finally:
+                await pool.stop()
+    finally:
+        if metrics_server is not None:
+            await metrics_server.stop()
+        await get_job_queue().close()
+        await run_status.stop()
+        await event_bus.stop()
+        await routing_watcher.stop()
+        await log_sink.stop()
+        await loop_monitor.stop()
+        shutdown_io_executor()
+        for sig in signals:
+            loop.remove_signal_handler(sig)
+
+
+def run_process(
+    index: int,
+    *,
+    affinity: bool,
+    graph_factory: GraphFactory = pipeline_graph,
+    handlers: dict[str, JobHandler] | None = None,
+    concurrency: int | None = None,
+) -> None:
+    """Entry point of one worker process."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(processName)s %(name)s %(levelname)s %(message)s"
+    )
+    if affinity:
+        core = pin_to_core(index)
+        if core is not None:
+            logger.info("Worker %d pinned to core %d", index, core)
+    metrics_port = settings.worker_metrics_port + index if settings.worker_metrics_port else 0
+    asyncio.run(
+        serve(
+            graph_factory=graph_factory,
+            handlers=handlers,
+            concurrency=concurrency,
+            metrics_port=metrics_port,
+        )
+    )
+
+
+def start_processes(
+    processes: int,
+    *,
+    affinity: bool = False,
+    graph_factory: GraphFactory = pipeline_graph,
+    handlers: dict[str, JobHandler] | None = None,
+    concurrency: int | None = None,
+) -> list[multiprocessing.process.BaseProcess]:
+    """Spawn worker processes (spawn context: no inherited loops or connections)."""
+    ctx = multiprocessing.get_context("spawn")
+    procs = []
+    for i in range(processes):
+        proc = ctx.Process(
+            target=run_process,
+            args=(i,),
+            kwargs={
+                "affinity": affinity,
+                "graph_factory": graph_factory,
+                "handlers": handlers,
+                "concurrency": concurrency,
+            },
+            name=f"editorial-worker-{i}",
+        )
+        proc.start()
+        procs.append(proc)
+    return procs
+
+
+def stop_processes(procs: list[multiprocessing.process.BaseProcess], timeout_s: float = 30) -> None:
+    """SIGTERM the workers (running jobs are handed back) and wait for them."""
+    for proc in procs:
+        if proc.is_alive():
+            proc.terminate()
+    for proc in procs:
+        proc.join(timeout_s)
+        if proc.is_alive():
+            logger.warning("Worker %s did not stop in %.0fs; killing", proc.name, timeout_s)
+            proc.kill()
+            proc.join()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run pipeline job workers.")
+    parser.add_argument(
+        "--processes", type=int, default=None,
+        help="worker processes (default: WORKER_PROCESSES; 0 = one per core)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=None,
+        help="job slots per process (default: JOB_WORKER_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--affinity", action=argparse.BooleanOptionalAction, default=None,
+        help="pin each process to one core (default: WORKER_CPU_AFFINITY)",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+
+    processes = process_count(args.processes)
+    affinity = settings.worker_cpu_affinity if args.affinity is None else args.affinity
+    if processes == 1 and not affinity:
+        asyncio.run(serve(concurrency=args.concurrency))
+        return
+
+    procs = start_processes(processes, affinity=affinity, concurrency=args.concurrency)
+    logger.info("Started %d worker processes", len(procs))
+    stopping = False
+
+    def _shutdown(signum: int, frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+    try:
+        while not stopping and any(p.is_alive() for p in procs):
+            for proc in procs:
+                proc.join(0.5)
+    finally:
+        stop_processes(procs)
+
+
+if __name__ == "__main__":
+    main()
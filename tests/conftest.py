@@ -1 +1,71 @@
 """Shared test fixtures."""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from editorial_ai.caching import cache_manager as cache_module
+from editorial_ai.config import settings
+from editorial_ai.jobs import SqliteJobQueue
+from editorial_ai.jobs import queue as queue_module
+from editorial_ai.observability import run_status as run_status_module
+from editorial_ai.observability.run_status import RunStatusRegistry, SqliteRunStatusStore
+from editorial_ai.routing import get_model_health
+
+
+@pytest.fixture(autouse=True)
+def _no_stats_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep node logs written by tests out of the observability SQLite store.
+
+    Tests that exercise the store enable it explicitly with a tmp path.
+    """
+    monkeypatch.setattr(settings, "observability_stats_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_model_health() -> None:
+    """Start every test with no recorded model health (no open circuits)."""
+    get_model_health().reset()
+
+
+@pytest.fixture(autouse=True)
+def _context_cache_registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Keep the shared context cache table out of data/ (fresh CacheManager per test)."""
+    path = tmp_path / "context_caches.db"
+    monkeypatch.setattr(settings, "context_cache_registry_path", str(path))
+    monkeypatch.setattr(cache_module, "_manager_instance", None)
+    yield
+    manager = cache_module._manager_instance
+    if manager is not None and manager._registry is not None:
+        manager._registry.close()
+
+
+@pytest.fixture(autouse=True)
+async def job_queue(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> SqliteJobQueue:
+    """Route enqueued pipeline jobs to a throwaway SQLite queue."""
+    queue = SqliteJobQueue(tmp_path / "jobs.db")
+    monkeypatch.setattr(queue_module, "_queue_instance", queue)
+    yield queue
+    await queue.close()
+
+
+@pytest.fixture(autouse=True)
+async def run_status(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> RunStatusRegistry:
+    """Route run status writes from node_wrapper to a throwaway registry."""
+    registry = RunStatusRegistry(SqliteRunStatusStore(tmp_path / "run_status.db"))
+    monkeypatch.setattr(run_status_module, "_registry_instance", registry)
+    yield registry
+    await registry.stop()
+
+
+@pytest.fixture
+def no_node_logs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Drop the NodeRunLogs node_wrapper writes instead of appending them to data/logs."""
+
+    async def _discard(log: object) -> None:
+        pass
+
+    module = sys.modules["editorial_ai.observability.node_wrapper"]
+    monkeypatch.setattr(module, "append_node_log_async", _discard)
@@ -6,6 +6,7 @@ with approve/reject/revision decisions via Command(resume=...).
 
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -13,7 +14,9 @@ from langgraph.checkpoint.memory import MemorySaver
 from langgraph.types import Command
 
 from editorial_ai.graph import build_graph
+from editorial_ai.jobs import PIPELINE_RESUME, Job, resume_pipeline_job
 from editorial_ai.nodes.stubs import stub_enrich
+from editorial_ai.services import content_service
 
 
 def _stub_overrides_except_admin_gate_and_publish() -> dict:
@@ -284,3 +287,68 @@ async def test_resume_with_revision_routes_to_editorial(
 
     assert result["admin_decision"] == "approved"
     assert result["pipeline_status"] == "published"
+
+
+@pytest.mark.asyncio
+async def test_resume_job_keeps_the_decision_and_gives_it_back_after_the_gate(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, no_node_logs: None
+):
+    """The stored status survives admin_gate re-running, and a failed publish undoes it."""
+    monkeypatch.setattr(content_service, "_CONTENTS_DIR", tmp_path / "contents")
+    publish = AsyncMock(side_effect=RuntimeError("publish down"))
+    monkeypatch.setattr("editorial_ai.nodes.publish.update_content_status", publish)
+    graph = build_graph(
+        node_overrides=_stub_overrides_except_admin_gate_and_publish(),
+        checkpointer=MemorySaver(),
+    )
+    thread_id = "test-resume-job-1"
+    config = {"configurable": {"thread_id": thread_id}}
+
+    async def stored_status() -> str:
+        return (await content_service.get_content_by_thread_id(thread_id))["status"]
+
+    await graph.ainvoke({**_initial_state(), "thread_id": thread_id}, config=config)
+    content = await content_service.get_content_by_thread_id(thread_id)
+    assert content["status"] == "pending"
+
+    # What the approve route does before queueing the job
+    await content_service.update_content_status(content["id"], "approved")
+    job = Job(
+        id="j1", kind=PIPELINE_RESUME, thread_id=thread_id,
+        payload={
+            "resume": {"decision": "approved"},
+            "content_id": content["id"],
+            "previous_status": "pending",
+        },
+        status="running", attempts=1, max_attempts=2, run_after=0,
+    )
+
+    # admin_gate re-runs on resume without resetting the decision
+    with pytest.raises(RuntimeError):
+        await resume_pipeline_job(graph, job)
+    assert await stored_status() == "approved"
+
+    # Past the gate, the last attempt gives the decision back
+    job.attempts = 2
+    with pytest.raises(RuntimeError):
+        await resume_pipeline_job(graph, job)
+    assert await stored_status() == "pending"
+
+    # A different decision cannot be applied to a run that already acted
+    await content_service.update_content_status(content["id"], "rejected")
+    rejected = Job(
+        id="j2", kind=PIPELINE_RESUME, thread_id=thread_id,
+        payload={**job.payload, "resume": {"decision": "rejected"}},
+        status="running", attempts=1, max_attempts=1, run_after=0,
+    )
+    with pytest.raises(ValueError, match="already acted on 'approved'"):
+        await resume_pipeline_job(graph, rejected)
+    assert await stored_status() == "pending"
+
+    # Approving again continues the run from the failed node
+    await content_service.update_content_status(content["id"], "approved")
+    publish.side_effect = None
+    job.attempts = 1
+    await resume_pipeline_job(graph, job)
+    publish.assert_called_with(content["id"], "published")
+    assert await stored_status() == "approved"  # publish itself is mocked out
@@ -147,6 +147,8 @@ async def test_approve_content(
     mock_update: AsyncMock,
     client: AsyncClient,
     mock_graph: MagicMock,
+    job_queue,
+    run_status,
 ):
     mock_get.return_value = _SAMPLE_CONTENT
     approved_content = {**_SAMPLE_CONTENT, "status": "approved"}
@@ -156,13 +158,116 @@ async def test_approve_content(
         f"/api/contents/{_SAMPLE_CONTENT['id']}/approve",
         json={"feedback": "Great work"},
     )
-    assert resp.status_code == 200
-    assert resp.json()["status"] == "approved"
-    mock_graph.ainvoke.assert_called_once()
+    assert resp.status_code == 202
+    data = resp.json()
+    assert data["content"]["status"] == "approved"
+    assert (data["decision"], data["job_status"], data["duplicate"]) == (
+        "approved", "queued", False,
+    )
+    assert data["stream_url"] == "/api/pipeline/stream/test-thread-1"
+    # Resumed by a job worker, not inside the request
+    mock_graph.ainvoke.assert_not_called()
     mock_update.assert_called_once_with(
-        _SAMPLE_CONTENT["id"], "approved", admin_feedback="Great work"
+        _SAMPLE_CONTENT["id"],
+        "approved",
+        expected_updated_at=_NOW,
+        admin_feedback="Great work",
     )
 
+    job = await job_queue.get(data["job_id"])
+    assert (job.kind, job.thread_id, job.priority) == (
+        "pipeline_resume", "test-thread-1", "interactive",
+    )
+    assert job.payload["resume"] == {"decision": "approved", "feedback": "Great work"}
+    assert job.payload["previous_status"] == "pending"
+    assert (await run_status.get("test-thread-1")).pipeline_status == "resuming"
+
+
+@patch("editorial_ai.api.routes.admin.update_content_status", new_callable=AsyncMock)
+@patch("editorial_ai.api.routes.admin.get_content_by_id", new_callable=AsyncMock)
+async def test_double_click_queues_one_resume(
+    mock_get: AsyncMock,
+    mock_update: AsyncMock,
+    client: AsyncClient,
+    job_queue,
+):
+    mock_get.return_value = _SAMPLE_CONTENT
+    mock_update.return_value = {**_SAMPLE_CONTENT, "status": "approved"}
+    url = f"/api/contents/{_SAMPLE_CONTENT['id']}/approve"
+
+    first = await client.post(url, json={"expected_updated_at": _NOW})
+    later = datetime.now(UTC).isoformat()
+    mock_get.return_value = {**_SAMPLE_CONTENT, "status": "approved", "updated_at": later}
+    second = await client.post(url, json={"expected_updated_at": _NOW})
+
+    assert (first.status_code, second.status_code) == (202, 202)
+    assert second.json()["job_id"] == first.json()["job_id"]
+    assert second.json()["duplicate"] is True
+    mock_update.assert_called_once()
+    assert await job_queue.counts() == {"queued": 1}
+
+
+@patch("editorial_ai.api.routes.admin.update_content_status", new_callable=AsyncMock)
+@patch("editorial_ai.api.routes.admin.get_content_by_id", new_callable=AsyncMock)
+async def test_idempotency_key_header(
+    mock_get: AsyncMock,
+    mock_update: AsyncMock,
+    client: AsyncClient,
+    job_queue,
+):
+    mock_get.return_value = _SAMPLE_CONTENT
+    mock_update.return_value = {**_SAMPLE_CONTENT, "status": "rejected"}
+    url = f"/api/contents/{_SAMPLE_CONTENT['id']}/reject"
+    headers = {"Idempotency-Key": "click-1"}
+
+    first = await client.post(url, json={"reason": "Off brand"}, headers=headers)
+    second = await client.post(url, json={"reason": "Off brand"}, headers=headers)
+
+    assert second.json()["job_id"] == first.json()["job_id"]
+    job = await job_queue.get(first.json()["job_id"])
+    assert job.idempotency_key == "pipeline_resume:test-thread-1"
+    assert job.payload["request_key"] == "click-1"
+    assert job.payload["resume"] == {"decision": "rejected", "reason": "Off brand"}
+
+
+@patch("editorial_ai.api.routes.admin.update_content_status", new_callable=AsyncMock)
+@patch("editorial_ai.api.routes.admin.get_content_by_id", new_callable=AsyncMock)
+async def test_conflicting_decision_is_refused(
+    mock_get: AsyncMock,
+    mock_update: AsyncMock,
+    client: AsyncClient,
+    job_queue,
+):
+    mock_get.return_value = _SAMPLE_CONTENT
+    mock_update.return_value = {**_SAMPLE_CONTENT, "status": "approved"}
+    content_url = f"/api/contents/{_SAMPLE_CONTENT['id']}"
+
+    approve = await client.post(
+        f"{content_url}/approve", json={}, headers={"Idempotency-Key": "k1"}
+    )
+    mock_get.return_value = {**_SAMPLE_CONTENT, "status": "approved"}
+    reject = await client.post(
+        f"{content_url}/reject", json={"reason": "No"}, headers={"Idempotency-Key": "k2"}
+    )
+    reject_no_key = await client.post(f"{content_url}/reject", json={"reason": "No"})
+
+    assert approve.status_code == 202
+    assert (reject.status_code, reject_no_key.status_code) == (409, 409)
+    mock_update.assert_called_once()
+    assert await job_queue.counts() == {"queued": 1}
+
+
+@patch("editorial_ai.api.routes.admin.get_content_by_id", new_callable=AsyncMock)
+async def test_decision_on_decided_content_is_refused(
+    mock_get: AsyncMock, client: AsyncClient, job_queue
+):
+    mock_get.return_value = {**_SAMPLE_CONTENT, "status": "published"}
+
+    resp = await client.post(f"/api/contents/{_SAMPLE_CONTENT['id']}/approve", json={})
+
+    assert resp.status_code == 409
+    assert await job_queue.counts() == {}
+
 
 # ---------------------------------------------------------------------------
 # Reject (full flow)
@@ -189,11 +294,15 @@ async def test_reject_content(
         f"/api/contents/{_SAMPLE_CONTENT['id']}/reject",
         json={"reason": "Low quality"},
     )
-    assert resp.status_code == 200
-    assert resp.json()["status"] == "rejected"
-    mock_graph.ainvoke.assert_called_once()
+    assert resp.status_code == 202
+    assert resp.json()["content"]["status"] == "rejected"
+    assert resp.json()["decision"] == "rejected"
+    mock_graph.ainvoke.assert_not_called()
     mock_update.assert_called_once_with(
-        _SAMPLE_CONTENT["id"], "rejected", rejection_reason="Low quality"
+        _SAMPLE_CONTENT["id"],
+        "rejected",
+        expected_updated_at=_NOW,
+        rejection_reason="Low quality",
     )
 
 
@@ -262,4 +371,5 @@ async def test_trigger_pipeline(
     data = resp.json()
     assert data["thread_id"] == "test-uuid-1234"
     assert "admin gate" in data["message"].lower()
-    mock_graph.ainvoke.assert_called_once()
+    assert data["job_id"]
+    mock_graph.ainvoke.assert_not_called()  # queued for a worker
@@ -0,0 +1,159 @@
+"""Tests for batch triggers and the upstream work a batch's runs share."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from editorial_ai import batch as batch_module
+from editorial_ai.api.app import app
+from editorial_ai.api.routes import pipeline as pipeline_routes
+from editorial_ai.batch import SharedWork, run_batch
+from editorial_ai.jobs import SqliteJobQueue
+
+
+@pytest.fixture
+def shared_work(monkeypatch: pytest.MonkeyPatch) -> SharedWork:
+    work = SharedWork(ttl_s=60, max_entries=100)
+    monkeypatch.setattr(batch_module, "_shared_instance", work)
+    return work
+
+
+async def test_shared_work_runs_once_per_batch(shared_work: SharedWork) -> None:
+    calls = []
+
+    async def fetch() -> list[dict]:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return [{"id": "p1"}]
+
+    # Outside a batch nothing is shared
+    await shared_work.run("posts_search", "jennie", fetch)
+    await shared_work.run("posts_search", "jennie", fetch)
+    assert len(calls) == 2
+
+    with run_batch("b1"):
+        first, second = await asyncio.gather(
+            shared_work.run("posts_search", "jennie", fetch),
+            shared_work.run("posts_search", "jennie", fetch),
+        )
+        await shared_work.run("posts_search", "jennie", fetch)
+        await shared_work.run("posts_search", "lisa", fetch)
+    with run_batch("b2"):
+        await shared_work.run("posts_search", "jennie", fetch)
+
+    assert len(calls) == 5  # b1: jennie + lisa, b2: jennie
+    first[0]["id"] = "mutated"
+    assert second == [{"id": "p1"}]  # callers get their own copy
+    assert shared_work.stats("b1") == {"posts_search": {"computed": 2, "reused": 2}}
+
+
+async def test_shared_work_does_not_keep_failures(shared_work: SharedWork) -> None:
+    fetch = AsyncMock(side_effect=[RuntimeError("supabase down"), "context"])
+    with run_batch("b1"):
+        with pytest.raises(RuntimeError):
+            await shared_work.run("db_context", None, fetch)
+        assert await shared_work.run("db_context", None, fetch) == "context"
+        assert await shared_work.run("db_context", None, fetch) == "context"
+    assert fetch.await_count == 2
+
+
+async def test_waiters_take_over_when_the_computing_caller_is_cancelled(
+    shared_work: SharedWork,
+) -> None:
+    started = asyncio.Event()
+    calls = []
+
+    async def fetch() -> str:
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.05)
+        return "context"
+
+    with run_batch("b1"):
+        first = asyncio.create_task(shared_work.run("db_context", None, fetch))
+        await started.wait()
+        waiters = [
+            asyncio.create_task(shared_work.run("db_context", None, fetch)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        first.cancel()
+        results = await asyncio.gather(*waiters)
+
+    assert first.cancelled()
+    assert results == ["context", "context"]
+    assert len(calls) == 2  # the cancelled attempt, then one waiter computing for both
+    assert shared_work.stats("b1") == {"db_context": {"computed": 2, "reused": 1}}
+
+
+async def test_trigger_batch_queues_deduplicated_runs(
+    job_queue: SqliteJobQueue, shared_work: SharedWork
+) -> None:
+    app.state.graph = MagicMock()
+    items = [
+        {"seed_keyword": "spring", "mode": "ai_db_search"},
+        {"seed_keyword": "y2k"},
+        {"seed_keyword": "spring", "mode": "ai_db_search"},
+        {"seed_keyword": "denim", "priority": "interactive", "tenant": "acme"},
+    ]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/api/pipeline/trigger-batch", json={"items": items})
+        data = resp.json()
+        batch_id = data["batch_id"]
+
+        jobs = await job_queue.list_batch(batch_id)
+        claimed = await job_queue.claim("w1", lease_s=60, lanes=["batch"])
+        await job_queue.complete(claimed.id, "w1")
+        status = (await ac.get(data["status_url"])).json()
+        missing = await ac.get("/api/pipeline/batches/nope")
+
+    assert resp.status_code == 200
+    assert data["queued"] == 3
+    assert [i["duplicate_of"] for i in data["items"]] == [None, None, 0, None]
+    assert data["items"][2]["thread_id"] == data["items"][0]["thread_id"]
+
+    assert len(jobs) == 3
+    assert [(j.priority, j.tenant) for j in jobs] == [
+        ("batch", "fashion"), ("batch", "fashion"), ("interactive", "acme"),
+    ]
+    state = jobs[0].payload["initial_state"]
+    assert (state["batch_id"], state["priority"]) == (batch_id, "batch")
+
+    assert (status["total"], status["completed"], status["failed"]) == (3, 1, 0)
+    assert status["jobs"] == {"succeeded": 1, "queued": 2}
+    assert status["pipeline_statuses"] == {"queued": 3}
+    assert status["progress"] == pytest.approx(1 / 3)
+    assert status["throughput_per_min"] > 0 and status["eta_s"] > 0
+    assert status["finished_at"] is None
+    assert missing.status_code == 404
+
+
+async def test_trigger_batch_resolves_db_sources_once(
+    monkeypatch: pytest.MonkeyPatch, job_queue: SqliteJobQueue
+) -> None:
+    posts = AsyncMock(return_value=[{"id": "p1", "artist_name": "Jennie"}, {"id": "p2"}])
+    empty = AsyncMock(return_value=[])
+    monkeypatch.setattr(pipeline_routes, "get_supabase_client", AsyncMock())
+    monkeypatch.setattr(pipeline_routes, "_fetch_posts_by_ids", posts)
+    monkeypatch.setattr(pipeline_routes, "_fetch_celebs_by_ids", empty)
+    monkeypatch.setattr(pipeline_routes, "_fetch_products_by_ids", empty)
+
+    app.state.graph = MagicMock()
+    items = [
+        {"seed_keyword": "a", "mode": "db_source", "selected_posts": ["p1", "p2"]},
+        {"seed_keyword": "b", "mode": "db_source", "selected_posts": ["p2"]},
+    ]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/api/pipeline/trigger-batch", json={"items": items})
+
+    assert resp.status_code == 200
+    posts.assert_awaited_once()
+    assert posts.await_args.args[1] == ["p1", "p2"]
+    jobs = await job_queue.list_batch(resp.json()["batch_id"])
+    contexts = [[p["id"] for p in j.payload["initial_state"]["enriched_contexts"]] for j in jobs]
+    assert contexts == [["p1", "p2"], ["p2"]]
@@ -0,0 +1,196 @@
+"""Tests for per-run budgets and their progressive degradation."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from editorial_ai.budget import budget_status, build_budget, spend_entry
+from editorial_ai.config import settings
+from editorial_ai.graph import route_after_review
+from editorial_ai.models.layout import create_default_template
+from editorial_ai.models.review import CriterionResult, ReviewResult
+from editorial_ai.nodes.editorial import editorial_node
+from editorial_ai.nodes.review import review_node
+from editorial_ai.observability.models import NodeRunLog
+from editorial_ai.observability.node_wrapper import node_wrapper
+
+
+def _spent(tokens: int = 0, cost: float = 0.0, wall_ms: float = 0.0) -> list[dict]:
+    return [spend_entry("editorial", tokens=tokens, cost_usd=cost, duration_ms=wall_ms)]
+
+
+def _state(budget: dict, spent: list[dict], **overrides: object) -> dict:
+    state: dict = {
+        "thread_id": "t-budget",
+        "curation_input": {"keyword": "Y2K"},
+        "curated_topics": [{"keyword": "Y2K", "trend_background": "Y2K revival"}],
+        "current_draft": create_default_template("Y2K", "Y2K Revival").model_dump(),
+        "revision_count": 1,
+        "feedback_history": [],
+        "budget": budget,
+        "budget_spent": spent,
+    }
+    state.update(overrides)
+    return state
+
+
+def _failing_review() -> ReviewResult:
+    return ReviewResult(
+        passed=False,
+        criteria=[CriterionResult(criterion="hallucination", passed=False, reason="bad")],
+        summary="Hallucination detected",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Budget levels
+# ---------------------------------------------------------------------------
+
+
+def test_build_budget_merges_request_and_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert build_budget() is None
+    monkeypatch.setattr(settings, "run_budget_max_tokens", 50_000)
+    monkeypatch.setattr(settings, "run_budget_max_wall_s", 0)  # 0 = unlimited
+
+    assert build_budget() == {"max_tokens": 50_000}
+    assert build_budget(max_tokens=10_000, max_cost_usd=0.5) == {
+        "max_tokens": 10_000,
+        "max_cost_usd": 0.5,
+    }
+
+
+@pytest.mark.parametrize(
+    ("tokens", "level"),
+    [(4_000, "ok"), (5_000, "low"), (8_500, "critical"), (10_000, "exhausted")],
+)
+def test_level_thresholds(tokens: int, level: str) -> None:
+    status = budget_status(_state({"max_tokens": 10_000}, _spent(tokens=tokens)))
+    assert status is not None
+    assert status.level == level
+
+
+def test_tightest_limit_wins() -> None:
+    status = budget_status(
+        _state(
+            {"max_tokens": 100_000, "max_cost_usd": 1.0, "max_wall_s": 60},
+            _spent(tokens=1_000, cost=0.1) + _spent(wall_ms=50_000),
+        )
+    )
+    assert status is not None
+    assert status.level == "critical"
+    assert status.remaining == pytest.approx(1 - 50 / 60)
+    assert status.spent["tokens"] == 1_000
+
+
+def test_runs_without_budget_have_no_status() -> None:
+    assert budget_status({"thread_id": "t"}) is None
+
+
+# ---------------------------------------------------------------------------
+# Degradation in nodes and routing
+# ---------------------------------------------------------------------------
+
+
+@patch("editorial_ai.nodes.editorial.get_genai_client", return_value=MagicMock())
+@patch("editorial_ai.nodes.editorial.EditorialService")
+async def test_editorial_skips_image_and_repairs_when_critical(
+    mock_service_cls: MagicMock, _client: MagicMock
+) -> None:
+    layout = create_default_template("Y2K", "Y2K Revival")
+    mock_service_cls.return_value.create_editorial = AsyncMock(return_value=(layout, None))
+
+    result = await editorial_node(_state({"max_tokens": 10_000}, _spent(tokens=9_000)))
+
+    assert mock_service_cls.call_args.kwargs["max_repair_attempts"] == 0
+    kwargs = mock_service_cls.return_value.create_editorial.call_args.kwargs
+    assert kwargs["generate_image"] is False
+    assert kwargs["budget_level"] == "critical"
+    assert [d["action"] for d in result["budget_decisions"]] == [
+        "skip_layout_image",
+        "skip_repair_loop",
+    ]
+    assert result["budget_status"] == "critical"
+
+
+@patch("editorial_ai.nodes.editorial.get_genai_client", return_value=MagicMock())
+@patch("editorial_ai.nodes.editorial.EditorialService")
+async def test_editorial_unbudgeted_run_is_unchanged(
+    mock_service_cls: MagicMock, _client: MagicMock
+) -> None:
+    layout = create_default_template("Y2K", "Y2K Revival")
+    mock_service_cls.return_value.create_editorial = AsyncMock(return_value=(layout, None))
+
+    result = await editorial_node(_state({}, []))
+
+    kwargs = mock_service_cls.return_value.create_editorial.call_args.kwargs
+    assert kwargs["generate_image"] is True
+    assert "budget_decisions" not in result
+    assert "budget_status" not in result
+
+
+@patch("editorial_ai.nodes.review.get_genai_client", return_value=MagicMock())
+@patch("editorial_ai.nodes.review.ReviewService")
+async def test_review_exhausted_goes_to_admin_gate(
+    mock_service_cls: MagicMock, _client: MagicMock
+) -> None:
+    mock_service_cls.return_value.evaluate = AsyncMock(return_value=_failing_review())
+    state = _state({"max_cost_usd": 0.10}, _spent(cost=0.12))
+
+    result = await review_node(state)
+
+    assert result["pipeline_status"] == "awaiting_approval"
+    assert "revision_count" not in result
+    assert [d["action"] for d in result["budget_decisions"]] == [
+        "review_budget_model",
+        "skip_revisions",
+    ]
+    assert mock_service_cls.return_value.evaluate.call_args.kwargs["budget_level"] == "exhausted"
+    assert route_after_review({**state, **result}) == "admin_gate"
+
+
+@patch("editorial_ai.nodes.review.get_genai_client", return_value=MagicMock())
+@patch("editorial_ai.nodes.review.ReviewService")
+async def test_review_with_budget_left_still_revises(
+    mock_service_cls: MagicMock, _client: MagicMock
+) -> None:
+    mock_service_cls.return_value.evaluate = AsyncMock(return_value=_failing_review())
+    state = _state({"max_cost_usd": 1.0}, _spent(cost=0.1))
+
+    result = await review_node(state)
+
+    assert result["revision_count"] == 2
+    assert result["budget_status"] == "ok"
+    assert route_after_review({**state, **result}) == "editorial"
+
+
+# ---------------------------------------------------------------------------
+# Ledger and logs
+# ---------------------------------------------------------------------------
+
+
+async def test_node_wrapper_appends_spend_and_logs_decisions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    logs: list[NodeRunLog] = []
+
+    async def _capture(log: NodeRunLog) -> None:
+        logs.append(log)
+
+    module = sys.modules["editorial_ai.observability.node_wrapper"]
+    monkeypatch.setattr(module, "append_node_log_async", _capture)
+
+    async def review(state: dict) -> dict:
+        return {"budget_decisions": [{"node": "review", "action": "skip_revisions"}]}
+
+    wrapped = node_wrapper("review")(review)
+    result = await wrapped({"thread_id": "t", "budget": {"max_tokens": 10}})
+    unbudgeted = await wrapped({"thread_id": "t"})
+
+    (entry,) = result["budget_spent"]
+    assert entry["node"] == "review"
+    assert entry["tokens"] == 0
+    assert "budget_spent" not in unbudgeted
+    assert logs[0].budget_decisions == [{"node": "review", "action": "skip_revisions"}]
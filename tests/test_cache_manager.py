@@ -1,17 +1,23 @@
-"""Tests for CacheManager: get_or_create, threshold, key scoping, error handling."""
+"""Tests for CacheManager: get_or_create, threshold, key scoping, error handling,
+local expiry, hot-key extension, the shared registry and eviction."""
 
 from __future__ import annotations
 
+import asyncio
+import time
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from google.genai import types
 
+from editorial_ai.caching import cache_manager as cache_module
 from editorial_ai.caching.cache_manager import (
     CHARS_PER_TOKEN_ESTIMATE,
     MIN_CACHE_TOKENS,
     CacheManager,
 )
+from editorial_ai.caching.registry import CacheRegistry
 
 
 @pytest.fixture
@@ -24,6 +30,8 @@ def mock_client():
     client.aio = MagicMock()
     client.aio.caches = MagicMock()
     client.aio.caches.create = AsyncMock()
+    client.aio.caches.update = AsyncMock()
+    client.aio.caches.delete = AsyncMock()
     return client
 
 
@@ -99,6 +107,20 @@ class TestGetOrCreateCreatesCache:
         assert result == "cachedContents/abc123"
 
 
+def _clock(monkeypatch: pytest.MonkeyPatch, start: float = 1_000_000.0) -> list[float]:
+    """Patch time.time() to a controllable clock; mutate now[0] to advance."""
+    now = [start]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def _named(name: str) -> MagicMock:
+    cache = MagicMock()
+    cache.name = name
+    cache.usage_metadata = None
+    return cache
+
+
 class TestGetOrCreateReusesExisting:
     @pytest.mark.asyncio
     async def test_second_call_reuses_cached(self, cache_manager, mock_client):
@@ -106,8 +128,6 @@ class TestGetOrCreateReusesExisting:
         mock_cache = MagicMock()
         mock_cache.name = "cachedContents/abc123"
         mock_client.aio.caches.create.return_value = mock_cache
-        # First call creates
-        mock_client.caches.get.return_value = mock_cache
 
         content = _long_content()
         await cache_manager.get_or_create(
@@ -120,14 +140,15 @@ class TestGetOrCreateReusesExisting:
         assert result == "cachedContents/abc123"
         # create called only once (first time)
         assert mock_client.aio.caches.create.call_count == 1
-        # get called once to verify existing cache
-        mock_client.caches.get.assert_called_once_with(name="cachedContents/abc123")
+        # expiry is tracked locally: no blocking verification call
+        mock_client.caches.get.assert_not_called()
 
 
 class TestGetOrCreateRecreatesExpired:
     @pytest.mark.asyncio
-    async def test_expired_cache_recreates(self, cache_manager, mock_client):
-        """If cache.get fails (expired), creates a new one."""
+    async def test_expired_cache_recreates(self, cache_manager, mock_client, monkeypatch):
+        """Once the locally tracked TTL runs out, creates a new one."""
+        now = _clock(monkeypatch)
         mock_cache = MagicMock()
         mock_cache.name = "cachedContents/first"
         mock_client.aio.caches.create.return_value = mock_cache
@@ -135,20 +156,108 @@ class TestGetOrCreateRecreatesExpired:
         content = _long_content()
         # First call creates
         await cache_manager.get_or_create(
-            cache_key="test-key", model="gemini-2.0-flash", contents=content
+            cache_key="test-key", model="gemini-2.0-flash", contents=content, ttl="600s"
         )
 
-        # Simulate expiration: get raises
-        mock_client.caches.get.side_effect = Exception("404 Not Found")
+        # Simulate expiration (within the safety margin counts as expired)
+        now[0] += 600 - cache_module.EXPIRY_MARGIN_S
         new_cache = MagicMock()
         new_cache.name = "cachedContents/second"
         mock_client.aio.caches.create.return_value = new_cache
 
         result = await cache_manager.get_or_create(
-            cache_key="test-key", model="gemini-2.0-flash", contents=content
+            cache_key="test-key", model="gemini-2.0-flash", contents=content, ttl="600s"
         )
         assert result == "cachedContents/second"
         assert mock_client.aio.caches.create.call_count == 2
+        mock_client.caches.get.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_of_other_keys_are_pruned(
+        self, cache_manager, mock_client, monkeypatch
+    ):
+        """Keys never looked up again do not accumulate once they expire."""
+        now = _clock(monkeypatch)
+        mock_client.aio.caches.create.return_value = MagicMock(usage_metadata=None)
+        content = _long_content()
+        for key in ("a", "b"):
+            await cache_manager.get_or_create(key, "gemini-2.0-flash", content, ttl="600s")
+
+        now[0] += 601
+        await cache_manager.get_or_create("c", "gemini-2.0-flash", content, ttl="600s")
+        assert list(cache_manager._active_caches) == [("c", "gemini-2.0-flash")]
+        mock_client.aio.caches.delete.assert_not_called()  # already gone server-side
+
+
+class TestHotKeyExtension:
+    @pytest.mark.asyncio
+    async def test_hot_key_near_expiry_is_extended_in_background(
+        self, cache_manager, mock_client, monkeypatch
+    ):
+        now = _clock(monkeypatch)
+        mock_client.aio.caches.create.return_value = _named("cachedContents/hot")
+        content = _long_content()
+        await cache_manager.get_or_create("k", "gemini-2.0-flash", content, ttl="1000s")
+
+        for _ in range(cache_module.HOT_HITS - 1):
+            await cache_manager.get_or_create("k", "gemini-2.0-flash", content, ttl="1000s")
+        mock_client.aio.caches.update.assert_not_called()  # plenty of TTL left
+
+        now[0] += 800
+        await cache_manager.get_or_create("k", "gemini-2.0-flash", content, ttl="1000s")
+        await asyncio.sleep(0)
+
+        mock_client.aio.caches.update.assert_awaited_once()
+        assert mock_client.aio.caches.update.call_args.kwargs["name"] == "cachedContents/hot"
+        # extended from "now": survives past the original expiry
+        now[0] += 500
+        result = await cache_manager.get_or_create("k", "gemini-2.0-flash", content, ttl="1000s")
+        assert result == "cachedContents/hot"
+        assert mock_client.aio.caches.create.call_count == 1
+
+
+class TestRegistryAndEviction:
+    @pytest.mark.asyncio
+    async def test_workers_share_caches_via_registry(self, mock_client, tmp_path: Path):
+        mock_client.aio.caches.create.return_value = _named("cachedContents/shared")
+        first = CacheManager(mock_client, registry=CacheRegistry(tmp_path / "caches.db"))
+        second = CacheManager(mock_client, registry=CacheRegistry(tmp_path / "caches.db"))
+
+        content = _long_content()
+        await first.get_or_create("k", "gemini-2.0-flash", content)
+        result = await second.get_or_create("k", "gemini-2.0-flash", content)
+
+        assert result == "cachedContents/shared"
+        assert mock_client.aio.caches.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_over_entry_cap(self, mock_client, tmp_path: Path):
+        registry = CacheRegistry(tmp_path / "caches.db")
+        manager = CacheManager(mock_client, registry=registry, max_entries=2)
+        mock_client.aio.caches.create.side_effect = [
+            _named(f"cachedContents/{i}") for i in range(3)
+        ]
+        content = _long_content()
+        for key in ("a", "b"):
+            await manager.get_or_create(key, "gemini-2.0-flash", content)
+        await manager.get_or_create("a", "gemini-2.0-flash", content)  # "b" is now LRU
+        await manager.get_or_create("c", "gemini-2.0-flash", content)
+
+        mock_client.aio.caches.delete.assert_awaited_once_with(name="cachedContents/1")
+        assert {e.cache_key for e in registry.entries()} == {"a", "c"}
+
+    @pytest.mark.asyncio
+    async def test_evicts_over_token_cap(self, mock_client):
+        manager = CacheManager(mock_client, max_tokens=8_000)
+        mock_client.aio.caches.create.side_effect = [
+            _named("cachedContents/a"), _named("cachedContents/b"),
+        ]
+        content = _long_content(20_000)  # ~5000 tokens each
+        await manager.get_or_create("a", "gemini-2.0-flash", content)
+        await manager.get_or_create("b", "gemini-2.0-flash", content)
+
+        mock_client.aio.caches.delete.assert_awaited_once_with(name="cachedContents/a")
 
 
 class TestGetOrCreateFireAndForget:
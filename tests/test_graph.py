@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import pytest
 from langgraph.graph.state import CompiledStateGraph
 
 from editorial_ai.graph import build_graph, graph
@@ -145,3 +148,57 @@ def test_graph_admin_revision_requested():
     result = test_graph.invoke(_initial_state())
     assert result["pipeline_status"] == "published"
     assert call_count["admin"] == 2
+
+
+@pytest.mark.usefixtures("no_node_logs")
+async def test_design_spec_and_source_run_in_parallel() -> None:
+    """design_spec and source overlap; editorial waits for both; wall time counted once."""
+    events: list[str] = []
+
+    async def curation(state: dict) -> dict:
+        return {"curated_topics": [{"keyword": "k"}], "pipeline_status": "sourcing"}
+
+    async def design_spec(state: dict) -> dict:
+        events.append("design_spec:start")
+        await asyncio.sleep(0.1)
+        events.append("design_spec:end")
+        return {"design_spec": {"theme": "x"}, "budget_status": "low"}
+
+    async def source(state: dict) -> dict:
+        events.append("source:start")
+        await asyncio.sleep(0.1)
+        events.append("source:end")
+        return {
+            "enriched_contexts": [{"k": 1}],
+            "pipeline_status": "drafting",
+            "budget_status": "ok",
+        }
+
+    async def editorial(state: dict) -> dict:
+        events.append("editorial")
+        assert state["design_spec"] and state["enriched_contexts"]
+        return {"current_draft": {"title": "t"}, "pipeline_status": "reviewing"}
+
+    async def stop(state: dict) -> dict:
+        return {"review_result": {"passed": False}, "revision_count": 3}
+
+    compiled = build_graph(
+        node_overrides={
+            "curation": curation,
+            "design_spec": design_spec,
+            "source": source,
+            "editorial": editorial,
+            "enrich": lambda state: {},
+            "review": stop,
+        }
+    )
+    result = await compiled.ainvoke({"thread_id": "par-1", "budget": {"max_wall_s": 600}})
+
+    assert events.index("source:start") < events.index("design_spec:end")
+    assert events.index("design_spec:start") < events.index("source:end")
+    assert events[-1] == "editorial"
+    assert result["budget_status"] == "low"  # most severe of the parallel writes
+    upstream = sum(
+        e["wall_s"] for e in result["budget_spent"] if e["node"] in ("design_spec", "source")
+    )
+    assert 0.09 < upstream < 0.15  # overlapping time charged once, not ~0.2s
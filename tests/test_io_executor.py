@@ -0,0 +1,122 @@
+"""Tests for the bounded I/O executor and the event-loop lag monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from editorial_ai.io_executor import get_io_executor, run_io, shutdown_io_executor
+from editorial_ai.observability.loop_monitor import LoopLagMonitor, percentile
+from editorial_ai.services import content_service
+
+_STALL_S = 0.05
+
+
+def _slow_write(path: Path, payload: str) -> None:
+    """Simulate a slow disk write (fsync on a busy volume)."""
+    time.sleep(_STALL_S)
+    path.write_text(payload, encoding="utf-8")
+
+
+async def _measure_p99(tmp_path: Path, *, offload: bool) -> float:
+    monitor = LoopLagMonitor(interval_s=0.005)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    for i in range(5):
+        target = tmp_path / f"{offload}-{i}.json"
+        if offload:
+            await run_io(_slow_write, target, "{}")
+        else:
+            _slow_write(target, "{}")
+        await asyncio.sleep(0.01)
+    await monitor.stop()
+    return monitor.snapshot()["p99_ms"]
+
+
+# ---------------------------------------------------------------------------
+# run_io
+# ---------------------------------------------------------------------------
+
+
+async def test_run_io_runs_off_loop_thread() -> None:
+    loop_thread = threading.get_ident()
+    worker_thread = await run_io(threading.get_ident)
+    assert worker_thread != loop_thread
+
+
+async def test_run_io_passes_kwargs(tmp_path: Path) -> None:
+    target = tmp_path / "a.txt"
+    await run_io(target.write_text, "hello", encoding="utf-8")
+    assert await run_io(target.read_text, encoding="utf-8") == "hello"
+
+
+async def test_shutdown_recreates_executor_lazily() -> None:
+    first = get_io_executor()
+    shutdown_io_executor()
+    assert get_io_executor() is not first
+    assert await run_io(lambda: 42) == 42
+
+
+# ---------------------------------------------------------------------------
+# Loop lag
+# ---------------------------------------------------------------------------
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 99) == 0.0
+
+
+async def test_offloaded_writes_cut_p99_loop_lag(tmp_path: Path) -> None:
+    """Blocking writes on the loop stall it; run_io keeps p99 lag low."""
+    blocking_p99 = await _measure_p99(tmp_path, offload=False)
+    offloaded_p99 = await _measure_p99(tmp_path, offload=True)
+
+    assert blocking_p99 >= _STALL_S * 1000 * 0.8
+    assert offloaded_p99 < blocking_p99 / 2
+
+
+async def test_monitor_stop_is_idempotent() -> None:
+    monitor = LoopLagMonitor(interval_s=0.001)
+    monitor.start()
+    await asyncio.sleep(0.01)
+    await monitor.stop()
+    await monitor.stop()
+    assert not monitor.running
+    assert monitor.snapshot()["samples"] > 0
+
+
+# ---------------------------------------------------------------------------
+# content_service uses the executor
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def contents_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    d = tmp_path / "contents"
+    monkeypatch.setattr(content_service, "_CONTENTS_DIR", d)
+    return d
+
+
+async def test_content_roundtrip_on_executor(contents_dir: Path) -> None:
+    saved = await content_service.save_pending_content(
+        thread_id="thread-io",
+        layout_json={"title": "T", "blocks": []},
+        title="T",
+        keyword="k",
+    )
+    assert (contents_dir / f"{saved['id']}.json").exists()
+
+    fetched = await content_service.get_content_by_thread_id("thread-io")
+    assert fetched is not None
+    assert fetched["id"] == saved["id"]
+
+    updated = await content_service.update_content_status(saved["id"], "approved")
+    assert updated["status"] == "approved"
+    assert await content_service.list_contents_count(status="approved") == 1
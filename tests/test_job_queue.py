@@ -0,0 +1,434 @@
+"""Tests for the durable pipeline job queue and worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from editorial_ai.api.app import app
+from editorial_ai.config import settings
+from editorial_ai.jobs import (
+    PIPELINE_RESUME,
+    PIPELINE_RUN,
+    Job,
+    JobWorkerPool,
+    LaneScheduler,
+    SqliteJobQueue,
+    backoff_s,
+    resume_pipeline_job,
+    run_pipeline_job,
+    saturated_tenants,
+)
+from editorial_ai.jobs import handlers as handlers_module
+
+# ---------------------------------------------------------------------------
+# Queue
+# ---------------------------------------------------------------------------
+
+
+async def test_claim_complete_lifecycle(job_queue: SqliteJobQueue) -> None:
+    job = await job_queue.enqueue(PIPELINE_RUN, "t1", {"initial_state": {"thread_id": "t1"}})
+
+    claimed = await job_queue.claim("w1", lease_s=60)
+    assert claimed is not None and claimed.id == job.id
+    assert (claimed.status, claimed.attempts, claimed.locked_by) == ("running", 1, "w1")
+    assert claimed.payload == {"initial_state": {"thread_id": "t1"}}
+    assert await job_queue.claim("w2", lease_s=60) is None  # leased to w1
+
+    assert await job_queue.complete(job.id, "w1")
+    assert (await job_queue.get(job.id)).status == "succeeded"
+    assert await job_queue.counts() == {"succeeded": 1}
+
+
+async def test_failed_attempts_back_off_then_fail(
+    job_queue: SqliteJobQueue, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "job_retry_backoff_s", 10)
+    monkeypatch.setattr(settings, "job_retry_backoff_max_s", 15)
+    job = await job_queue.enqueue(PIPELINE_RUN, "t1", {}, max_attempts=2)
+
+    await job_queue.claim("w1", lease_s=60)
+    assert await job_queue.fail(job.id, "w1", "boom")
+    retry = await job_queue.get(job.id)
+    assert (retry.status, retry.last_error) == ("queued", "boom")
+    assert retry.run_after >= time.time() + 9
+    assert await job_queue.claim("w1", lease_s=60) is None  # backing off
+
+    job_queue._connect().execute("UPDATE pipeline_jobs SET run_after = 0")  # backoff over
+    await job_queue.claim("w1", lease_s=60)
+    assert await job_queue.fail(job.id, "w1", "boom again")
+    assert (await job_queue.get(job.id)).status == "failed"
+    assert [backoff_s(n) for n in (1, 2, 3)] == [10, 15, 15]
+
+
+async def test_expired_lease_is_reclaimed(job_queue: SqliteJobQueue) -> None:
+    job = await job_queue.enqueue(PIPELINE_RUN, "t1", {}, max_attempts=2)
+    await job_queue.claim("dead-worker", lease_s=-1)  # lease already expired
+
+    reclaimed = await job_queue.claim("w2", lease_s=60)
+    assert reclaimed.id == job.id
+    assert (reclaimed.locked_by, reclaimed.attempts) == ("w2", 2)
+    assert not await job_queue.complete(job.id, "dead-worker")
+
+    # Final attempt dies too: failed instead of reclaimed forever
+    await job_queue.heartbeat(job.id, "w2", lease_s=-1)
+    assert await job_queue.claim("w3", lease_s=60) is None
+    failed = await job_queue.get(job.id)
+    assert (failed.status, failed.last_error) == ("failed", "lease expired on final attempt")
+
+
+async def test_release_keeps_attempts(job_queue: SqliteJobQueue) -> None:
+    job = await job_queue.enqueue(PIPELINE_RUN, "t1", {})
+    await job_queue.claim("w1", lease_s=60)
+    assert await job_queue.release(job.id, "w1")
+
+    again = await job_queue.claim("w2", lease_s=60)
+    assert again.attempts == 1
+
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+
+async def test_idempotency_key_dedups_until_failed(job_queue: SqliteJobQueue) -> None:
+    first = await job_queue.enqueue(PIPELINE_RESUME, "t1", {"n": 1}, idempotency_key="k")
+    again = await job_queue.enqueue(PIPELINE_RESUME, "t1", {"n": 2}, idempotency_key="k")
+    other = await job_queue.enqueue(PIPELINE_RESUME, "t1", {"n": 3})
+    assert (again.id, again.payload) == (first.id, {"n": 1})
+    assert other.id != first.id and other.idempotency_key is None
+    assert (await job_queue.get_by_key("k")).id == first.id
+
+    # A key whose job failed for good is given to the new request
+    job_queue._connect().execute("UPDATE pipeline_jobs SET status = 'failed', attempts = 3")
+    retry = await job_queue.enqueue(PIPELINE_RESUME, "t1", {"n": 4}, idempotency_key="k")
+    assert retry.id != first.id
+    assert (retry.status, retry.attempts, retry.payload) == ("queued", 0, {"n": 4})
+    assert await job_queue.get(first.id) is None
+
+
+async def test_pool_caps_concurrency(job_queue: SqliteJobQueue) -> None:
+    running, peak = 0, 0
+    gate = asyncio.Event()
+
+    async def handler(graph: object, job: Job) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await gate.wait()
+        running -= 1
+
+    pool = JobWorkerPool(
+        MagicMock(), queue=job_queue, concurrency=2, poll_interval_s=0.01,
+        handlers={"test": handler},
+    )
+    for i in range(5):
+        await job_queue.enqueue("test", f"t{i}", {})
+    pool.start()
+    try:
+        for _ in range(100):
+            if running == 2:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        assert running == peak == 2
+        gate.set()
+        for _ in range(200):
+            if (await job_queue.counts()).get("succeeded") == 5:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await pool.stop()
+    assert await job_queue.counts() == {"succeeded": 5}
+    assert peak == 2
+
+
+async def test_pool_retries_failures_and_releases_on_stop(job_queue: SqliteJobQueue) -> None:
+    started = asyncio.Event()
+
+    async def failing(graph: object, job: Job) -> None:
+        raise RuntimeError("db down")
+
+    async def slow(graph: object, job: Job) -> None:
+        started.set()
+        await asyncio.sleep(60)
+
+    pool = JobWorkerPool(
+        MagicMock(), queue=job_queue, concurrency=1, handlers={"fail": failing, "slow": slow}
+    )
+    failed = await job_queue.enqueue("fail", "t1", {})
+    assert (await pool.run_once()).id == failed.id
+    retry = await job_queue.get(failed.id)
+    assert (retry.status, retry.last_error) == ("queued", "RuntimeError: db down")
+
+    slow_job = await job_queue.enqueue("slow", "t2", {})
+    pool.start()
+    await asyncio.wait_for(started.wait(), 2)
+    await pool.stop()
+    released = await job_queue.get(slow_job.id)
+    assert (released.status, released.attempts) == ("queued", 0)
+
+
+async def test_lost_lease_cancels_handler(
+    job_queue: SqliteJobQueue, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cancelled = asyncio.Event()
+
+    async def slow(graph: object, job: Job) -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    pool = JobWorkerPool(
+        MagicMock(), queue=job_queue, concurrency=1, lease_s=0.15, handlers={"slow": slow}
+    )
+    job = await job_queue.enqueue("slow", "t1", {})
+    monkeypatch.setattr(job_queue, "heartbeat", AsyncMock(return_value=False))  # stolen
+
+    assert (await asyncio.wait_for(pool.run_once(), 2)).id == job.id
+    assert cancelled.is_set()
+    # Not ours any more: neither completed, failed nor released
+    assert (await job_queue.get(job.id)).status == "running"
+
+
+# ---------------------------------------------------------------------------
+# Pipeline handler: start or resume from checkpoint
+# ---------------------------------------------------------------------------
+
+
+def _graph(snapshot: object) -> MagicMock:
+    graph = MagicMock()
+    graph.aget_state = AsyncMock(return_value=snapshot)
+    graph.ainvoke = AsyncMock(return_value={})
+    return graph
+
+
+def _job(**payload: object) -> Job:
+    return Job(
+        id="j", kind=PIPELINE_RUN, thread_id="t1", payload=payload, status="running",
+        attempts=2, max_attempts=3, run_after=0,
+    )
+
+
+@pytest.mark.parametrize(
+    ("snapshot", "expected_input"),
+    [
+        (SimpleNamespace(values={}, next=(), tasks=()), {"thread_id": "t1"}),  # fresh
+        (SimpleNamespace(values={"x": 1}, next=("editorial",), tasks=()), None),  # crashed
+    ],
+)
+async def test_pipeline_job_starts_or_resumes(snapshot: object, expected_input: object) -> None:
+    graph = _graph(snapshot)
+    await run_pipeline_job(graph, _job(initial_state={"thread_id": "t1"}))
+
+    assert graph.ainvoke.call_args.args[0] == expected_input
+    assert graph.ainvoke.call_args.kwargs["config"] == {"configurable": {"thread_id": "t1"}}
+
+
+@pytest.mark.parametrize(
+    "snapshot",
+    [
+        SimpleNamespace(values={"x": 1}, next=(), tasks=()),  # finished
+        SimpleNamespace(  # waiting at admin_gate
+            values={"x": 1}, next=("admin_gate",), tasks=(SimpleNamespace(interrupts=("i",)),)
+        ),
+    ],
+)
+async def test_pipeline_job_skips_settled_threads(snapshot: object) -> None:
+    graph = _graph(snapshot)
+    await run_pipeline_job(graph, _job(initial_state={}))
+    graph.ainvoke.assert_not_called()
+
+
+_AT_GATE = SimpleNamespace(
+    values={"x": 1}, next=("admin_gate",), tasks=(SimpleNamespace(interrupts=("i",)),)
+)
+
+
+@pytest.mark.parametrize(
+    ("snapshot", "resumes"),
+    [
+        (_AT_GATE, True),
+        (SimpleNamespace(values={"x": 1}, next=("publish",), tasks=()), False),  # died mid-run
+    ],
+)
+async def test_resume_job_sends_decision_only_at_the_gate(
+    snapshot: object, resumes: bool
+) -> None:
+    graph = _graph(snapshot)
+    await resume_pipeline_job(graph, _job(resume={"decision": "approved"}))
+
+    graph_input = graph.ainvoke.call_args.args[0]
+    if resumes:
+        assert graph_input.resume == {"decision": "approved"}
+    else:
+        assert graph_input is None
+
+
+async def test_resume_job_skips_finished_threads() -> None:
+    graph = _graph(SimpleNamespace(values={"x": 1}, next=(), tasks=()))
+    await resume_pipeline_job(graph, _job(resume={"decision": "approved"}))
+    graph.ainvoke.assert_not_called()
+
+
+async def test_resume_job_final_failure_gives_decision_back(
+    monkeypatch: pytest.MonkeyPatch, run_status
+) -> None:
+    restore = AsyncMock()
+    monkeypatch.setattr(handlers_module, "update_content_status", restore)
+    monkeypatch.setattr(
+        handlers_module,
+        "get_content_by_id",
+        AsyncMock(return_value={"status": "approved", "updated_at": "v1"}),
+    )
+    await run_status.resuming("t1")
+    graph = _graph(_AT_GATE)
+    graph.ainvoke.side_effect = RuntimeError("publish down")
+    job = _job(resume={"decision": "approved"}, content_id="c1", previous_status="pending")
+
+    job.attempts = 1  # retries left: nothing undone yet
+    with pytest.raises(RuntimeError):
+        await resume_pipeline_job(graph, job)
+    restore.assert_not_called()
+
+    job.attempts = job.max_attempts
+    with pytest.raises(RuntimeError):
+        await resume_pipeline_job(graph, job)
+    restore.assert_called_once_with("c1", "pending", expected_updated_at="v1")
+    assert (await run_status.get("t1")).pipeline_status == "awaiting_approval"
+
+
+# ---------------------------------------------------------------------------
+# API
+# ---------------------------------------------------------------------------
+
+
+async def test_trigger_enqueues_instead_of_running(job_queue: SqliteJobQueue) -> None:
+    graph = _graph(None)
+    app.state.graph = graph
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/api/pipeline/trigger", json={"seed_keyword": "spring"})
+        job_id = resp.json()["job_id"]
+        job = await ac.get(f"/api/pipeline/jobs/{job_id}")
+        missing = await ac.get("/api/pipeline/jobs/nope")
+
+    assert resp.status_code == 200
+    graph.ainvoke.assert_not_called()
+    assert job.json()["status"] == "queued"
+    assert job.json()["thread_id"] == resp.json()["thread_id"]
+    assert missing.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Priority lanes, fair scheduling and tenant quotas
+# ---------------------------------------------------------------------------
+
+
+def test_lane_scheduler_shares_claims_by_weight() -> None:
+    scheduler = LaneScheduler({"interactive": 8, "standard": 3, "batch": 1})
+    claimed = []
+    for _ in range(24):  # every lane backed up
+        lane = scheduler.order()[0]
+        scheduler.charge(lane)
+        claimed.append(lane)
+    assert {lane: claimed.count(lane) for lane in set(claimed)} == {
+        "interactive": 16, "standard": 6, "batch": 2,
+    }
+
+
+
+def test_lane_scheduler_idle_lane_gets_no_banked_credit() -> None:
+    scheduler = LaneScheduler({"interactive": 1, "standard": 1, "batch": 1})
+    for _ in range(10):  # only interactive work for a while
+        scheduler.charge("interactive")
+
+    claimed = []
+    for _ in range(4):  # then batch work arrives too
+        lane = next(lane for lane in scheduler.order() if lane in {"interactive", "batch"})
+        scheduler.charge(lane)
+        claimed.append(lane)
+    assert claimed == ["batch", "interactive", "batch", "interactive"]
+
+
+async def test_claim_prefers_lanes_in_order(job_queue: SqliteJobQueue) -> None:
+    batch = await job_queue.enqueue(PIPELINE_RUN, "t1", {}, priority="batch")
+    interactive = await job_queue.enqueue(PIPELINE_RUN, "t2", {}, priority="interactive")
+
+    first = await job_queue.claim("w1", lease_s=60)
+    assert first.id == interactive.id  # default order: by priority
+    await job_queue.release(first.id, "w1")
+
+    first = await job_queue.claim("w1", lease_s=60, lanes=["batch", "interactive", "standard"])
+    assert (first.id, first.priority) == (batch.id, "batch")
+    assert first.started_at is not None and first.queue_wait_s >= 0
+
+
+async def test_tenant_quota_holds_jobs_back(
+    job_queue: SqliteJobQueue, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "job_tenant_quotas", {"fashion": 1})
+    running = await job_queue.enqueue(PIPELINE_RUN, "t1", {}, tenant="fashion")
+    await job_queue.enqueue(PIPELINE_RUN, "t2", {}, tenant="fashion")
+    beauty = await job_queue.enqueue(PIPELINE_RUN, "t3", {}, tenant="beauty")
+
+    assert (await job_queue.claim("w1", lease_s=60)).id == running.id
+    assert (await job_queue.claim("w2", lease_s=60)).id == beauty.id
+    assert await job_queue.claim("w3", lease_s=60) is None  # fashion at quota
+
+    await job_queue.complete(running.id, "w1")
+    assert (await job_queue.claim("w3", lease_s=60)).thread_id == "t2"
+    assert saturated_tenants({"fashion": 1, "beauty": 5}) == ["fashion"]
+
+
+async def test_lane_stats_report_queue_wait(job_queue: SqliteJobQueue) -> None:
+    job = await job_queue.enqueue(PIPELINE_RUN, "t1", {}, priority="interactive")
+    await job_queue.enqueue(PIPELINE_RUN, "t2", {}, priority="batch")
+    job_queue._connect().execute(
+        "UPDATE pipeline_jobs SET created_at = created_at - 30 WHERE id = ?", (job.id,)
+    )
+    await job_queue.claim("w1", lease_s=60)
+
+    stats = await job_queue.lane_stats(time.time() - 60)
+    assert stats["interactive"]["counts"] == {"running": 1}
+    assert stats["interactive"]["waits"][0] == pytest.approx(30, abs=1)
+    assert stats["batch"] == {"counts": {"queued": 1}, "waits": []}
+    assert stats["standard"] == {"counts": {}, "waits": []}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get("/api/observability/queue")
+    lanes = {lane["priority"]: lane for lane in resp.json()["lanes"]}
+    assert resp.status_code == 200
+    assert lanes["interactive"]["started"] == 1
+    assert lanes["interactive"]["wait_max_s"] == pytest.approx(30, abs=1)
+    assert lanes["batch"]["queued"] == 1
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        ({"seed_keyword": "spring"}, ("standard", "fashion")),
+        ({"seed_keyword": "spring", "priority": "batch", "tenant": "acme"}, ("batch", "acme")),
+    ],
+)
+async def test_trigger_sets_priority_and_tenant(
+    job_queue: SqliteJobQueue, body: dict, expected: tuple[str, str]
+) -> None:
+    app.state.graph = _graph(None)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/api/pipeline/trigger", json=body)
+        job = (await ac.get(f"/api/pipeline/jobs/{resp.json()['job_id']}")).json()
+
+    assert (job["priority"], job["tenant"]) == expected
+    queued = await job_queue.get(job["job_id"])
+    assert queued.payload["initial_state"]["priority"] == expected[0]
@@ -0,0 +1,174 @@
+"""Tests for the batched node log sink and gzip compaction."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from editorial_ai.observability import storage
+from editorial_ai.observability.log_sink import LogSink
+from editorial_ai.observability.models import NodeRunLog
+
+
+def _log(thread_id: str, node: str = "curation") -> NodeRunLog:
+    now = datetime.now(timezone.utc)
+    return NodeRunLog(
+        thread_id=thread_id, node_name=node, status="success", started_at=now, ended_at=now
+    )
+
+
+@pytest.fixture
+def log_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "data" / "logs"
+
+
+@pytest.fixture
+def sink(monkeypatch: pytest.MonkeyPatch) -> LogSink:
+    s = LogSink(batch_size=10, flush_interval_s=60, compact_after_days=0)
+    monkeypatch.setattr(storage, "get_log_sink", lambda: s)
+    return s
+
+
+# ---------------------------------------------------------------------------
+# Batching
+# ---------------------------------------------------------------------------
+
+
+async def test_sink_not_running_falls_back_to_direct_write(log_dir: Path, sink: LogSink) -> None:
+    await storage.append_node_log_async(_log("t1"))
+    assert len(storage.read_node_logs("t1")) == 1
+
+
+async def test_sink_batches_until_size(log_dir: Path, sink: LogSink) -> None:
+    sink.start()
+    try:
+        for _ in range(9):
+            await storage.append_node_log_async(_log("t1"))
+        await asyncio.sleep(0.05)
+        assert storage.read_node_logs("t1") == []
+
+        await storage.append_node_log_async(_log("t1"))
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if storage.read_node_logs("t1"):
+                break
+        assert len(storage.read_node_logs("t1")) == 10
+    finally:
+        await sink.stop()
+
+
+async def test_sink_flushes_on_interval(log_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    s = LogSink(batch_size=1000, flush_interval_s=0.02, compact_after_days=0)
+    monkeypatch.setattr(storage, "get_log_sink", lambda: s)
+    s.start()
+    try:
+        await storage.append_node_log_async(_log("t1"))
+        await asyncio.sleep(0.1)
+        assert len(storage.read_node_logs("t1")) == 1
+    finally:
+        await s.stop()
+
+
+async def test_async_read_sees_queued_logs(log_dir: Path, sink: LogSink) -> None:
+    sink.start()
+    try:
+        await storage.append_node_log_async(_log("t1", "curation"))
+        await storage.append_node_log_async(_log("t2"))
+        await storage.append_node_log_async(_log("t1", "editorial"))
+        logs = await storage.read_node_logs_async("t1")
+        assert [log.node_name for log in logs] == ["curation", "editorial"]
+    finally:
+        await sink.stop()
+
+
+async def test_flush_fsyncs_thread(
+    log_dir: Path, sink: LogSink, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    synced: list[int] = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd)))
+    sink.start()
+    try:
+        await storage.append_node_log_async(_log("t1"))
+        await storage.flush_node_logs("t1")
+        assert synced
+        assert len(storage.read_node_logs("t1")) == 1
+    finally:
+        await sink.stop()
+
+
+async def test_stop_drains_queue(log_dir: Path, sink: LogSink) -> None:
+    sink.start()
+    for i in range(25):
+        await storage.append_node_log_async(_log(f"t{i % 3}"))
+    await sink.stop()
+    assert not sink.running
+    total = sum(len(storage.read_node_logs(f"t{i}")) for i in range(3))
+    assert total == 25
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+
+def _age(path: Path, days: float) -> None:
+    old = time.time() - days * 86400
+    os.utime(path, (old, old))
+
+
+def test_compaction_gzips_old_threads_only(log_dir: Path) -> None:
+    storage.append_node_log(_log("old"))
+    storage.append_node_log(_log("new"))
+    _age(log_dir / "old.jsonl", 10)
+
+    assert storage.compact_old_logs(7) == 1
+    assert not (log_dir / "old.jsonl").exists()
+    assert (log_dir / "old.jsonl.gz").exists()
+    assert (log_dir / "new.jsonl").exists()
+    with gzip.open(log_dir / "old.jsonl.gz", "rt", encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+
+
+def test_read_merges_compacted_and_live(log_dir: Path) -> None:
+    storage.append_node_log(_log("t1", "curation"))
+    _age(log_dir / "t1.jsonl", 10)
+    storage.compact_old_logs(7)
+
+    # Resumed days later: new lines land in a fresh live file
+    storage.append_node_log(_log("t1", "publish"))
+    assert [log.node_name for log in storage.read_node_logs("t1")] == ["curation", "publish"]
+
+    # A second compaction merges into the existing archive
+    _age(log_dir / "t1.jsonl", 10)
+    storage.compact_old_logs(7)
+    assert not (log_dir / "t1.jsonl").exists()
+    assert [log.node_name for log in storage.read_node_logs("t1")] == ["curation", "publish"]
+
+
+def test_read_during_compaction_sees_each_log_once(
+    log_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage.append_node_log(_log("t1"))
+    _age(log_dir / "t1.jsonl", 10)
+    seen: list[int] = []
+    reader = threading.Thread(target=lambda: seen.append(len(storage.read_node_logs("t1"))))
+    real_replace = os.replace
+
+    def replace_then_read(src: Path, dst: Path) -> None:
+        real_replace(src, dst)
+        reader.start()  # both the .gz and the live file exist now
+        reader.join(0.2)
+
+    monkeypatch.setattr(storage.os, "replace", replace_then_read)
+    assert storage.compact_old_logs(7) == 1
+    reader.join(2)
+    assert seen == [1]
@@ -0,0 +1,187 @@
+"""Tests for the Prometheus metrics registry and instrumentation helpers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from langgraph.errors import GraphInterrupt
+
+from editorial_ai.api.app import app
+from editorial_ai.observability import (
+    harvest_tokens,
+    llm_call,
+    pipeline_run,
+    reset_token_collector,
+    supabase_query,
+)
+from editorial_ai.observability.metrics import (
+    LLM_CALL_DURATION,
+    LLM_TOKENS,
+    NODE_DURATION,
+    PIPELINES_IN_FLIGHT,
+    REGISTRY,
+    REVISION_LOOPS,
+    SUPABASE_QUERY_DURATION,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
+from editorial_ai.observability.node_wrapper import node_wrapper
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics(no_node_logs: None) -> None:
+    REGISTRY.clear()
+
+
+def _decision(model: str = "gemini-2.5-flash", reason: str = "default") -> SimpleNamespace:
+    return SimpleNamespace(model=model, reason=reason)
+
+
+def _response(prompt: int, completion: int, cached: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=prompt,
+            candidates_token_count=completion,
+            total_token_count=prompt + completion,
+            cached_content_token_count=cached,
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Registry / exposition format
+# ---------------------------------------------------------------------------
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    hist = registry.register(Histogram("t_seconds", "Test.", ("op",), buckets=(0.1, 1)))
+    child = hist.labels("read")
+    for value in (0.05, 0.1, 0.5, 5):
+        child.observe(value)
+
+    text = registry.render()
+    assert "# TYPE t_seconds histogram" in text
+    assert 't_seconds_bucket{op="read",le="0.1"} 2' in text
+    assert 't_seconds_bucket{op="read",le="1"} 3' in text
+    assert 't_seconds_bucket{op="read",le="+Inf"} 4' in text
+    assert 't_seconds_count{op="read"} 4' in text
+    assert 't_seconds_sum{op="read"} 5.65' in text
+
+
+def test_labels_returns_cached_child_and_clear_keeps_it_bound() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("t_events", "Test.", ("kind",)))
+    child = counter.labels("a")
+    assert counter.labels("a") is child
+    child.inc(3)
+    registry.clear()
+    child.inc()
+    assert 't_events_total{kind="a"} 1' in registry.render()
+
+
+def test_wrong_label_count_raises() -> None:
+    with pytest.raises(ValueError):
+        NODE_DURATION.labels("only-one")
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("t_esc", "Test.", ("v",)))
+    counter.labels('a"b\\c').inc()
+    assert 't_esc_total{v="a\\"b\\\\c"} 1' in registry.render()
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation
+# ---------------------------------------------------------------------------
+
+
+async def test_llm_call_records_latency_and_tokens() -> None:
+    reset_token_collector()
+    with llm_call("curation_research", _decision()) as call:
+        call.record(_response(1000, 200, cached=600))
+
+    (usage,) = harvest_tokens()
+    assert usage.route == "curation_research"
+    assert usage.routing_reason == "default"
+    assert usage.cached_tokens == 600
+    assert usage.latency_ms is not None and usage.latency_ms >= 0
+
+    assert LLM_CALL_DURATION.labels("gemini-2.5-flash", "curation_research", "ok").count == 1
+    assert LLM_TOKENS.labels("gemini-2.5-flash", "prompt_cached").sum == 600
+    assert LLM_TOKENS.labels("gemini-2.5-flash", "prompt_uncached").sum == 400
+    assert LLM_TOKENS.labels("gemini-2.5-flash", "completion").sum == 200
+
+
+async def test_llm_call_error_outcome_and_missing_usage() -> None:
+    reset_token_collector()
+    with pytest.raises(RuntimeError):
+        with llm_call("review", _decision()) as call:
+            call.record(SimpleNamespace(usage_metadata=None))
+            raise RuntimeError("boom")
+
+    assert harvest_tokens() == []
+    assert LLM_CALL_DURATION.labels("gemini-2.5-flash", "review", "error").count == 1
+
+
+async def test_supabase_query_outcomes() -> None:
+    with supabase_query("posts"):
+        pass
+    with pytest.raises(ValueError):
+        with supabase_query("posts"):
+            raise ValueError("bad filter")
+
+    assert SUPABASE_QUERY_DURATION.labels("posts", "ok").count == 1
+    assert SUPABASE_QUERY_DURATION.labels("posts", "error").count == 1
+
+
+async def test_pipeline_run_tracks_in_flight() -> None:
+    with pipeline_run():
+        assert PIPELINES_IN_FLIGHT.labels().value == 1
+    assert PIPELINES_IN_FLIGHT.labels().value == 0
+
+
+async def test_node_wrapper_feeds_duration_and_revision_loops() -> None:
+    async def review(state: dict) -> dict:
+        return {"revision_count": state.get("revision_count", 0) + 1}
+
+    def fail(state: dict) -> dict:
+        raise RuntimeError("x")
+
+    await node_wrapper("review")(review)({"thread_id": "t", "revision_count": 0})
+    with pytest.raises(RuntimeError):
+        await node_wrapper("editorial")(fail)({"thread_id": "t"})
+
+    assert NODE_DURATION.labels("review", "success").count == 1
+    assert NODE_DURATION.labels("editorial", "error").count == 1
+    assert REVISION_LOOPS.labels().value == 1
+
+
+async def test_node_wrapper_records_a_park_as_parked() -> None:
+    def admin_gate(state: dict) -> dict:
+        raise GraphInterrupt(())
+
+    with pytest.raises(GraphInterrupt):
+        await node_wrapper("admin_gate")(admin_gate)({"thread_id": "t"})
+
+    assert NODE_DURATION.labels("admin_gate", "parked").count == 1
+    assert NODE_DURATION.labels("admin_gate", "error").count == 0
+
+
+async def test_metrics_endpoint() -> None:
+    with supabase_query("celebs"):
+        pass
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'editorial_supabase_query_duration_seconds_count{table="celebs",outcome="ok"} 1' in (
+        resp.text
+    )
+    assert "# TYPE editorial_pipelines_in_flight gauge" in resp.text
@@ -0,0 +1,190 @@
+"""Tests for model health tracking and adaptive routing failover."""
+
+from __future__ import annotations
+
+import textwrap
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from editorial_ai.config import settings
+from editorial_ai.observability import llm_call
+from editorial_ai.routing import get_model_health
+from editorial_ai.routing.health import HealthPolicy, ModelHealthTracker, is_unavailable_error
+from editorial_ai.routing.model_router import ModelRouter, RoutingDecision
+from editorial_ai.services.editorial_service import EditorialService
+
+
+def _config(tmp_path: Path, *, enabled: bool) -> Path:
+    config = textwrap.dedent(f"""\
+        defaults:
+          model: "gemini-2.5-flash"
+
+        adaptive:
+          enabled: {str(enabled).lower()}
+          min_samples: 3
+          max_error_rate: 0.3
+
+        nodes:
+          review:
+            default_model: "gemini-2.5-flash"
+            candidates: ["gemini-2.5-flash", "gemini-2.5-flash-lite"]
+            latency_slo_ms: 1000
+    """)
+    path = tmp_path / "routing.yaml"
+    path.write_text(config)
+    return path
+
+
+def _fail(health: ModelHealthTracker, model: str, n: int = 5) -> None:
+    for _ in range(n):
+        health.observe(model, 100, "error")
+
+
+# ---------------------------------------------------------------------------
+# Health tracker
+# ---------------------------------------------------------------------------
+
+
+def test_ewma_latency_and_error_rate() -> None:
+    health = ModelHealthTracker(HealthPolicy(ewma_alpha=0.5))
+    health.observe("m", 100, "ok")
+    health.observe("m", 300, "ok")
+    health.observe("m", 900, "timeout")
+
+    h = health.snapshot()["m"]
+    assert h["latency_ms"] == pytest.approx(200)  # timeouts don't count toward latency
+    assert h["error_rate"] == pytest.approx(0.5)
+    assert h["timeout_rate"] == pytest.approx(0.5)
+    assert h["samples"] == 3
+
+
+def test_issue_thresholds() -> None:
+    health = ModelHealthTracker(HealthPolicy(min_samples=3))
+    _fail(health, "m", 2)
+    assert health.issue("m") is None  # too few samples
+
+    _fail(health, "m", 1)
+    assert health.issue("m") == "error_rate"
+
+    for _ in range(3):
+        health.observe("slow", 5_000, "ok")
+    assert health.issue("slow") is None
+    assert health.issue("slow", latency_slo_ms=1_000) == "slo"
+
+
+def test_idle_degraded_model_gets_a_probe(monkeypatch: pytest.MonkeyPatch) -> None:
+    health = ModelHealthTracker(HealthPolicy(min_samples=1, recovery_s=60))
+    _fail(health, "m")
+    assert health.issue("m") == "error_rate"
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert health.issue("m") is None
+
+
+def test_circuit_breaker_cooldown(monkeypatch: pytest.MonkeyPatch) -> None:
+    health = ModelHealthTracker()
+    health.mark_unavailable("m", "404", cooldown_s=30)
+    assert not health.is_available("m")
+    assert health.issue("m") == "unavailable"
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+    assert health.is_available("m")
+
+
+def test_is_unavailable_error() -> None:
+    err = RuntimeError("404 NOT_FOUND: model gemini-x is not found")
+    assert is_unavailable_error(err)
+    assert is_unavailable_error(type("E", (Exception,), {"code": 404})())
+    assert not is_unavailable_error(RuntimeError("503 overloaded"))
+
+
+# ---------------------------------------------------------------------------
+# Router failover
+# ---------------------------------------------------------------------------
+
+
+def test_adaptive_router_fails_over_on_error_rate(tmp_path: Path) -> None:
+    health = ModelHealthTracker()
+    router = ModelRouter(_config(tmp_path, enabled=True), health=health)
+    assert health.policy == HealthPolicy()  # loading a config leaves the tracker alone
+    router.apply_health_policy()
+    assert health.policy.min_samples == 3
+
+    _fail(health, "gemini-2.5-flash")
+    decision = router.resolve("review")
+
+    assert decision.model == "gemini-2.5-flash-lite"
+    assert decision.reason == "adaptive:error_rate"
+
+
+def test_adaptive_router_keeps_model_when_no_candidate_is_healthy(tmp_path: Path) -> None:
+    health = ModelHealthTracker()
+    router = ModelRouter(_config(tmp_path, enabled=True), health=health)
+    router.apply_health_policy()
+
+    _fail(health, "gemini-2.5-flash")
+    _fail(health, "gemini-2.5-flash-lite")
+
+    decision = router.resolve("review")
+    assert (decision.model, decision.reason) == ("gemini-2.5-flash", "default")
+
+
+def test_static_router_only_skips_unavailable_models(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "routing_adaptive", None)
+    health = ModelHealthTracker()
+    router = ModelRouter(_config(tmp_path, enabled=False), health=health)
+    assert router.adaptive is False
+
+    _fail(health, "gemini-2.5-flash")
+    assert router.resolve("review").model == "gemini-2.5-flash"
+
+    health.mark_unavailable("gemini-2.5-flash", "404")
+    decision = router.resolve("review")
+    assert decision.model == "gemini-2.5-flash-lite"
+    assert decision.reason == "adaptive:unavailable"
+
+
+def test_setting_overrides_yaml(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "routing_adaptive", True)
+    router = ModelRouter(_config(tmp_path, enabled=False), health=ModelHealthTracker())
+    assert router.adaptive is True
+
+
+# ---------------------------------------------------------------------------
+# Call outcomes
+# ---------------------------------------------------------------------------
+
+
+def test_llm_call_reports_outcomes() -> None:
+    decision = RoutingDecision(model="gemini-x", reason="default")
+    with llm_call("review", decision):
+        pass
+    with pytest.raises(RuntimeError), llm_call("review", decision):
+        raise RuntimeError("404 model gemini-x not found")
+
+    snapshot = get_model_health().snapshot()["gemini-x"]
+    assert snapshot["samples"] == 2
+    assert snapshot["available"] is False
+    assert "not found" in snapshot["unavailable_reason"]
+
+
+async def test_layout_image_fails_over_then_skips_unavailable_models() -> None:
+    client = MagicMock()
+    client.aio.models.generate_content = AsyncMock(
+        side_effect=RuntimeError("404 model is not supported")
+    )
+    service = EditorialService(client, image_model="gemini-img")
+
+    for _ in range(3):
+        assert await service.generate_layout_image("Y2K", "Y2K Revival", 4) is None
+
+    # 404 on the configured model, then on the routing candidate; then no more calls
+    models = [c.kwargs["model"] for c in client.aio.models.generate_content.call_args_list]
+    assert models == ["gemini-img", "gemini-2.5-flash-image"]
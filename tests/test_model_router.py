@@ -25,6 +25,7 @@ def tmp_config(tmp_path: Path) -> Path:
             upgrade_model: "gemini-2.5-pro"
             upgrade_conditions:
               min_revision_count: 2
+            budget_model: "gemini-2.5-flash-lite"
     """)
     config_path = tmp_path / "test_routing_config.yaml"
     config_path.write_text(config)
@@ -84,6 +85,27 @@ def test_routing_decision_has_reason(router: ModelRouter) -> None:
     assert router.resolve("upgradeable_node", revision_count=3).reason == "upgrade:revision>=2"
 
 
+def test_budget_low_suppresses_upgrade(router: ModelRouter) -> None:
+    """A low run budget keeps the default model instead of upgrading to Pro."""
+    decision = router.resolve("upgradeable_node", revision_count=2, budget_level="low")
+    assert decision.model == "gemini-2.5-flash"
+    assert decision.reason == "budget:no_upgrade"
+
+    ok = router.resolve("upgradeable_node", revision_count=2, budget_level="ok")
+    assert ok.model == "gemini-2.5-pro"
+
+
+def test_budget_critical_uses_budget_model(router: ModelRouter) -> None:
+    """A critical run budget switches to the route's budget_model when it has one."""
+    decision = router.resolve("upgradeable_node", budget_level="critical")
+    assert decision.model == "gemini-2.5-flash-lite"
+    assert decision.reason == "budget:critical"
+
+    no_budget_model = router.resolve("complex_node", budget_level="exhausted")
+    assert no_budget_model.model == "gemini-2.5-flash"
+    assert no_budget_model.reason == "default"
+
+
 def test_custom_config_path(tmp_path: Path) -> None:
     """Can load from a custom path with different defaults."""
     config = textwrap.dedent("""\
@@ -0,0 +1,194 @@
+"""Tests for node log snapshot modes and the node_wrapper integration."""
+
+from __future__ import annotations
+
+import base64
+import os
+import sys
+
+import pytest
+
+from editorial_ai.config import settings
+from editorial_ai.observability.models import NodeRunLog
+from editorial_ai.observability.node_wrapper import node_wrapper
+from editorial_ai.observability.snapshot import (
+    MAX_DIFF_OPS,
+    diff_snapshot,
+    full_snapshot,
+    json_size,
+    keys_snapshot,
+    resolve_snapshot_mode,
+    snapshot_input,
+    snapshot_output,
+    truncate,
+)
+
+
+def _large_state() -> dict:
+    """A late-pipeline state: long draft, enriched contexts and a layout image."""
+    image = base64.b64encode(os.urandom(200_000)).decode()
+    return {
+        "thread_id": "t-snap",
+        "curation_input": {"keyword": "minimal fashion"},
+        "curated_topics": [{"title": f"topic {i}", "summary": "x" * 2000} for i in range(20)],
+        "enriched_contexts": [{"post_id": i, "body": "y" * 3000} for i in range(30)],
+        "current_draft": {
+            "title": "Draft",
+            "blocks": [{"type": "body_text", "paragraphs": ["z" * 1500] * 4} for _ in range(12)],
+        },
+        "layout_image_base64": image,
+        "feedback_history": [{"revision": 1, "passed": False}],
+        "error_log": [],
+        "revision_count": 1,
+    }
+
+
+@pytest.fixture
+def captured(monkeypatch: pytest.MonkeyPatch) -> list[NodeRunLog]:
+    logs: list[NodeRunLog] = []
+
+    async def _capture(log: NodeRunLog) -> None:
+        logs.append(log)
+
+    # The package re-exports the decorator under the module's name
+    module = sys.modules["editorial_ai.observability.node_wrapper"]
+    monkeypatch.setattr(module, "append_node_log_async", _capture)
+    return logs
+
+
+# ---------------------------------------------------------------------------
+# Mode resolution
+# ---------------------------------------------------------------------------
+
+
+def test_resolve_mode_default_and_per_node(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "node_snapshot_mode", "keys")
+    monkeypatch.setattr(settings, "node_snapshot_modes", {"editorial": "diff"})
+    assert resolve_snapshot_mode("curation") == "keys"
+    assert resolve_snapshot_mode("editorial") == "diff"
+
+
+# ---------------------------------------------------------------------------
+# Snapshot shapes
+# ---------------------------------------------------------------------------
+
+
+def test_off_mode_records_nothing() -> None:
+    assert snapshot_input({"a": 1}, "off") is None
+    assert snapshot_output({"a": 1}, {}, "off") is None
+
+
+def test_keys_snapshot_summarises_types() -> None:
+    snap = keys_snapshot({"draft": {"a": 1, "b": 2}, "image": "x" * 10, "items": [1, 2, 3]})
+    assert snap == {"_keys": {"draft": "dict[2]", "image": "str[10]", "items": "list[3]"}}
+
+
+def test_truncate_caps_strings_lists_and_depth() -> None:
+    value = {"s": "a" * 50, "l": list(range(30)), "deep": {"x": {"y": {"z": 1}}}}
+    out = truncate(value, max_str=10, max_items=5, max_depth=2)
+    assert out["s"].startswith("a" * 10) and "+40 chars" in out["s"]
+    assert out["l"][:5] == [0, 1, 2, 3, 4]
+    assert out["l"][-1] == "…[+25 items]"
+    assert out["deep"]["x"] == "<dict with 1 keys>"
+
+
+def test_full_snapshot_matches_previous_behaviour() -> None:
+    assert full_snapshot({"b": b"raw", "n": 1}) == {"b": "b'raw'", "n": 1}
+
+
+def test_compact_modes_shrink_large_state_by_90_percent() -> None:
+    state = _large_state()
+    full_bytes = json_size(full_snapshot(state))
+    for mode in ("keys", "truncated", "diff"):
+        assert json_size(snapshot_input(state, mode)) < full_bytes * 0.1, mode
+
+
+# ---------------------------------------------------------------------------
+# Diff mode
+# ---------------------------------------------------------------------------
+
+
+def test_diff_reports_changed_paths_only() -> None:
+    previous = {
+        "current_draft": {"title": "Old", "blocks": [{"type": "hero"}, {"type": "body_text"}]},
+        "revision_count": 1,
+    }
+    output = {
+        "current_draft": {"title": "New", "blocks": [{"type": "hero"}], "tags": ["a"]},
+        "revision_count": 1,
+    }
+    snap = diff_snapshot(previous, output)
+    assert snap is not None
+    assert sorted(snap["_diff"], key=lambda op: op["path"]) == [
+        {"op": "remove", "path": "/current_draft/blocks/1"},
+        {"op": "add", "path": "/current_draft/tags", "value": ["a"]},
+        {"op": "replace", "path": "/current_draft/title", "value": "New"},
+    ]
+    assert snap["_unchanged"] == ["revision_count"]
+
+
+def test_diff_reports_reducer_keys_as_append() -> None:
+    previous = {"feedback_history": [{"revision": 1}]}
+    snap = diff_snapshot(previous, {"feedback_history": [{"revision": 2}]})
+    assert snap == {
+        "_diff": [{"op": "append", "path": "/feedback_history", "value": [{"revision": 2}]}]
+    }
+
+
+def test_diff_is_capped() -> None:
+    previous = {"items": list(range(MAX_DIFF_OPS * 2))}
+    output = {"items": [-1] * (MAX_DIFF_OPS * 2)}
+    snap = diff_snapshot(previous, output)
+    assert snap is not None
+    assert len(snap["_diff"]) == MAX_DIFF_OPS
+    assert snap["_diff_truncated"] is True
+
+
+# ---------------------------------------------------------------------------
+# node_wrapper integration
+# ---------------------------------------------------------------------------
+
+
+async def test_wrapper_records_mode_and_size(
+    captured: list[NodeRunLog], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "node_snapshot_modes", {"editorial": "diff"})
+    state = _large_state()
+
+    async def editorial(s: dict) -> dict:
+        return {"current_draft": {**s["current_draft"], "title": "Revised"}}
+
+    result = await node_wrapper("editorial")(editorial)(state)
+
+    assert result["current_draft"]["title"] == "Revised"
+    (log,) = captured
+    assert log.snapshot_mode == "diff"
+    assert log.output_state == {
+        "_diff": [{"op": "replace", "path": "/current_draft/title", "value": "Revised"}]
+    }
+    assert log.snapshot_bytes == json_size(log.input_state) + json_size(log.output_state)
+    assert log.snapshot_bytes < json_size(full_snapshot(state)) * 0.1
+
+
+async def test_wrapper_handles_sync_nodes_and_errors(
+    captured: list[NodeRunLog], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "node_snapshot_mode", "full")
+
+    def ok(s: dict) -> dict:
+        return {"revision_count": 2}
+
+    def boom(s: dict) -> dict:
+        raise ValueError("bad draft")
+
+    assert await node_wrapper("ok")(ok)({"thread_id": "t1"}) == {"revision_count": 2}
+    with pytest.raises(ValueError, match="bad draft"):
+        await node_wrapper("boom")(boom)({"thread_id": "t1"})
+
+    ok_log, err_log = captured
+    assert ok_log.status == "success"
+    assert ok_log.output_state == {"revision_count": 2}
+    assert err_log.status == "error"
+    assert err_log.error_type == "ValueError"
+    assert err_log.output_state is None
+    assert err_log.input_state == {"thread_id": "t1"}
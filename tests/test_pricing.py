@@ -0,0 +1,196 @@
+"""Tests for the price table and cost accounting on logs and summaries."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from editorial_ai.observability import harvest_tokens, llm_call, reset_token_collector
+from editorial_ai.observability.models import NodeRunLog, PipelineRunSummary, TokenUsage
+from editorial_ai.observability.pricing import PriceTable, get_price_table
+from editorial_ai.observability.stats_store import StatsStore
+
+_T0 = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def table() -> PriceTable:
+    return PriceTable()
+
+
+def test_flash_cost_with_cached_prompt(table: PriceTable) -> None:
+    cost = table.cost(
+        "gemini-2.5-flash", prompt_tokens=1_000_000, completion_tokens=100_000,
+        cached_tokens=400_000,
+    )
+    # 600k * 0.30 + 400k * 0.075 + 100k * 2.50 (per 1M)
+    assert cost == pytest.approx(0.18 + 0.03 + 0.25)
+
+
+def test_pro_long_context_rates(table: PriceTable) -> None:
+    short = table.cost("gemini-2.5-pro", prompt_tokens=200_000, completion_tokens=0)
+    long = table.cost("gemini-2.5-pro", prompt_tokens=200_001, completion_tokens=0)
+    assert short == pytest.approx(0.25)
+    assert long == pytest.approx(200_001 * 2.50 / 1_000_000)
+
+
+def test_image_model_bills_per_image(table: PriceTable) -> None:
+    cost = table.cost(
+        "gemini-2.0-flash-preview-image-generation",
+        prompt_tokens=1_000, completion_tokens=1_290 + 100, images=1,
+    )
+    assert cost == pytest.approx((1_000 * 0.10 + 100 * 0.40) / 1_000_000 + 0.039)
+
+
+def test_unknown_model_is_unpriced(table: PriceTable) -> None:
+    assert table.cost("gpt-x", prompt_tokens=10, completion_tokens=10) is None
+
+
+def test_custom_table_version(tmp_path: Path) -> None:
+    path = tmp_path / "pricing.yaml"
+    path.write_text(
+        "version: v2\nmodels:\n  m:\n    input: 1\n    output: 2\n", encoding="utf-8"
+    )
+    custom = PriceTable(path)
+    assert custom.version == "v2"
+    # cached_input defaults to the input rate
+    assert custom.cost("m", prompt_tokens=10, completion_tokens=0, cached_tokens=10) == (
+        pytest.approx(10 / 1_000_000)
+    )
+
+
+async def test_llm_call_records_cost_and_images() -> None:
+    part = SimpleNamespace(text=None, inline_data=SimpleNamespace(mime_type="image/png", data=b""))
+    response = SimpleNamespace(
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))],
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=1_000,
+            candidates_token_count=1_290,
+            total_token_count=2_290,
+            cached_content_token_count=0,
+        ),
+    )
+    decision = SimpleNamespace(model="gemini-2.0-flash-preview-image-generation", reason=None)
+
+    reset_token_collector()
+    with llm_call("editorial_layout_image", decision) as call:
+        call.record(response)
+    (usage,) = harvest_tokens()
+
+    assert usage.images == 1
+    assert usage.cost_usd == pytest.approx(1_000 * 0.10 / 1_000_000 + 0.039)
+    assert usage.price_version == get_price_table().version
+
+
+# ---------------------------------------------------------------------------
+# Logs and summaries
+# ---------------------------------------------------------------------------
+
+
+def _log(node: str, minute: int, cost: float | None, **kwargs) -> NodeRunLog:  # noqa: ANN003
+    started = _T0 + timedelta(minutes=minute)
+    usages = [TokenUsage(total_tokens=10, cost_usd=cost)] if cost is not None else []
+    return NodeRunLog(
+        thread_id="t1", node_name=node, status="success",
+        started_at=started, ended_at=started + timedelta(seconds=30),
+        token_usage=usages, **kwargs,
+    )
+
+
+def test_node_cost_sums_priced_calls() -> None:
+    log = NodeRunLog(
+        thread_id="t1", node_name="editorial", status="success",
+        started_at=_T0, ended_at=_T0,
+        token_usage=[TokenUsage(cost_usd=0.01), TokenUsage(cost_usd=None), {"cost_usd": 0.02}],
+    )
+    assert log.cost_usd == pytest.approx(0.03)
+
+
+def test_summary_cost_per_article_and_revision_loop() -> None:
+    logs = [
+        _log("curation", 0, 0.01),
+        _log("editorial", 1, 0.05),
+        _log("enrich", 2, None),
+        _log("review", 3, 0.02),
+        _log("editorial", 4, 0.20),  # revision loop 1 (pro upgrade)
+        _log("enrich", 5, None),
+        _log("review", 6, 0.04),
+        _log("admin_gate", 7, None),
+        _log("publish", 8, None, pipeline_status="published"),
+    ]
+    summary = PipelineRunSummary.from_logs("t1", logs)
+
+    assert summary.total_cost_usd == pytest.approx(0.32)
+    assert summary.published is True
+    assert summary.cost_per_published_article == pytest.approx(0.32)
+    assert summary.revision_loops == 1
+    assert summary.revision_cost_usd == pytest.approx(0.24)
+    assert summary.cost_per_revision_loop == pytest.approx(0.24)
+
+
+def test_summary_counts_revision_loops_per_fanout_branch() -> None:
+    logs = [_log("curation", 0, 0.01), _log("upstream_ready", 1, None)]
+    for topic in (0, 1, 2):  # branches interleave; only topic 1 is sent back
+        logs += [
+            _log("editorial", 2, 0.05, topic_index=topic),
+            _log("enrich", 3, None, topic_index=topic),
+            _log("review", 4, 0.02, topic_index=topic),
+        ]
+    logs += [
+        _log("editorial", 5, 0.20, topic_index=1),  # revision loop 1
+        _log("enrich", 6, None, topic_index=1),
+        _log("review", 7, 0.04, topic_index=1),
+        _log("collect_drafts", 8, None),
+    ]
+    summary = PipelineRunSummary.from_logs("t1", logs)
+
+    assert summary.revision_loops == 1
+    assert summary.revision_cost_usd == pytest.approx(0.24)
+
+
+def test_unpublished_run_has_no_article_cost() -> None:
+    summary = PipelineRunSummary.from_logs("t1", [_log("editorial", 0, 0.05)])
+    assert summary.cost_per_published_article is None
+    assert summary.cost_per_revision_loop is None
+
+
+# ---------------------------------------------------------------------------
+# Stats store
+# ---------------------------------------------------------------------------
+
+
+def test_stats_store_cost_totals_and_migration(tmp_path: Path) -> None:
+    db = tmp_path / "observability.db"
+    # A database created before cost columns existed
+    conn = sqlite3.connect(db)
+    conn.execute(
+        "CREATE TABLE daily_rollups (day TEXT NOT NULL, node_name TEXT NOT NULL, "
+        "model_name TEXT NOT NULL, routing_reason TEXT NOT NULL, runs INTEGER NOT NULL "
+        "DEFAULT 0, errors INTEGER NOT NULL DEFAULT 0, duration_ms_sum REAL NOT NULL "
+        "DEFAULT 0, llm_calls INTEGER NOT NULL DEFAULT 0, prompt_tokens INTEGER NOT NULL "
+        "DEFAULT 0, completion_tokens INTEGER NOT NULL DEFAULT 0, total_tokens INTEGER "
+        "NOT NULL DEFAULT 0, cached_tokens INTEGER NOT NULL DEFAULT 0, "
+        "PRIMARY KEY (day, node_name, model_name, routing_reason))"
+    )
+    conn.commit()
+    conn.close()
+
+    store = StatsStore(db)
+    try:
+        store.record_runs([
+            _log("editorial", 0, 0.05),
+            _log("publish", 1, None, pipeline_status="published"),
+            _log("editorial", 2, 0.30).model_copy(update={"thread_id": "t2"}),
+        ])
+        result = store.stats()
+    finally:
+        store.close()
+
+    (group,) = [g for g in result["groups"] if g["node_name"] == "editorial"]
+    assert group["cost_usd"] == pytest.approx(0.35)
+    assert result["totals"]["cost_usd"] == pytest.approx(0.35)
+    assert result["totals"]["cost_per_published_article"] == pytest.approx(0.05)
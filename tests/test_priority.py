@@ -0,0 +1,97 @@
+"""Tests for priority lanes at the LLM capacity gate."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from editorial_ai import priority as priority_module
+from editorial_ai.observability import llm_call, node_wrapper
+from editorial_ai.priority import LLMCapacityGate, current_priority, run_priority
+
+
+async def _wait_until(predicate) -> None:  # noqa: ANN001
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+async def test_gate_serves_interactive_before_batch() -> None:
+    gate = LLMCapacityGate(limit=1)
+    order: list[str] = []
+
+    async def call(lane: str) -> None:
+        await gate.acquire(lane)
+        order.append(lane)
+        gate.release()
+
+    await gate.acquire("batch")  # the only slot is busy
+    waiters = [asyncio.create_task(call(lane)) for lane in ("batch", "standard", "interactive")]
+    await _wait_until(lambda: gate.waiting == 3)
+    gate.release()
+    await asyncio.gather(*waiters)
+
+    assert order == ["interactive", "standard", "batch"]
+    assert gate.in_use == 0
+
+
+async def test_gate_reserves_slots_for_interactive() -> None:
+    gate = LLMCapacityGate(limit=3, reserved=1)
+    await gate.acquire("batch")
+    await gate.acquire("standard")
+
+    blocked = asyncio.create_task(gate.acquire("batch"))
+    await _wait_until(lambda: gate.waiting == 1)
+    assert await gate.acquire("interactive") == 0.0  # reserved slot, no wait
+    assert not blocked.done()
+
+    gate.release()
+    gate.release()
+    assert await blocked >= 0
+    assert gate.in_use == 2
+
+
+async def test_cancelled_waiter_gives_up_its_place() -> None:
+    gate = LLMCapacityGate(limit=1)
+    await gate.acquire("interactive")
+    cancelled = asyncio.create_task(gate.acquire("interactive"))
+    later = asyncio.create_task(gate.acquire("batch"))
+    await _wait_until(lambda: gate.waiting == 2)
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    gate.release()
+    await asyncio.wait_for(later, 1)
+    assert gate.in_use == 1
+
+
+@pytest.mark.usefixtures("no_node_logs")
+async def test_node_priority_reaches_llm_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    gate = LLMCapacityGate(limit=1)
+    monkeypatch.setattr(priority_module, "_gate_instance", gate)
+    seen: list[str] = []
+
+    async def acquire(lane: str) -> float:
+        seen.append(lane)
+        return await LLMCapacityGate.acquire(gate, lane)
+
+    monkeypatch.setattr(gate, "acquire", acquire)
+
+    async def node(state: dict) -> dict:
+        decision = SimpleNamespace(model="gemini-2.5-flash", reason="default")
+        async with llm_call("review", decision):
+            assert gate.in_use == 1
+        return {}
+
+    await node_wrapper("review")(node)({"thread_id": "t1", "priority": "interactive"})
+    await node_wrapper("review")(node)({"thread_id": "t2"})
+
+    assert seen == ["interactive", "standard"]
+    assert gate.in_use == 0
+    with run_priority("bogus"):
+        assert current_priority() == "standard"
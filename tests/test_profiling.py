@@ -0,0 +1,128 @@
+"""Tests for on-demand node profiling and the profile artifact API."""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from editorial_ai.api.app import app
+from editorial_ai.config import settings
+from editorial_ai.jobs import get_job_queue
+from editorial_ai.observability.models import NodeRunLog
+from editorial_ai.observability.node_wrapper import node_wrapper
+from editorial_ai.observability.profiling import NodeProfiler, collapsed_stacks
+
+
+@pytest.fixture
+def captured(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[NodeRunLog]:
+    monkeypatch.chdir(tmp_path)
+    logs: list[NodeRunLog] = []
+
+    async def _capture(log: NodeRunLog) -> None:
+        logs.append(log)
+
+    module = sys.modules["editorial_ai.observability.node_wrapper"]
+    monkeypatch.setattr(module, "append_node_log_async", _capture)
+    return logs
+
+
+def _busy(n: int) -> list[str]:
+    return [str(i) * 10 for i in range(n)]
+
+
+def _outer() -> int:
+    return len(_busy(20_000))
+
+
+def test_collapsed_stacks_follow_call_edges() -> None:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    _outer()
+    profiler.disable()
+
+    lines = collapsed_stacks(pstats.Stats(profiler))
+    busy = [line for line in lines if ":_busy:" in line]
+    assert busy
+    stack, weight = busy[0].rsplit(" ", 1)
+    assert ":_outer:" in stack.split(";")[-2]
+    assert int(weight) > 0
+
+
+async def test_profiled_run_writes_artifacts(captured: list[NodeRunLog]) -> None:
+    async def editorial(state: dict) -> dict:
+        _outer()
+        return {}
+
+    await node_wrapper("editorial")(editorial)({"thread_id": "t-prof", "profile": True})
+
+    (log,) = captured
+    assert log.profile is not None
+    assert log.profile.peak_memory_bytes > 0
+    d = Path("data/logs/profiles/t-prof")
+    assert (d / log.profile.pstats_file).exists()
+    collapsed = (d / log.profile.collapsed_file).read_text()
+    assert ":_busy:" in collapsed
+    pstats.Stats(str(d / log.profile.pstats_file))  # loadable
+
+
+async def test_unprofiled_and_disabled_runs_skip_profiling(
+    captured: list[NodeRunLog], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def curation(state: dict) -> dict:
+        return {}
+
+    wrapped = node_wrapper("curation")(curation)
+    await wrapped({"thread_id": "t-plain"})
+    monkeypatch.setattr(settings, "profiling_enabled", False)
+    await wrapped({"thread_id": "t-off", "profile": True})
+
+    assert [log.profile for log in captured] == [None, None]
+    assert not Path("data/logs/profiles").exists()
+
+
+def test_only_one_profiler_at_a_time() -> None:
+    first = NodeProfiler("t1", "editorial")
+    second = NodeProfiler("t2", "editorial")
+    assert first.start()
+    try:
+        assert not second.start()
+    finally:
+        first.stop()
+    assert second.start()
+    second.stop()
+
+
+async def test_trigger_header_and_artifact_api(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post(
+            "/api/pipeline/trigger",
+            json={"seed_keyword": "spring"},
+            headers={"X-Profile": "1"},
+        )
+        thread_id = resp.json()["thread_id"]
+
+        d = Path("data/logs/profiles") / thread_id
+        d.mkdir(parents=True)
+        (d / "review-1700000000000.collapsed").write_text("a;b 10\n")
+        listing = await ac.get(f"/api/pipeline/profiles/{thread_id}")
+        artifact = await ac.get(f"/api/pipeline/profiles/{thread_id}/review-1700000000000.collapsed")
+        missing = await ac.get(f"/api/pipeline/profiles/{thread_id}/nope.prof")
+
+    assert resp.json()["profiling"] is True
+    job = await get_job_queue().get(resp.json()["job_id"])
+    assert job.payload["initial_state"]["profile"] is True
+
+    (entry,) = listing.json()["artifacts"]
+    assert entry["node_name"] == "review"
+    assert entry["format"] == "collapsed"
+    assert artifact.text == "a;b 10\n"
+    assert missing.status_code == 404
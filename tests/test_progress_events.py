@@ -0,0 +1,216 @@
+"""Tests for live progress events and the SSE stream."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from langgraph.errors import GraphInterrupt
+
+from editorial_ai.api.app import app
+from editorial_ai.jobs import Job, JobWorkerPool, SqliteJobQueue
+from editorial_ai.observability import events as events_module
+from editorial_ai.observability import node_wrapper
+from editorial_ai.observability.events import EventBus, ProgressEvent
+from editorial_ai.observability.run_status import RunStatusRegistry
+
+
+@pytest.fixture
+def bus(monkeypatch: pytest.MonkeyPatch) -> EventBus:
+    bus = EventBus(bridge=False)
+    monkeypatch.setattr(events_module, "_bus_instance", bus)
+    return bus
+
+
+async def _until(predicate) -> None:  # noqa: ANN001
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+async def test_subscribers_get_their_threads_events(bus: EventBus) -> None:
+    with bus.subscribe("t1") as sub, bus.subscribe("t2") as other:
+        bus.publish(ProgressEvent("t1", "node_started", "curation"))
+        bus.publish(ProgressEvent("t1", "status", "curation", {"pipeline_status": "sourcing"}))
+
+        assert (await sub.get(1)).type == "node_started"
+        assert (await sub.get(1)).data == {"pipeline_status": "sourcing"}
+        assert await other.get(0.01) is None
+    assert bus.subscriber_count("t1") == 0
+    assert bus.last_status("t1").data["pipeline_status"] == "sourcing"
+
+
+async def test_slow_subscriber_drops_oldest(bus: EventBus) -> None:
+    bus.max_queue = 2
+    with bus.subscribe("t1") as sub:
+        for node in ("a", "b", "c"):
+            bus.publish(ProgressEvent("t1", "node_started", node))
+        assert [(await sub.get(1)).node_name for _ in range(2)] == ["b", "c"]
+        assert sub.dropped == 1
+
+
+async def test_bridge_skips_own_notifications(bus: EventBus) -> None:
+    with bus.subscribe("t1") as sub:
+        own = ProgressEvent("t1", "node_started", "a", origin=bus.origin)
+        bus.receive(own.to_json())
+        bus.receive(ProgressEvent("t1", "node_started", "b", origin="worker-2").to_json())
+        bus.receive("not json")
+        assert (await sub.get(1)).node_name == "b"
+        assert await sub.get(0.01) is None
+
+
+@pytest.mark.usefixtures("no_node_logs")
+async def test_node_wrapper_publishes_progress(bus: EventBus) -> None:
+    async def review(state: dict) -> dict:
+        return {"pipeline_status": "failed", "error_log": ["review: bad json"]}
+
+    async def boom(state: dict) -> dict:
+        raise RuntimeError("kaboom")
+
+    state = {"thread_id": "t1", "pipeline_status": "reviewing"}
+    with bus.subscribe("t1") as sub:
+        await node_wrapper("review")(review)(state)
+        with pytest.raises(RuntimeError):
+            await node_wrapper("editorial")(boom)(state)
+        received = []
+        while (event := await sub.get(0.01)) is not None:
+            received.append(event)
+
+    assert [(e.type, e.node_name) for e in received] == [
+        ("node_started", "review"),
+        ("node_finished", "review"),
+        ("error", "review"),
+        ("status", "review"),
+        ("node_started", "editorial"),
+        ("node_finished", "editorial"),
+        ("error", "editorial"),
+    ]
+    assert received[1].data["status"] == "success"
+    assert received[1].data["total_tokens"] == 0
+    assert received[3].data == {"pipeline_status": "failed", "previous": "reviewing"}
+    assert received[6].data == {"error_type": "RuntimeError", "message": "kaboom"}
+
+
+@pytest.mark.usefixtures("no_node_logs")
+async def test_interrupt_is_not_published_as_error(bus: EventBus) -> None:
+    async def admin_gate(state: dict) -> dict:
+        raise GraphInterrupt(())
+
+    with bus.subscribe("t1") as sub:
+        with pytest.raises(GraphInterrupt):
+            await node_wrapper("admin_gate")(admin_gate)({"thread_id": "t1"})
+        received = []
+        while (event := await sub.get(0.01)) is not None:
+            received.append(event)
+
+    assert [e.type for e in received] == ["node_started", "node_finished"]
+    assert received[1].data["status"] == "success"
+
+
+async def test_final_job_failure_settles_the_stream(
+    bus: EventBus, job_queue: SqliteJobQueue, run_status: RunStatusRegistry
+) -> None:
+    async def failing(graph: object, job: Job) -> None:
+        raise RuntimeError("node blew up")
+
+    pool = JobWorkerPool(MagicMock(), queue=job_queue, concurrency=1, handlers={"fail": failing})
+    await job_queue.enqueue("fail", "t1", {}, max_attempts=2)
+    with bus.subscribe("t1") as sub:
+        await pool.run_once()
+        assert await sub.get(0.01) is None  # retried: not settled yet
+        job_queue._connect().execute("UPDATE pipeline_jobs SET run_after = 0")  # backoff over
+        await pool.run_once()
+        event = await sub.get(1)
+
+    assert event.settled
+    assert event.data == {"pipeline_status": "failed", "previous": None}
+    status = await run_status.get("t1")
+    assert status.pipeline_status == "failed"
+    assert status.errors == ["job fail failed: RuntimeError: node blew up"]
+
+
+async def test_stream_endpoint_relays_until_settled(bus: EventBus) -> None:
+    bus.publish(ProgressEvent("t1", "status", "curation", {"pipeline_status": "drafting"}))
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        request = asyncio.create_task(ac.get("/api/pipeline/stream/t1"))
+        await _until(lambda: bus.subscriber_count("t1") == 1)
+        bus.publish(ProgressEvent("t1", "node_finished", "review", {"total_tokens": 42}))
+        bus.publish(
+            ProgressEvent("t1", "status", "review", {"pipeline_status": "awaiting_approval"})
+        )
+        resp = await asyncio.wait_for(request, 5)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    messages = [m for m in resp.text.split("\n\n") if m]
+    events = [dict(line.split(": ", 1) for line in m.splitlines()) for m in messages]
+    assert [(e["id"], e["event"]) for e in events] == [
+        ("1", "status"), ("2", "node_finished"), ("3", "status"),
+    ]
+    assert json.loads(events[1]["data"])["total_tokens"] == 42
+    assert bus.subscriber_count("t1") == 0
+
+
+class _FakePostgres:
+    """Just enough of LISTEN/NOTIFY for two buses to talk through it."""
+
+    def __init__(self) -> None:
+        self.listeners: list[asyncio.Queue[str]] = []
+
+    def connect(self) -> object:
+        server = self
+
+        class Conn:
+            def __init__(self) -> None:
+                self.inbox: asyncio.Queue[str] = asyncio.Queue()
+
+            async def __aenter__(self) -> Conn:
+                return self
+
+            async def __aexit__(self, *exc: object) -> None:
+                if self.inbox in server.listeners:
+                    server.listeners.remove(self.inbox)
+
+            async def execute(self, sql: str, params: tuple = ()) -> None:
+                if sql.startswith("LISTEN"):
+                    server.listeners.append(self.inbox)
+                else:
+                    for inbox in server.listeners:
+                        inbox.put_nowait(params[1])
+
+            async def notifies(self):  # noqa: ANN202
+                while True:
+                    yield SimpleNamespace(payload=await self.inbox.get())
+
+        async def _connect() -> Conn:
+            return Conn()
+
+        return _connect
+
+
+async def test_bridge_delivers_across_processes() -> None:
+    server = _FakePostgres()
+    api = EventBus(bridge=True, conninfo="postgresql://fake")
+    worker = EventBus(bridge=True, conninfo="postgresql://fake")
+    for bus in (api, worker):
+        bus._connect = server.connect()
+        bus.start()
+    try:
+        await _until(lambda: len(server.listeners) == 2)
+        with api.subscribe("t1") as sub, worker.subscribe("t1") as local:
+            worker.publish(ProgressEvent("t1", "node_started", "editorial"))
+            remote = await sub.get(2)
+            assert (remote.node_name, remote.origin) == ("editorial", worker.origin)
+            assert (await local.get(1)).node_name == "editorial"
+            assert await local.get(0.05) is None  # own notification skipped
+    finally:
+        await api.stop()
+        await worker.stop()
@@ -0,0 +1,179 @@
+"""Tests for static-prefix prompt assembly and per-route cached-token stats."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from editorial_ai.api.app import app
+from editorial_ai.caching import CacheManager
+from editorial_ai.caching import cache_manager as cache_module
+from editorial_ai.caching.cache_manager import min_cache_tokens
+from editorial_ai.config import settings
+from editorial_ai.observability import stats_store as stats_module
+from editorial_ai.observability.models import NodeRunLog, TokenUsage
+from editorial_ai.observability.stats_store import StatsStore
+from editorial_ai.prompts.assembly import PromptParts, assemble
+from editorial_ai.prompts.editorial import (
+    build_content_generation_prompt_parts,
+    build_layout_parsing_prompt_parts,
+)
+from editorial_ai.prompts.review import build_review_prompt_parts
+from editorial_ai.rubrics import ContentType, get_rubric
+from editorial_ai.services.editorial_service import BLOCK_TYPES
+from editorial_ai.services.review_service import ReviewService
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    client = MagicMock()
+    client.aio.caches.create = AsyncMock(return_value=MagicMock(name="c", usage_metadata=None))
+    client.aio.caches.create.return_value.name = "cachedContents/prefix"
+    client.aio.models.generate_content = AsyncMock(return_value=MagicMock(text="{}"))
+    return client
+
+
+@pytest.fixture
+def manager(client: MagicMock, monkeypatch: pytest.MonkeyPatch) -> CacheManager:
+    manager = CacheManager(client)
+    monkeypatch.setattr(cache_module, "_manager_instance", manager)
+    return manager
+
+
+@pytest.fixture
+def small_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Let the short test prefixes qualify for explicit caching."""
+    monkeypatch.setattr(cache_module, "MIN_CACHE_TOKENS", 1)
+    monkeypatch.setattr(cache_module, "MIN_CACHE_TOKENS_BY_MODEL", {})
+
+
+def test_static_prefix_does_not_depend_on_inputs() -> None:
+    rubric = get_rubric(ContentType.FASHION_MAGAZINE)
+    a = build_review_prompt_parts('{"title": "A"}', "[]", rubric_config=rubric)
+    b = build_review_prompt_parts('{"title": "B"}', "[1]", rubric_config=rubric)
+    content = build_content_generation_prompt_parts("Y2K", "trend")
+    layout = build_layout_parsing_prompt_parts("Y2K", ["hero"])
+
+    assert a.prefix == b.prefix and a.prefix_key == b.prefix_key
+    assert a.suffix != b.suffix
+    assert a.text.startswith(a.prefix) and a.text.endswith(a.suffix)
+    assert "Y2K" not in content.prefix + layout.prefix
+    assert "Y2K" in content.suffix and "Y2K" in layout.suffix
+
+
+async def test_small_prefix_sent_in_full(client: MagicMock, manager: CacheManager) -> None:
+    parts = PromptParts("static", "dynamic")
+    assembled = await assemble("review", "gemini-2.5-flash", parts, client=client)
+
+    assert assembled.contents == parts.text
+    assert assembled.cached_content is None
+    client.aio.caches.create.assert_not_called()
+
+
+async def test_threshold_uses_token_estimate_of_real_prefixes(
+    client: MagicMock, manager: CacheManager
+) -> None:
+    rubric = get_rubric(ContentType.FASHION_MAGAZINE)
+    review = build_review_prompt_parts('{"title": "A"}', "[]", rubric_config=rubric)
+    layout = build_layout_parsing_prompt_parts("Y2K", BLOCK_TYPES)
+
+    assert min_cache_tokens("models/gemini-2.5-flash-lite") == 1024
+    assert min_cache_tokens("gemini-2.0-flash") == cache_module.MIN_CACHE_TOKENS
+    flash = await assemble("editorial_layout_parse", "gemini-2.5-flash", layout, client=client)
+    pro = await assemble("editorial_layout_parse", "gemini-2.5-pro", layout, client=client)
+    small = await assemble("review", "gemini-2.5-flash", review, client=client)
+
+    assert (flash.contents, flash.cached_content) == (layout.suffix, "cachedContents/prefix")
+    assert pro.cached_content is None and small.cached_content is None
+    client.aio.caches.create.assert_awaited_once()
+
+
+async def test_large_prefix_cached_once_per_model(
+    client: MagicMock, manager: CacheManager, small_threshold: None
+) -> None:
+    model = "gemini-2.5-flash"
+    first = await assemble("review", model, PromptParts("static", "one"), client=client)
+    second = await assemble("review", model, PromptParts("static", "two"), client=client)
+
+    assert (first.contents, first.cached_content) == ("one", "cachedContents/prefix")
+    assert second.contents == "two"
+    assert second.prompt == PromptParts("static", "two").text
+    client.aio.caches.create.assert_awaited_once()
+    assert client.aio.caches.create.call_args.kwargs["config"].display_name.startswith(
+        "prefix:review:"
+    )
+
+
+async def test_explicit_cache_skipped_when_incompatible_or_disabled(
+    client: MagicMock,
+    manager: CacheManager,
+    small_threshold: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    parts = PromptParts("static", "dynamic")
+    schema_call = await assemble(
+        "editorial_content", "m", parts, client=client, explicit_cache=False
+    )
+    monkeypatch.setattr(settings, "prompt_prefix_cache_enabled", False)
+    disabled = await assemble("review", "m", parts, client=client)
+
+    assert schema_call.cached_content is None and disabled.cached_content is None
+    assert schema_call.contents == disabled.contents == parts.text
+    client.aio.caches.create.assert_not_called()
+
+
+async def test_review_sends_only_suffix_with_cached_rubric(
+    client: MagicMock, manager: CacheManager, small_threshold: None
+) -> None:
+    service = ReviewService(client)
+    await service.evaluate_with_llm('{"title": "A"}', "[]")
+
+    kwargs = client.aio.models.generate_content.call_args.kwargs
+    assert kwargs["config"].cached_content == "cachedContents/prefix"
+    assert kwargs["contents"].startswith("## 에디토리얼 초안")
+    assert "## 평가 기준" not in kwargs["contents"]
+
+
+async def test_cache_stats_per_route(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = StatsStore(tmp_path / "observability.db")
+    monkeypatch.setattr(stats_module, "_store", store)
+    now = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+
+    def usage(route: str, prompt: int, cached: int) -> TokenUsage:
+        return TokenUsage(
+            prompt_tokens=prompt, total_tokens=prompt, cached_tokens=cached,
+            model_name="gemini-2.5-flash", route=route,
+        )
+
+    store.record_runs([
+        NodeRunLog(
+            thread_id="t", node_name="editorial", status="success", started_at=now, ended_at=now,
+            token_usage=[
+                usage("editorial_content", 1000, 0), usage("editorial_layout_parse", 800, 600)
+            ],
+        ),
+        NodeRunLog(
+            thread_id="t", node_name="review", status="success", started_at=now, ended_at=now,
+            token_usage=[usage("review", 2000, 1500), usage("review", 2000, 1500)],
+        ),
+    ])
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get(
+            "/api/observability/cache", params={"since": "2026-03-01", "until": "2026-03-31"}
+        )
+    store.close()
+
+    assert resp.status_code == 200
+    body = resp.json()
+    by_route = {r["route"]: r for r in body["routes"]}
+    assert by_route["review"]["llm_calls"] == 2
+    assert by_route["review"]["cache_hit_ratio"] == 0.75
+    assert by_route["editorial_content"]["cache_hit_ratio"] == 0.0
+    assert body["cached_tokens"] == 3600
+    assert body["cache_hit_ratio"] == round(3600 / 5800, 4)
@@ -0,0 +1,133 @@
+"""Tests for the prompt budgeter, prompt-size routing and prompt_chars logging."""
+
+from __future__ import annotations
+
+import json
+import textwrap
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from editorial_ai.observability.collector import harvest_prompt_trims, reset_prompt_trims
+from editorial_ai.observability.models import NodeRunLog, SpanRecord
+from editorial_ai.prompts.budgeter import (
+    ContextChunk,
+    estimate_tokens,
+    fit_context,
+    query_terms,
+)
+from editorial_ai.routing import ModelRouter, RoutingConfigError
+from editorial_ai.routing import model_router as router_module
+from editorial_ai.services.review_service import ReviewService
+
+_CONFIG = textwrap.dedent("""\
+    nodes:
+      editorial_content:
+        default_model: "gemini-2.5-flash"
+        max_prompt_tokens: {budget}
+      review:
+        default_model: "gemini-2.5-flash"
+        upgrade_model: "gemini-2.5-pro"
+        upgrade_conditions:
+          min_revision_count: 2
+        max_prompt_tokens: {budget}
+        small_prompt_model: "gemini-2.5-flash-lite"
+        small_prompt_max_tokens: 1000
+""")
+
+
+@pytest.fixture
+def router(monkeypatch: pytest.MonkeyPatch) -> ModelRouter:
+    router = ModelRouter(data=_CONFIG.format(budget=60))
+    monkeypatch.setattr(router_module, "_router_instance", router)
+    return router
+
+
+def test_estimate_tokens() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("a" * 400) == 100
+    # Hangul is denser than Latin text
+    assert estimate_tokens("가" * 150) == 100
+
+
+def test_fit_context_keeps_required_and_most_relevant(router: ModelRouter) -> None:
+    chunks = [
+        ContextChunk("Y2K revival background", required=True),
+        ContextChunk("unrelated " * 40),
+        ContextChunk("low-rise Y2K denim " * 10),
+        ContextChunk("Keywords: Y2K, denim", required=True),
+    ]
+    reset_prompt_trims()
+    fit = fit_context("editorial_content", chunks, terms=query_terms("Y2K denim"))
+
+    assert fit.text.splitlines() == [chunks[0].text, chunks[2].text, chunks[3].text]
+    assert fit.dropped == 1
+    assert fit.chars_after < fit.chars_before
+    (trim,) = harvest_prompt_trims()
+    assert trim == {
+        "route": "editorial_content",
+        "chars_before": fit.chars_before,
+        "chars_after": fit.chars_after,
+        "dropped_chunks": 1,
+    }
+
+
+def test_fit_context_untouched_under_budget(router: ModelRouter) -> None:
+    chunks = [ContextChunk("short"), ContextChunk("context")]
+    reset_prompt_trims()
+    fit = fit_context("editorial_content", chunks, terms=set())
+    unbudgeted = fit_context("design_spec", chunks * 100, terms=set())
+
+    assert fit.text == "short\ncontext"
+    assert not fit.trimmed and not unbudgeted.trimmed
+    assert harvest_prompt_trims() == []
+
+
+def test_small_prompts_route_to_lite(router: ModelRouter) -> None:
+    small = router.resolve("review", prompt_tokens=800)
+    large = router.resolve("review", prompt_tokens=5000)
+    upgraded = router.resolve("review", revision_count=2, prompt_tokens=800)
+
+    assert (small.model, small.reason) == ("gemini-2.5-flash-lite", "prompt_tokens<=1000")
+    assert large.reason == "default"
+    assert upgraded.model == "gemini-2.5-pro"
+
+
+def test_small_prompt_settings_must_pair() -> None:
+    with pytest.raises(RoutingConfigError):
+        ModelRouter(data="nodes:\n  review:\n    default_model: m\n    small_prompt_model: l\n")
+
+
+def test_node_log_prompt_chars_from_spans_and_trims() -> None:
+    now = datetime(2026, 3, 2, tzinfo=UTC)
+    log = NodeRunLog(
+        thread_id="t", node_name="editorial", status="success", started_at=now, ended_at=now,
+        spans=[
+            SpanRecord(span_id=1, name="editorial_content", kind="llm", started_at=now,
+                       request_chars=1200),
+            SpanRecord(span_id=2, name="posts", kind="supabase", started_at=now,
+                       request_chars=50),
+        ],
+        prompt_trims=[{"route": "editorial_content", "chars_before": 2000, "chars_after": 1000}],
+    )
+    assert log.prompt_chars == 1200
+    assert log.prompt_chars_untrimmed == 2200
+
+
+async def test_review_trims_topics_and_routes_by_size(router: ModelRouter) -> None:
+    client = MagicMock()
+    client.aio.models.generate_content = AsyncMock(return_value=MagicMock(text="{}"))
+    service = ReviewService(client)
+    topics = [
+        {"keyword": "Y2K", "trend_background": "primary topic"},
+        {"keyword": "gorpcore", "trend_background": "x" * 2000},
+    ]
+    draft = {"keyword": "Y2K", "title": "Y2K Revival"}
+
+    await service.evaluate(draft, topics)
+
+    kwargs = client.aio.models.generate_content.call_args.kwargs
+    assert json.dumps(topics[0], ensure_ascii=False) in kwargs["contents"]
+    assert "gorpcore" not in kwargs["contents"]
+    assert kwargs["model"] == "gemini-2.5-flash-lite"
@@ -0,0 +1,130 @@
+"""Tests for replaying a run from a chosen node with memoized upstream outputs."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from langgraph.checkpoint.memory import MemorySaver
+
+from editorial_ai.api.app import app
+from editorial_ai.graph import build_graph
+from editorial_ai.jobs import PIPELINE_REPLAY, SqliteJobQueue, replay_pipeline_job
+from editorial_ai.replay import plan_replay, state_hash
+
+pytestmark = pytest.mark.usefixtures("no_node_logs")
+
+
+def _counting_graph(calls: Counter) -> object:
+    async def curation(state: dict) -> dict:
+        calls["curation"] += 1
+        return {"curated_topics": [{"keyword": "k"}], "pipeline_status": "sourcing"}
+
+    async def design_spec(state: dict) -> dict:
+        calls["design_spec"] += 1
+        return {"design_spec": {"theme": "x"}}
+
+    async def source(state: dict) -> dict:
+        calls["source"] += 1
+        return {"enriched_contexts": [{"post_id": "p1"}], "pipeline_status": "drafting"}
+
+    async def editorial(state: dict) -> dict:
+        calls["editorial"] += 1
+        title = f"v{calls['editorial']}"
+        return {"current_draft": {"title": title}, "pipeline_status": "reviewing"}
+
+    async def enrich(state: dict) -> dict:
+        calls["enrich"] += 1
+        return {}
+
+    async def review(state: dict) -> dict:
+        calls["review"] += 1
+        return {
+            "review_result": {"passed": False},
+            "revision_count": 3,
+            "pipeline_status": "failed",
+        }
+
+    return build_graph(
+        node_overrides={
+            "curation": curation,
+            "design_spec": design_spec,
+            "source": source,
+            "editorial": editorial,
+            "enrich": enrich,
+            "review": review,
+        },
+        checkpointer=MemorySaver(),
+    )
+
+
+def test_state_hash_ignores_volatile_keys() -> None:
+    base = {"curated_topics": [{"keyword": "k"}], "thread_id": "a", "budget_spent": [{"x": 1}]}
+    assert state_hash(base) == state_hash({**base, "thread_id": "b", "budget_spent": []})
+    assert state_hash(base) != state_hash({**base, "curated_topics": []})
+
+
+async def test_replay_reuses_upstream_and_recomputes_from_node(
+    job_queue: SqliteJobQueue,
+) -> None:
+    calls: Counter = Counter()
+    graph = _counting_graph(calls)
+    initial = {"thread_id": "src", "curation_input": {"seed_keyword": "k"}}
+    initial["budget"] = {"max_wall_s": 600}  # spend ledger differs between the runs
+    await graph.ainvoke(initial, config={"configurable": {"thread_id": "src"}})
+
+    plan = await plan_replay(graph, "src", "editorial")
+    assert plan.reused_nodes == ["curation", "design_spec", "source"]
+    assert plan.initial_state["thread_id"] == "src"
+
+    job = await job_queue.enqueue(
+        PIPELINE_REPLAY,
+        "fork",
+        {
+            "initial_state": {**plan.initial_state, "thread_id": "fork"},
+            "source_thread_id": "src",
+            "from_node": "editorial",
+        },
+    )
+    await replay_pipeline_job(graph, job)
+
+    assert calls == Counter(
+        curation=1, design_spec=1, source=1, editorial=2, enrich=2, review=2
+    )
+    forked = await graph.aget_state({"configurable": {"thread_id": "fork"}})
+    assert forked.values["thread_id"] == "fork"
+    assert forked.values["enriched_contexts"] == [{"post_id": "p1"}]
+    assert forked.values["current_draft"] == {"title": "v2"}
+
+
+async def test_replay_endpoint_validates_and_queues(job_queue: SqliteJobQueue) -> None:
+    calls: Counter = Counter()
+    graph = _counting_graph(calls)
+    await graph.ainvoke(
+        {"thread_id": "src", "curation_input": {}, "priority": "batch"},
+        config={"configurable": {"thread_id": "src"}},
+    )
+    app.state.graph = graph
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        unknown = await ac.post(
+            "/api/pipeline/replay", json={"thread_id": "src", "from_node": "nope"}
+        )
+        missing = await ac.post(
+            "/api/pipeline/replay", json={"thread_id": "gone", "from_node": "review"}
+        )
+        resp = await ac.post(
+            "/api/pipeline/replay", json={"thread_id": "src", "from_node": "review"}
+        )
+
+    assert unknown.status_code == 422
+    assert missing.status_code == 404
+    assert resp.status_code == 202
+    body = resp.json()
+    assert body["reused_nodes"] == ["curation", "design_spec", "editorial", "enrich", "source"]
+    job = await job_queue.claim("w1", lease_s=60)
+    assert (job.kind, job.thread_id, job.priority) == (PIPELINE_REPLAY, body["thread_id"], "batch")
+    assert job.payload["initial_state"]["thread_id"] == body["thread_id"]
+    assert job.payload["from_node"] == "review"
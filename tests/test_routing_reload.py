@@ -0,0 +1,247 @@
+"""Tests for routing config hot reload, version stamps and per-run overrides."""
+
+from __future__ import annotations
+
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from editorial_ai.api.app import app
+from editorial_ai.config import settings
+from editorial_ai.jobs import get_job_queue
+from editorial_ai.observability import harvest_tokens, llm_call, reset_token_collector
+from editorial_ai.observability.models import NodeRunLog
+from editorial_ai.observability.node_wrapper import node_wrapper
+from editorial_ai.routing import (
+    ModelRouter,
+    RoutingConfigError,
+    get_model_health,
+    get_model_router,
+    reload_model_router,
+    route_overrides,
+)
+from editorial_ai.routing import model_router as router_module
+from editorial_ai.routing.health import HealthPolicy
+from editorial_ai.routing.watcher import RoutingConfigWatcher
+
+_CONFIG = textwrap.dedent("""\
+    defaults:
+      model: "gemini-2.5-flash"
+
+    nodes:
+      review:
+        default_model: "{review}"
+      editorial_content:
+        default_model: "gemini-2.5-flash"
+""")
+
+
+def _write(path: Path, review: str = "gemini-2.5-flash") -> str:
+    text = _CONFIG.format(review=review)
+    path.write_text(text)
+    return text
+
+
+@pytest.fixture
+def config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "routing.yaml"
+    _write(path)
+    monkeypatch.setattr(settings, "routing_config_path", str(path))
+    monkeypatch.setattr(router_module, "_router_instance", None)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Validation and swap
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "nodes: [",
+        "nodes: {}",
+        "nodes:\n  review:\n    default_model: ''\n",
+        "nodes:\n  review:\n    default_model: m\n    upgrade_modle: p\n",
+        "nodes:\n  review:\n    default_model: m\n    latency_slo_ms: -1\n",
+        "adaptive:\n  max_error_rate: high\nnodes:\n  review:\n    default_model: m\n",
+    ],
+)
+def test_invalid_config_rejected(text: str) -> None:
+    with pytest.raises(RoutingConfigError):
+        ModelRouter(data=text)
+
+
+def test_reload_swaps_router_and_version(config: Path) -> None:
+    before = get_model_router()
+    assert before.resolve("review").version == before.version
+
+    _write(config, review="gemini-2.5-flash-lite")
+    after = reload_model_router()
+
+    assert get_model_router() is after
+    assert after.version != before.version
+    assert after.resolve("review").model == "gemini-2.5-flash-lite"
+    # Decisions already handed out keep the old router's answer
+    assert before.resolve("review").model == "gemini-2.5-flash"
+
+
+def test_invalid_reload_keeps_current_router(config: Path) -> None:
+    current = get_model_router()
+    config.write_text("nodes: {}\n")
+
+    with pytest.raises(RoutingConfigError):
+        reload_model_router()
+    assert get_model_router() is current
+
+
+def test_only_the_installed_config_sets_the_health_policy(config: Path) -> None:
+    get_model_router()
+    assert get_model_health().policy == HealthPolicy()
+
+    config.write_text("adaptive:\n  min_samples: 7\n" + _CONFIG.format(review="m"))
+    ModelRouter(config)  # loading alone leaves the shared tracker alone
+    assert get_model_health().policy == HealthPolicy()
+
+    reload_model_router()
+    assert get_model_health().policy.min_samples == 7
+
+
+async def test_watcher_reloads_on_change(config: Path) -> None:
+    watcher = RoutingConfigWatcher(interval_s=1)  # never started: no baseline yet
+    assert await watcher.check()
+    assert not await watcher.check()  # unchanged
+    current = get_model_router()
+
+    config.write_text("nodes: {}\n")
+    assert not await watcher.check()  # invalid: rejected
+    assert get_model_router() is current
+
+    _write(config, review="gemini-2.5-pro")
+    assert await watcher.check()
+    assert get_model_router().resolve("review").model == "gemini-2.5-pro"
+
+
+# ---------------------------------------------------------------------------
+# Version stamp and overrides
+# ---------------------------------------------------------------------------
+
+
+def test_version_recorded_on_token_usage(config: Path) -> None:
+    decision = get_model_router().resolve("review")
+    response = MagicMock()
+    response.usage_metadata.prompt_token_count = 10
+    response.usage_metadata.candidates_token_count = 5
+    response.usage_metadata.total_token_count = 15
+    response.usage_metadata.cached_content_token_count = 0
+
+    reset_token_collector()
+    with llm_call("review", decision) as call:
+        call.record(response)
+    (usage,) = harvest_tokens()
+
+    assert usage.routing_reason == "default"
+    assert usage.routing_version == get_model_router().version
+
+
+def test_overrides_beat_routing(config: Path) -> None:
+    router = get_model_router()
+    with route_overrides({"review": "gemini-2.5-pro"}):
+        decision = router.resolve("review", budget_level="exhausted")
+        untouched = router.resolve("editorial_content")
+    assert (decision.model, decision.reason) == ("gemini-2.5-pro", "override")
+    assert untouched.reason == "default"
+    assert router.resolve("review").model == "gemini-2.5-flash"
+
+
+async def test_node_wrapper_applies_run_overrides(
+    config: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def _capture(log: NodeRunLog) -> None:
+        pass
+
+    module = sys.modules["editorial_ai.observability.node_wrapper"]
+    monkeypatch.setattr(module, "append_node_log_async", _capture)
+
+    async def review(state: dict) -> dict:
+        return {"model": get_model_router().resolve("review").model}
+
+    wrapped = node_wrapper("review")(review)
+    result = await wrapped(
+        {"thread_id": "t", "model_overrides": {"review": "gemini-2.5-flash-lite"}}
+    )
+    assert result["model"] == "gemini-2.5-flash-lite"
+
+
+# ---------------------------------------------------------------------------
+# API
+# ---------------------------------------------------------------------------
+
+
+async def test_routing_admin_api(config: Path) -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        current = (await ac.get("/api/observability/routing")).json()
+        dry = await ac.post(
+            "/api/observability/routing/reload",
+            json={"config": _CONFIG.format(review="gemini-2.5-pro"), "dry_run": True},
+        )
+        bad = await ac.post("/api/observability/routing/reload", json={"config": "nodes: {}"})
+        applied = await ac.post(
+            "/api/observability/routing/reload",
+            json={"config": _CONFIG.format(review="gemini-2.5-flash-lite")},
+        )
+
+    assert current["routes"]["review"]["default_model"] == "gemini-2.5-flash"
+    assert dry.json()["applied"] is False
+    assert dry.json()["routes"]["review"]["default_model"] == "gemini-2.5-pro"
+    assert bad.status_code == 422
+    assert applied.status_code == 200
+    assert applied.json()["version"] == get_model_router().version != current["version"]
+    assert "gemini-2.5-flash-lite" in config.read_text()
+
+
+async def test_routing_api_never_overwrites_packaged_config(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "routing_config_path", None)
+    monkeypatch.setattr(router_module, "_router_instance", None)
+    packaged = router_module._DEFAULT_CONFIG_PATH.read_bytes()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post(
+            "/api/observability/routing/reload",
+            json={"config": _CONFIG.format(review="gemini-2.5-flash-lite")},
+        )
+        dry = await ac.post(
+            "/api/observability/routing/reload",
+            json={"config": _CONFIG.format(review="gemini-2.5-pro"), "dry_run": True},
+        )
+
+    assert resp.status_code == 409
+    assert "ROUTING_CONFIG_PATH" in resp.json()["detail"]
+    assert dry.status_code == 200
+    assert router_module._DEFAULT_CONFIG_PATH.read_bytes() == packaged
+
+
+async def test_trigger_validates_and_stores_overrides(config: Path) -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        bad = await ac.post(
+            "/api/pipeline/trigger",
+            json={"seed_keyword": "spring", "model_overrides": {"reveiw": "m"}},
+        )
+        ok = await ac.post(
+            "/api/pipeline/trigger",
+            json={"seed_keyword": "spring", "model_overrides": {"review": "gemini-2.5-pro"}},
+        )
+
+    assert bad.status_code == 422
+    assert ok.status_code == 200
+    job = await get_job_queue().get(ok.json()["job_id"])
+    assert job.payload["initial_state"]["model_overrides"] == {"review": "gemini-2.5-pro"}
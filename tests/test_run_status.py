@@ -0,0 +1,180 @@
+"""Tests for the run status registry and the status endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import interrupt
+
+from editorial_ai.api.app import app
+from editorial_ai.observability import node_wrapper
+from editorial_ai.observability.run_status import (
+    RunStatus,
+    RunStatusRegistry,
+    SqliteRunStatusStore,
+)
+from editorial_ai.state import EditorialPipelineState
+
+
+@pytest.mark.usefixtures("no_node_logs")
+async def test_node_wrapper_tracks_status(run_status: RunStatusRegistry) -> None:
+    seen: list[RunStatus] = []
+
+    async def review(state: dict) -> dict:
+        seen.append(await run_status.get("t1"))
+        return {
+            "pipeline_status": "drafting",
+            "revision_count": 1,
+            "error_log": ["review: failed"],
+        }
+
+    async def boom(state: dict) -> dict:
+        raise RuntimeError("kaboom")
+
+    state = {
+        "thread_id": "t1",
+        "pipeline_status": "reviewing",
+        "current_draft": {"title": "x"},
+        "error_log": ["curation: retry"],
+    }
+    await node_wrapper("review")(review)(state)
+
+    assert (seen[0].current_node, seen[0].node_state) == ("review", "running")
+    status = await run_status.get("t1")
+    assert status.pipeline_status == "drafting"
+    assert (status.current_node, status.node_state) == ("review", "done")
+    assert (status.revision_count, status.error_count, status.has_draft) == (1, 2, True)
+    assert status.errors == ["curation: retry", "review: failed"]
+
+    with pytest.raises(RuntimeError):
+        await node_wrapper("editorial")(boom)({**state, "pipeline_status": "drafting"})
+    status = await run_status.get("t1")
+    assert (status.node_state, status.error_count) == ("error", 2)
+    assert status.errors[-1] == "editorial: RuntimeError: kaboom"
+    assert status.started_at == seen[0].started_at
+
+
+async def test_reads_refresh_from_table_after_ttl(tmp_path) -> None:  # noqa: ANN001
+    path = tmp_path / "shared.db"
+    api = RunStatusRegistry(SqliteRunStatusStore(path), ttl_s=60)
+    worker = RunStatusRegistry(SqliteRunStatusStore(path))
+    try:
+        await worker.put(RunStatus("t1", pipeline_status="curating"))
+        assert (await api.get("t1")).pipeline_status == "curating"
+
+        await worker.put(RunStatus("t1", pipeline_status="reviewing"))
+        assert (await api.get("t1")).pipeline_status == "curating"  # cached
+        api.ttl_s = 0
+        assert (await api.get("t1")).pipeline_status == "reviewing"
+
+        # An older row never replaces a newer local record
+        stale = RunStatus("t1", pipeline_status="curating", updated_at=time.time() - 60)
+        await worker.store.upsert([stale])
+        assert (await api.get("t1")).pipeline_status == "reviewing"
+        assert await api.get("nope") is None
+    finally:
+        await api.stop()
+        await worker.stop()
+
+
+async def test_flusher_batches_writes(tmp_path) -> None:  # noqa: ANN001
+    store = SqliteRunStatusStore(tmp_path / "rs.db")
+    registry = RunStatusRegistry(store, flush_interval_s=3600)
+    registry.start()
+    await registry.put(RunStatus("t1", pipeline_status="curating"))
+    await registry.put(RunStatus("t1", pipeline_status="sourcing"))
+    assert await store.get_many(["t1"]) == {}  # not flushed yet
+    assert (await registry.get("t1")).pipeline_status == "sourcing"
+
+    await registry.stop()  # flushes
+    assert (await SqliteRunStatusStore(store.path).get_many(["t1"]))["t1"].pipeline_status == (
+        "sourcing"
+    )
+
+
+async def test_status_endpoints_read_registry(run_status: RunStatusRegistry) -> None:
+    graph = MagicMock()
+    graph.aget_state = AsyncMock(
+        side_effect=[
+            SimpleNamespace(values={"pipeline_status": "published", "current_draft": {}}),
+            SimpleNamespace(values={}),
+        ]
+    )
+    app.state.graph = graph
+    await run_status.put(RunStatus("t1", pipeline_status="reviewing", current_node="review"))
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        one = await ac.get("/api/pipeline/status/t1")
+        bulk = await ac.get("/api/pipeline/status", params={"ids": "t1,t2,t1"})
+        old = await ac.get("/api/pipeline/status/old-run")  # predates the registry
+        unknown = await ac.get("/api/pipeline/status/nope")
+        queued = await ac.post("/api/pipeline/trigger", json={"seed_keyword": "spring"})
+        queued_status = await ac.get(f"/api/pipeline/status/{queued.json()['thread_id']}")
+
+    assert one.json()["pipeline_status"] == "reviewing"
+    assert one.json()["current_node"] == "review"
+    assert [s["thread_id"] for s in bulk.json()["statuses"]] == ["t1"]
+    assert bulk.json()["missing"] == ["t2"]
+    assert old.json()["pipeline_status"] == "published"
+    assert old.json()["has_draft"] is True
+    assert (await run_status.get("old-run")).pipeline_status == "published"
+    assert unknown.status_code == 404
+    assert graph.aget_state.await_count == 2  # only the two registry misses
+    assert queued_status.json()["pipeline_status"] == "queued"
+
+
+@pytest.mark.usefixtures("no_node_logs")
+async def test_overlapping_nodes_keep_running_state(run_status: RunStatusRegistry) -> None:
+    release = asyncio.Event()
+
+    async def slow(state: dict) -> dict:
+        await release.wait()
+        return {"pipeline_status": "drafting"}
+
+    async def fast(state: dict) -> dict:
+        return {}
+
+    state = {"thread_id": "t1", "pipeline_status": "sourcing"}
+    task = asyncio.create_task(node_wrapper("source")(slow)(state))
+    await asyncio.sleep(0.01)
+    await node_wrapper("design_spec")(fast)(state)
+
+    status = await run_status.get("t1")
+    assert (status.current_node, status.node_state) == ("source", "running")
+
+    release.set()
+    await task
+    status = await run_status.get("t1")
+    assert (status.current_node, status.node_state) == ("source", "done")
+    assert status.pipeline_status == "drafting"
+
+
+@pytest.mark.usefixtures("no_node_logs")
+async def test_interrupt_parks_without_error(run_status: RunStatusRegistry) -> None:
+    async def admin_gate(state: dict) -> dict:
+        decision = interrupt({"content_id": "c1"})
+        return {"admin_decision": decision}
+
+    builder = StateGraph(EditorialPipelineState)
+    builder.add_node("admin_gate", node_wrapper("admin_gate")(admin_gate))
+    builder.add_edge(START, "admin_gate")
+    builder.add_edge("admin_gate", END)
+    graph = builder.compile(checkpointer=MemorySaver())
+
+    await graph.ainvoke(
+        {"thread_id": "t1", "pipeline_status": "awaiting_approval"},
+        config={"configurable": {"thread_id": "t1"}},
+    )
+
+    status = await run_status.get("t1")
+    assert status.pipeline_status == "awaiting_approval"
+    assert (status.current_node, status.node_state) == ("admin_gate", "done")
+    assert (status.error_count, status.errors) == (0, [])
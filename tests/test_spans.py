@@ -0,0 +1,190 @@
+"""Tests for sub-node spans and the logs API waterfall."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from google.genai import errors
+from httpx import ASGITransport, AsyncClient
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_none
+
+from editorial_ai.api.app import app
+from editorial_ai.observability import llm_call, supabase_query
+from editorial_ai.observability.models import NodeRunLog, SpanRecord
+from editorial_ai.observability.node_wrapper import node_wrapper
+from editorial_ai.observability.spans import (
+    Span,
+    harvest_spans,
+    note_attempt,
+    payload_chars,
+    reset_span_collector,
+)
+
+
+def _decision() -> SimpleNamespace:
+    return SimpleNamespace(model="gemini-2.5-flash", reason="default")
+
+
+def _response(text: str, cached: int = 0) -> SimpleNamespace:
+    part = SimpleNamespace(text=text, inline_data=None)
+    return SimpleNamespace(
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))],
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=100,
+            candidates_token_count=10,
+            total_token_count=110,
+            cached_content_token_count=cached,
+        ),
+    )
+
+
+@pytest.fixture
+def captured(monkeypatch: pytest.MonkeyPatch) -> list[NodeRunLog]:
+    logs: list[NodeRunLog] = []
+
+    async def _capture(log: NodeRunLog) -> None:
+        logs.append(log)
+
+    module = sys.modules["editorial_ai.observability.node_wrapper"]
+    monkeypatch.setattr(module, "append_node_log_async", _capture)
+    return logs
+
+
+# ---------------------------------------------------------------------------
+# Span stack
+# ---------------------------------------------------------------------------
+
+
+def test_spans_outside_a_node_are_not_kept() -> None:
+    harvest_spans()
+    with Span("orphan"):
+        pass
+    assert harvest_spans() == []
+
+
+async def test_nested_and_concurrent_spans() -> None:
+    reset_span_collector()
+
+    async def child(name: str) -> None:
+        with supabase_query(name):
+            await asyncio.sleep(0.01)
+
+    with Span("parent") as parent:
+        await asyncio.gather(child("posts"), child("spots"))
+
+    spans = {s.name: s for s in harvest_spans()}
+    assert spans["parent"].depth == 0
+    for table in ("posts", "spots"):
+        assert spans[table].kind == "supabase"
+        assert spans[table].parent_id == parent._id
+        assert spans[table].depth == 1
+        assert spans[table].latency_ms >= 10
+
+
+async def test_llm_span_records_sizes_and_cache() -> None:
+    reset_span_collector()
+    with llm_call("editorial_content", _decision()) as call:
+        call.record(_response("x" * 40, cached=64), request=("p" * 30, b"\x00" * 1000))
+
+    (span,) = harvest_spans()
+    assert span.kind == "llm"
+    assert span.name == "editorial_content"
+    assert span.model == "gemini-2.5-flash"
+    assert span.request_chars == 1030
+    assert span.response_chars == 40
+    assert span.cached_tokens == 64
+    assert span.attempts == 1
+
+
+async def test_retry_attempts_are_tagged() -> None:
+    calls = {"n": 0}
+
+    @retry(
+        retry=retry_if_exception_type(errors.ServerError),
+        stop=stop_after_attempt(3),
+        wait=wait_none(),
+        reraise=True,
+        before=note_attempt,
+    )
+    async def flaky() -> str:
+        with llm_call("review", _decision()) as call:
+            calls["n"] += 1
+            if calls["n"] < 3:
+                raise errors.ServerError(503, {"error": {"message": "busy"}})
+            call.record(_response("ok"), request="prompt")
+        return "ok"
+
+    reset_span_collector()
+    assert await flaky() == "ok"
+    spans = harvest_spans()
+
+    assert [s.attempts for s in spans] == [1, 2, 3]
+    assert [s.status for s in spans] == ["error", "error", "ok"]
+    assert spans[0].error_type == "ServerError"
+
+
+def test_payload_chars_handles_parts() -> None:
+    inline = SimpleNamespace(text=None, inline_data=SimpleNamespace(data=b"abc"))
+    assert payload_chars(["ab", b"cde", inline, None]) == 8
+
+
+# ---------------------------------------------------------------------------
+# Persistence and logs API
+# ---------------------------------------------------------------------------
+
+
+async def test_node_wrapper_persists_spans(captured: list[NodeRunLog]) -> None:
+    async def editorial(state: dict) -> dict:
+        with llm_call("editorial_content", _decision()) as call:
+            call.record(_response("draft"), request="prompt")
+        with llm_call("editorial_repair", _decision()) as call:
+            call.record(_response("fixed"), request="prompt")
+        return {}
+
+    await node_wrapper("editorial")(editorial)({"thread_id": "t-span"})
+
+    (log,) = captured
+    assert [s.name for s in log.spans] == ["editorial_content", "editorial_repair"]
+    assert log.token_usage[0].route == "editorial_content"
+
+
+async def test_logs_endpoint_returns_waterfall_offsets() -> None:
+    start = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+    logs = [
+        NodeRunLog(
+            thread_id="t1", node_name="curation", status="success",
+            started_at=start, ended_at=start + timedelta(seconds=2),
+        ),
+        NodeRunLog(
+            thread_id="t1", node_name="editorial", status="success",
+            started_at=start + timedelta(seconds=2), ended_at=start + timedelta(seconds=5),
+            spans=[
+                SpanRecord(
+                    span_id=1, name="editorial_content", kind="llm",
+                    started_at=start + timedelta(seconds=2, milliseconds=100),
+                    latency_ms=2500, attempts=2,
+                ),
+            ],
+        ),
+    ]
+    content = {"id": "c1", "thread_id": "t1"}
+    with (
+        patch("editorial_ai.api.routes.logs.get_content_by_id", AsyncMock(return_value=content)),
+        patch("editorial_ai.api.routes.logs.read_node_logs_async", AsyncMock(return_value=logs)),
+    ):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            resp = await ac.get("/api/contents/c1/logs")
+
+    assert resp.status_code == 200
+    runs = resp.json()["runs"]
+    assert [r["offset_ms"] for r in runs] == [0.0, 2000.0]
+    (span,) = runs[1]["spans"]
+    assert span["offset_ms"] == 2100.0
+    assert span["latency_ms"] == 2500
+    assert span["attempts"] == 2
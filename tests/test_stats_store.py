@@ -0,0 +1,205 @@
+"""Tests for the SQLite observability stats store and /api/observability/stats."""
+
+from __future__ import annotations
+
+import sys
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from langgraph.errors import GraphInterrupt
+
+from editorial_ai.api.app import app
+from editorial_ai.config import settings
+from editorial_ai.observability import stats_store as stats_module
+from editorial_ai.observability import node_wrapper, storage
+from editorial_ai.observability.models import NodeRunLog, TokenUsage
+from editorial_ai.observability.stats_store import StatsStore
+
+_DAY = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+
+
+def _run(
+    node: str,
+    duration_ms: float,
+    *,
+    thread_id: str = "t1",
+    usages: list[TokenUsage] | None = None,
+    status: str = "success",
+    pipeline_status: str | None = None,
+    started_at: datetime = _DAY,
+) -> NodeRunLog:
+    return NodeRunLog(
+        thread_id=thread_id,
+        node_name=node,
+        status=status,
+        pipeline_status=pipeline_status,
+        started_at=started_at,
+        ended_at=started_at + timedelta(milliseconds=duration_ms),
+        token_usage=usages or [],
+    )
+
+
+def _usage(model: str, reason: str, prompt: int, completion: int, cached: int = 0) -> TokenUsage:
+    return TokenUsage(
+        prompt_tokens=prompt,
+        completion_tokens=completion,
+        total_tokens=prompt + completion,
+        cached_tokens=cached,
+        model_name=model,
+        routing_reason=reason,
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> StatsStore:
+    s = StatsStore(tmp_path / "observability.db")
+    yield s
+    s.close()
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+def test_percentiles_and_totals_by_node(store: StatsStore) -> None:
+    store.record_runs(
+        [_run("editorial", float(ms), usages=[_usage("flash", "default", 100, 50, 40)])
+         for ms in range(1, 101)]
+        + [_run("review", 10.0, status="error")]
+    )
+    result = store.stats(group_by=["node_name"])
+
+    editorial, review = result["groups"]
+    assert editorial["node_name"] == "editorial"
+    assert editorial["runs"] == 100
+    assert editorial["p50_duration_ms"] == 50.0
+    assert editorial["p95_duration_ms"] == 95.0
+    assert editorial["p99_duration_ms"] == 99.0
+    assert editorial["total_tokens"] == 15_000
+    assert editorial["cache_hit_ratio"] == 0.4
+    assert review["errors"] == 1
+    assert result["totals"]["runs"] == 101
+
+
+def test_rollups_attribute_tokens_per_model_and_route(store: StatsStore) -> None:
+    store.record_runs([
+        _run("editorial", 100, usages=[
+            _usage("flash", "default", 100, 10),
+            _usage("pro", "upgrade:revision>=2", 300, 30),
+        ]),
+    ])
+    groups = store.stats(group_by=["model_name", "routing_reason"])["groups"]
+    by_model = {g["model_name"]: g for g in groups}
+
+    assert by_model["flash"]["total_tokens"] == 110
+    assert by_model["flash"]["runs"] == 1  # duration attributed to the first route
+    assert by_model["pro"]["total_tokens"] == 330
+    assert by_model["pro"]["routing_reason"] == "upgrade:revision>=2"
+    assert by_model["pro"]["runs"] == 0
+
+
+def test_filters_and_day_range(store: StatsStore) -> None:
+    store.record_runs([
+        _run("editorial", 10, started_at=_DAY),
+        _run("editorial", 20, started_at=_DAY + timedelta(days=1)),
+        _run("curation", 30, started_at=_DAY + timedelta(days=1)),
+    ])
+    result = store.stats(
+        since=date(2026, 3, 3), node_name="editorial", group_by=["day"]
+    )
+    (group,) = result["groups"]
+    assert group["day"] == "2026-03-03"
+    assert group["runs"] == 1
+    assert group["p50_duration_ms"] == 20.0
+
+
+def test_tokens_per_published_article(store: StatsStore) -> None:
+    store.record_runs([
+        _run("editorial", 10, thread_id="a", usages=[_usage("flash", "default", 800, 200)]),
+        _run("publish", 1, thread_id="a", pipeline_status="published"),
+        _run("editorial", 10, thread_id="b", usages=[_usage("flash", "default", 2500, 500)]),
+        _run("publish", 1, thread_id="b", pipeline_status="published"),
+        _run("editorial", 10, thread_id="c", usages=[_usage("flash", "default", 9000, 0)]),
+    ])
+    totals = store.stats()["totals"]
+    assert totals["published_articles"] == 2
+    assert totals["tokens_per_published_article"] == 2000.0
+
+
+def test_prune_keeps_rollups(store: StatsStore) -> None:
+    old = datetime.now(UTC) - timedelta(days=40)
+    store.record_runs([_run("editorial", 10, started_at=old)])
+    assert store.prune_runs(30) == 1
+
+    (group,) = store.stats()["groups"]
+    assert group["runs"] == 1
+    assert group["p50_duration_ms"] is None
+
+
+# ---------------------------------------------------------------------------
+# Wiring: log writers feed the store
+# ---------------------------------------------------------------------------
+
+
+def test_log_writers_index_runs(
+    store: StatsStore, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "observability_stats_enabled", True)
+    monkeypatch.setattr(storage, "get_stats_store", lambda: store)
+
+    storage.append_node_log(_run("curation", 5))
+    storage.write_log_batch({"t2": [_run("review", 7, thread_id="t2")]})
+
+    assert store.stats()["totals"]["runs"] == 2
+
+
+async def test_parked_node_is_not_counted_as_error(
+    store: StatsStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    logs: list[NodeRunLog] = []
+
+    async def _capture(log: NodeRunLog) -> None:
+        logs.append(log)
+
+    module = sys.modules["editorial_ai.observability.node_wrapper"]
+    monkeypatch.setattr(module, "append_node_log_async", _capture)
+
+    async def admin_gate(state: dict) -> dict:
+        raise GraphInterrupt(())
+
+    with pytest.raises(GraphInterrupt):
+        await node_wrapper("admin_gate")(admin_gate)({"thread_id": "t1"})
+    store.record_runs(logs)
+
+    assert (logs[0].status, logs[0].error_type) == ("success", None)
+    assert store.stats()["totals"]["errors"] == 0
+
+
+async def test_stats_endpoint(store: StatsStore, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(stats_module, "_store", store)
+    store.record_runs([_run("editorial", 42, usages=[_usage("flash", "default", 10, 5)])])
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get(
+            "/api/observability/stats",
+            params={
+                "since": "2026-03-01",
+                "until": "2026-03-31",
+                "group_by": ["node_name", "model_name"],
+            },
+        )
+        bad = await ac.get("/api/observability/stats", params={"group_by": "thread_id"})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["group_by"] == ["node_name", "model_name"]
+    assert body["groups"][0]["node_name"] == "editorial"
+    assert body["groups"][0]["model_name"] == "flash"
+    assert body["groups"][0]["p95_duration_ms"] == 42.0
+    assert body["totals"]["total_tokens"] == 15
+    assert bad.status_code == 422
@@ -0,0 +1,185 @@
+"""Tests for the topic fan-out graph topology."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from editorial_ai.config import settings
+from editorial_ai.graph import build_graph
+from editorial_ai.jobs import PIPELINE_GATE, SqliteJobQueue, gate_pipeline_job
+from editorial_ai.nodes.topic_fanout import route_topics
+from editorial_ai.services import draft_store
+
+_TOPICS = [
+    {"keyword": "A", "relevance_score": 0.9},
+    {"keyword": "B", "relevance_score": 0.8, "low_quality": True},
+    {"keyword": "C", "relevance_score": 0.7},
+    {"keyword": "D", "relevance_score": 0.6},
+]
+
+
+@pytest.fixture(autouse=True)
+def _isolated(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, no_node_logs: None
+) -> None:
+    monkeypatch.setattr(draft_store, "_DRAFTS_DIR", tmp_path / "drafts")
+    monkeypatch.setattr(settings, "editorial_fanout_max_topics", 2)
+    monkeypatch.setattr(settings, "editorial_fanout_concurrency", 1)
+
+
+def _fake_nodes(calls: dict[str, list]) -> dict:
+    active = {"now": 0, "max": 0}
+    calls["active"] = active
+
+    async def curation(state: dict) -> dict:
+        return {"curated_topics": _TOPICS, "pipeline_status": "sourcing"}
+
+    async def design_spec(state: dict) -> dict:
+        return {"design_spec": {"theme": "x"}}
+
+    async def source(state: dict) -> dict:
+        calls["source"].append(state["thread_id"])
+        return {"enriched_contexts": [{"keyword": "shared"}], "pipeline_status": "drafting"}
+
+    async def editorial(state: dict) -> dict:
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        keyword = state["curated_topics"][0]["keyword"]
+        calls["editorial"].append((keyword, state["enriched_contexts"][0]["keyword"]))
+        return {"current_draft": {"title": keyword}, "pipeline_status": "reviewing"}
+
+    async def enrich(state: dict) -> dict:
+        return {}
+
+    async def review(state: dict) -> dict:
+        return {"review_result": {"passed": True}, "pipeline_status": "awaiting_approval"}
+
+    async def admin_gate(state: dict) -> dict:
+        calls["admin_gate"].append(state["current_draft"]["title"])
+        return {"admin_decision": "approved"}
+
+    async def publish(state: dict) -> dict:
+        return {"pipeline_status": "published"}
+
+    return {
+        "curation": curation,
+        "design_spec": design_spec,
+        "source": source,
+        "editorial": editorial,
+        "enrich": enrich,
+        "review": review,
+        "admin_gate": admin_gate,
+        "publish": publish,
+    }
+
+
+async def test_fanout_drafts_each_topic_and_queues_extra_approvals(
+    job_queue: SqliteJobQueue,
+) -> None:
+    calls: dict[str, list] = {"source": [], "editorial": [], "admin_gate": []}
+    graph = build_graph(
+        node_overrides=_fake_nodes(calls), checkpointer=MemorySaver(), fanout=True
+    )
+
+    result = await graph.ainvoke(
+        {"thread_id": "t1", "curation_input": {"seed_keyword": "A"}},
+        config={"configurable": {"thread_id": "t1"}},
+    )
+
+    assert calls["source"] == ["t1"]  # one source fetch for every branch
+    assert sorted(calls["editorial"]) == [("A", "shared"), ("C", "shared")]
+    assert calls["active"]["max"] == 1
+    assert result["pipeline_status"] == "published"
+    assert result["current_draft"] == {"title": "A"}
+    drafts = sorted(result["topic_drafts"], key=lambda d: d["topic_index"])
+    assert [(d["topic_index"], d["ready"], d["draft_ref"]) for d in drafts] == [
+        (0, True, "t1/topic-0"),
+        (2, True, "t1/topic-2"),
+    ]
+    assert all("current_draft" not in d for d in drafts)
+
+    job = await job_queue.claim("w1", lease_s=60)
+    assert (job.kind, job.thread_id) == (PIPELINE_GATE, "t1-topic-2")
+    assert job.payload["state"]["curation_input"]["seed_keyword"] == "C"
+
+    await gate_pipeline_job(graph, job)
+    child = await graph.aget_state({"configurable": {"thread_id": "t1-topic-2"}})
+    assert child.values["current_draft"] == {"title": "C"}
+    assert child.values["pipeline_status"] == "published"
+    assert calls["admin_gate"] == ["A", "C"]
+    assert calls["editorial"].count(("C", "shared")) == 1  # not drafted again
+
+
+async def test_fanout_without_ready_drafts_fails(job_queue: SqliteJobQueue) -> None:
+    calls: dict[str, list] = {"source": [], "editorial": [], "admin_gate": []}
+    nodes = _fake_nodes(calls)
+
+    async def review(state: dict) -> dict:
+        return {"review_result": {"passed": False}, "revision_count": 3, "pipeline_status": "failed"}
+
+    nodes["review"] = review
+    graph = build_graph(node_overrides=nodes, fanout=True)
+    result = await graph.ainvoke({"thread_id": "t2", "curation_input": {}})
+
+    assert result["pipeline_status"] == "failed"
+    assert calls["admin_gate"] == []
+    assert "no draft ready" in result["error_log"][-1]
+    assert await job_queue.claim("w1", lease_s=60) is None
+
+
+def test_branches_split_the_remaining_budget() -> None:
+    state = {
+        "thread_id": "t3",
+        "curated_topics": _TOPICS,
+        "budget": {"max_tokens": 1000, "max_wall_s": 60},
+        "budget_spent": [{"node": "curation", "tokens": 400, "cost_usd": 0, "wall_s": 20}],
+    }
+    sends = route_topics(state)
+
+    assert len(sends) == 2
+    assert all(s.arg["budget"] == {"max_tokens": 300, "max_wall_s": 20} for s in sends)
+    assert all(s.arg["budget_spent"] == [] for s in sends)
+    assert "budget" not in route_topics({**state, "budget": None})[0].arg
+
+
+async def test_fanout_run_stays_within_its_budget(job_queue: SqliteJobQueue) -> None:
+    calls: dict[str, list] = {"source": [], "editorial": [], "admin_gate": []}
+    nodes = _fake_nodes(calls)
+    seen: list[dict] = []
+
+    async def editorial(state: dict) -> dict:
+        seen.append(state["budget"])
+        keyword = state["curated_topics"][0]["keyword"]
+        return {"current_draft": {"title": keyword}, "pipeline_status": "reviewing"}
+
+    nodes["editorial"] = editorial
+    graph = build_graph(node_overrides=nodes, fanout=True)
+    result = await graph.ainvoke(
+        {"thread_id": "t4", "curation_input": {}, "budget": {"max_cost_usd": 1.0}}
+    )
+
+    assert seen == [{"max_cost_usd": 0.5}, {"max_cost_usd": 0.5}]
+    assert result["budget"] == {"max_cost_usd": 1.0}
+    branch_entries = [e for e in result["budget_spent"] if e["node"] == "editorial"]
+    assert len(branch_entries) == 2  # each branch's ledger merged into the run's
+
+
+def test_sweep_removes_only_stale_drafts() -> None:
+    stale = draft_store._DRAFTS_DIR / "old"
+    fresh = draft_store._DRAFTS_DIR / "new"
+    for thread_dir in (stale, fresh):
+        thread_dir.mkdir(parents=True)
+        (thread_dir / "topic-0.json").write_text("{}")
+    week_ago = time.time() - 8 * 86400
+    os.utime(stale / "topic-0.json", (week_ago, week_ago))
+
+    assert draft_store.sweep_old_drafts(7) == 1
+    assert not stale.exists() and fresh.exists()
@@ -0,0 +1,115 @@
+"""Tests for the standalone multi-process worker entry point."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from contextlib import asynccontextmanager
+
+import pytest
+
+from editorial_ai.config import settings
+from editorial_ai.jobs import Job, SqliteJobQueue
+from editorial_ai.observability.metrics import NODE_DURATION
+from editorial_ai.worker import pin_to_core, process_count, serve
+
+
+def test_process_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "worker_processes", 3)
+    assert process_count() == 3
+    assert process_count(2) == 2
+    monkeypatch.setattr(settings, "worker_processes", 0)
+    assert process_count() == (os.cpu_count() or 1)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+def test_pin_to_core_restores() -> None:
+    original = os.sched_getaffinity(0)
+    try:
+        core = pin_to_core(len(original))  # wraps around
+        assert os.sched_getaffinity(0) == {sorted(original)[0]} == {core}
+    finally:
+        os.sched_setaffinity(0, original)
+
+
+async def test_serve_runs_jobs_until_stopped(job_queue: SqliteJobQueue) -> None:
+    ran: list[tuple[object, str]] = []
+    stop = asyncio.Event()
+
+    @asynccontextmanager
+    async def graph_factory():
+        yield "graph"
+
+    async def handler(graph: object, job: Job) -> None:
+        ran.append((graph, job.thread_id))
+
+    async def stop_when_done() -> None:
+        while (await job_queue.get(job.id)).status != "succeeded":
+            await asyncio.sleep(0.01)
+        stop.set()
+
+    job = await job_queue.enqueue("test", "t1", {})
+    await asyncio.wait_for(
+        asyncio.gather(
+            serve(
+                graph_factory=graph_factory, handlers={"test": handler}, concurrency=1, stop=stop
+            ),
+            stop_when_done(),
+        ),
+        5,
+    )
+
+    assert ran == [("graph", "t1")]
+    assert (await job_queue.get(job.id)).status == "succeeded"
+
+
+async def _http_get(port: int, path: str) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: worker\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+async def test_serve_exposes_its_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "worker_metrics_host", "127.0.0.1")
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    NODE_DURATION.labels("curation", "success").observe(0.2)
+    stop = asyncio.Event()
+    responses: list[bytes] = []
+
+    @asynccontextmanager
+    async def graph_factory():
+        yield "graph"
+
+    async def scrape() -> None:
+        for _ in range(200):
+            try:
+                responses.append(await _http_get(port, "/metrics"))
+                responses.append(await _http_get(port, "/other"))
+                break
+            except ConnectionRefusedError:
+                await asyncio.sleep(0.01)
+        stop.set()
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            serve(graph_factory=graph_factory, handlers={}, stop=stop, metrics_port=port),
+            scrape(),
+        ),
+        5,
+    )
+
+    metrics, other = responses
+    assert metrics.startswith(b"HTTP/1.1 200 OK")
+    assert b'editorial_node_duration_seconds_count{node_name="curation",status="success"}' in (
+        metrics
+    )
+    assert other.startswith(b"HTTP/1.1 404")
+    with pytest.raises(ConnectionRefusedError):
+        await _http_get(port, "/metrics")  # closed with the worker